@@ -88,7 +88,15 @@ class PyDAG(PyDiGraph):
 
 
 @functools.singledispatch
-def distance_matrix(graph, parallel_threshold=300):
+def distance_matrix(
+    graph,
+    parallel_threshold=300,
+    dtype=None,
+    null_value=0.0,
+    cutoff=None,
+    sparse=False,
+    out=None,
+):
     """Get the distance matrix for a graph
 
     This differs from functions like :func:`~retworkx.floyd_warshall_numpy` in
@@ -101,34 +109,104 @@ def distance_matrix(graph, parallel_threshold=300):
     ``RAYON_NUM_THREADS`` can be used to adjust how many threads will be used.
 
     :param graph: The graph to get the distance matrix for, can be either a
-        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph` (or a
+        frozen :class:`~retworkx.CSRGraph` or :class:`~retworkx.CSRDiGraph`).
     :param int parallel_threshold: The number of nodes to calculate the
         the distance matrix in parallel at. It defaults to 300, but this can
         be tuned
     :param bool as_undirected: If set to ``True`` the input directed graph
         will be treat as if each edge was bidirectional/undirected in the
         output distance matrix.
-
-    :returns: The distance matrix
+    :param dtype: The dtype of the output matrix, one of ``numpy.float64``
+        (the default), ``numpy.int32``, ``numpy.uint16`` or ``numpy.uint8``.
+        The smaller integer types use a fraction of the memory of the default
+        but can only hold distances up to their maximum value.
+    :param null_value: The value of the entries for pairs of nodes without a
+        path between them. It defaults to ``0.0``, the same value as the
+        diagonal, set it to for example ``numpy.inf`` (or ``-1`` for
+        ``int32``) to tell the two apart. For an integer ``dtype`` the
+        largest value of the type (such as ``255`` for ``uint8``) can be
+        used, it is then reserved for ``null_value`` and a distance that
+        large raises a ``ValueError``.
+    :param int cutoff: If set only the distances up to ``cutoff`` are
+        computed, the entries of pairs of nodes further apart than that are
+        set to ``null_value``. Each search stops at that depth so this is
+        much faster when only nearby pairs matter.
+    :param bool sparse: If set to ``True`` return the matrix in compressed
+        sparse row form instead, as a tuple of numpy arrays
+        ``(indptr, indices, data)`` holding only the distances between
+        distinct nodes that can reach each other (within ``cutoff``). The
+        distances from row ``i`` are ``data[indptr[i]:indptr[i + 1]]`` and
+        their columns are ``indices[indptr[i]:indptr[i + 1]]``, in increasing
+        order. ``indptr`` and ``indices`` are ``int64`` and ``data`` has the
+        type set by ``dtype``, ``null_value`` is ignored. This can be passed
+        directly to ``scipy.sparse.csr_matrix((data, indices, indptr))``.
+    :param out: Where to write the distance matrix to instead of a new array,
+        for matrices that don't fit in memory. Either a ``numpy.memmap`` (or
+        any other writeable C contiguous array) of the right shape and dtype,
+        whose dtype is used if ``dtype`` isn't set, or a path to create a new
+        ``.npy`` file at, which can be opened again with
+        ``numpy.load(path, mmap_mode="r")``. The rows are computed in chunks
+        that are flushed to the file one at a time so the memory used stays
+        bounded by the size of a chunk. It can't be used with ``sparse``.
+        ``out`` must not be read or written from another thread until the
+        function returns.
+
+    :returns: The distance matrix (``out`` if it is set, or the memory mapped
+        file it points to), or its ``(indptr, indices, data)`` arrays if
+        ``sparse`` is set
     :rtype: numpy.ndarray
+    :raises ValueError: If ``dtype`` isn't supported, if ``null_value`` can't
+        be represented in ``dtype``, if a distance within ``cutoff`` is too
+        large for ``dtype`` or if ``out`` doesn't match the output
     """
     raise TypeError("Invalid Input Type %s for graph" % type(graph))
 
 
 @distance_matrix.register(PyDiGraph)
+@distance_matrix.register(CSRDiGraph)
 def _digraph_distance_matrix(
-    graph, parallel_threshold=300, as_undirected=False
+    graph,
+    parallel_threshold=300,
+    as_undirected=False,
+    dtype=None,
+    null_value=0.0,
+    cutoff=None,
+    sparse=False,
+    out=None,
 ):
     return digraph_distance_matrix(
         graph,
         parallel_threshold=parallel_threshold,
         as_undirected=as_undirected,
+        dtype=dtype,
+        null_value=null_value,
+        cutoff=cutoff,
+        sparse=sparse,
+        out=out,
     )
 
 
 @distance_matrix.register(PyGraph)
-def _graph_distance_matrix(graph, parallel_threshold=300):
-    return graph_distance_matrix(graph, parallel_threshold=parallel_threshold)
+@distance_matrix.register(CSRGraph)
+def _graph_distance_matrix(
+    graph,
+    parallel_threshold=300,
+    dtype=None,
+    null_value=0.0,
+    cutoff=None,
+    sparse=False,
+    out=None,
+):
+    return graph_distance_matrix(
+        graph,
+        parallel_threshold=parallel_threshold,
+        dtype=dtype,
+        null_value=null_value,
+        cutoff=cutoff,
+        sparse=sparse,
+        out=out,
+    )
 
 
 @functools.singledispatch
@@ -220,6 +298,9 @@ def floyd_warshall_numpy(
     weight_fn=None,
     default_weight=1.0,
     parallel_threshold=300,
+    dtype=None,
+    return_predecessors=False,
+    out=None,
 ):
     """Find all-pairs shortest path lengths using Floyd's algorithm
 
@@ -235,6 +316,8 @@ def floyd_warshall_numpy(
 
     :param graph: The graph to run Floyd's algorithm on. Can
         either be a :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+        (or a frozen :class:`~retworkx.CSRGraph` or
+        :class:`~retworkx.CSRDiGraph`)
     :param callable weight_fn: A callable object (function, lambda, etc) which
         will be passed the edge object and expected to return a ``float``. This
         tells retworkx/rust how to extract a numerical weight as a ``float``
@@ -254,36 +337,80 @@ def floyd_warshall_numpy(
     :param int parallel_threshold: The number of nodes to execute
         the algorithm in parallel at. It defaults to 300, but this can
         be tuned
+    :param dtype: The dtype of the output distance matrix, either
+        ``numpy.float64`` (the default) or ``numpy.float32``. ``float32``
+        halves the memory used at the cost of precision.
+    :param bool return_predecessors: If set to ``True`` a predecessor matrix
+        is returned along with the distance matrix.
+    :param out: Where to write the distance matrix to instead of a new array,
+        for matrices that don't fit in memory. Either a ``numpy.memmap`` (or
+        any other writeable C contiguous array) of the right shape and dtype,
+        whose dtype is used if ``dtype`` isn't set, or a path to create a new
+        ``.npy`` file at. Every step of the algorithm updates every row, so it
+        runs in place on the mapped file and the OS pages it in and out as
+        needed. It can't be used with ``return_predecessors``. ``out`` must not
+        be read or written from another thread until the function returns.
 
     :returns: A matrix of shortest path distances between nodes. If there is no
         path between two nodes then the corresponding matrix entry will be
-        ``np.inf``.
+        ``np.inf``. If ``return_predecessors`` is set a tuple
+        ``(dist, pred)`` is returned instead, where ``pred`` is an int64
+        matrix whose entry ``[i, j]`` is the row/column position of the
+        node before ``j`` on the shortest path from ``i`` to ``j``, or
+        ``-1`` if ``i == j`` or there is no path. The rows and columns of
+        both matrices are in node index order, skipping the indices of
+        removed nodes, so ``pred`` holds positions in the matrix and not
+        node indices. ``graph.node_indexes()[pos]`` gives the node index
+        of a position, the two are the same if no nodes were removed.
     :rtype: numpy.ndarray
+    :raises ValueError: If ``dtype`` is not ``float64`` or ``float32``, if
+        ``out`` doesn't match the output or if both ``out`` and
+        ``return_predecessors`` are set
     """
     raise TypeError("Invalid Input Type %s for graph" % type(graph))
 
 
 @floyd_warshall_numpy.register(PyDiGraph)
+@floyd_warshall_numpy.register(CSRDiGraph)
 def _digraph_floyd_warshall_numpy(
-    graph, weight_fn=None, default_weight=1.0, parallel_threshold=300
+    graph,
+    weight_fn=None,
+    default_weight=1.0,
+    parallel_threshold=300,
+    dtype=None,
+    return_predecessors=False,
+    out=None,
 ):
     return digraph_floyd_warshall_numpy(
         graph,
         weight_fn=weight_fn,
         default_weight=default_weight,
         parallel_threshold=parallel_threshold,
+        dtype=dtype,
+        return_predecessors=return_predecessors,
+        out=out,
     )
 
 
 @floyd_warshall_numpy.register(PyGraph)
+@floyd_warshall_numpy.register(CSRGraph)
 def _graph_floyd_warshall_numpy(
-    graph, weight_fn=None, default_weight=1.0, parallel_threshold=300
+    graph,
+    weight_fn=None,
+    default_weight=1.0,
+    parallel_threshold=300,
+    dtype=None,
+    return_predecessors=False,
+    out=None,
 ):
     return graph_floyd_warshall_numpy(
         graph,
         weight_fn=weight_fn,
         default_weight=default_weight,
         parallel_threshold=parallel_threshold,
+        dtype=dtype,
+        return_predecessors=return_predecessors,
+        out=out,
     )
 
 
@@ -340,6 +467,7 @@ def dijkstra_shortest_paths(
     weight_fn=None,
     default_weight=1.0,
     as_undirected=False,
+    as_arrays=False,
 ):
     """Find the shortest path from a node
 
@@ -348,6 +476,8 @@ def dijkstra_shortest_paths(
 
     :param graph: The input graph to use. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+        (or a frozen :class:`~retworkx.CSRGraph` or
+        :class:`~retworkx.CSRDiGraph`)
     :param int source: The node index to find paths from
     :param int target: An optional target to find a path to
     :param weight_fn: An optional weight function for an edge. It will accept
@@ -357,16 +487,29 @@ def dijkstra_shortest_paths(
         float value will be used for the weight/cost of each edge.
     :param bool as_undirected: If set to true the graph will be treated as
         undirected for finding the shortest path. This only works with a
-        :class:`~retworkx.PyDiGraph` input for ``graph``
+        :class:`~retworkx.PyDiGraph` or :class:`~retworkx.CSRDiGraph` input
+        for ``graph``
+    :param bool as_arrays: If set to true return the shortest paths as a pair
+        of numpy arrays instead of a dictionary of paths, see below.
 
     :return: Dictionary of paths. The keys are destination node indices and
-        the dict values are lists of node indices making the path.
-    :rtype: dict
+        the dict values are lists of node indices making the path. If
+        ``as_arrays`` is set a tuple ``(distances, predecessors)`` of a
+        ``float64`` and an ``int64`` numpy array indexed by node index is
+        returned instead, where ``distances`` is the length of the shortest
+        path to each node (``np.inf`` if it isn't reached) and
+        ``predecessors`` is the node before it on that path (``-1`` for
+        ``source`` and nodes that aren't reached). If ``target`` is set only
+        the nodes settled before ``target`` was reached are filled in. The
+        path to a node can be rebuilt with
+        :func:`~retworkx.path_from_predecessors`.
+    :rtype: PathMapping or tuple
     """
     raise TypeError("Invalid Input Type %s for graph" % type(graph))
 
 
 @dijkstra_shortest_paths.register(PyDiGraph)
+@dijkstra_shortest_paths.register(CSRDiGraph)
 def _digraph_dijkstra_shortest_path(
     graph,
     source,
@@ -374,6 +517,7 @@ def _digraph_dijkstra_shortest_path(
     weight_fn=None,
     default_weight=1.0,
     as_undirected=False,
+    as_arrays=False,
 ):
     return digraph_dijkstra_shortest_paths(
         graph,
@@ -382,12 +526,19 @@ def _digraph_dijkstra_shortest_path(
         weight_fn=weight_fn,
         default_weight=default_weight,
         as_undirected=as_undirected,
+        as_arrays=as_arrays,
     )
 
 
 @dijkstra_shortest_paths.register(PyGraph)
+@dijkstra_shortest_paths.register(CSRGraph)
 def _graph_dijkstra_shortest_path(
-    graph, source, target=None, weight_fn=None, default_weight=1.0
+    graph,
+    source,
+    target=None,
+    weight_fn=None,
+    default_weight=1.0,
+    as_arrays=False,
 ):
     return graph_dijkstra_shortest_paths(
         graph,
@@ -395,6 +546,7 @@ def _graph_dijkstra_shortest_path(
         target=target,
         weight_fn=weight_fn,
         default_weight=default_weight,
+        as_arrays=as_arrays,
     )
 
 
@@ -405,6 +557,8 @@ def dijkstra_shortest_path_lengths(graph, node, edge_cost_fn, goal=None):
 
     :param graph: The input graph to use. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+        (or a frozen :class:`~retworkx.CSRGraph` or
+        :class:`~retworkx.CSRDiGraph`)
     :param int node: The node index to use as the source for finding the
         shortest paths from
     :param edge_cost_fn: A python callable that will take in 1 parameter, an
@@ -424,6 +578,7 @@ def dijkstra_shortest_path_lengths(graph, node, edge_cost_fn, goal=None):
 
 
 @dijkstra_shortest_path_lengths.register(PyDiGraph)
+@dijkstra_shortest_path_lengths.register(CSRDiGraph)
 def _digraph_dijkstra_shortest_path_lengths(
     graph, node, edge_cost_fn, goal=None
 ):
@@ -433,12 +588,385 @@ def _digraph_dijkstra_shortest_path_lengths(
 
 
 @dijkstra_shortest_path_lengths.register(PyGraph)
+@dijkstra_shortest_path_lengths.register(CSRGraph)
 def _graph_dijkstra_shortest_path_lengths(graph, node, edge_cost_fn, goal=None):
     return graph_dijkstra_shortest_path_lengths(
         graph, node, edge_cost_fn, goal=goal
     )
 
 
+@functools.singledispatch
+def all_pairs_dijkstra_path_lengths(
+    graph,
+    weight_fn=None,
+    sources=None,
+    targets=None,
+    default_weight=1.0,
+    parallel_threshold=300,
+    cutoff=None,
+    sparse=False,
+    out=None,
+):
+    """Compute the lengths of the shortest paths between all pairs of nodes
+    using Dijkstra's algorithm
+
+    The weight of every edge is computed once before the search is run from
+    each source node. This function is multithreaded and will run the
+    searches in parallel if the number of source nodes is above the value of
+    ``parallel_threshold`` (it defaults to 300). If the function will be
+    running in parallel the env var ``RAYON_NUM_THREADS`` can be used to
+    adjust how many threads will be used.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+        (or a frozen :class:`~retworkx.CSRGraph` or
+        :class:`~retworkx.CSRDiGraph`)
+    :param weight_fn: An optional weight function for an edge. It will accept
+        a single argument, the edge's weight object and will return a float
+        which will be used to represent the weight/cost of the edge. It must
+        be non-negative
+    :param list sources: An optional list of node indices to find the paths
+        from, in the order of the rows of the output. If not specified all
+        the nodes of the graph (in index order) are used.
+    :param list targets: An optional list of node indices to find the paths
+        to, in the order of the columns of the output. If not specified all
+        the nodes of the graph (in index order) are used.
+    :param float default_weight: If ``weight_fn`` isn't specified this
+        optional float value will be used for the weight/cost of each edge.
+    :param int parallel_threshold: The number of source nodes to run the
+        searches in parallel at. It defaults to 300, but this can be tuned
+    :param bool as_undirected: If set to ``True`` the input directed graph
+        will be treated as if each edge was bidirectional/undirected.
+    :param float cutoff: If set only the paths with a length up to ``cutoff``
+        are found, the entries of longer paths are set to ``np.inf``. Each
+        search stops at that length so this is much faster when only nearby
+        pairs matter.
+    :param bool sparse: If set to ``True`` return the matrix in compressed
+        sparse row form instead, as a tuple of numpy arrays
+        ``(indptr, indices, data)`` holding only the finite entries for
+        pairs of distinct nodes. The lengths from ``sources[i]`` are
+        ``data[indptr[i]:indptr[i + 1]]`` and their columns (positions in
+        ``targets``) are ``indices[indptr[i]:indptr[i + 1]]``, in increasing
+        order. ``indptr`` and ``indices`` are ``int64`` and ``data`` is
+        ``float64``.
+    :param out: Where to write the matrix to instead of a new array, for
+        matrices that don't fit in memory. Either a float64 ``numpy.memmap``
+        (or any other writeable C contiguous array) of the right shape or a
+        path to create a new ``.npy`` file at, which can be opened again with
+        ``numpy.load(path, mmap_mode="r")``. The rows are computed in chunks
+        that are flushed to the file one at a time so the memory used stays
+        bounded by the size of a chunk. It can't be used with ``sparse``.
+        ``out`` must not be read or written from another thread until the
+        function returns.
+
+    :returns: A matrix of shape ``(len(sources), len(targets))`` where the
+        entry ``[i, j]`` is the length of the shortest path from
+        ``sources[i]`` to ``targets[j]``. If there is no path between two
+        nodes the corresponding entry will be ``np.inf``. If ``out`` is set
+        the matrix is written to it (or the memory mapped file it points to)
+        and it is returned. If ``sparse`` is set the ``(indptr, indices,
+        data)`` arrays of the matrix are returned instead.
+    :rtype: numpy.ndarray
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@all_pairs_dijkstra_path_lengths.register(PyDiGraph)
+@all_pairs_dijkstra_path_lengths.register(CSRDiGraph)
+def _digraph_all_pairs_dijkstra_path_lengths(
+    graph,
+    weight_fn=None,
+    sources=None,
+    targets=None,
+    default_weight=1.0,
+    parallel_threshold=300,
+    as_undirected=False,
+    cutoff=None,
+    sparse=False,
+    out=None,
+):
+    return digraph_all_pairs_dijkstra_path_lengths(
+        graph,
+        weight_fn=weight_fn,
+        sources=sources,
+        targets=targets,
+        default_weight=default_weight,
+        as_undirected=as_undirected,
+        parallel_threshold=parallel_threshold,
+        cutoff=cutoff,
+        sparse=sparse,
+        out=out,
+    )
+
+
+@all_pairs_dijkstra_path_lengths.register(PyGraph)
+@all_pairs_dijkstra_path_lengths.register(CSRGraph)
+def _graph_all_pairs_dijkstra_path_lengths(
+    graph,
+    weight_fn=None,
+    sources=None,
+    targets=None,
+    default_weight=1.0,
+    parallel_threshold=300,
+    cutoff=None,
+    sparse=False,
+    out=None,
+):
+    return graph_all_pairs_dijkstra_path_lengths(
+        graph,
+        weight_fn=weight_fn,
+        sources=sources,
+        targets=targets,
+        default_weight=default_weight,
+        parallel_threshold=parallel_threshold,
+        cutoff=cutoff,
+        sparse=sparse,
+        out=out,
+    )
+
+
+@functools.singledispatch
+def bidirectional_dijkstra(
+    graph, source, target, weight_fn=None, default_weight=1.0
+):
+    """Find the shortest path between two nodes using a bidirectional
+    Dijkstra search
+
+    A Dijkstra search is run from both ``source`` and ``target`` at the same
+    time (for a :class:`~retworkx.PyDiGraph` backward from ``target`` along
+    the incoming edges of each node), stopping as soon as no shorter path can
+    be found through the nodes where the two searches met. For a single pair
+    of nodes this usually visits far fewer nodes than
+    :func:`~retworkx.dijkstra_shortest_paths` with a ``target``. If there are
+    multiple shortest paths any one of them may be returned.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+        (or a frozen :class:`~retworkx.CSRGraph` or
+        :class:`~retworkx.CSRDiGraph`)
+    :param int source: The node index to find the path from
+    :param int target: The node index to find the path to
+    :param weight_fn: An optional weight function for an edge. It will accept
+        a single argument, the edge's weight object and will return a float
+        which will be used to represent the weight/cost of the edge. It must
+        be non-negative
+    :param float default_weight: If ``weight_fn`` isn't specified this
+        optional float value will be used for the weight/cost of each edge.
+    :param bool as_undirected: If set to ``True`` the input directed graph
+        will be treated as if each edge was bidirectional/undirected.
+
+    :returns: A tuple of the length of the shortest path and the path as a
+        list of node indices starting with ``source`` and ending with
+        ``target``
+    :rtype: tuple
+    :raises NoPathFound: If there is no path from ``source`` to ``target``
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@bidirectional_dijkstra.register(PyDiGraph)
+@bidirectional_dijkstra.register(CSRDiGraph)
+def _digraph_bidirectional_dijkstra(
+    graph,
+    source,
+    target,
+    weight_fn=None,
+    default_weight=1.0,
+    as_undirected=False,
+):
+    return digraph_bidirectional_dijkstra(
+        graph,
+        source,
+        target,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+        as_undirected=as_undirected,
+    )
+
+
+@bidirectional_dijkstra.register(PyGraph)
+@bidirectional_dijkstra.register(CSRGraph)
+def _graph_bidirectional_dijkstra(
+    graph, source, target, weight_fn=None, default_weight=1.0
+):
+    return graph_bidirectional_dijkstra(
+        graph,
+        source,
+        target,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+    )
+
+
+@functools.singledispatch
+def bellman_ford_shortest_paths(
+    graph,
+    source,
+    target=None,
+    weight_fn=None,
+    default_weight=1.0,
+    as_arrays=False,
+):
+    """Find the shortest paths from a node using the Bellman-Ford algorithm
+
+    Unlike :func:`~retworkx.dijkstra_shortest_paths` the edge weights may be
+    negative. In an undirected graph every edge can be traversed in both
+    directions, so any edge with a negative weight that is reachable from
+    ``source`` is a negative cycle.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+        (or a frozen :class:`~retworkx.CSRGraph` or
+        :class:`~retworkx.CSRDiGraph`)
+    :param int source: The node index to find paths from
+    :param int target: An optional target to find a path to
+    :param weight_fn: An optional weight function for an edge. It will accept
+        a single argument, the edge's weight object and will return a float
+        which will be used to represent the weight/cost of the edge
+    :param float default_weight: If ``weight_fn`` isn't specified this
+        optional float value will be used for the weight/cost of each edge.
+    :param bool as_arrays: If set to true return the shortest paths as a pair
+        of numpy arrays instead of a dictionary of paths, see below.
+    :param bool as_undirected: If set to true the graph will be treated as
+        undirected for finding the shortest path. This only works with a
+        :class:`~retworkx.PyDiGraph` input for ``graph``
+
+    :return: Dictionary of paths. The keys are destination node indices and
+        the dict values are lists of node indices making the path. If
+        ``as_arrays`` is set a tuple ``(distances, predecessors)`` of a
+        ``float64`` and an ``int64`` numpy array indexed by node index is
+        returned instead, where ``distances`` is the length of the shortest
+        path to each node (``np.inf`` if it isn't reached) and
+        ``predecessors`` is the node before it on that path (``-1`` for
+        ``source`` and nodes that aren't reached).
+    :rtype: PathMapping
+    :raises NegativeCycle: If there is a negative cycle reachable from
+        ``source``
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@bellman_ford_shortest_paths.register(PyDiGraph)
+@bellman_ford_shortest_paths.register(CSRDiGraph)
+def _digraph_bellman_ford_shortest_paths(
+    graph,
+    source,
+    target=None,
+    weight_fn=None,
+    default_weight=1.0,
+    as_arrays=False,
+    as_undirected=False,
+):
+    return digraph_bellman_ford_shortest_paths(
+        graph,
+        source,
+        target=target,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+        as_undirected=as_undirected,
+        as_arrays=as_arrays,
+    )
+
+
+@bellman_ford_shortest_paths.register(PyGraph)
+@bellman_ford_shortest_paths.register(CSRGraph)
+def _graph_bellman_ford_shortest_paths(
+    graph,
+    source,
+    target=None,
+    weight_fn=None,
+    default_weight=1.0,
+    as_arrays=False,
+):
+    return graph_bellman_ford_shortest_paths(
+        graph,
+        source,
+        target=target,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+        as_arrays=as_arrays,
+    )
+
+
+@functools.singledispatch
+def johnson_all_pairs(
+    graph,
+    weight_fn=None,
+    default_weight=1.0,
+    parallel_threshold=300,
+):
+    """Find all-pairs shortest path lengths using Johnson's algorithm
+
+    Johnson's algorithm supports negative edge weights like
+    :func:`~retworkx.floyd_warshall_numpy` but is much faster for sparse
+    graphs. For a :class:`~retworkx.PyDiGraph` the edges are reweighted to be
+    non-negative once, using the potentials found by a single Bellman-Ford
+    search, and then a Dijkstra search is run from every node. In an
+    undirected graph any edge with a negative weight is a negative cycle.
+
+    This function is multithreaded and will run the searches in parallel if
+    the number of nodes in the graph is above the value of
+    ``parallel_threshold`` (it defaults to 300). If the function will be
+    running in parallel the env var ``RAYON_NUM_THREADS`` can be used to
+    adjust how many threads will be used.
+
+    :param graph: The graph to run Johnson's algorithm on. Can
+        either be a :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+        (or a frozen :class:`~retworkx.CSRGraph` or
+        :class:`~retworkx.CSRDiGraph`)
+    :param weight_fn: An optional weight function for an edge. It will accept
+        a single argument, the edge's weight object and will return a float
+        which will be used to represent the weight/cost of the edge
+    :param float default_weight: If ``weight_fn`` isn't specified this
+        optional float value will be used for the weight/cost of each edge.
+    :param int parallel_threshold: The number of nodes to execute
+        the algorithm in parallel at. It defaults to 300, but this can
+        be tuned
+    :param bool as_undirected: If set to true each directed edge will be
+        treated as bidirectional/undirected. This only works with a
+        :class:`~retworkx.PyDiGraph` input for ``graph``
+
+    :returns: A matrix of shortest path distances between nodes in the same
+        form as :func:`~retworkx.floyd_warshall_numpy`. If there is no path
+        between two nodes then the corresponding matrix entry will be
+        ``np.inf``.
+    :rtype: numpy.ndarray
+    :raises NegativeCycle: If the graph has a negative cycle
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@johnson_all_pairs.register(PyDiGraph)
+@johnson_all_pairs.register(CSRDiGraph)
+def _digraph_johnson_all_pairs(
+    graph,
+    weight_fn=None,
+    default_weight=1.0,
+    parallel_threshold=300,
+    as_undirected=False,
+):
+    return digraph_johnson_all_pairs(
+        graph,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+        as_undirected=as_undirected,
+        parallel_threshold=parallel_threshold,
+    )
+
+
+@johnson_all_pairs.register(PyGraph)
+@johnson_all_pairs.register(CSRGraph)
+def _graph_johnson_all_pairs(
+    graph, weight_fn=None, default_weight=1.0, parallel_threshold=300
+):
+    return graph_johnson_all_pairs(
+        graph,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+        parallel_threshold=parallel_threshold,
+    )
+
+
 @functools.singledispatch
 def k_shortest_path_lengths(graph, start, k, edge_cost, goal=None):
     """Compute the length of the kth shortest path
@@ -480,7 +1008,10 @@ def _graph_k_shortest_path_lengths(graph, start, k, edge_cost, goal=None):
 def dfs_edges(graph, source):
     """Get edge list in depth first order
 
-    :param PyGraph graph: The graph to get the DFS edge list from
+    :param graph: The graph to get the DFS edge list from. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+        (or a frozen :class:`~retworkx.CSRGraph` or
+        :class:`~retworkx.CSRDiGraph`)
     :param int source: An optional node index to use as the starting node
         for the depth-first search. The edge list will only return edges in
         the components reachable from this index. If this is not specified
@@ -496,11 +1027,13 @@ def dfs_edges(graph, source):
 
 
 @dfs_edges.register(PyDiGraph)
+@dfs_edges.register(CSRDiGraph)
 def _digraph_dfs_edges(graph, source):
     return digraph_dfs_edges(graph, source)
 
 
 @dfs_edges.register(PyGraph)
+@dfs_edges.register(CSRGraph)
 def _graph_dfs_edges(graph, source):
     return graph_dfs_edges(graph, source)
 
@@ -0,0 +1,261 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use pyo3::exceptions::{PyIndexError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+use pyo3::Python;
+
+use ndarray::prelude::*;
+use numpy::{IntoPyArray, PyArray2, PyReadonlyArray1};
+
+/// Number of bytes of output computed between two flushes of an ``out``
+/// array
+const OUT_CHUNK_BYTES: usize = 1 << 26;
+
+/// Convert an int64 numpy array of indices into a ``Vec<usize>``, raising
+/// an ``IndexError`` for any negative entry.
+pub fn indices_from_array(
+    array: &PyReadonlyArray1<i64>,
+) -> PyResult<Vec<usize>> {
+    array
+        .as_array()
+        .iter()
+        .map(|index| {
+            if *index < 0 {
+                Err(PyIndexError::new_err(format!(
+                    "Invalid negative index {}",
+                    index
+                )))
+            } else {
+                Ok(*index as usize)
+            }
+        })
+        .collect()
+}
+
+/// Build the payloads for ``count`` edges from an optional weights object.
+///
+/// ``None`` gives every edge a ``None`` payload. A float64 numpy array is read
+/// directly from its buffer, anything else (an object array or any other
+/// sequence) is iterated and each element is used as the payload.
+pub fn payloads_from_array(
+    py: Python,
+    weights: Option<&PyAny>,
+    count: usize,
+) -> PyResult<Vec<PyObject>> {
+    let weights = match weights {
+        Some(weights) if !weights.is_none() => weights,
+        _ => return Ok((0..count).map(|_| py.None()).collect()),
+    };
+    if let Ok(float_weights) = weights.extract::<PyReadonlyArray1<f64>>() {
+        let array = float_weights.as_array();
+        if array.len() != count {
+            return Err(PyValueError::new_err(format!(
+                "weights has length {} but {} were expected",
+                array.len(),
+                count
+            )));
+        }
+        return Ok(array.iter().map(|weight| weight.to_object(py)).collect());
+    }
+    let length = weights.len()?;
+    if length != count {
+        return Err(PyValueError::new_err(format!(
+            "weights has length {} but {} were expected",
+            length, count
+        )));
+    }
+    let mut out: Vec<PyObject> = Vec::with_capacity(count);
+    for weight in weights.iter()? {
+        out.push(weight?.into());
+    }
+    Ok(out)
+}
+
+/// The name of the numpy dtype described by ``dtype`` (anything accepted by
+/// ``numpy.dtype()``), or ``default`` if it isn't set.
+pub fn dtype_name(
+    py: Python,
+    dtype: Option<&PyAny>,
+    default: &str,
+) -> PyResult<String> {
+    match dtype {
+        Some(dtype) if !dtype.is_none() => py
+            .import("numpy")?
+            .getattr("dtype")?
+            .call1((dtype,))?
+            .getattr("name")?
+            .extract(),
+        _ => Ok(default.to_string()),
+    }
+}
+
+/// Concatenate ``rows`` of ``(column, value)`` pairs into the
+/// ``(indptr, indices, data)`` arrays of a compressed sparse row matrix and
+/// return them as a tuple of numpy arrays. ``indptr`` and ``indices`` are
+/// int64 and ``data`` has the element type of the values.
+pub fn csr_arrays<T: numpy::Element>(
+    py: Python,
+    rows: Vec<Vec<(usize, T)>>,
+) -> PyObject {
+    let nnz: usize = rows.iter().map(|row| row.len()).sum();
+    let mut indptr: Vec<i64> = Vec::with_capacity(rows.len() + 1);
+    let mut indices: Vec<i64> = Vec::with_capacity(nnz);
+    let mut data: Vec<T> = Vec::with_capacity(nnz);
+    indptr.push(0);
+    for row in rows {
+        for (column, value) in row {
+            indices.push(column as i64);
+            data.push(value);
+        }
+        indptr.push(indices.len() as i64);
+    }
+    (
+        indptr.into_pyarray(py),
+        indices.into_pyarray(py),
+        data.into_pyarray(py),
+    )
+        .into_py(py)
+}
+
+fn is_ndarray(py: Python, obj: &PyAny) -> PyResult<bool> {
+    let ndarray = py.import("numpy")?.getattr("ndarray")?;
+    py.import("builtins")?
+        .getattr("isinstance")?
+        .call1((obj, ndarray))?
+        .extract()
+}
+
+/// The dtype name for a function with ``dtype`` and ``out`` arguments:
+/// ``dtype`` if it is set, else the dtype of ``out`` if it is a numpy array,
+/// else ``default``.
+pub fn output_dtype_name(
+    py: Python,
+    dtype: Option<&PyAny>,
+    out: Option<&PyAny>,
+    default: &str,
+) -> PyResult<String> {
+    if let Some(out) = out {
+        if dtype.map_or(true, |dtype| dtype.is_none()) && is_ndarray(py, out)? {
+            return out.getattr("dtype")?.getattr("name")?.extract();
+        }
+    }
+    dtype_name(py, dtype, default)
+}
+
+/// Get the output array of a function with an ``out`` argument.
+///
+/// If ``out`` isn't set a new array of ``shape`` and ``dtype`` is allocated.
+/// A numpy array (such as a ``numpy.memmap``) is used as is and must have
+/// that shape and dtype and be writeable, C contiguous and in native byte
+/// order. Anything else is used as a path to create a new ``.npy`` file in
+/// and map it with ``numpy.lib.format.open_memmap()``.
+pub fn output_array<'p>(
+    py: Python<'p>,
+    out: Option<&'p PyAny>,
+    shape: (usize, usize),
+    dtype: &str,
+) -> PyResult<&'p PyAny> {
+    let out = match out {
+        Some(out) if !out.is_none() => out,
+        _ => return py.import("numpy")?.call_method1("empty", (shape, dtype)),
+    };
+    if !is_ndarray(py, out)? {
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("mode", "w+")?;
+        kwargs.set_item("dtype", dtype)?;
+        kwargs.set_item("shape", shape)?;
+        return py.import("numpy.lib.format")?.call(
+            "open_memmap",
+            (out,),
+            Some(kwargs),
+        );
+    }
+    let out_shape: Vec<usize> = out.getattr("shape")?.extract()?;
+    if out_shape != [shape.0, shape.1] {
+        return Err(PyValueError::new_err(format!(
+            "out has shape {:?} but ({}, {}) was expected",
+            out_shape, shape.0, shape.1
+        )));
+    }
+    let out_dtype: String = out.getattr("dtype")?.getattr("name")?.extract()?;
+    if out_dtype != dtype {
+        return Err(PyValueError::new_err(format!(
+            "out has dtype {} but {} was expected",
+            out_dtype, dtype
+        )));
+    }
+    if !out
+        .getattr("dtype")?
+        .getattr("isnative")?
+        .extract::<bool>()?
+    {
+        return Err(PyValueError::new_err(
+            "out must be an array in native byte order",
+        ));
+    }
+    let flags = out.getattr("flags")?;
+    if !flags.getattr("writeable")?.extract::<bool>()?
+        || !flags.getattr("c_contiguous")?.extract::<bool>()?
+    {
+        return Err(PyValueError::new_err(
+            "out must be a writeable C contiguous array",
+        ));
+    }
+    Ok(out)
+}
+
+/// Fill the rows of ``out``, an array from ``output_array()``, by calling
+/// ``compute(chunk, first)`` without the GIL, where ``chunk`` is the view of
+/// the rows ``first..first + chunk.nrows()``.
+///
+/// If ``chunked`` is set the rows are computed in chunks of about
+/// ``OUT_CHUNK_BYTES`` and ``out`` is flushed after every chunk if it is a
+/// ``numpy.memmap``, so the pages written so far can be dropped from memory
+/// by the OS. Otherwise all the rows are computed at once. Stops and returns
+/// ``false`` as soon as ``compute`` does.
+pub fn fill_rows<T, F>(
+    py: Python,
+    out: &PyAny,
+    chunked: bool,
+    compute: F,
+) -> PyResult<bool>
+where
+    T: numpy::Element + Send,
+    F: Fn(ArrayViewMut2<T>, usize) -> bool + Sync,
+{
+    let array: &PyArray2<T> = out.extract()?;
+    // output_array() checked that the array is writeable and in native byte
+    // order. The view is held while the GIL is released, the docs of ``out``
+    // tell the caller not to touch the array from another thread meanwhile.
+    let mut view = unsafe { array.as_array_mut() };
+    let (nrows, ncols) = view.dim();
+    let chunk_rows = if chunked {
+        OUT_CHUNK_BYTES / (ncols * std::mem::size_of::<T>()).max(1)
+    } else {
+        nrows
+    }
+    .max(1);
+    let flush = out.hasattr("flush")?;
+    for first in (0..nrows).step_by(chunk_rows) {
+        let last = (first + chunk_rows).min(nrows);
+        let chunk = view.slice_mut(s![first..last, ..]);
+        if !py.allow_threads(|| compute(chunk, first)) {
+            return Ok(false);
+        }
+        if flush {
+            out.call_method0("flush")?;
+        }
+    }
+    Ok(true)
+}
@@ -0,0 +1,132 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use pyo3::exceptions::PyRuntimeError;
+use pyo3::gc::{PyGCProtocol, PyVisit};
+use pyo3::prelude::*;
+use pyo3::types::PyType;
+use pyo3::PyTraverseError;
+
+use super::digraph::PyDiGraph;
+use super::topo_order::TopoOrder;
+use super::DAGWouldCycle;
+
+/// A batch of mutations to a :class:`~retworkx.PyDiGraph`
+///
+/// This class is returned by :meth:`retworkx.PyDiGraph.batch` and is used as
+/// a context manager. When the ``with`` block is entered a copy of the
+/// graph is kept and, if the graph has ``check_cycle`` set, checking for
+/// cycles on every new edge is suspended. When the block is exited the graph
+/// is checked for cycles once with a single topological sort. If there is a
+/// cycle the graph is restored to the state it had when the block was
+/// entered and :class:`~retworkx.DAGWouldCycle` is raised. The graph is also
+/// restored if an exception is raised inside the block.
+///
+/// While the block is running the ``check_cycle`` attribute of the graph
+/// reads ``False``.
+///
+/// For example::
+///
+///     import retworkx
+///
+///     dag = retworkx.PyDAG(check_cycle=True)
+///     with dag.batch():
+///         dag.add_nodes_from(range(1000))
+///         dag.add_edges_from_no_data([(i, i + 1) for i in range(999)])
+///
+#[pyclass(module = "retworkx", gc)]
+pub struct DAGBatch {
+    pub graph: Py<PyDiGraph>,
+    pub snapshot: Option<PyDiGraph>,
+}
+
+#[pymethods]
+impl DAGBatch {
+    fn __enter__(&mut self, py: Python) -> PyResult<Py<PyDiGraph>> {
+        if self.snapshot.is_some() {
+            return Err(PyRuntimeError::new_err("The batch is already active"));
+        }
+        let mut graph = self.graph.try_borrow_mut(py)?;
+        self.snapshot = Some(graph.clone());
+        if graph.check_cycle {
+            graph.check_cycle = false;
+            graph.topo_order = TopoOrder::default();
+        }
+        Ok(self.graph.clone_ref(py))
+    }
+
+    fn __exit__(
+        &mut self,
+        py: Python,
+        exc_type: Option<&PyType>,
+        _exc_value: Option<&PyAny>,
+        _traceback: Option<&PyAny>,
+    ) -> PyResult<bool> {
+        let snapshot = match self.snapshot.take() {
+            Some(snapshot) => snapshot,
+            None => {
+                return Err(PyRuntimeError::new_err("The batch is not active"))
+            }
+        };
+        let mut graph = self.graph.try_borrow_mut(py)?;
+        if exc_type.is_some() {
+            restore(&mut graph, snapshot);
+            return Ok(false);
+        }
+        if snapshot.check_cycle {
+            match TopoOrder::from_graph(&graph.graph) {
+                Some(topo_order) => {
+                    graph.topo_order = topo_order;
+                    graph.check_cycle = true;
+                }
+                None => {
+                    restore(&mut graph, snapshot);
+                    return Err(DAGWouldCycle::new_err(
+                        "The batch of mutations would cycle",
+                    ));
+                }
+            }
+        }
+        Ok(false)
+    }
+}
+
+/// Roll ``graph`` back to ``snapshot``. The generation keeps counting up from
+/// the current one, so views created during the batch see the change.
+fn restore(graph: &mut PyDiGraph, snapshot: PyDiGraph) {
+    let generation = graph.generation;
+    *graph = snapshot;
+    graph.generation = generation + 1;
+}
+
+#[pyproto]
+impl PyGCProtocol for DAGBatch {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        visit.call(&self.graph)?;
+        if let Some(snapshot) = &self.snapshot {
+            for node in snapshot.graph.node_indices() {
+                visit.call(&snapshot.graph[node])?;
+            }
+            for edge in snapshot.graph.edge_indices() {
+                visit.call(&snapshot.graph[edge])?;
+            }
+            if let Some(index) = &snapshot.payload_index {
+                index.traverse(&visit)?;
+            }
+        }
+        Ok(())
+    }
+
+    fn __clear__(&mut self) {
+        self.snapshot = None;
+    }
+}
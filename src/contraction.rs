@@ -0,0 +1,213 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+// Shared helpers for contracting sets of nodes into a single node, used by
+// the ``contract_nodes()`` and ``quotient_graph()`` methods of the graph
+// classes.
+
+use std::hash::Hash;
+
+use hashbrown::{HashMap, HashSet};
+
+use pyo3::exceptions::{PyIndexError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyList;
+use pyo3::Python;
+
+use petgraph::graph::NodeIndex;
+use petgraph::stable_graph::StableGraph;
+use petgraph::visit::{EdgeRef, NodeIndexable};
+use petgraph::{Direction, EdgeType};
+
+/// Validate the node indices in ``nodes``, returning them without
+/// duplicates (in their original order) and as a set.
+pub fn contraction_members<Ty: EdgeType>(
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    nodes: &[usize],
+) -> PyResult<(Vec<NodeIndex>, HashSet<NodeIndex>)> {
+    let mut members: Vec<NodeIndex> = Vec::with_capacity(nodes.len());
+    let mut member_set: HashSet<NodeIndex> =
+        HashSet::with_capacity(nodes.len());
+    for node in nodes.iter().map(|index| NodeIndex::new(*index)) {
+        if !graph.contains_node(node) {
+            return Err(PyIndexError::new_err("No node found for index"));
+        }
+        if member_set.insert(node) {
+            members.push(node);
+        }
+    }
+    Ok((members, member_set))
+}
+
+/// Collect the edges between ``members`` and the rest of ``graph`` as
+/// ``((other, outgoing), weight)`` where ``other`` is the endpoint outside
+/// of ``members`` and ``outgoing`` is whether the edge leaves ``members``
+/// (always ``true`` for undirected graphs). Edges between two members are
+/// dropped.
+pub fn boundary_edges<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    members: &[NodeIndex],
+    member_set: &HashSet<NodeIndex>,
+) -> Vec<((NodeIndex, bool), PyObject)> {
+    let mut out: Vec<((NodeIndex, bool), PyObject)> = Vec::new();
+    for node in members {
+        if Ty::is_directed() {
+            for edge in graph.edges_directed(*node, Direction::Outgoing) {
+                if !member_set.contains(&edge.target()) {
+                    out.push((
+                        (edge.target(), true),
+                        edge.weight().clone_ref(py),
+                    ));
+                }
+            }
+            for edge in graph.edges_directed(*node, Direction::Incoming) {
+                if !member_set.contains(&edge.source()) {
+                    out.push((
+                        (edge.source(), false),
+                        edge.weight().clone_ref(py),
+                    ));
+                }
+            }
+        } else {
+            for edge in graph.edges(*node) {
+                let other = if edge.source() == *node {
+                    edge.target()
+                } else {
+                    edge.source()
+                };
+                if !member_set.contains(&other) {
+                    out.push(((other, true), edge.weight().clone_ref(py)));
+                }
+            }
+        }
+    }
+    out
+}
+
+/// Merge the weights of edges with the same key, keeping the position of the
+/// first one. The weights are combined with ``weight_combo_fn`` if it is
+/// set, otherwise the last weight is kept (matching what adding a parallel
+/// edge to a graph with ``multigraph=False`` does).
+pub fn combine_parallel<K: Hash + Eq + Copy>(
+    py: Python,
+    edges: Vec<(K, PyObject)>,
+    weight_combo_fn: &Option<PyObject>,
+) -> PyResult<Vec<(K, PyObject)>> {
+    let mut out: Vec<(K, PyObject)> = Vec::with_capacity(edges.len());
+    let mut seen: HashMap<K, usize> = HashMap::with_capacity(edges.len());
+    for (key, weight) in edges {
+        match seen.get(&key) {
+            Some(pos) => {
+                let merged = match weight_combo_fn {
+                    Some(combo) => {
+                        combo.call1(py, (out[*pos].1.clone_ref(py), weight))?
+                    }
+                    None => weight,
+                };
+                out[*pos].1 = merged;
+            }
+            None => {
+                seen.insert(key, out.len());
+                out.push((key, weight));
+            }
+        }
+    }
+    Ok(out)
+}
+
+/// Build the quotient graph of ``graph`` for ``partition``.
+///
+/// Every block of ``partition`` becomes a single node, in the order of the
+/// blocks, with ``node_fn`` called on the list of payloads of the block as
+/// its payload (or the list itself if ``node_fn`` isn't set). Nodes that
+/// are not in any block follow, in node index order, with their payload
+/// unchanged. Edges between two nodes of the same block are dropped, and if
+/// ``multigraph`` is ``false`` parallel edges are combined with
+/// ``combine_parallel`` (for undirected graphs the endpoints of those edges
+/// are stored in sorted order).
+pub fn quotient<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    partition: Vec<Vec<usize>>,
+    node_fn: &Option<PyObject>,
+    weight_combo_fn: &Option<PyObject>,
+    multigraph: bool,
+) -> PyResult<StableGraph<PyObject, PyObject, Ty>> {
+    let mut out = StableGraph::<PyObject, PyObject, Ty>::with_capacity(
+        graph.node_count(),
+        graph.edge_count(),
+    );
+    // The new node for every node of graph and whether it was contracted
+    let mut new_node: Vec<Option<(NodeIndex, bool)>> =
+        vec![None; graph.node_bound()];
+    for block in partition {
+        if block.is_empty() {
+            return Err(PyValueError::new_err(
+                "Blocks of the partition can not be empty",
+            ));
+        }
+        let mut payloads: Vec<&PyObject> = Vec::with_capacity(block.len());
+        let index = NodeIndex::new(out.node_count());
+        for node in block {
+            match graph.node_weight(NodeIndex::new(node)) {
+                Some(weight) => payloads.push(weight),
+                None => {
+                    return Err(PyIndexError::new_err(
+                        "No node found for index",
+                    ))
+                }
+            }
+            if new_node[node].is_some() {
+                return Err(PyValueError::new_err(format!(
+                    "Node {} appears more than once in the partition",
+                    node
+                )));
+            }
+            new_node[node] = Some((index, true));
+        }
+        let payloads = PyList::new(py, payloads);
+        let payload = match node_fn {
+            Some(node_fn) => node_fn.call1(py, (payloads,))?,
+            None => payloads.into(),
+        };
+        out.add_node(payload);
+    }
+    for node in graph.node_indices() {
+        if new_node[node.index()].is_none() {
+            let index = out.add_node(graph[node].clone_ref(py));
+            new_node[node.index()] = Some((index, false));
+        }
+    }
+    let mut edges: Vec<((NodeIndex, NodeIndex), PyObject)> =
+        Vec::with_capacity(graph.edge_count());
+    for edge in graph.edge_references() {
+        let (source, contracted) = new_node[edge.source().index()].unwrap();
+        let (target, _) = new_node[edge.target().index()].unwrap();
+        if source == target && contracted {
+            continue;
+        }
+        let key = if Ty::is_directed() || multigraph || source <= target {
+            (source, target)
+        } else {
+            (target, source)
+        };
+        edges.push((key, edge.weight().clone_ref(py)));
+    }
+    if !multigraph {
+        edges = combine_parallel(py, edges, weight_combo_fn)?;
+    }
+    for ((source, target), weight) in edges {
+        out.add_edge(source, target, weight);
+    }
+    Ok(out)
+}
@@ -0,0 +1,985 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use std::borrow::Cow;
+use std::iter::{Chain, Enumerate};
+use std::slice;
+
+use fixedbitset::FixedBitSet;
+
+use pyo3::class::PyMappingProtocol;
+use pyo3::exceptions::{PyIndexError, PyTypeError};
+use pyo3::gc::{PyGCProtocol, PyVisit};
+use pyo3::prelude::*;
+use pyo3::PyTraverseError;
+use pyo3::Python;
+
+use numpy::IntoPyArray;
+
+use petgraph::graph::{EdgeIndex, NodeIndex};
+use petgraph::prelude::*;
+use petgraph::stable_graph::StableGraph;
+use petgraph::visit::{
+    GraphBase, GraphProp, GraphRef, IntoEdgeReferences, IntoEdges,
+    IntoNeighbors, IntoNeighborsDirected, IntoNodeIdentifiers, NodeCount,
+    NodeIndexable, Visitable,
+};
+use petgraph::EdgeType;
+
+use super::digraph::PyDiGraph;
+use super::graph::PyGraph;
+use super::iterators::{EdgeList, NodeIndices, WeightedEdgeList};
+use super::NodesRemoved;
+
+/// The rows of a compressed sparse row adjacency structure.
+///
+/// The neighbors of node ``n`` are ``neighbors[offsets[n]..offsets[n + 1]]``
+/// and ``edges`` holds the edge index for each entry of ``neighbors``.
+/// ``offsets`` has an entry for every node slot (including removed nodes,
+/// which have an empty row) so the original node indices are preserved.
+#[derive(Clone, Default)]
+pub struct Adjacency {
+    pub offsets: Vec<usize>,
+    pub neighbors: Vec<usize>,
+    pub edges: Vec<usize>,
+}
+
+impl Adjacency {
+    /// Build the rows from ``graph.edges_directed()`` so the neighbor order
+    /// of each row matches the order of the source graph.
+    pub fn from_graph<Ty: EdgeType>(
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+        dir: petgraph::Direction,
+    ) -> Self {
+        let node_bound = graph.node_bound();
+        let entry_count = if Ty::is_directed() {
+            graph.edge_count()
+        } else {
+            2 * graph.edge_count()
+        };
+        let mut offsets: Vec<usize> = Vec::with_capacity(node_bound + 1);
+        let mut neighbors: Vec<usize> = Vec::with_capacity(entry_count);
+        let mut edges: Vec<usize> = Vec::with_capacity(entry_count);
+        offsets.push(0);
+        for index in 0..node_bound {
+            let node = NodeIndex::new(index);
+            if graph.node_weight(node).is_some() {
+                for edge in graph.edges_directed(node, dir) {
+                    let other = if edge.source() == node {
+                        edge.target()
+                    } else {
+                        edge.source()
+                    };
+                    neighbors.push(other.index());
+                    edges.push(edge.id().index());
+                }
+            }
+            offsets.push(neighbors.len());
+        }
+        Adjacency {
+            offsets,
+            neighbors,
+            edges,
+        }
+    }
+
+    #[inline]
+    pub fn row(&self, node: usize) -> &[usize] {
+        if node + 1 >= self.offsets.len() {
+            return &[];
+        }
+        &self.neighbors[self.offsets[node]..self.offsets[node + 1]]
+    }
+
+    #[inline]
+    pub fn row_edges(&self, node: usize) -> &[usize] {
+        if node + 1 >= self.offsets.len() {
+            return &[];
+        }
+        &self.edges[self.offsets[node]..self.offsets[node + 1]]
+    }
+
+    fn to_arrays(&self, py: Python) -> (PyObject, PyObject, PyObject) {
+        let to_array = |values: &[usize]| -> PyObject {
+            let out: Vec<i64> = values.iter().map(|x| *x as i64).collect();
+            out.into_pyarray(py).into()
+        };
+        (
+            to_array(&self.offsets),
+            to_array(&self.neighbors),
+            to_array(&self.edges),
+        )
+    }
+}
+
+/// The node and edge payloads of a frozen graph indexed by the original
+/// node and edge indices. Removed nodes and edges are ``None``.
+#[derive(Clone, Default)]
+pub struct Payloads {
+    pub nodes: Vec<Option<PyObject>>,
+    pub edges: Vec<Option<(usize, usize, PyObject)>>,
+    pub node_count: usize,
+    pub edge_count: usize,
+}
+
+impl Payloads {
+    fn from_graph<Ty: EdgeType>(
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+    ) -> Self {
+        let nodes: Vec<Option<PyObject>> = (0..graph.node_bound())
+            .map(|index| {
+                graph
+                    .node_weight(NodeIndex::new(index))
+                    .map(|weight| weight.clone_ref(py))
+            })
+            .collect();
+        let edge_bound = graph
+            .edge_indices()
+            .map(|edge| edge.index() + 1)
+            .max()
+            .unwrap_or(0);
+        let mut edges: Vec<Option<(usize, usize, PyObject)>> =
+            (0..edge_bound).map(|_| None).collect();
+        for edge in graph.edge_references() {
+            edges[edge.id().index()] = Some((
+                edge.source().index(),
+                edge.target().index(),
+                edge.weight().clone_ref(py),
+            ));
+        }
+        Payloads {
+            nodes,
+            edges,
+            node_count: graph.node_count(),
+            edge_count: graph.edge_count(),
+        }
+    }
+
+    fn node_indexes(&self) -> NodeIndices {
+        NodeIndices {
+            nodes: self.node_indices().map(|node| node.index()).collect(),
+        }
+    }
+
+    pub fn node_indices(&self) -> NodeIdentifiers {
+        NodeIdentifiers {
+            iter: self.nodes.iter().enumerate(),
+        }
+    }
+
+    pub fn has_node(&self, node: usize) -> bool {
+        self.nodes.get(node).map_or(false, |node| node.is_some())
+    }
+
+    fn get_node_data(&self, node: usize) -> PyResult<&PyObject> {
+        match self.nodes.get(node) {
+            Some(Some(weight)) => Ok(weight),
+            _ => Err(PyIndexError::new_err("No node found for index")),
+        }
+    }
+
+    fn edge_list(&self) -> EdgeList {
+        EdgeList {
+            edges: self
+                .edges
+                .iter()
+                .filter_map(|edge| edge.as_ref().map(|(s, t, _)| (*s, *t)))
+                .collect(),
+        }
+    }
+
+    fn weighted_edge_list(&self, py: Python) -> WeightedEdgeList {
+        WeightedEdgeList {
+            edges: self
+                .edges
+                .iter()
+                .filter_map(|edge| {
+                    edge.as_ref().map(|(s, t, w)| (*s, *t, w.clone_ref(py)))
+                })
+                .collect(),
+        }
+    }
+
+    fn traverse(&self, visit: &PyVisit) -> Result<(), PyTraverseError> {
+        for node in self.nodes.iter().flatten() {
+            visit.call(node)?;
+        }
+        for (_, _, weight) in self.edges.iter().flatten() {
+            visit.call(weight)?;
+        }
+        Ok(())
+    }
+}
+
+/// A graph the compressed sparse row kernels can run on. The rows of a
+/// frozen graph are borrowed, the rows of a ``StableGraph`` are built on
+/// every call.
+pub trait AsAdjacency<'a>: Copy {
+    /// The rows of the edges in direction ``dir``, for an undirected graph
+    /// both directions have every edge of a node.
+    fn adjacency(self, dir: petgraph::Direction) -> Cow<'a, Adjacency>;
+
+    /// Whether there is a node at index ``node``
+    fn has_node(self, node: usize) -> bool;
+}
+
+impl<'a, Ty: EdgeType> AsAdjacency<'a>
+    for &'a StableGraph<PyObject, PyObject, Ty>
+{
+    fn adjacency(self, dir: petgraph::Direction) -> Cow<'a, Adjacency> {
+        Cow::Owned(Adjacency::from_graph(self, dir))
+    }
+
+    fn has_node(self, node: usize) -> bool {
+        StableGraph::contains_node(self, NodeIndex::new(node))
+    }
+}
+
+impl<'a> AsAdjacency<'a> for &'a CSRDiGraph {
+    fn adjacency(self, dir: petgraph::Direction) -> Cow<'a, Adjacency> {
+        match dir {
+            petgraph::Direction::Outgoing => Cow::Borrowed(&self.out_adj),
+            petgraph::Direction::Incoming => Cow::Borrowed(&self.in_adj),
+        }
+    }
+
+    fn has_node(self, node: usize) -> bool {
+        self.payloads.has_node(node)
+    }
+}
+
+impl<'a> AsAdjacency<'a> for &'a CSRGraph {
+    fn adjacency(self, _dir: petgraph::Direction) -> Cow<'a, Adjacency> {
+        Cow::Borrowed(&self.out_adj)
+    }
+
+    fn has_node(self, node: usize) -> bool {
+        self.payloads.has_node(node)
+    }
+}
+
+/// Iterator over the node indices of a frozen graph
+pub struct NodeIdentifiers<'a> {
+    iter: Enumerate<slice::Iter<'a, Option<PyObject>>>,
+}
+
+impl<'a> Iterator for NodeIdentifiers<'a> {
+    type Item = NodeIndex;
+    fn next(&mut self) -> Option<NodeIndex> {
+        for (index, node) in &mut self.iter {
+            if node.is_some() {
+                return Some(NodeIndex::new(index));
+            }
+        }
+        None
+    }
+}
+
+/// Iterator over a row of a frozen graph
+pub struct Neighbors<'a> {
+    iter: slice::Iter<'a, usize>,
+}
+
+impl<'a> Iterator for Neighbors<'a> {
+    type Item = NodeIndex;
+    #[inline]
+    fn next(&mut self) -> Option<NodeIndex> {
+        self.iter.next().map(|node| NodeIndex::new(*node))
+    }
+
+    fn size_hint(&self) -> (usize, Option<usize>) {
+        self.iter.size_hint()
+    }
+}
+
+/// A reference to an edge of a frozen graph, ``source`` is always the node
+/// the edge was reached from.
+#[derive(Clone, Copy)]
+pub struct FrozenEdgeReference<'a> {
+    source: NodeIndex,
+    target: NodeIndex,
+    id: EdgeIndex,
+    weight: &'a PyObject,
+}
+
+impl<'a> EdgeRef for FrozenEdgeReference<'a> {
+    type NodeId = NodeIndex;
+    type EdgeId = EdgeIndex;
+    type Weight = PyObject;
+
+    fn source(&self) -> NodeIndex {
+        self.source
+    }
+    fn target(&self) -> NodeIndex {
+        self.target
+    }
+    fn weight(&self) -> &PyObject {
+        self.weight
+    }
+    fn id(&self) -> EdgeIndex {
+        self.id
+    }
+}
+
+/// Iterator over the edges of a row of a frozen graph
+pub struct Edges<'a> {
+    source: NodeIndex,
+    neighbors: slice::Iter<'a, usize>,
+    edges: slice::Iter<'a, usize>,
+    payloads: &'a [Option<(usize, usize, PyObject)>],
+}
+
+impl<'a> Iterator for Edges<'a> {
+    type Item = FrozenEdgeReference<'a>;
+    #[inline]
+    fn next(&mut self) -> Option<FrozenEdgeReference<'a>> {
+        let target = self.neighbors.next()?;
+        let edge = *self.edges.next()?;
+        let payloads: &'a [Option<(usize, usize, PyObject)>] = self.payloads;
+        Some(FrozenEdgeReference {
+            source: self.source,
+            target: NodeIndex::new(*target),
+            id: EdgeIndex::new(edge),
+            weight: &payloads[edge].as_ref().unwrap().2,
+        })
+    }
+}
+
+/// Iterator over all the edges of a frozen graph
+pub struct EdgeReferences<'a> {
+    iter: Enumerate<slice::Iter<'a, Option<(usize, usize, PyObject)>>>,
+}
+
+impl<'a> Iterator for EdgeReferences<'a> {
+    type Item = FrozenEdgeReference<'a>;
+    fn next(&mut self) -> Option<FrozenEdgeReference<'a>> {
+        for (index, edge) in &mut self.iter {
+            if let Some((source, target, weight)) = edge {
+                return Some(FrozenEdgeReference {
+                    source: NodeIndex::new(*source),
+                    target: NodeIndex::new(*target),
+                    id: EdgeIndex::new(index),
+                    weight,
+                });
+            }
+        }
+        None
+    }
+}
+
+macro_rules! frozen_graph_traits {
+    ($name:ident, $edge_type:ty) => {
+        impl GraphBase for $name {
+            type NodeId = NodeIndex;
+            type EdgeId = EdgeIndex;
+        }
+
+        impl<'a> NodesRemoved for &'a $name {
+            fn nodes_removed(&self) -> bool {
+                self.payloads.node_count != self.payloads.nodes.len()
+            }
+        }
+
+        impl NodeCount for $name {
+            fn node_count(&self) -> usize {
+                self.payloads.node_count
+            }
+        }
+
+        impl GraphProp for $name {
+            type EdgeType = $edge_type;
+        }
+
+        impl Visitable for $name {
+            type Map = FixedBitSet;
+            fn visit_map(&self) -> FixedBitSet {
+                FixedBitSet::with_capacity(self.payloads.nodes.len())
+            }
+            fn reset_map(&self, map: &mut FixedBitSet) {
+                map.clear();
+                map.grow(self.payloads.nodes.len());
+            }
+        }
+
+        impl petgraph::visit::Data for $name {
+            type NodeWeight = PyObject;
+            type EdgeWeight = PyObject;
+        }
+
+        impl NodeIndexable for $name {
+            fn node_bound(&self) -> usize {
+                self.payloads.nodes.len()
+            }
+            fn to_index(&self, ix: NodeIndex) -> usize {
+                ix.index()
+            }
+            fn from_index(&self, ix: usize) -> Self::NodeId {
+                NodeIndex::new(ix)
+            }
+        }
+
+        impl<'a> IntoNodeIdentifiers for &'a $name {
+            type NodeIdentifiers = NodeIdentifiers<'a>;
+            fn node_identifiers(self) -> Self::NodeIdentifiers {
+                self.payloads.node_indices()
+            }
+        }
+
+        impl<'a> IntoNeighbors for &'a $name {
+            type Neighbors = Neighbors<'a>;
+            fn neighbors(self, n: NodeIndex) -> Self::Neighbors {
+                Neighbors {
+                    iter: self.out_adj.row(n.index()).iter(),
+                }
+            }
+        }
+
+        impl<'a> IntoEdgeReferences for &'a $name {
+            type EdgeRef = FrozenEdgeReference<'a>;
+            type EdgeReferences = EdgeReferences<'a>;
+            fn edge_references(self) -> Self::EdgeReferences {
+                EdgeReferences {
+                    iter: self.payloads.edges.iter().enumerate(),
+                }
+            }
+        }
+
+        impl<'a> IntoEdges for &'a $name {
+            type Edges = Edges<'a>;
+            fn edges(self, a: NodeIndex) -> Self::Edges {
+                Edges {
+                    source: a,
+                    neighbors: self.out_adj.row(a.index()).iter(),
+                    edges: self.out_adj.row_edges(a.index()).iter(),
+                    payloads: &self.payloads.edges,
+                }
+            }
+        }
+    };
+}
+
+/// A read-only directed graph stored in compressed sparse row (CSR) form
+///
+/// A ``CSRDiGraph`` is created by calling :meth:`PyDiGraph.freeze` and is a
+/// snapshot of the graph at that point: later changes to the source graph
+/// are not reflected in it. The adjacency of every node is stored as a
+/// contiguous slice of an array (for both the outgoing and incoming
+/// direction) which makes repeated traversals of the same graph
+/// significantly faster than on a :class:`~retworkx.PyDiGraph`. Node and edge
+/// indices are the same as in the source graph and the node and edge
+/// weights/data payloads are shared with it (not copied).
+///
+/// The traversal, shortest path, component and topological sort functions
+/// for directed graphs, such as :func:`~retworkx.dfs_edges`,
+/// :func:`~retworkx.dijkstra_shortest_paths`,
+/// :func:`~retworkx.distance_matrix`,
+/// :func:`~retworkx.strongly_connected_components` and
+/// :func:`~retworkx.topological_sort`, accept a ``CSRDiGraph`` in place of a
+/// :class:`~retworkx.PyDiGraph`.
+#[pyclass(module = "retworkx", gc)]
+#[derive(Clone)]
+pub struct CSRDiGraph {
+    pub payloads: Payloads,
+    pub out_adj: Adjacency,
+    pub in_adj: Adjacency,
+}
+
+frozen_graph_traits!(CSRDiGraph, petgraph::Directed);
+
+impl<'a> IntoNeighborsDirected for &'a CSRDiGraph {
+    type NeighborsDirected = Neighbors<'a>;
+    fn neighbors_directed(
+        self,
+        n: NodeIndex,
+        d: petgraph::Direction,
+    ) -> Self::NeighborsDirected {
+        let adj = match d {
+            petgraph::Direction::Outgoing => &self.out_adj,
+            petgraph::Direction::Incoming => &self.in_adj,
+        };
+        Neighbors {
+            iter: adj.row(n.index()).iter(),
+        }
+    }
+}
+
+impl CSRDiGraph {
+    pub fn from_graph(
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, petgraph::Directed>,
+    ) -> Self {
+        CSRDiGraph {
+            payloads: Payloads::from_graph(py, graph),
+            out_adj: Adjacency::from_graph(
+                graph,
+                petgraph::Direction::Outgoing,
+            ),
+            in_adj: Adjacency::from_graph(graph, petgraph::Direction::Incoming),
+        }
+    }
+}
+
+/// A view of a frozen directed graph that follows every edge in both
+/// directions, used for the ``as_undirected`` option of the traversal
+/// functions. The edges of a node are its outgoing row followed by its
+/// incoming row so no adjacency is copied.
+#[derive(Clone, Copy)]
+pub struct Undirected<'a> {
+    graph: &'a CSRDiGraph,
+}
+
+impl<'a> Undirected<'a> {
+    pub fn new(graph: &'a CSRDiGraph) -> Self {
+        Undirected { graph }
+    }
+
+    fn row_edges(self, adj: &'a Adjacency, a: NodeIndex) -> Edges<'a> {
+        Edges {
+            source: a,
+            neighbors: adj.row(a.index()).iter(),
+            edges: adj.row_edges(a.index()).iter(),
+            payloads: &self.graph.payloads.edges,
+        }
+    }
+}
+
+impl<'a> GraphBase for Undirected<'a> {
+    type NodeId = NodeIndex;
+    type EdgeId = EdgeIndex;
+}
+
+impl<'a> GraphRef for Undirected<'a> {}
+
+impl<'a> petgraph::visit::Data for Undirected<'a> {
+    type NodeWeight = PyObject;
+    type EdgeWeight = PyObject;
+}
+
+impl<'a> Visitable for Undirected<'a> {
+    type Map = FixedBitSet;
+    fn visit_map(&self) -> FixedBitSet {
+        self.graph.visit_map()
+    }
+    fn reset_map(&self, map: &mut FixedBitSet) {
+        self.graph.reset_map(map)
+    }
+}
+
+impl<'a> IntoNeighbors for Undirected<'a> {
+    type Neighbors = Chain<Neighbors<'a>, Neighbors<'a>>;
+    fn neighbors(self, n: NodeIndex) -> Self::Neighbors {
+        Neighbors {
+            iter: self.graph.out_adj.row(n.index()).iter(),
+        }
+        .chain(Neighbors {
+            iter: self.graph.in_adj.row(n.index()).iter(),
+        })
+    }
+}
+
+impl<'a> IntoEdgeReferences for Undirected<'a> {
+    type EdgeRef = FrozenEdgeReference<'a>;
+    type EdgeReferences = EdgeReferences<'a>;
+    fn edge_references(self) -> Self::EdgeReferences {
+        self.graph.edge_references()
+    }
+}
+
+impl<'a> IntoEdges for Undirected<'a> {
+    type Edges = Chain<Edges<'a>, Edges<'a>>;
+    fn edges(self, a: NodeIndex) -> Self::Edges {
+        self.row_edges(&self.graph.out_adj, a)
+            .chain(self.row_edges(&self.graph.in_adj, a))
+    }
+}
+
+#[pymethods]
+impl CSRDiGraph {
+    /// Return a list of the indices of all the nodes in the graph
+    ///
+    /// :returns: A list of the node indices
+    /// :rtype: NodeIndices
+    #[text_signature = "(self)"]
+    pub fn node_indexes(&self) -> NodeIndices {
+        self.payloads.node_indexes()
+    }
+
+    /// Return a list of all node data.
+    ///
+    /// :returns: A list of all the node data objects in the graph
+    /// :rtype: list
+    #[text_signature = "(self)"]
+    pub fn nodes(&self) -> Vec<&PyObject> {
+        self.payloads.nodes.iter().flatten().collect()
+    }
+
+    /// Return a list of all edge data.
+    ///
+    /// :returns: A list of all the edge data objects in the graph
+    /// :rtype: list
+    #[text_signature = "(self)"]
+    pub fn edges(&self) -> Vec<&PyObject> {
+        self.payloads.edges.iter().flatten().map(|e| &e.2).collect()
+    }
+
+    /// Get edge list
+    ///
+    /// :returns: An edge list of the form ``(source, target)``
+    /// :rtype: EdgeList
+    #[text_signature = "(self)"]
+    pub fn edge_list(&self) -> EdgeList {
+        self.payloads.edge_list()
+    }
+
+    /// Get edge list with weights
+    ///
+    /// :returns: An edge list of the form ``(source, target, weight)``
+    /// :rtype: WeightedEdgeList
+    #[text_signature = "(self)"]
+    pub fn weighted_edge_list(&self, py: Python) -> WeightedEdgeList {
+        self.payloads.weighted_edge_list(py)
+    }
+
+    /// Return the node data for a given node index
+    ///
+    /// :param int node: The index for the node
+    ///
+    /// :returns: The data object set for that node
+    /// :raises IndexError: when an invalid node index is provided
+    #[text_signature = "(self, node, /)"]
+    pub fn get_node_data(&self, node: usize) -> PyResult<&PyObject> {
+        self.payloads.get_node_data(node)
+    }
+
+    /// Return True if there is an edge from node_a to node_b.
+    ///
+    /// :param int node_a: The source node index to check for an edge
+    /// :param int node_b: The destination node index to check for an edge
+    ///
+    /// :returns: True if there is an edge false if there is no edge
+    /// :rtype: bool
+    #[text_signature = "(self, node_a, node_b, /)"]
+    pub fn has_edge(&self, node_a: usize, node_b: usize) -> bool {
+        self.out_adj.row(node_a).contains(&node_b)
+    }
+
+    /// Return the indices of the successors of a node
+    ///
+    /// :param int node: The node index to get the successors of
+    ///
+    /// :returns: A list of the node indices of the successors
+    /// :rtype: NodeIndices
+    #[text_signature = "(self, node, /)"]
+    pub fn successor_indices(&self, node: usize) -> NodeIndices {
+        NodeIndices {
+            nodes: self.out_adj.row(node).to_vec(),
+        }
+    }
+
+    /// Return the indices of the predecessors of a node
+    ///
+    /// :param int node: The node index to get the predecessors of
+    ///
+    /// :returns: A list of the node indices of the predecessors
+    /// :rtype: NodeIndices
+    #[text_signature = "(self, node, /)"]
+    pub fn predecessor_indices(&self, node: usize) -> NodeIndices {
+        NodeIndices {
+            nodes: self.in_adj.row(node).to_vec(),
+        }
+    }
+
+    /// Get the degree of a node for inbound edges.
+    ///
+    /// :param int node: The index of the node to find the inbound degree of
+    ///
+    /// :returns: The inbound degree for the specified node
+    /// :rtype: int
+    #[text_signature = "(self, node, /)"]
+    pub fn in_degree(&self, node: usize) -> usize {
+        self.in_adj.row(node).len()
+    }
+
+    /// Get the degree of a node for outbound edges.
+    ///
+    /// :param int node: The index of the node to find the outbound degree of
+    ///
+    /// :returns: The outbound degree for the specified node
+    /// :rtype: int
+    #[text_signature = "(self, node, /)"]
+    pub fn out_degree(&self, node: usize) -> usize {
+        self.out_adj.row(node).len()
+    }
+
+    /// Return the arrays of the outgoing compressed sparse row adjacency
+    ///
+    /// The successors of node ``n`` are
+    /// ``indices[indptr[n]:indptr[n + 1]]`` and the edge indices of those
+    /// edges are ``edge_ids[indptr[n]:indptr[n + 1]]``.
+    ///
+    /// :returns: A tuple of 1 dimensional ``np.int64`` arrays of the form
+    ///     ``(indptr, indices, edge_ids)``
+    /// :rtype: tuple
+    #[text_signature = "(self)"]
+    pub fn csr_arrays(&self, py: Python) -> (PyObject, PyObject, PyObject) {
+        self.out_adj.to_arrays(py)
+    }
+}
+
+#[pyproto]
+impl PyMappingProtocol for CSRDiGraph {
+    fn __len__(&self) -> PyResult<usize> {
+        Ok(self.payloads.node_count)
+    }
+
+    fn __getitem__(&'p self, idx: usize) -> PyResult<&'p PyObject> {
+        self.payloads.get_node_data(idx)
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for CSRDiGraph {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        self.payloads.traverse(&visit)
+    }
+
+    fn __clear__(&mut self) {
+        self.payloads = Payloads::default();
+        self.out_adj = Adjacency::default();
+        self.in_adj = Adjacency::default();
+    }
+}
+
+/// A read-only undirected graph stored in compressed sparse row (CSR) form
+///
+/// A ``CSRGraph`` is created by calling :meth:`PyGraph.freeze` and is a
+/// snapshot of the graph at that point: later changes to the source graph
+/// are not reflected in it. The neighbors of every node are stored as a
+/// contiguous slice of an array which makes repeated traversals of the same
+/// graph significantly faster than on a :class:`~retworkx.PyGraph`. Node and
+/// edge indices are the same as in the source graph and the node and edge
+/// weights/data payloads are shared with it (not copied).
+///
+/// The traversal, shortest path and component functions for undirected
+/// graphs, such as :func:`~retworkx.dfs_edges`,
+/// :func:`~retworkx.dijkstra_shortest_paths`,
+/// :func:`~retworkx.distance_matrix` and
+/// :func:`~retworkx.connected_components`, accept a ``CSRGraph`` in place of
+/// a :class:`~retworkx.PyGraph`.
+#[pyclass(module = "retworkx", gc)]
+#[derive(Clone)]
+pub struct CSRGraph {
+    pub payloads: Payloads,
+    pub out_adj: Adjacency,
+}
+
+frozen_graph_traits!(CSRGraph, petgraph::Undirected);
+
+impl<'a> IntoNeighborsDirected for &'a CSRGraph {
+    type NeighborsDirected = Neighbors<'a>;
+    fn neighbors_directed(
+        self,
+        n: NodeIndex,
+        _d: petgraph::Direction,
+    ) -> Self::NeighborsDirected {
+        Neighbors {
+            iter: self.out_adj.row(n.index()).iter(),
+        }
+    }
+}
+
+impl CSRGraph {
+    pub fn from_graph(
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, petgraph::Undirected>,
+    ) -> Self {
+        CSRGraph {
+            payloads: Payloads::from_graph(py, graph),
+            out_adj: Adjacency::from_graph(
+                graph,
+                petgraph::Direction::Outgoing,
+            ),
+        }
+    }
+}
+
+#[pymethods]
+impl CSRGraph {
+    /// Return a list of the indices of all the nodes in the graph
+    ///
+    /// :returns: A list of the node indices
+    /// :rtype: NodeIndices
+    #[text_signature = "(self)"]
+    pub fn node_indexes(&self) -> NodeIndices {
+        self.payloads.node_indexes()
+    }
+
+    /// Return a list of all node data.
+    ///
+    /// :returns: A list of all the node data objects in the graph
+    /// :rtype: list
+    #[text_signature = "(self)"]
+    pub fn nodes(&self) -> Vec<&PyObject> {
+        self.payloads.nodes.iter().flatten().collect()
+    }
+
+    /// Return a list of all edge data.
+    ///
+    /// :returns: A list of all the edge data objects in the graph
+    /// :rtype: list
+    #[text_signature = "(self)"]
+    pub fn edges(&self) -> Vec<&PyObject> {
+        self.payloads.edges.iter().flatten().map(|e| &e.2).collect()
+    }
+
+    /// Get edge list
+    ///
+    /// :returns: An edge list of the form ``(node_a, node_b)``
+    /// :rtype: EdgeList
+    #[text_signature = "(self)"]
+    pub fn edge_list(&self) -> EdgeList {
+        self.payloads.edge_list()
+    }
+
+    /// Get edge list with weights
+    ///
+    /// :returns: An edge list of the form ``(node_a, node_b, weight)``
+    /// :rtype: WeightedEdgeList
+    #[text_signature = "(self)"]
+    pub fn weighted_edge_list(&self, py: Python) -> WeightedEdgeList {
+        self.payloads.weighted_edge_list(py)
+    }
+
+    /// Return the node data for a given node index
+    ///
+    /// :param int node: The index for the node
+    ///
+    /// :returns: The data object set for that node
+    /// :raises IndexError: when an invalid node index is provided
+    #[text_signature = "(self, node, /)"]
+    pub fn get_node_data(&self, node: usize) -> PyResult<&PyObject> {
+        self.payloads.get_node_data(node)
+    }
+
+    /// Return True if there is an edge between node_a to node_b.
+    ///
+    /// :param int node_a: The node index to check for an edge between
+    /// :param int node_b: The node index to check for an edge between
+    ///
+    /// :returns: True if there is an edge false if there is no edge
+    /// :rtype: bool
+    #[text_signature = "(self, node_a, node_b, /)"]
+    pub fn has_edge(&self, node_a: usize, node_b: usize) -> bool {
+        self.out_adj.row(node_a).contains(&node_b)
+    }
+
+    /// Return the indices of the neighbors of a node
+    ///
+    /// :param int node: The node index to get the neighbors of
+    ///
+    /// :returns: A list of the node indices of the neighbors
+    /// :rtype: NodeIndices
+    #[text_signature = "(self, node, /)"]
+    pub fn neighbors(&self, node: usize) -> NodeIndices {
+        NodeIndices {
+            nodes: self.out_adj.row(node).to_vec(),
+        }
+    }
+
+    /// Get the degree for a node
+    ///
+    /// :param int node: The index of the node to find the degree of
+    ///
+    /// :returns: The degree of the node
+    /// :rtype: int
+    #[text_signature = "(self, node, /)"]
+    pub fn degree(&self, node: usize) -> usize {
+        self.out_adj.row(node).len()
+    }
+
+    /// Return the arrays of the compressed sparse row adjacency
+    ///
+    /// The neighbors of node ``n`` are
+    /// ``indices[indptr[n]:indptr[n + 1]]`` and the edge indices of those
+    /// edges are ``edge_ids[indptr[n]:indptr[n + 1]]``. Every edge is stored
+    /// in the row of both of its endpoints.
+    ///
+    /// :returns: A tuple of 1 dimensional ``np.int64`` arrays of the form
+    ///     ``(indptr, indices, edge_ids)``
+    /// :rtype: tuple
+    #[text_signature = "(self)"]
+    pub fn csr_arrays(&self, py: Python) -> (PyObject, PyObject, PyObject) {
+        self.out_adj.to_arrays(py)
+    }
+}
+
+#[pyproto]
+impl PyMappingProtocol for CSRGraph {
+    fn __len__(&self) -> PyResult<usize> {
+        Ok(self.payloads.node_count)
+    }
+
+    fn __getitem__(&'p self, idx: usize) -> PyResult<&'p PyObject> {
+        self.payloads.get_node_data(idx)
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for CSRGraph {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        self.payloads.traverse(&visit)
+    }
+
+    fn __clear__(&mut self) {
+        self.payloads = Payloads::default();
+        self.out_adj = Adjacency::default();
+    }
+}
+
+/// A directed graph argument, either a :class:`~retworkx.PyDiGraph` or a
+/// frozen :class:`~retworkx.CSRDiGraph`, for the functions that run on both.
+pub enum AnyDiGraph<'a> {
+    Graph(PyRef<'a, PyDiGraph>),
+    Frozen(PyRef<'a, CSRDiGraph>),
+}
+
+impl<'a> FromPyObject<'a> for AnyDiGraph<'a> {
+    fn extract(ob: &'a PyAny) -> PyResult<Self> {
+        if let Ok(graph) = ob.downcast::<PyCell<PyDiGraph>>() {
+            return Ok(AnyDiGraph::Graph(graph.try_borrow()?));
+        }
+        if let Ok(graph) = ob.downcast::<PyCell<CSRDiGraph>>() {
+            return Ok(AnyDiGraph::Frozen(graph.try_borrow()?));
+        }
+        Err(PyTypeError::new_err("Expected a PyDiGraph or CSRDiGraph"))
+    }
+}
+
+/// An undirected graph argument, either a :class:`~retworkx.PyGraph` or a
+/// frozen :class:`~retworkx.CSRGraph`, for the functions that run on both.
+pub enum AnyGraph<'a> {
+    Graph(PyRef<'a, PyGraph>),
+    Frozen(PyRef<'a, CSRGraph>),
+}
+
+impl<'a> FromPyObject<'a> for AnyGraph<'a> {
+    fn extract(ob: &'a PyAny) -> PyResult<Self> {
+        if let Ok(graph) = ob.downcast::<PyCell<PyGraph>>() {
+            return Ok(AnyGraph::Graph(graph.try_borrow()?));
+        }
+        if let Ok(graph) = ob.downcast::<PyCell<CSRGraph>>() {
+            return Ok(AnyGraph::Frozen(graph.try_borrow()?));
+        }
+        Err(PyTypeError::new_err("Expected a PyGraph or CSRGraph"))
+    }
+}
@@ -16,13 +16,14 @@ use std::collections::BTreeMap;
 use std::fs::File;
 use std::io::prelude::*;
 use std::io::BufReader;
+use std::mem::size_of;
 use std::ops::{Index, IndexMut};
 use std::str;
 
 use hashbrown::{HashMap, HashSet};
 
 use pyo3::class::PyMappingProtocol;
-use pyo3::exceptions::PyIndexError;
+use pyo3::exceptions::{PyIndexError, PyValueError};
 use pyo3::gc::{PyGCProtocol, PyVisit};
 use pyo3::prelude::*;
 use pyo3::types::{PyBool, PyDict, PyList, PyLong, PyString, PyTuple};
@@ -30,7 +31,7 @@ use pyo3::PyTraverseError;
 use pyo3::Python;
 
 use ndarray::prelude::*;
-use numpy::PyReadonlyArray2;
+use numpy::{IntoPyArray, PyReadonlyArray1, PyReadonlyArray2};
 
 use petgraph::algo;
 use petgraph::graph::{EdgeIndex, NodeIndex};
@@ -45,11 +46,23 @@ use petgraph::visit::{
     NodeFiltered, NodeIndexable, Visitable,
 };
 
+use super::array_utils::{indices_from_array, payloads_from_array};
+use super::batch::DAGBatch;
+use super::contraction::{
+    boundary_edges, combine_parallel, contraction_members, quotient,
+};
+use super::csr::CSRDiGraph;
 use super::dot_utils::build_dot;
+use super::edge_map::{edge_map_for, EdgeMap};
 use super::iterators::{EdgeList, NodeIndices, WeightedEdgeList};
+use super::memory::{graph_slots, payload_bytes};
+use super::payload_index::PayloadIndex;
+use super::pickle_state::{pack_state, unpack_state};
+use super::topo_order::TopoOrder;
+use super::views::{AdjView, EdgeView, NodeView, ViewGraph};
 use super::{
-    is_directed_acyclic_graph, DAGHasCycle, DAGWouldCycle, NoEdgeBetweenNodes,
-    NoSuitableNeighbors, NodesRemoved,
+    DAGHasCycle, DAGWouldCycle, NoEdgeBetweenNodes, NoSuitableNeighbors,
+    NodesRemoved,
 };
 
 /// A class for creating directed graphs
@@ -107,21 +120,43 @@ use super::{
 /// :meth:`~PyDiGraph.add_edges_from_no_data`,
 /// :meth:`~PyDiGraph.extend_from_edge_list`,  and
 /// :meth:`~PyDiGraph.extend_from_weighted_edge_list` comes with a performance
-/// penalty that grows as the graph does. If you're adding a node and edge at
-/// the same time leveraging :meth:`PyDiGraph.add_child` or
-/// :meth:`PyDiGraph.add_parent` will avoid this overhead.
+/// penalty. A topological order of the graph is maintained while cycle
+/// checking is enabled, an edge that agrees with that order is added in
+/// constant time while any other edge only visits the nodes between its
+/// endpoints in the order. If you're adding a node and edge at the same time
+/// leveraging :meth:`PyDiGraph.add_child` or :meth:`PyDiGraph.add_parent`
+/// will avoid this overhead. The maintained order is also what
+/// :func:`~retworkx.topological_sort` returns for the graph.
+///
+/// :param bool check_cycle: When this is set to ``True`` the created
+///     PyDiGraph has runtime cycle detection enabled.
+/// :param bool multigraph: When this is set to ``False`` the created
+///     PyDiGraph object will not be a multigraph. When ``False`` if parallel
+///     edges are added the weight/weight from that method call will be used
+///     to update the existing edge in place. A non-multigraph also keeps a
+///     hash index of its edges so that finding the edge between two nodes
+///     (for example in :meth:`has_edge`, :meth:`get_edge_data` or when adding
+///     an edge) takes constant time instead of scanning the neighbors of a
+///     node.
+/// :param int node_capacity: The number of nodes to allocate space for up
+///     front. If you know how many nodes will be added to the graph, setting
+///     this avoids reallocating and copying the node storage as it grows.
+/// :param int edge_capacity: The number of edges to allocate space for up
+///     front, see ``node_capacity``.
 #[pyclass(module = "retworkx", subclass, gc)]
-#[text_signature = "(/, check_cycle=False, multigraph=True)"]
+#[text_signature = "(/, check_cycle=False, multigraph=True, node_capacity=0, edge_capacity=0)"]
 #[derive(Clone)]
 pub struct PyDiGraph {
     pub graph: StableDiGraph<PyObject, PyObject>,
-    pub cycle_state: algo::DfsSpace<
-        NodeIndex,
-        <StableDiGraph<PyObject, PyObject> as Visitable>::Map,
-    >,
+    pub topo_order: TopoOrder,
     pub check_cycle: bool,
     pub node_removed: bool,
     pub multigraph: bool,
+    pub edge_map: Option<EdgeMap>,
+    pub payload_index: Option<PayloadIndex>,
+    /// Incremented by every change to the nodes or edges of the graph, so
+    /// live views can tell that their position in it is stale
+    pub generation: u64,
 }
 
 pub type Edges<'a, E> =
@@ -307,34 +342,85 @@ impl GetAdjacencyMatrix for PyDiGraph {
 
 // Rust side only PyDiGraph methods
 impl PyDiGraph {
+    /// The bytes allocated on the heap for the structure of the graph,
+    /// not including the payloads.
+    fn _heap_bytes(&self) -> usize {
+        graph_slots(&self.graph).total()
+            + self.edge_map.as_ref().map_or(0, |map| map.heap_bytes())
+            + self.topo_order.heap_bytes()
+            + self._payload_index_bytes()
+    }
+
+    /// Whether contracting ``members`` into a single node would create a
+    /// cycle, which is the case if there is a path leaving ``members`` that
+    /// comes back to them.
+    fn _contraction_would_cycle(&self, members: &HashSet<NodeIndex>) -> bool {
+        let mut seen: HashSet<NodeIndex> = HashSet::new();
+        let mut stack: Vec<NodeIndex> = members
+            .iter()
+            .flat_map(|node| {
+                self.graph
+                    .neighbors_directed(*node, petgraph::Direction::Outgoing)
+            })
+            .filter(|node| !members.contains(node))
+            .collect();
+        while let Some(node) = stack.pop() {
+            if !seen.insert(node) {
+                continue;
+            }
+            for child in self
+                .graph
+                .neighbors_directed(node, petgraph::Direction::Outgoing)
+            {
+                if members.contains(&child) {
+                    return true;
+                }
+                if !seen.contains(&child) {
+                    stack.push(child);
+                }
+            }
+        }
+        false
+    }
+
+    fn _payload_index_bytes(&self) -> usize {
+        self.payload_index
+            .as_ref()
+            .map_or(0, |index| index.heap_bytes())
+    }
+
+    /// Add a node, adding it to the payload index if there is one. The
+    /// payload is hashed first so that an unhashable payload doesn't leave
+    /// the node in the graph without an index entry.
+    fn _add_node(&mut self, py: Python, obj: PyObject) -> PyResult<NodeIndex> {
+        let hash = match &self.payload_index {
+            Some(index) => Some(index.hash(py, &obj)?),
+            None => None,
+        };
+        let node = self.graph.add_node(obj);
+        self.generation += 1;
+        if let (Some(index), Some(hash)) = (&mut self.payload_index, hash) {
+            index.insert(hash, node);
+        }
+        Ok(node)
+    }
+
     fn _add_edge(
         &mut self,
         p_index: NodeIndex,
         c_index: NodeIndex,
         edge: PyObject,
     ) -> PyResult<usize> {
-        // Only check for cycles if instance attribute is set to true
-        if self.check_cycle {
-            // Only check for a cycle (by running has_path_connecting) if
-            // the new edge could potentially add a cycle
-            let cycle_check_required =
-                is_cycle_check_required(self, p_index, c_index);
-            let state = Some(&mut self.cycle_state);
-            if cycle_check_required
-                && algo::has_path_connecting(
-                    &self.graph,
-                    c_index,
-                    p_index,
-                    state,
-                )
-            {
-                return Err(DAGWouldCycle::new_err(
-                    "Adding an edge would cycle",
-                ));
-            }
+        // Only check for cycles if instance attribute is set to true. The
+        // topological order is updated incrementally so only the nodes
+        // between the two endpoints in the current order are visited.
+        if self.check_cycle
+            && !self.topo_order.add_edge(&self.graph, p_index, c_index)
+        {
+            return Err(DAGWouldCycle::new_err("Adding an edge would cycle"));
         }
         if !self.multigraph {
-            let exists = self.graph.find_edge(p_index, c_index);
+            let exists = self._find_edge(p_index, c_index);
             if let Some(index) = exists {
                 let edge_weight = self.graph.edge_weight_mut(index).unwrap();
                 *edge_weight = edge;
@@ -342,9 +428,59 @@ impl PyDiGraph {
             }
         }
         let edge = self.graph.add_edge(p_index, c_index, edge);
+        self.generation += 1;
+        if let Some(edge_map) = &mut self.edge_map {
+            edge_map.insert(p_index, c_index, edge);
+        }
         Ok(edge.index())
     }
 
+    /// Find an edge between two nodes, using the edge map if the graph
+    /// isn't a multigraph instead of scanning the adjacency list.
+    pub fn _find_edge(&self, a: NodeIndex, b: NodeIndex) -> Option<EdgeIndex> {
+        match &self.edge_map {
+            Some(edge_map) => edge_map.get(&self.graph, a, b),
+            None => self.graph.find_edge(a, b),
+        }
+    }
+
+    /// Remove every edge, keeping the nodes, and reset the state derived
+    /// from the edges.
+    pub fn clear_edges(&mut self) {
+        self.graph.clear_edges();
+        self.generation += 1;
+        self.edge_map = edge_map_for(&self.graph, self.multigraph);
+        self.topo_order = TopoOrder::default();
+    }
+
+    fn _remove_edge(&mut self, edge: EdgeIndex) -> Option<PyObject> {
+        if let Some(edge_map) = &mut self.edge_map {
+            if let Some((source, target)) = self.graph.edge_endpoints(edge) {
+                edge_map.remove(source, target, edge);
+            }
+        }
+        self.generation += 1;
+        self.graph.remove_edge(edge)
+    }
+
+    fn _remove_node(
+        &mut self,
+        py: Python,
+        node: NodeIndex,
+    ) -> Option<PyObject> {
+        if let Some(edge_map) = &mut self.edge_map {
+            edge_map.remove_node(&self.graph, node);
+        }
+        if let Some(index) = &mut self.payload_index {
+            if let Some(weight) = self.graph.node_weight(node) {
+                index.remove_payload(py, node, weight);
+            }
+        }
+        self.topo_order.remove(node);
+        self.generation += 1;
+        self.graph.remove_node(node)
+    }
+
     fn insert_between(
         &mut self,
         py: Python,
@@ -386,69 +522,22 @@ impl PyDiGraph {
                     weight.clone_ref(py),
                 )?;
             }
-            self.graph.remove_edge(edge_index);
+            self._remove_edge(edge_index);
         }
         Ok(())
     }
-}
-
-#[pymethods]
-impl PyDiGraph {
-    #[new]
-    #[args(check_cycle = "false", multigraph = "true")]
-    fn new(check_cycle: bool, multigraph: bool) -> Self {
-        PyDiGraph {
-            graph: StableDiGraph::<PyObject, PyObject>::new(),
-            cycle_state: algo::DfsSpace::default(),
-            check_cycle,
-            node_removed: false,
-            multigraph,
-        }
-    }
-
-    fn __getstate__(&self, py: Python) -> PyResult<PyObject> {
-        let out_dict = PyDict::new(py);
-        let node_dict = PyDict::new(py);
-        let mut out_list: Vec<PyObject> =
-            Vec::with_capacity(self.graph.edge_count());
-        out_dict.set_item("nodes", node_dict)?;
-        out_dict.set_item("nodes_removed", self.node_removed)?;
-        out_dict.set_item("multigraph", self.multigraph)?;
-        let dir = petgraph::Direction::Incoming;
-        for node_index in self.graph.node_indices() {
-            let node_data = self.graph.node_weight(node_index).unwrap();
-            node_dict.set_item(node_index.index(), node_data)?;
-            for edge in self.graph.edges_directed(node_index, dir) {
-                let edge_w = edge.weight();
-                let triplet =
-                    (edge.source().index(), edge.target().index(), edge_w)
-                        .to_object(py);
-                out_list.push(triplet);
-            }
-        }
-        let py_out_list: PyObject = PyList::new(py, out_list).into();
-        out_dict.set_item("edges", py_out_list)?;
-        Ok(out_dict.into())
-    }
-
-    fn __setstate__(&mut self, py: Python, state: PyObject) -> PyResult<()> {
-        self.graph = StableDiGraph::<PyObject, PyObject>::new();
-        let dict_state = state.cast_as::<PyDict>(py)?;
 
+    /// Rebuild the graph from the dictionary pickle state used before the
+    /// structure was packed into a single array.
+    fn _setstate_legacy(
+        &mut self,
+        py: Python,
+        dict_state: &PyDict,
+    ) -> PyResult<()> {
         let nodes_dict =
             dict_state.get_item("nodes").unwrap().downcast::<PyDict>()?;
         let edges_list =
             dict_state.get_item("edges").unwrap().downcast::<PyList>()?;
-        let nodes_removed_raw = dict_state
-            .get_item("nodes_removed")
-            .unwrap()
-            .downcast::<PyBool>()?;
-        self.node_removed = nodes_removed_raw.extract()?;
-        let multigraph_raw = dict_state
-            .get_item("multigraph")
-            .unwrap()
-            .downcast::<PyBool>()?;
-        self.multigraph = multigraph_raw.extract()?;
         let mut node_indices: Vec<usize> = Vec::new();
         for raw_index in nodes_dict.keys() {
             let tmp_index = raw_index.downcast::<PyLong>()?;
@@ -493,6 +582,79 @@ impl PyDiGraph {
         }
         Ok(())
     }
+}
+
+#[pymethods]
+impl PyDiGraph {
+    #[new]
+    #[args(
+        check_cycle = "false",
+        multigraph = "true",
+        node_capacity = "0",
+        edge_capacity = "0"
+    )]
+    fn new(
+        check_cycle: bool,
+        multigraph: bool,
+        node_capacity: usize,
+        edge_capacity: usize,
+    ) -> Self {
+        let graph = StableDiGraph::<PyObject, PyObject>::with_capacity(
+            node_capacity,
+            edge_capacity,
+        );
+        let mut edge_map = edge_map_for(&graph, multigraph);
+        if let Some(edge_map) = edge_map.as_mut() {
+            edge_map.reserve(edge_capacity);
+        }
+        PyDiGraph {
+            graph,
+            topo_order: TopoOrder::default(),
+            check_cycle,
+            node_removed: false,
+            generation: 0,
+            multigraph,
+            edge_map,
+            payload_index: None,
+        }
+    }
+
+    fn __getstate__(&self, py: Python) -> PyResult<PyObject> {
+        let out_dict = PyDict::new(py);
+        out_dict.set_item("nodes_removed", self.node_removed)?;
+        out_dict.set_item("multigraph", self.multigraph)?;
+        pack_state(py, &self.graph, out_dict)?;
+        Ok(out_dict.into())
+    }
+
+    fn __setstate__(&mut self, py: Python, state: PyObject) -> PyResult<()> {
+        self.graph = StableDiGraph::<PyObject, PyObject>::new();
+        self.generation += 1;
+        let dict_state = state.cast_as::<PyDict>(py)?;
+        let nodes_removed_raw = dict_state
+            .get_item("nodes_removed")
+            .unwrap()
+            .downcast::<PyBool>()?;
+        self.node_removed = nodes_removed_raw.extract()?;
+        let multigraph_raw = dict_state
+            .get_item("multigraph")
+            .unwrap()
+            .downcast::<PyBool>()?;
+        self.multigraph = multigraph_raw.extract()?;
+        match unpack_state(py, dict_state)? {
+            Some(graph) => self.graph = graph,
+            None => self._setstate_legacy(py, dict_state)?,
+        }
+        if self.check_cycle {
+            self.topo_order =
+                TopoOrder::from_graph(&self.graph).unwrap_or_default();
+        }
+        self.edge_map = edge_map_for(&self.graph, self.multigraph);
+        if let Some(index) = &self.payload_index {
+            self.payload_index = Some(index.rebuild(py, &self.graph)?);
+        }
+        Ok(())
+    }
 
     /// Whether cycle checking is enabled for the DiGraph/DAG.
     ///
@@ -505,13 +667,62 @@ impl PyDiGraph {
 
     #[setter]
     fn set_check_cycle(&mut self, value: bool) -> PyResult<()> {
-        if !self.check_cycle && value && !is_directed_acyclic_graph(self) {
-            return Err(DAGHasCycle::new_err("PyDiGraph object has a cycle"));
+        if !self.check_cycle && value {
+            self.topo_order = match TopoOrder::from_graph(&self.graph) {
+                Some(order) => order,
+                None => {
+                    return Err(DAGHasCycle::new_err(
+                        "PyDiGraph object has a cycle",
+                    ))
+                }
+            };
+        } else if !value {
+            self.topo_order = TopoOrder::default();
         }
         self.check_cycle = value;
         Ok(())
     }
 
+    /// Return a context manager to apply a batch of mutations to the graph
+    ///
+    /// Inside the ``with`` block cycle checking is suspended, and when the
+    /// block exits the graph is checked for cycles once with a single
+    /// topological sort. This makes building or modifying a large DAG with
+    /// ``check_cycle`` set (for example with
+    /// :meth:`~retworkx.PyDiGraph.add_edges_from`,
+    /// :meth:`~retworkx.PyDiGraph.extend_from_edge_list` or
+    /// :meth:`~retworkx.PyDiGraph.insert_node_on_in_edges_multiple`) take
+    /// O(V+E) time for the check instead of a check for every new edge. If
+    /// the mutations would create a cycle, or an exception is raised inside
+    /// the block, the graph is restored to the state it had when the block
+    /// was entered. For example::
+    ///
+    ///     import retworkx
+    ///
+    ///     dag = retworkx.PyDAG(check_cycle=True)
+    ///     dag.add_nodes_from(range(4))
+    ///     try:
+    ///         with dag.batch():
+    ///             dag.add_edges_from_no_data([(0, 1), (1, 2), (2, 0)])
+    ///     except retworkx.DAGWouldCycle:
+    ///         pass
+    ///     assert len(dag.edge_list()) == 0
+    ///
+    /// A copy of the graph is kept while the block runs so that it can be
+    /// restored. If the graph doesn't have ``check_cycle`` set no check is
+    /// done, but the graph is still restored if an exception is raised.
+    ///
+    /// :returns: A context manager for the batch, entering it returns the
+    ///     graph
+    /// :rtype: DAGBatch
+    #[text_signature = "(self)"]
+    pub fn batch(slf: PyRef<Self>) -> DAGBatch {
+        DAGBatch {
+            graph: slf.into(),
+            snapshot: None,
+        }
+    }
+
     /// Whether the graph is a multigraph (allows multiple edges between
     /// nodes) or not
     ///
@@ -546,6 +757,36 @@ impl PyDiGraph {
             .collect()
     }
 
+    /// Get a live view of the nodes of the graph
+    ///
+    /// Unlike :meth:`nodes` and :meth:`node_indexes` this doesn't build a
+    /// list of every node, the returned view looks up nodes in the graph
+    /// every time it is used and reflects any later changes to the graph.
+    ///
+    /// :returns: A mapping of node indices to node data
+    /// :rtype: NodeView
+    #[text_signature = "(self)"]
+    pub fn node_view(slf: PyRef<Self>) -> NodeView {
+        NodeView {
+            graph: ViewGraph::Directed(slf.into()),
+        }
+    }
+
+    /// Get a live view of the edges of the graph
+    ///
+    /// Unlike :meth:`edges` and :meth:`edge_list` this doesn't build a list
+    /// of every edge, the returned view looks up edges in the graph every
+    /// time it is used and reflects any later changes to the graph.
+    ///
+    /// :returns: A mapping of ``(source, target)`` tuples to edge data
+    /// :rtype: EdgeView
+    #[text_signature = "(self)"]
+    pub fn edge_view(slf: PyRef<Self>) -> EdgeView {
+        EdgeView {
+            graph: ViewGraph::Directed(slf.into()),
+        }
+    }
+
     /// Return a list of all node indexes.
     ///
     /// :returns: A list of all the node indexes in the graph
@@ -568,11 +809,15 @@ impl PyDiGraph {
     pub fn has_edge(&self, node_a: usize, node_b: usize) -> bool {
         let index_a = NodeIndex::new(node_a);
         let index_b = NodeIndex::new(node_b);
-        self.graph.find_edge(index_a, index_b).is_some()
+        self._find_edge(index_a, index_b).is_some()
     }
 
     /// Return a list of all the node successor data.
     ///
+    /// This builds a new list on every call. To loop over the successors of
+    /// a node without copying them use ``adj_view(node, False)``
+    /// instead, which yields the node indices of the successors.
+    ///
     /// :param int node: The index for the node to get the successors for
     ///
     /// :returns: A list of the node data for all the child neighbor nodes
@@ -596,6 +841,10 @@ impl PyDiGraph {
 
     /// Return a list of all the node predecessor data.
     ///
+    /// This builds a new list on every call. To loop over the predecessors of
+    /// a node without copying them use ``adj_view(node, True)``
+    /// instead, which yields the node indices of the predecessors.
+    ///
     /// :param int node: The index for the node to get the predecessors for
     ///
     /// :returns: A list of the node data for all the parent neighbor nodes
@@ -632,7 +881,7 @@ impl PyDiGraph {
     ) -> PyResult<&PyObject> {
         let index_a = NodeIndex::new(node_a);
         let index_b = NodeIndex::new(node_b);
-        let edge_index = match self.graph.find_edge(index_a, index_b) {
+        let edge_index = match self._find_edge(index_a, index_b) {
             Some(edge_index) => edge_index,
             None => {
                 return Err(NoEdgeBetweenNodes::new_err(
@@ -665,7 +914,7 @@ impl PyDiGraph {
     ) -> PyResult<()> {
         let index_a = NodeIndex::new(source);
         let index_b = NodeIndex::new(target);
-        let edge_index = match self.graph.find_edge(index_a, index_b) {
+        let edge_index = match self._find_edge(index_a, index_b) {
             Some(edge_index) => edge_index,
             None => {
                 return Err(NoEdgeBetweenNodes::new_err(
@@ -699,6 +948,47 @@ impl PyDiGraph {
         Ok(())
     }
 
+    /// Update the weights/payloads of many edges at once by edge index
+    ///
+    /// This is the array equivalent of calling
+    /// :meth:`~retworkx.PyDiGraph.update_edge_by_index` once per edge.
+    ///
+    /// :param numpy.ndarray edge_indices: A 1 dimensional ``np.int64`` array
+    ///     of the edge indices to update
+    /// :param weights: The new payloads for the edges. This can either be a
+    ///     1 dimensional ``np.float64`` array (each value will be used as a
+    ///     ``float`` payload) or any other sequence (including an object
+    ///     array) of the same length as ``edge_indices``.
+    ///
+    /// :raises IndexError: When an edge index is not present in the graph. No
+    ///     edges are updated in this case.
+    /// :raises ValueError: When ``weights`` is not the same length as
+    ///     ``edge_indices``
+    #[text_signature = "(self, edge_indices, weights, /)"]
+    pub fn update_edges_from_array<'p>(
+        &mut self,
+        py: Python<'p>,
+        edge_indices: PyReadonlyArray1<'p, i64>,
+        weights: &'p PyAny,
+    ) -> PyResult<()> {
+        let edges = indices_from_array(&edge_indices)?;
+        let payloads = payloads_from_array(py, Some(weights), edges.len())?;
+        for edge in &edges {
+            if self.graph.edge_weight(EdgeIndex::new(*edge)).is_none() {
+                return Err(PyIndexError::new_err(format!(
+                    "No edge found for index {}",
+                    edge
+                )));
+            }
+        }
+        for (edge, payload) in edges.into_iter().zip(payloads) {
+            let data =
+                self.graph.edge_weight_mut(EdgeIndex::new(edge)).unwrap();
+            *data = payload;
+        }
+        Ok(())
+    }
+
     /// Return the node data for a given node index
     ///
     /// :param int node: The index for the node
@@ -763,6 +1053,63 @@ impl PyDiGraph {
         }
     }
 
+    /// Get the node indices of the graph as a numpy array
+    ///
+    /// This is equivalent to :meth:`~retworkx.PyDiGraph.node_indexes` but
+    /// returns a numpy array directly instead of a
+    /// :class:`~retworkx.NodeIndices` object.
+    ///
+    /// :returns: A 1 dimensional ``np.int64`` array of node indices
+    /// :rtype: numpy.ndarray
+    #[text_signature = "(self)"]
+    pub fn node_index_array(&self, py: Python) -> PyObject {
+        let out: Vec<i64> = self
+            .graph
+            .node_indices()
+            .map(|node| node.index() as i64)
+            .collect();
+        out.into_pyarray(py).into()
+    }
+
+    /// Get the edge list of the graph as a numpy array
+    ///
+    /// This is equivalent to :meth:`~retworkx.PyDiGraph.edge_list` but returns
+    /// a numpy array directly instead of an :class:`~retworkx.EdgeList`
+    /// object. The rows are in the same order as the indices returned by
+    /// :meth:`~retworkx.PyDiGraph.edge_ids_array`.
+    ///
+    /// :returns: A 2 dimensional ``np.int64`` array with shape ``(E, 2)``
+    ///     where each row is the ``(source, target)`` node indices of an edge
+    /// :rtype: numpy.ndarray
+    #[text_signature = "(self)"]
+    pub fn edge_index_array(&self, py: Python) -> PyObject {
+        let mut flat: Vec<i64> =
+            Vec::with_capacity(2 * self.graph.edge_count());
+        for edge in self.graph.edge_references() {
+            flat.push(edge.source().index() as i64);
+            flat.push(edge.target().index() as i64);
+        }
+        let out =
+            Array2::from_shape_vec((self.graph.edge_count(), 2), flat).unwrap();
+        out.into_pyarray(py).into()
+    }
+
+    /// Get the edge indices of the graph as a numpy array
+    ///
+    /// :returns: A 1 dimensional ``np.int64`` array of edge indices in the
+    ///     same order as the rows of
+    ///     :meth:`~retworkx.PyDiGraph.edge_index_array`
+    /// :rtype: numpy.ndarray
+    #[text_signature = "(self)"]
+    pub fn edge_ids_array(&self, py: Python) -> PyObject {
+        let out: Vec<i64> = self
+            .graph
+            .edge_references()
+            .map(|edge| edge.id().index() as i64)
+            .collect();
+        out.into_pyarray(py).into()
+    }
+
     /// Get edge list with weights
     ///
     /// Returns a list of tuples of the form ``(source, target, weight)`` where
@@ -792,9 +1139,9 @@ impl PyDiGraph {
     ///     present in the graph it will be ignored and this function will have
     ///     no effect.
     #[text_signature = "(self, node, /)"]
-    pub fn remove_node(&mut self, node: usize) -> PyResult<()> {
+    pub fn remove_node(&mut self, py: Python, node: usize) -> PyResult<()> {
         let index = NodeIndex::new(node);
-        self.graph.remove_node(index);
+        self._remove_node(py, index);
         self.node_removed = true;
         Ok(())
     }
@@ -866,7 +1213,7 @@ impl PyDiGraph {
         for (source, target, weight) in edge_list {
             self._add_edge(source, target, weight)?;
         }
-        self.graph.remove_node(index);
+        self._remove_node(py, index);
         self.node_removed = true;
         Ok(())
     }
@@ -950,6 +1297,94 @@ impl PyDiGraph {
         Ok(out_list)
     }
 
+    /// Add new edges to the graph from arrays of node indices.
+    ///
+    /// This is equivalent to :meth:`add_edges_from` (or
+    /// :meth:`add_edges_from_no_data` if ``weights`` is not set) but instead
+    /// of a list of tuples it takes numpy arrays, which avoids converting every
+    /// edge from a Python object. It is the preferred method for adding a
+    /// large number of edges at once.
+    ///
+    /// :param numpy.ndarray sources: A 1 dimensional ``np.int64`` array of
+    ///     the parent node index for each edge
+    /// :param numpy.ndarray targets: A 1 dimensional ``np.int64`` array of
+    ///     the child node index for each edge. It must be the same length as
+    ///     ``sources``.
+    /// :param weights: An optional payload for each edge. This can either be
+    ///     a 1 dimensional ``np.float64`` array (each value will be used as
+    ///     a ``float`` payload) or any other sequence (including an object
+    ///     array) of the same length as ``sources``. If not specified ``None``
+    ///     will be used for every edge.
+    ///
+    /// :returns: A 1 dimensional ``np.int64`` array of the indices of the
+    ///     created (or updated if :attr:`~retworkx.PyDiGraph.multigraph` is
+    ///     ``False``) edges
+    /// :rtype: numpy.ndarray
+    ///
+    /// :raises IndexError: When a node index in ``sources`` or ``targets`` is
+    ///     not present in the graph. No edges are added in this case.
+    /// :raises ValueError: When the input arrays are not the same length
+    /// :raises DAGWouldCycle: When ``check_cycle`` is enabled and the edges
+    ///     would introduce a cycle. No edges are added in this case.
+    #[text_signature = "(self, sources, targets, /, weights=None)"]
+    pub fn add_edges_from_array<'p>(
+        &mut self,
+        py: Python<'p>,
+        sources: PyReadonlyArray1<'p, i64>,
+        targets: PyReadonlyArray1<'p, i64>,
+        weights: Option<&'p PyAny>,
+    ) -> PyResult<PyObject> {
+        let sources = indices_from_array(&sources)?;
+        let targets = indices_from_array(&targets)?;
+        if sources.len() != targets.len() {
+            return Err(PyValueError::new_err(
+                "sources and targets must be the same length",
+            ));
+        }
+        let payloads = payloads_from_array(py, weights, sources.len())?;
+        for node in sources.iter().chain(targets.iter()) {
+            if self.graph.node_weight(NodeIndex::new(*node)).is_none() {
+                return Err(PyIndexError::new_err(format!(
+                    "No node found for index {}",
+                    node
+                )));
+            }
+        }
+        // Check the whole batch up front so that a cycle closed by a later
+        // edge doesn't leave the earlier edges of the batch in the graph.
+        if self.check_cycle {
+            let mut scratch = self.graph.map(|_, _| (), |_, _| ());
+            for (source, target) in sources.iter().zip(targets.iter()) {
+                scratch.add_edge(
+                    NodeIndex::new(*source),
+                    NodeIndex::new(*target),
+                    (),
+                );
+            }
+            if algo::is_cyclic_directed(&scratch) {
+                return Err(DAGWouldCycle::new_err(
+                    "Adding an edge would cycle",
+                ));
+            }
+        }
+        let mut out_list: Vec<i64> = Vec::with_capacity(sources.len());
+        let fast_path = self.multigraph && !self.check_cycle;
+        for ((source, target), payload) in
+            sources.into_iter().zip(targets).zip(payloads)
+        {
+            let p_index = NodeIndex::new(source);
+            let c_index = NodeIndex::new(target);
+            let edge = if fast_path {
+                self.generation += 1;
+                self.graph.add_edge(p_index, c_index, payload).index()
+            } else {
+                self._add_edge(p_index, c_index, payload)?
+            };
+            out_list.push(edge as i64);
+        }
+        Ok(out_list.into_pyarray(py).into())
+    }
+
     /// Extend graph from an edge list
     ///
     /// This method differs from :meth:`add_edges_from_no_data` in that it will
@@ -968,7 +1403,7 @@ impl PyDiGraph {
         for (source, target) in edge_list {
             let max_index = cmp::max(source, target);
             while max_index >= self.node_count() {
-                self.graph.add_node(py.None());
+                self._add_node(py, py.None())?;
             }
             self._add_edge(
                 NodeIndex::new(source),
@@ -997,7 +1432,7 @@ impl PyDiGraph {
         for (source, target, weight) in edge_list {
             let max_index = cmp::max(source, target);
             while max_index >= self.node_count() {
-                self.graph.add_node(py.None());
+                self._add_node(py, py.None())?;
             }
             self._add_edge(
                 NodeIndex::new(source),
@@ -1118,7 +1553,7 @@ impl PyDiGraph {
     pub fn remove_edge(&mut self, parent: usize, child: usize) -> PyResult<()> {
         let p_index = NodeIndex::new(parent);
         let c_index = NodeIndex::new(child);
-        let edge_index = match self.graph.find_edge(p_index, c_index) {
+        let edge_index = match self._find_edge(p_index, c_index) {
             Some(edge_index) => edge_index,
             None => {
                 return Err(NoEdgeBetweenNodes::new_err(
@@ -1126,7 +1561,7 @@ impl PyDiGraph {
                 ))
             }
         };
-        self.graph.remove_edge(edge_index);
+        self._remove_edge(edge_index);
         Ok(())
     }
 
@@ -1136,7 +1571,7 @@ impl PyDiGraph {
     #[text_signature = "(self, edge, /)"]
     pub fn remove_edge_from_index(&mut self, edge: usize) -> PyResult<()> {
         let edge_index = EdgeIndex::new(edge);
-        self.graph.remove_edge(edge_index);
+        self._remove_edge(edge_index);
         Ok(())
     }
 
@@ -1156,7 +1591,7 @@ impl PyDiGraph {
             .iter()
             .map(|(x, y)| (NodeIndex::new(*x), NodeIndex::new(*y)))
         {
-            let edge_index = match self.graph.find_edge(p_index, c_index) {
+            let edge_index = match self._find_edge(p_index, c_index) {
                 Some(edge_index) => edge_index,
                 None => {
                     return Err(NoEdgeBetweenNodes::new_err(
@@ -1164,7 +1599,7 @@ impl PyDiGraph {
                     ))
                 }
             };
-            self.graph.remove_edge(edge_index);
+            self._remove_edge(edge_index);
         }
         Ok(())
     }
@@ -1176,27 +1611,36 @@ impl PyDiGraph {
     /// :returns: The index of the newly created node
     /// :rtype: int
     #[text_signature = "(self, obj, /)"]
-    pub fn add_node(&mut self, obj: PyObject) -> PyResult<usize> {
-        let index = self.graph.add_node(obj);
+    pub fn add_node(&mut self, py: Python, obj: PyObject) -> PyResult<usize> {
+        let index = self._add_node(py, obj)?;
         Ok(index.index())
     }
 
     /// Find node within this graph given a specific weight
     ///
     /// This algorithm has a worst case of O(n) since it searches the node
-    /// indices in order. If there is more than one node in the graph with the
-    /// same weight only the first match (by node index) will be returned.
+    /// indices in order. If a payload index has been built with
+    /// :meth:`~retworkx.PyDiGraph.build_payload_index` it is used instead
+    /// and the lookup takes expected O(1) time. If there is more than one
+    /// node in the graph with the same weight only the first match (by node
+    /// index) will be returned.
     ///
     /// :param obj: The weight to look for in the graph.
     ///
     /// :returns: the index of the first node in the graph that is equal to the
     ///     weight. If no match is found ``None`` will be returned.
     /// :rtype: int
+    #[text_signature = "(self, obj, /)"]
     pub fn find_node_by_weight(
         &self,
         py: Python,
         obj: PyObject,
-    ) -> Option<usize> {
+    ) -> PyResult<Option<usize>> {
+        if let Some(payload_index) = &self.payload_index {
+            return Ok(payload_index
+                .find(py, &self.graph, &obj)?
+                .map(|node| node.index()));
+        }
         let mut index = None;
         for node in self.graph.node_indices() {
             let weight = self.graph.node_weight(node).unwrap();
@@ -1210,7 +1654,58 @@ impl PyDiGraph {
                 break;
             }
         }
-        index
+        Ok(index)
+    }
+
+    /// Build a hash index of the node payloads in the graph.
+    ///
+    /// Once built the index is kept up to date as nodes are added, removed
+    /// or have their payload replaced with ``graph[index] = obj``, and it
+    /// is used by :meth:`~retworkx.PyDiGraph.find_node_by_weight` and
+    /// :func:`~retworkx.digraph_union` (with ``merge_nodes=True``) to find
+    /// nodes by payload in expected O(1) time instead of scanning the whole
+    /// graph. Calling this method again replaces the existing index.
+    ///
+    /// Nodes are indexed by the ``hash()`` of their payload, so all node
+    /// payloads must be hashable. If the payloads aren't hashable (or
+    /// are expensive to hash) a ``key`` function can be provided, it must
+    /// return a hashable object that is equal for any two payloads that are
+    /// equal. Lookups still compare the payloads themselves for equality.
+    /// If a payload is mutated in place in a way that changes its hash (or
+    /// its ``key``) it has to be set again with ``graph[index] = obj`` to
+    /// be found through the index.
+    ///
+    /// The index is not copied to new graphs created from this graph (for
+    /// example by :meth:`~retworkx.PyDiGraph.subgraph` or by pickling),
+    /// except by :meth:`~retworkx.PyDiGraph.copy`.
+    ///
+    /// :param key: An optional callable that will be passed a node's payload
+    ///     and returns the object to hash for it. If not specified the
+    ///     payload itself is hashed.
+    #[text_signature = "(self, /, key=None)"]
+    pub fn build_payload_index(
+        &mut self,
+        py: Python,
+        key: Option<PyObject>,
+    ) -> PyResult<()> {
+        self.payload_index = Some(PayloadIndex::build(py, &self.graph, key)?);
+        Ok(())
+    }
+
+    /// Remove the payload index built by
+    /// :meth:`~retworkx.PyDiGraph.build_payload_index`.
+    ///
+    /// If the graph doesn't have a payload index this method has no effect.
+    #[text_signature = "(self)"]
+    pub fn clear_payload_index(&mut self) {
+        self.payload_index = None;
+    }
+
+    /// Whether the graph has a payload index built by
+    /// :meth:`~retworkx.PyDiGraph.build_payload_index`
+    #[getter]
+    fn has_payload_index(&self) -> bool {
+        self.payload_index.is_some()
     }
 
     /// Merge two nodes in the graph.
@@ -1274,7 +1769,7 @@ impl PyDiGraph {
                     }
                 }
             }
-            self.remove_node(u)?;
+            self.remove_node(py, u)?;
             for edge in edges_to_add {
                 self.add_edge(edge.0, edge.1, edge.2)?;
             }
@@ -1283,6 +1778,153 @@ impl PyDiGraph {
         Ok(())
     }
 
+    /// Contract a set of nodes into a single new node.
+    ///
+    /// The nodes in ``nodes`` are removed from the graph and replaced by a
+    /// new node with ``obj`` as its payload. Every edge between one of
+    /// ``nodes`` and a node outside of ``nodes`` is moved to the new node,
+    /// edges between two of ``nodes`` are dropped. This is done in a single
+    /// pass over the edges of ``nodes``, which is much faster than
+    /// contracting the nodes one pair at a time with
+    /// :meth:`~retworkx.PyDiGraph.merge_nodes`.
+    ///
+    /// If the graph was created with ``multigraph=False`` the edges that
+    /// become parallel are combined into a single edge, either with
+    /// ``weight_combo_fn`` or by keeping the weight of the last one.
+    ///
+    /// :param list nodes: The indices of the nodes to contract. Any duplicate
+    ///     indices are ignored.
+    /// :param obj: The python object to attach to the new node
+    /// :param bool check_cycle: Whether to check that the contraction won't
+    ///     introduce a cycle before making any changes. If not specified
+    ///     (the default) the ``check_cycle`` attribute of the graph is used,
+    ///     the contraction is always checked if the graph has
+    ///     ``check_cycle`` set.
+    /// :param weight_combo_fn: An optional python callable that takes the
+    ///     weights of two parallel edges and returns the weight for the
+    ///     combined edge. Only used if the graph has ``multigraph=False``.
+    ///
+    /// :returns: The index of the new node
+    /// :rtype: int
+    ///
+    /// :raises IndexError: If one of the ``nodes`` is not in the graph
+    /// :raises DAGWouldCycle: If the cycle check is enabled and contracting
+    ///     the nodes would introduce a cycle
+    #[text_signature = "(self, nodes, obj, /, check_cycle=None, weight_combo_fn=None)"]
+    pub fn contract_nodes(
+        &mut self,
+        py: Python,
+        nodes: Vec<usize>,
+        obj: PyObject,
+        check_cycle: Option<bool>,
+        weight_combo_fn: Option<PyObject>,
+    ) -> PyResult<usize> {
+        let (members, member_set) = contraction_members(&self.graph, &nodes)?;
+        if (self.check_cycle || check_cycle.unwrap_or(false))
+            && self._contraction_would_cycle(&member_set)
+        {
+            return Err(DAGWouldCycle::new_err(
+                "Contracting the nodes would cycle",
+            ));
+        }
+        let mut edges = boundary_edges(py, &self.graph, &members, &member_set);
+        if !self.multigraph {
+            edges = combine_parallel(py, edges, &weight_combo_fn)?;
+        }
+        let new_node = self._add_node(py, obj)?;
+        if self.check_cycle {
+            self.topo_order.replace_first(&members, new_node);
+        }
+        for node in members {
+            self._remove_node(py, node);
+            self.node_removed = true;
+        }
+        for ((other, outgoing), weight) in edges {
+            if outgoing {
+                self._add_edge(new_node, other, weight)?;
+            } else {
+                self._add_edge(other, new_node, weight)?;
+            }
+        }
+        Ok(new_node.index())
+    }
+
+    /// Return the quotient graph of this graph for a partition of its nodes.
+    ///
+    /// This contracts every block of ``partition`` into a single node, like
+    /// calling :meth:`~retworkx.PyDiGraph.contract_nodes` once for every
+    /// block, but builds the contracted graph in a single pass over the
+    /// graph. This graph is not modified.
+    ///
+    /// The node for each block has the list of the payloads of the nodes in
+    /// the block as its payload, or the return of ``node_fn`` called with
+    /// that list. The node for the ``i``-th block has index ``i`` in the
+    /// returned graph. The nodes that are not in any block are added after
+    /// them in node index order, with their payloads unchanged. Edges
+    /// between two nodes of the same block are dropped and, if the graph was
+    /// created with ``multigraph=False``, edges that become parallel are
+    /// combined into a single edge, either with ``weight_combo_fn`` or by
+    /// keeping the weight of the last one.
+    ///
+    /// :param list partition: A list of blocks, each a list of the node
+    ///     indices in that block. The blocks must not be empty and a node can
+    ///     be in at most one block.
+    /// :param node_fn: An optional python callable that takes the list of
+    ///     payloads of the nodes in a block and returns the payload for the
+    ///     node of the block.
+    /// :param weight_combo_fn: An optional python callable that takes the
+    ///     weights of two parallel edges and returns the weight for the
+    ///     combined edge. Only used if the graph has ``multigraph=False``.
+    ///
+    /// :returns: The quotient graph
+    /// :rtype: PyDiGraph
+    ///
+    /// :raises IndexError: If a node in ``partition`` is not in the graph
+    /// :raises ValueError: If a block is empty or a node appears more than
+    ///     once in ``partition``
+    /// :raises DAGWouldCycle: If the graph has ``check_cycle`` set and the
+    ///     quotient graph would have a cycle
+    #[text_signature = "(self, partition, /, node_fn=None, weight_combo_fn=None)"]
+    pub fn quotient_graph(
+        &self,
+        py: Python,
+        partition: Vec<Vec<usize>>,
+        node_fn: Option<PyObject>,
+        weight_combo_fn: Option<PyObject>,
+    ) -> PyResult<PyDiGraph> {
+        let graph = quotient(
+            py,
+            &self.graph,
+            partition,
+            &node_fn,
+            &weight_combo_fn,
+            self.multigraph,
+        )?;
+        let topo_order = if self.check_cycle {
+            match TopoOrder::from_graph(&graph) {
+                Some(topo_order) => topo_order,
+                None => {
+                    return Err(DAGWouldCycle::new_err(
+                        "The quotient graph would have a cycle",
+                    ))
+                }
+            }
+        } else {
+            TopoOrder::default()
+        };
+        let edge_map = edge_map_for(&graph, self.multigraph);
+        Ok(PyDiGraph {
+            graph,
+            topo_order,
+            check_cycle: self.check_cycle,
+            node_removed: false,
+            generation: 0,
+            multigraph: self.multigraph,
+            edge_map,
+            payload_index: None,
+        })
+    }
+
     /// Add a new child node to the graph.
     ///
     /// This will create a new node on the graph and add an edge from the parent
@@ -1297,13 +1939,24 @@ impl PyDiGraph {
     #[text_signature = "(self, parent, obj, edge, /)"]
     pub fn add_child(
         &mut self,
+        py: Python,
         parent: usize,
         obj: PyObject,
         edge: PyObject,
     ) -> PyResult<usize> {
         let index = NodeIndex::new(parent);
-        let child_node = self.graph.add_node(obj);
-        self.graph.add_edge(index, child_node, edge);
+        let child_node = self._add_node(py, obj)?;
+        let edge_index = self.graph.add_edge(index, child_node, edge);
+        self.generation += 1;
+        if let Some(edge_map) = &mut self.edge_map {
+            edge_map.insert(index, child_node, edge_index);
+        }
+        if self.check_cycle {
+            // A new node with a single incoming edge can't create a cycle and
+            // is always valid at the end of the topological order
+            self.topo_order.ensure(index);
+            self.topo_order.push_back(child_node);
+        }
         Ok(child_node.index())
     }
 
@@ -1321,13 +1974,22 @@ impl PyDiGraph {
     #[text_signature = "(self, child, obj, edge, /)"]
     pub fn add_parent(
         &mut self,
+        py: Python,
         child: usize,
         obj: PyObject,
         edge: PyObject,
     ) -> PyResult<usize> {
         let index = NodeIndex::new(child);
-        let parent_node = self.graph.add_node(obj);
-        self.graph.add_edge(parent_node, index, edge);
+        let parent_node = self._add_node(py, obj)?;
+        let edge_index = self.graph.add_edge(parent_node, index, edge);
+        self.generation += 1;
+        if let Some(edge_map) = &mut self.edge_map {
+            edge_map.insert(parent_node, index, edge_index);
+        }
+        if self.check_cycle {
+            self.topo_order.ensure(index);
+            self.topo_order.push_front(parent_node);
+        }
         Ok(parent_node.index())
     }
 
@@ -1362,6 +2024,46 @@ impl PyDiGraph {
         out_map
     }
 
+    /// Get a live view of the neighbors of a node
+    ///
+    /// Unlike :meth:`adj` and :meth:`adj_direction` this doesn't build a
+    /// dictionary, the returned view looks up the neighbors of the node in
+    /// the graph every time it is used and reflects any later changes to
+    /// the graph.
+    ///
+    /// :param int node: The index of the node to get the neighbors of
+    /// :param bool direction: The direction of the edges to the neighbors,
+    ///     ``True`` means inbound edges (predecessors), ``False`` means
+    ///     outbound edges (successors) and ``None`` (the default) means
+    ///     both.
+    ///
+    /// :returns: A mapping of the node indices of the neighbors to the edge
+    ///     data of the edge between that neighbor and ``node``
+    /// :rtype: AdjView
+    /// :raises IndexError: If ``node`` is not in the graph
+    #[text_signature = "(self, node, /, direction=None)"]
+    pub fn adj_view(
+        slf: PyRef<Self>,
+        node: usize,
+        direction: Option<bool>,
+    ) -> PyResult<AdjView> {
+        if !slf.graph.contains_node(NodeIndex::new(node)) {
+            return Err(PyIndexError::new_err("No node found for index"));
+        }
+        let direction = direction.map(|direction| {
+            if direction {
+                petgraph::Direction::Incoming
+            } else {
+                petgraph::Direction::Outgoing
+            }
+        });
+        Ok(AdjView {
+            graph: ViewGraph::Directed(slf.into()),
+            node: NodeIndex::new(node),
+            direction,
+        })
+    }
+
     /// Get the index and data for either the parent or children of a node.
     ///
     /// This will return a dictionary where the keys are the node indexes of
@@ -1423,6 +2125,10 @@ impl PyDiGraph {
     /// This will return a list of neighbor node indices. This function
     /// is equivalent to :meth:`successor_indices`.
     ///
+    /// This builds a new list on every call. To loop over the neighbors
+    /// of a node without copying them use ``adj_view(node, False)``
+    /// instead.
+    ///
     /// :param int node: The index of the node to get the neighbors of
     ///
     /// :returns: A list of the neighbor node indices
@@ -1536,12 +2242,16 @@ impl PyDiGraph {
     /// :returns: A list of int indices of the newly created nodes
     /// :rtype: NodeIndices
     #[text_signature = "(self, obj_list, /)"]
-    pub fn add_nodes_from(&mut self, obj_list: Vec<PyObject>) -> NodeIndices {
-        let out_list: Vec<usize> = obj_list
-            .into_iter()
-            .map(|obj| self.graph.add_node(obj).index())
-            .collect();
-        NodeIndices { nodes: out_list }
+    pub fn add_nodes_from(
+        &mut self,
+        py: Python,
+        obj_list: Vec<PyObject>,
+    ) -> PyResult<NodeIndices> {
+        let mut out_list: Vec<usize> = Vec::with_capacity(obj_list.len());
+        for obj in obj_list {
+            out_list.push(self._add_node(py, obj)?.index());
+        }
+        Ok(NodeIndices { nodes: out_list })
     }
 
     /// Remove nodes from the graph.
@@ -1554,10 +2264,11 @@ impl PyDiGraph {
     #[text_signature = "(self, index_list, /)"]
     pub fn remove_nodes_from(
         &mut self,
+        py: Python,
         index_list: Vec<usize>,
     ) -> PyResult<()> {
         for node in index_list.iter().map(|x| NodeIndex::new(*x)) {
-            self.graph.remove_node(node);
+            self._remove_node(py, node);
         }
         Ok(())
     }
@@ -1810,10 +2521,13 @@ impl PyDiGraph {
         }
         Ok(PyDiGraph {
             graph: out_graph,
-            cycle_state: algo::DfsSpace::default(),
+            topo_order: TopoOrder::default(),
             check_cycle: false,
             node_removed: false,
+            generation: 0,
             multigraph: true,
+            edge_map: None,
+            payload_index: None,
         })
     }
 
@@ -1839,7 +2553,10 @@ impl PyDiGraph {
     ) -> PyDiGraph {
         let array = matrix.as_array();
         let shape = array.shape();
-        let mut out_graph = StableDiGraph::<PyObject, PyObject>::new();
+        let edge_count = array.iter().filter(|weight| **weight > 0.0).count();
+        let mut out_graph = StableDiGraph::<PyObject, PyObject>::with_capacity(
+            shape[0], edge_count,
+        );
         let _node_indices: Vec<NodeIndex> = (0..shape[0])
             .map(|node| out_graph.add_node(node.to_object(py)))
             .collect();
@@ -1861,10 +2578,13 @@ impl PyDiGraph {
 
         PyDiGraph {
             graph: out_graph,
-            cycle_state: algo::DfsSpace::default(),
+            topo_order: TopoOrder::default(),
             check_cycle: false,
             node_removed: false,
+            generation: 0,
             multigraph: true,
+            edge_map: None,
+            payload_index: None,
         }
     }
 
@@ -1979,11 +2699,12 @@ impl PyDiGraph {
         // TODO: Reimplement this without looping over the graphs
         // Loop over other nodes add add to self graph
         for node in other.graph.node_indices() {
-            let new_index = self.graph.add_node(weight_transform_callable(
+            let weight = weight_transform_callable(
                 py,
                 &node_map_func,
                 &other.graph[node],
-            )?);
+            )?;
+            let new_index = self._add_node(py, weight)?;
             new_node_map.insert(node, new_index);
         }
 
@@ -2011,6 +2732,318 @@ impl PyDiGraph {
         Ok(out_dict.into())
     }
 
+    /// Substitute a node with a copy of another graph.
+    ///
+    /// The node ``node`` is removed and every node and edge of ``other`` is
+    /// added to this graph in its place. The edges into and out of ``node``
+    /// are rewired to the new nodes according to ``edge_map_fn``, which is
+    /// called for every edge of ``node`` with the ``source``, ``target`` and
+    /// ``weight`` of the edge and returns the index of the node in ``other``
+    /// that the edge should be connected to instead of ``node``, or ``None``
+    /// to drop the edge. All of this is done in a single call, which is
+    /// much faster than combining :meth:`~retworkx.PyDiGraph.remove_node`,
+    /// :meth:`~retworkx.PyDiGraph.compose` and adding the rewired edges
+    /// from Python.
+    ///
+    /// ``edge_map_fn`` is called for every edge before the graph is
+    /// modified, so if it raises an exception (or returns an index that is
+    /// not in ``other``) the graph is left unchanged.
+    ///
+    /// :param int node: The index of the node to substitute
+    /// :param PyDiGraph other: The graph to substitute in place of ``node``
+    /// :param edge_map_fn: A python callable that takes the ``source``,
+    ///     ``target`` and ``weight`` of an edge of ``node`` and returns the
+    ///     index of the node in ``other`` to connect the edge to, or ``None``
+    ///     to drop the edge. For a self loop on ``node`` the returned node is
+    ///     used for both endpoints.
+    ///
+    /// :returns: A dictionary mapping the node indices of ``other`` to the
+    ///     indices of the new nodes in this graph
+    /// :rtype: dict
+    ///
+    /// :raises IndexError: If ``node`` is not in the graph or
+    ///     ``edge_map_fn`` returns an index that is not in ``other``
+    /// :raises DAGWouldCycle: If cycle checking is enabled and the
+    ///     substitution would introduce a cycle
+    #[text_signature = "(self, node, other, edge_map_fn, /)"]
+    pub fn substitute_node_with_subgraph(
+        &mut self,
+        py: Python,
+        node: usize,
+        other: &PyDiGraph,
+        edge_map_fn: PyObject,
+    ) -> PyResult<PyObject> {
+        let node_index = NodeIndex::new(node);
+        if !self.graph.contains_node(node_index) {
+            return Err(PyIndexError::new_err("No node found for index"));
+        }
+        let map_edge = |source: NodeIndex,
+                        target: NodeIndex,
+                        weight: &PyObject|
+         -> PyResult<Option<NodeIndex>> {
+            let res: Option<usize> = edge_map_fn
+                .call1(py, (source.index(), target.index(), weight))?
+                .extract(py)?;
+            match res {
+                Some(index) => {
+                    let index = NodeIndex::new(index);
+                    if !other.graph.contains_node(index) {
+                        return Err(PyIndexError::new_err(
+                            "No node found in other for the index returned \
+                             by edge_map_fn",
+                        ));
+                    }
+                    Ok(Some(index))
+                }
+                None => Ok(None),
+            }
+        };
+        // The edges to add after the substitution as (source, target,
+        // weight), with the endpoints that were node as indices of other
+        let mut in_edges: Vec<(NodeIndex, NodeIndex, PyObject)> = Vec::new();
+        let mut out_edges: Vec<(NodeIndex, NodeIndex, PyObject)> = Vec::new();
+        let mut self_loops: Vec<(NodeIndex, PyObject)> = Vec::new();
+        for edge in self
+            .graph
+            .edges_directed(node_index, petgraph::Direction::Incoming)
+        {
+            if edge.source() == node_index {
+                continue;
+            }
+            if let Some(target) =
+                map_edge(edge.source(), edge.target(), edge.weight())?
+            {
+                in_edges.push((
+                    edge.source(),
+                    target,
+                    edge.weight().clone_ref(py),
+                ));
+            }
+        }
+        for edge in self
+            .graph
+            .edges_directed(node_index, petgraph::Direction::Outgoing)
+        {
+            if let Some(other_node) =
+                map_edge(edge.source(), edge.target(), edge.weight())?
+            {
+                if edge.target() == node_index {
+                    self_loops.push((other_node, edge.weight().clone_ref(py)));
+                } else {
+                    out_edges.push((
+                        other_node,
+                        edge.target(),
+                        edge.weight().clone_ref(py),
+                    ));
+                }
+            }
+        }
+        // Edges between node and the rest of the graph can't form a cycle
+        // through other since the graph is acyclic, so only other itself and
+        // self loops on node need to be checked.
+        let mut first_node: Option<NodeIndex> = None;
+        if self.check_cycle {
+            if !self_loops.is_empty() {
+                return Err(DAGWouldCycle::new_err(
+                    "Substituting the node would cycle",
+                ));
+            }
+            match algo::toposort(&other.graph, None) {
+                Ok(order) => first_node = order.first().copied(),
+                Err(_) => {
+                    return Err(DAGWouldCycle::new_err(
+                        "Substituting the node would cycle",
+                    ))
+                }
+            }
+        }
+
+        let mut node_map: HashMap<NodeIndex, NodeIndex> =
+            HashMap::with_capacity(other.node_count());
+        for other_node in other.graph.node_indices() {
+            let new_node =
+                self._add_node(py, other.graph[other_node].clone_ref(py))?;
+            node_map.insert(other_node, new_node);
+        }
+        if let Some(first_node) = first_node {
+            // Give the substituted graph the position of node in the
+            // topological order so that the rewired edges agree with it
+            self.topo_order
+                .replace_first(&[node_index], node_map[&first_node]);
+        }
+        self._remove_node(py, node_index);
+        self.node_removed = true;
+        for edge in other.graph.edge_references() {
+            self._add_edge(
+                node_map[&edge.source()],
+                node_map[&edge.target()],
+                edge.weight().clone_ref(py),
+            )?;
+        }
+        for (source, target, weight) in in_edges {
+            self._add_edge(source, node_map[&target], weight)?;
+        }
+        for (source, target, weight) in out_edges {
+            self._add_edge(node_map[&source], target, weight)?;
+        }
+        for (other_node, weight) in self_loops {
+            let new_node = node_map[&other_node];
+            self._add_edge(new_node, new_node, weight)?;
+        }
+        let out_dict = PyDict::new(py);
+        for (other_node, new_node) in node_map.iter() {
+            out_dict.set_item(other_node.index(), new_node.index())?;
+        }
+        Ok(out_dict.into())
+    }
+
+    fn __sizeof__(&self) -> usize {
+        size_of::<Self>() + self._heap_bytes()
+    }
+
+    /// Get an estimate of the memory used by the graph
+    ///
+    /// :param bool deep: If set to ``True`` the memory used by the node and
+    ///     edge weight/data payloads is included, as reported by
+    ///     :func:`sys.getsizeof` for each payload and, for builtin
+    ///     containers (``list``, ``tuple``, ``dict``, ``set`` and
+    ///     ``frozenset``), everything they contain. Objects referenced more
+    ///     than once are only counted once. By default only the memory used
+    ///     by the graph itself is counted.
+    ///
+    /// :returns: A dictionary of the number of bytes used by each part of
+    ///     the graph with the keys:
+    ///
+    ///     * ``"object"``: the graph object itself
+    ///     * ``"node_slots"``: the slots holding nodes
+    ///     * ``"edge_slots"``: the slots holding edges
+    ///     * ``"free_node_slots"``: the slots left vacant by removed nodes,
+    ///       which are reused by new nodes
+    ///     * ``"free_edge_slots"``: the slots left vacant by removed edges,
+    ///       which are reused by new edges
+    ///     * ``"edge_index"``: the index of edges by their endpoints kept
+    ///       when ``multigraph`` is ``False``
+    ///     * ``"topo_order"``: the topological order kept when
+    ///       ``check_cycle`` is ``True``
+    ///     * ``"payload_index"``: the index of node payloads created by
+    ///       :meth:`~retworkx.PyDiGraph.build_payload_index`
+    ///     * ``"payloads"``: the node and edge payloads, only present if
+    ///       ``deep`` is ``True``
+    ///     * ``"total"``: the sum of all of the above
+    /// :rtype: dict
+    #[text_signature = "(self, /, deep=False)"]
+    #[args(deep = "false")]
+    pub fn memory_usage(&self, py: Python, deep: bool) -> PyResult<PyObject> {
+        let out_dict = PyDict::new(py);
+        let slots = graph_slots(&self.graph);
+        out_dict.set_item("object", size_of::<Self>())?;
+        out_dict.set_item("node_slots", slots.node_slots)?;
+        out_dict.set_item("edge_slots", slots.edge_slots)?;
+        out_dict.set_item("free_node_slots", slots.free_node_slots)?;
+        out_dict.set_item("free_edge_slots", slots.free_edge_slots)?;
+        out_dict.set_item(
+            "edge_index",
+            self.edge_map.as_ref().map_or(0, |map| map.heap_bytes()),
+        )?;
+        out_dict.set_item("topo_order", self.topo_order.heap_bytes())?;
+        out_dict.set_item("payload_index", self._payload_index_bytes())?;
+        let mut total = self.__sizeof__();
+        if deep {
+            let payloads = payload_bytes(
+                py,
+                self.graph
+                    .node_indices()
+                    .map(|node| &self.graph[node])
+                    .chain(
+                        self.graph.edge_indices().map(|edge| &self.graph[edge]),
+                    ),
+            )?;
+            out_dict.set_item("payloads", payloads)?;
+            total += payloads;
+        }
+        out_dict.set_item("total", total)?;
+        Ok(out_dict.into())
+    }
+
+    /// Return a shallow copy of the graph
+    ///
+    /// The new graph has the same nodes and edges with the same indices, and
+    /// the same settings as this graph. Unlike :func:`copy.deepcopy` the
+    /// structure of the graph is copied natively without going through
+    /// pickling, and the node and edge weight/data payloads are not copied.
+    /// They are passed by reference so if you update (not replace) an object
+    /// used as the weight in one graph it will also be updated in the other.
+    ///
+    /// :returns: A copy of this graph
+    /// :rtype: PyDiGraph
+    #[text_signature = "(self)"]
+    pub fn copy(&self) -> PyDiGraph {
+        self.clone()
+    }
+
+    fn __copy__(&self) -> PyDiGraph {
+        self.clone()
+    }
+
+    /// Remove the holes left in the node and edge indices by removals
+    ///
+    /// The graph is rebuilt so that the node indices and the edge indices
+    /// are contiguous from ``0``, keeping the relative order of the existing
+    /// indices. Node and edge weight/data payloads are not copied. A graph
+    /// without holes can use faster paths in methods and functions that
+    /// would otherwise need to remap the indices on every call.
+    ///
+    /// :returns: A tuple of two ``np.int64`` arrays ``(node_map, edge_map)``
+    ///     where ``node_map[old_index]`` is the new index of the node that
+    ///     had the index ``old_index`` (and similarly for ``edge_map`` and
+    ///     edges), or ``-1`` if there was no node (or edge) with that index.
+    ///     The arrays have one entry for every index up to the largest index
+    ///     in use before compacting.
+    /// :rtype: tuple
+    #[text_signature = "(self)"]
+    pub fn compact(&mut self, py: Python) -> (PyObject, PyObject) {
+        let node_bound = self.graph.node_bound();
+        let edge_bound = self
+            .graph
+            .edge_indices()
+            .last()
+            .map_or(0, |edge| edge.index() + 1);
+        let mut node_mapping: Vec<i64> = vec![-1; node_bound];
+        let mut edge_mapping: Vec<i64> = vec![-1; edge_bound];
+        let mut graph = StableDiGraph::<PyObject, PyObject>::with_capacity(
+            self.graph.node_count(),
+            self.graph.edge_count(),
+        );
+        for node in self.graph.node_indices() {
+            let new_node = graph.add_node(self.graph[node].clone_ref(py));
+            node_mapping[node.index()] = new_node.index() as i64;
+        }
+        for edge in self.graph.edge_indices() {
+            let (source, target) = self.graph.edge_endpoints(edge).unwrap();
+            let new_edge = graph.add_edge(
+                NodeIndex::new(node_mapping[source.index()] as usize),
+                NodeIndex::new(node_mapping[target.index()] as usize),
+                self.graph[edge].clone_ref(py),
+            );
+            edge_mapping[edge.index()] = new_edge.index() as i64;
+        }
+        self.graph = graph;
+        self.generation += 1;
+        self.node_removed = false;
+        if self.check_cycle {
+            self.topo_order =
+                TopoOrder::from_graph(&self.graph).unwrap_or_default();
+        }
+        self.edge_map = edge_map_for(&self.graph, self.multigraph);
+        if let Some(index) = &mut self.payload_index {
+            index.remap(&node_mapping);
+        }
+        (
+            node_mapping.into_pyarray(py).into(),
+            edge_mapping.into_pyarray(py).into(),
+        )
+    }
+
     /// Return a new PyDiGraph object for a subgraph of this graph
     ///
     /// :param list nodes: A list of node indices to generate the subgraph
@@ -2031,7 +3064,10 @@ impl PyDiGraph {
             HashMap::with_capacity(nodes.len());
         let node_filter =
             |node: NodeIndex| -> bool { node_set.contains(&node.index()) };
-        let mut out_graph = StableDiGraph::<PyObject, PyObject>::new();
+        let mut out_graph = StableDiGraph::<PyObject, PyObject>::with_capacity(
+            node_set.len(),
+            0,
+        );
         let filtered = NodeFiltered(self, node_filter);
         for node in filtered.node_references() {
             let new_node = out_graph.add_node(node.1.clone_ref(py));
@@ -2046,12 +3082,21 @@ impl PyDiGraph {
                 edge.weight().clone_ref(py),
             );
         }
+        let topo_order = if self.check_cycle {
+            TopoOrder::from_graph(&out_graph).unwrap_or_default()
+        } else {
+            TopoOrder::default()
+        };
+        let edge_map = edge_map_for(&out_graph, self.multigraph);
         PyDiGraph {
             graph: out_graph,
             node_removed: false,
-            cycle_state: algo::DfsSpace::default(),
+            generation: 0,
+            topo_order,
             check_cycle: self.check_cycle,
             multigraph: self.multigraph,
+            edge_map,
+            payload_index: None,
         }
     }
 
@@ -2078,6 +3123,23 @@ impl PyDiGraph {
         edges.is_empty()
     }
 
+    /// Return a read-only compressed sparse row snapshot of this graph
+    ///
+    /// The returned :class:`~retworkx.CSRDiGraph` stores the adjacency of
+    /// the graph in contiguous arrays which makes it much faster to traverse
+    /// than a :class:`~retworkx.PyDiGraph`. This is useful when the same
+    /// graph is analysed many times between mutations. Node and edge indices
+    /// are preserved and the node and edge weights/data payloads are passed
+    /// by reference to the new object. Later changes to this graph are not
+    /// reflected in the returned snapshot.
+    ///
+    /// :returns: A frozen copy of this graph
+    /// :rtype: CSRDiGraph
+    #[text_signature = "(self)"]
+    pub fn freeze(&self, py: Python) -> CSRDiGraph {
+        CSRDiGraph::from_graph(py, &self.graph)
+    }
+
     /// Generate a new PyGraph object from this graph
     ///
     /// This will create a new :class:`~retworkx.PyGraph` object from this
@@ -2091,7 +3153,10 @@ impl PyDiGraph {
     /// :rtype: PyGraph
     #[text_signature = "(self)"]
     pub fn to_undirected(&self, py: Python) -> crate::graph::PyGraph {
-        let mut new_graph = StableUnGraph::<PyObject, PyObject>::default();
+        let mut new_graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+            self.graph.node_count(),
+            self.graph.edge_count(),
+        );
         let mut node_map: HashMap<NodeIndex, NodeIndex> =
             HashMap::with_capacity(self.node_count());
         for node_index in self.graph.node_indices() {
@@ -2108,7 +3173,9 @@ impl PyDiGraph {
         crate::graph::PyGraph {
             graph: new_graph,
             node_removed: false,
+            generation: 0,
             multigraph: true,
+            edge_map: None,
         }
     }
 }
@@ -2127,43 +3194,34 @@ impl PyMappingProtocol for PyDiGraph {
     }
 
     fn __setitem__(&'p mut self, idx: usize, value: PyObject) -> PyResult<()> {
-        let data = match self
-            .graph
-            .node_weight_mut(NodeIndex::new(idx as usize))
-        {
+        let node = NodeIndex::new(idx as usize);
+        let data = match self.graph.node_weight_mut(node) {
             Some(node_data) => node_data,
             None => {
                 return Err(PyIndexError::new_err("No node found for index"))
             }
         };
+        if let Some(index) = &mut self.payload_index {
+            let gil = Python::acquire_gil();
+            let py = gil.python();
+            let hash = index.hash(py, &value)?;
+            index.remove_payload(py, node, data);
+            index.insert(hash, node);
+        }
         *data = value;
         Ok(())
     }
 
     fn __delitem__(&'p mut self, idx: usize) -> PyResult<()> {
-        match self.graph.remove_node(NodeIndex::new(idx as usize)) {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        match self._remove_node(py, NodeIndex::new(idx as usize)) {
             Some(_) => Ok(()),
             None => Err(PyIndexError::new_err("No node found for index")),
         }
     }
 }
 
-fn is_cycle_check_required(
-    dag: &PyDiGraph,
-    a: NodeIndex,
-    b: NodeIndex,
-) -> bool {
-    let mut parents_a = dag
-        .graph
-        .neighbors_directed(a, petgraph::Direction::Incoming);
-    let mut children_b = dag
-        .graph
-        .neighbors_directed(b, petgraph::Direction::Outgoing);
-    parents_a.next().is_some()
-        && children_b.next().is_some()
-        && dag.graph.find_edge(a, b).is_none()
-}
-
 fn weight_transform_callable(
     py: Python,
     map_fn: &Option<PyObject>,
@@ -2201,6 +3259,9 @@ impl PyGCProtocol for PyDiGraph {
         {
             visit.call(edge)?;
         }
+        if let Some(index) = &self.payload_index {
+            index.traverse(&visit)?;
+        }
         Ok(())
     }
 
@@ -2212,6 +3273,10 @@ impl PyGCProtocol for PyDiGraph {
     // [2] https://pyo3.rs/v0.12.4/class/protocols.html#garbage-collector-integration
     fn __clear__(&mut self) {
         self.graph = StableDiGraph::<PyObject, PyObject>::new();
+        self.generation += 1;
+        self.topo_order = TopoOrder::default();
+        self.edge_map = edge_map_for(&self.graph, self.multigraph);
+        self.payload_index = None;
         self.node_removed = false;
     }
 }
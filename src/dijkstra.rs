@@ -21,10 +21,12 @@ use std::collections::BinaryHeap;
 use std::hash::Hash;
 
 use hashbrown::hash_map::Entry::{Occupied, Vacant};
-use hashbrown::HashMap;
+use hashbrown::{HashMap, HashSet};
 
 use petgraph::algo::Measure;
+use petgraph::graph::NodeIndex;
 use petgraph::visit::{EdgeRef, IntoEdges, VisitMap, Visitable};
+use petgraph::Direction;
 
 use pyo3::prelude::*;
 
@@ -160,3 +162,114 @@ where
     }
     Ok(scores)
 }
+
+/// Bidirectional Dijkstra's shortest path algorithm.
+///
+/// Compute the length of the shortest path from `start` to `goal` and the
+/// path itself. A search is grown forward from `start` along the outgoing
+/// edges of each node and backward from `goal` along the incoming edges,
+/// always expanding the frontier with the lowest cost. The searches stop as soon as the sum of the lowest costs of both
+/// frontiers can't improve on the best path found through a node reached
+/// by both of them, so for point to point queries far fewer nodes are
+/// usually settled than by a search from `start` alone.
+///
+/// `edges(node, dir)` yields the `(neighbor, edge index)` pairs of the edges
+/// of `node` to follow in direction `dir`. The function `edge_cost` should
+/// return the cost for a particular edge index, which is used to compute
+/// path costs. Edge costs must be non-negative.
+///
+/// Returns `None` if there is no path from `start` to `goal`.
+pub fn bidirectional_dijkstra<E, I, F, K>(
+    start: NodeIndex,
+    goal: NodeIndex,
+    mut edges: E,
+    mut edge_cost: F,
+) -> PyResult<Option<(K, Vec<NodeIndex>)>>
+where
+    E: FnMut(NodeIndex, Direction) -> I,
+    I: Iterator<Item = (NodeIndex, usize)>,
+    F: FnMut(usize) -> PyResult<K>,
+    K: Measure + Copy,
+{
+    let zero_score = K::default();
+    if start == goal {
+        return Ok(Some((zero_score, vec![start])));
+    }
+    // Index 0 is the forward search from start and 1 the backward search
+    // from goal
+    let directions = [Direction::Outgoing, Direction::Incoming];
+    let mut scores: [HashMap<NodeIndex, K>; 2] =
+        [HashMap::new(), HashMap::new()];
+    let mut predecessors: [HashMap<NodeIndex, NodeIndex>; 2] =
+        [HashMap::new(), HashMap::new()];
+    let mut settled: [HashSet<NodeIndex>; 2] = [HashSet::new(), HashSet::new()];
+    let mut visit_next: [BinaryHeap<MinScored<K, NodeIndex>>; 2] =
+        [BinaryHeap::new(), BinaryHeap::new()];
+    scores[0].insert(start, zero_score);
+    scores[1].insert(goal, zero_score);
+    visit_next[0].push(MinScored(zero_score, start));
+    visit_next[1].push(MinScored(zero_score, goal));
+    // The shortest path found so far and the node both searches met at
+    let mut best: Option<(K, NodeIndex)> = None;
+    loop {
+        let (forward_score, backward_score) =
+            match (visit_next[0].peek(), visit_next[1].peek()) {
+                (Some(forward), Some(backward)) => (forward.0, backward.0),
+                _ => break,
+            };
+        if let Some((best_score, _)) = best {
+            if forward_score + backward_score >= best_score {
+                break;
+            }
+        }
+        let side = if forward_score <= backward_score {
+            0
+        } else {
+            1
+        };
+        let MinScored(node_score, node) = visit_next[side].pop().unwrap();
+        if !settled[side].insert(node) {
+            continue;
+        }
+        for (next, edge) in edges(node, directions[side]) {
+            if settled[side].contains(&next) {
+                continue;
+            }
+            let next_score = node_score + edge_cost(edge)?;
+            let improved = match scores[side].get(&next) {
+                Some(score) => next_score < *score,
+                None => true,
+            };
+            if !improved {
+                continue;
+            }
+            scores[side].insert(next, next_score);
+            predecessors[side].insert(next, node);
+            visit_next[side].push(MinScored(next_score, next));
+            if let Some(other_score) = scores[1 - side].get(&next) {
+                let path_score = next_score + *other_score;
+                if best.map_or(true, |(best_score, _)| path_score < best_score)
+                {
+                    best = Some((path_score, next));
+                }
+            }
+        }
+    }
+    let (best_score, meet) = match best {
+        Some(best) => best,
+        None => return Ok(None),
+    };
+    let mut path: Vec<NodeIndex> = vec![meet];
+    let mut node = meet;
+    while let Some(prev) = predecessors[0].get(&node) {
+        path.push(*prev);
+        node = *prev;
+    }
+    path.reverse();
+    node = meet;
+    while let Some(next) = predecessors[1].get(&node) {
+        path.push(*next);
+        node = *next;
+    }
+    Ok(Some((best_score, path)))
+}
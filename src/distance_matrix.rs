@@ -0,0 +1,361 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+// Unweighted distance matrices computed with one breadth-first search per
+// row on a compressed sparse row adjacency.
+//
+// Each search switches between the usual top-down step, which scans the
+// edges of the frontier, and a bottom-up step, which checks every node not
+// found yet for a parent in the frontier. The bottom-up step is much cheaper
+// once the frontier holds a large part of the graph, which happens after a
+// few levels on small world graphs. The switching heuristic is the one from
+// Beamer et al., "Direction-Optimizing Breadth-First Search" (SC 2012).
+
+use std::sync::atomic::{AtomicBool, Ordering};
+
+use fixedbitset::FixedBitSet;
+
+use ndarray::prelude::*;
+use rayon::prelude::*;
+
+use super::csr::Adjacency;
+
+/// Switch to bottom-up once the frontier has more than ``1 / ALPHA`` of the
+/// edges of the nodes that haven't been found yet
+const ALPHA: usize = 14;
+/// Switch back to top-down once the frontier has less than ``1 / BETA`` of
+/// the nodes
+const BETA: usize = 24;
+
+/// An element type for a distance matrix.
+pub trait Distance: Copy + Send + Sync {
+    /// The dtype name of the type
+    const NAME: &'static str;
+    /// The largest distance the type can hold
+    const MAX: usize;
+
+    fn from_usize(value: usize) -> Self;
+
+    /// Convert ``value``, returning ``None`` if the type can't hold it
+    fn from_f64(value: f64) -> Option<Self>;
+}
+
+impl Distance for f64 {
+    const NAME: &'static str = "float64";
+    const MAX: usize = std::usize::MAX;
+
+    fn from_usize(value: usize) -> Self {
+        value as f64
+    }
+
+    fn from_f64(value: f64) -> Option<Self> {
+        Some(value)
+    }
+}
+
+macro_rules! integer_distance {
+    ($type:ty, $name:expr, $min:expr, $max:expr) => {
+        impl Distance for $type {
+            const NAME: &'static str = $name;
+            const MAX: usize = $max as usize;
+
+            fn from_usize(value: usize) -> Self {
+                value as $type
+            }
+
+            fn from_f64(value: f64) -> Option<Self> {
+                if value.fract() == 0.0
+                    && value >= $min as f64
+                    && value <= $max as f64
+                {
+                    Some(value as $type)
+                } else {
+                    None
+                }
+            }
+        }
+    };
+}
+
+integer_distance!(i32, "int32", std::i32::MIN, std::i32::MAX);
+integer_distance!(u16, "uint16", std::u16::MIN, std::u16::MAX);
+integer_distance!(u8, "uint8", std::u8::MIN, std::u8::MAX);
+
+/// The adjacency of a graph prepared for breadth-first searches.
+pub struct BfsGraph<'a> {
+    /// The rows followed by a top-down step
+    out_rows: &'a [&'a Adjacency],
+    /// The rows followed backwards by a bottom-up step, every edge of
+    /// ``out_rows`` must appear reversed in them
+    in_rows: &'a [&'a Adjacency],
+    /// The node indices of the graph, in output order
+    pub nodes: Vec<usize>,
+    /// The position of every node index in ``nodes``
+    pub position: Vec<usize>,
+    degree: Vec<usize>,
+    degree_total: usize,
+    node_bound: usize,
+}
+
+impl<'a> BfsGraph<'a> {
+    pub fn new(
+        out_rows: &'a [&'a Adjacency],
+        in_rows: &'a [&'a Adjacency],
+        nodes: Vec<usize>,
+        node_bound: usize,
+    ) -> Self {
+        let mut position: Vec<usize> = vec![0; node_bound];
+        for (pos, node) in nodes.iter().enumerate() {
+            position[*node] = pos;
+        }
+        let degree: Vec<usize> = (0..node_bound)
+            .map(|node| out_rows.iter().map(|adj| adj.row(node).len()).sum())
+            .collect();
+        let degree_total = degree.iter().sum();
+        BfsGraph {
+            out_rows,
+            in_rows,
+            nodes,
+            position,
+            degree,
+            degree_total,
+            node_bound,
+        }
+    }
+
+    /// Fill ``matrix`` with the distances from the nodes at positions
+    /// ``first..first + matrix.nrows()`` to every node. The diagonal is set
+    /// to ``0`` and the entries of nodes that can't be reached, or that are
+    /// further than ``cutoff`` if it is set, are left untouched. The rows are
+    /// computed in parallel if ``parallel`` is set, this is left to the
+    /// caller since ``matrix`` may only be one chunk of the full matrix.
+    ///
+    /// Returns ``false`` if a distance within ``cutoff`` is larger than
+    /// ``max_distance``, in which case the rows are incomplete.
+    /// ``max_distance`` is at most ``T::MAX``, it is lower if the largest
+    /// values of ``T`` are reserved for the entries of unreachable nodes.
+    pub fn fill<T: Distance>(
+        &self,
+        mut matrix: ArrayViewMut2<T>,
+        first: usize,
+        cutoff: Option<usize>,
+        max_distance: usize,
+        parallel: bool,
+    ) -> bool {
+        let (limit, checked) = search_limit(cutoff, max_distance);
+        let too_far = AtomicBool::new(false);
+        let search =
+            |state: &mut BfsState,
+             (index, mut row): (usize, ArrayViewMut1<T>)| {
+                let source = self.nodes[first + index];
+                row[self.position[source]] = T::from_usize(0);
+                let cut = state.run(self, source, limit, |node, level| {
+                    row[self.position[node]] = T::from_usize(level);
+                });
+                if cut && checked {
+                    too_far.store(true, Ordering::Relaxed);
+                }
+            };
+        if !parallel {
+            let mut state = BfsState::new(self.node_bound);
+            matrix
+                .axis_iter_mut(Axis(0))
+                .enumerate()
+                .for_each(|item| search(&mut state, item));
+        } else {
+            matrix
+                .axis_iter_mut(Axis(0))
+                .into_par_iter()
+                .enumerate()
+                .for_each_init(
+                    || BfsState::new(self.node_bound),
+                    |state, item| search(state, item),
+                );
+        }
+        !too_far.load(Ordering::Relaxed)
+    }
+
+    /// Find the distances from every node to the nodes within ``cutoff`` of
+    /// it (all the nodes it can reach if ``cutoff`` isn't set). Every row is
+    /// a list of ``(position, distance)`` pairs sorted by position, the
+    /// source itself is left out. The rows are computed in parallel if there
+    /// are at least ``parallel_threshold`` nodes.
+    ///
+    /// Returns ``None`` if a distance within ``cutoff`` is larger than
+    /// ``T::MAX``.
+    pub fn sparse_rows<T: Distance>(
+        &self,
+        cutoff: Option<usize>,
+        parallel_threshold: usize,
+    ) -> Option<Vec<Vec<(usize, T)>>> {
+        let (limit, checked) = search_limit(cutoff, T::MAX);
+        let too_far = AtomicBool::new(false);
+        let search = |state: &mut BfsState, source: &usize| {
+            let mut row: Vec<(usize, T)> = Vec::new();
+            let cut = state.run(self, *source, limit, |node, level| {
+                row.push((self.position[node], T::from_usize(level)));
+            });
+            if cut && checked {
+                too_far.store(true, Ordering::Relaxed);
+            }
+            row.sort_unstable_by_key(|(position, _)| *position);
+            row
+        };
+        let rows: Vec<Vec<(usize, T)>> =
+            if self.nodes.len() < parallel_threshold {
+                let mut state = BfsState::new(self.node_bound);
+                self.nodes
+                    .iter()
+                    .map(|source| search(&mut state, source))
+                    .collect()
+            } else {
+                self.nodes
+                    .par_iter()
+                    .map_init(
+                        || BfsState::new(self.node_bound),
+                        |state, source| search(state, source),
+                    )
+                    .collect()
+            };
+        if too_far.load(Ordering::Relaxed) {
+            None
+        } else {
+            Some(rows)
+        }
+    }
+}
+
+/// The depth to stop a search at for ``cutoff`` when the largest distance
+/// that can be stored is ``max_distance``, and whether reaching it means a
+/// distance can't be stored.
+fn search_limit(cutoff: Option<usize>, max_distance: usize) -> (usize, bool) {
+    match cutoff {
+        Some(cutoff) if cutoff <= max_distance => (cutoff, false),
+        _ => (max_distance, true),
+    }
+}
+
+/// The buffers of a breadth-first search, reused between searches.
+pub struct BfsState {
+    visited: FixedBitSet,
+    frontier_set: FixedBitSet,
+    frontier: Vec<usize>,
+    next: Vec<usize>,
+    unvisited: Vec<usize>,
+}
+
+impl BfsState {
+    pub fn new(node_bound: usize) -> Self {
+        BfsState {
+            visited: FixedBitSet::with_capacity(node_bound),
+            frontier_set: FixedBitSet::with_capacity(node_bound),
+            frontier: Vec::new(),
+            next: Vec::new(),
+            unvisited: Vec::new(),
+        }
+    }
+
+    /// Run a breadth-first search from ``source`` calling ``visit`` with
+    /// every node found (other than ``source``) and its distance from
+    /// ``source``, in order of distance. The search stops after the nodes
+    /// at distance ``cutoff``, in which case it returns whether there are
+    /// nodes further away.
+    pub fn run<F>(
+        &mut self,
+        graph: &BfsGraph,
+        source: usize,
+        cutoff: usize,
+        mut visit: F,
+    ) -> bool
+    where
+        F: FnMut(usize, usize),
+    {
+        self.visited.clear();
+        self.visited.insert(source);
+        self.frontier.clear();
+        self.frontier.push(source);
+        self.unvisited.clear();
+        let mut unvisited_ready = false;
+        let mut found: usize = 1;
+        let mut remaining_degree = graph.degree_total - graph.degree[source];
+        let mut bottom_up = false;
+        let mut level: usize = 0;
+        while !self.frontier.is_empty() && found < graph.nodes.len() {
+            if level == cutoff {
+                let visited = &self.visited;
+                return self.frontier.iter().any(|node| {
+                    graph.out_rows.iter().any(|adj| {
+                        adj.row(*node).iter().any(|next| !visited[*next])
+                    })
+                });
+            }
+            level += 1;
+            if bottom_up {
+                bottom_up = self.frontier.len() * BETA >= graph.nodes.len();
+            } else {
+                let frontier_degree: usize =
+                    self.frontier.iter().map(|node| graph.degree[*node]).sum();
+                bottom_up = frontier_degree * ALPHA > remaining_degree;
+            }
+            self.next.clear();
+            if bottom_up {
+                if !unvisited_ready {
+                    let visited = &self.visited;
+                    self.unvisited.extend(
+                        graph.nodes.iter().filter(|node| !visited[**node]),
+                    );
+                    unvisited_ready = true;
+                }
+                self.frontier_set.clear();
+                for node in &self.frontier {
+                    self.frontier_set.insert(*node);
+                }
+                let visited = &mut self.visited;
+                let frontier_set = &self.frontier_set;
+                let next = &mut self.next;
+                self.unvisited.retain(|node| {
+                    if visited[*node] {
+                        return false;
+                    }
+                    let has_parent = graph.in_rows.iter().any(|adj| {
+                        adj.row(*node)
+                            .iter()
+                            .any(|parent| frontier_set[*parent])
+                    });
+                    if has_parent {
+                        visited.insert(*node);
+                        next.push(*node);
+                    }
+                    !has_parent
+                });
+            } else {
+                for node in &self.frontier {
+                    for adj in graph.out_rows {
+                        for next in adj.row(*node) {
+                            if !self.visited[*next] {
+                                self.visited.insert(*next);
+                                self.next.push(*next);
+                            }
+                        }
+                    }
+                }
+            }
+            for node in &self.next {
+                found += 1;
+                remaining_degree -= graph.degree[*node];
+                visit(*node, level);
+            }
+            std::mem::swap(&mut self.frontier, &mut self.next);
+        }
+        false
+    }
+}
@@ -0,0 +1,118 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use hashbrown::HashMap;
+
+use pyo3::prelude::*;
+
+use petgraph::graph::{EdgeIndex, NodeIndex};
+use petgraph::stable_graph::StableGraph;
+use petgraph::visit::EdgeRef;
+use petgraph::{Direction, EdgeType};
+
+use super::memory::hash_map_bytes;
+
+/// A hash index from the endpoints of an edge to its edge index.
+///
+/// This is kept by graphs that don't allow parallel edges so that finding
+/// the edge between two nodes doesn't need to scan the adjacency list of
+/// either of them. For undirected graphs the endpoints are stored in sorted
+/// order. Entries are validated against the graph on lookup, so an entry
+/// left behind by a removed edge is never returned.
+#[derive(Clone)]
+pub struct EdgeMap {
+    map: HashMap<(NodeIndex, NodeIndex), EdgeIndex>,
+    directed: bool,
+}
+
+/// Build an ``EdgeMap`` for ``graph`` if it is not a multigraph.
+pub fn edge_map_for<Ty: EdgeType>(
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    multigraph: bool,
+) -> Option<EdgeMap> {
+    if multigraph {
+        return None;
+    }
+    let mut out = EdgeMap {
+        map: HashMap::with_capacity(graph.edge_count()),
+        directed: Ty::is_directed(),
+    };
+    for edge in graph.edge_references() {
+        out.insert(edge.source(), edge.target(), edge.id());
+    }
+    Some(out)
+}
+
+impl EdgeMap {
+    fn key(&self, a: NodeIndex, b: NodeIndex) -> (NodeIndex, NodeIndex) {
+        if self.directed || a <= b {
+            (a, b)
+        } else {
+            (b, a)
+        }
+    }
+
+    /// Find the edge between ``a`` and ``b`` in ``graph``.
+    pub fn get<Ty: EdgeType>(
+        &self,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+        a: NodeIndex,
+        b: NodeIndex,
+    ) -> Option<EdgeIndex> {
+        let key = self.key(a, b);
+        let edge = *self.map.get(&key)?;
+        let (source, target) = graph.edge_endpoints(edge)?;
+        if self.key(source, target) == key {
+            Some(edge)
+        } else {
+            None
+        }
+    }
+
+    /// Record ``edge`` as the edge between ``a`` and ``b``.
+    pub fn insert(&mut self, a: NodeIndex, b: NodeIndex, edge: EdgeIndex) {
+        let key = self.key(a, b);
+        self.map.insert(key, edge);
+    }
+
+    /// Forget ``edge`` as the edge between ``a`` and ``b``.
+    pub fn remove(&mut self, a: NodeIndex, b: NodeIndex, edge: EdgeIndex) {
+        let key = self.key(a, b);
+        if self.map.get(&key) == Some(&edge) {
+            self.map.remove(&key);
+        }
+    }
+
+    /// Reserve capacity for at least ``additional`` more edges.
+    pub fn reserve(&mut self, additional: usize) {
+        self.map.reserve(additional);
+    }
+
+    /// The bytes allocated for the index.
+    pub fn heap_bytes(&self) -> usize {
+        hash_map_bytes(&self.map)
+    }
+
+    /// Forget every edge incident to ``node`` before it is removed from
+    /// ``graph``.
+    pub fn remove_node<Ty: EdgeType>(
+        &mut self,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+        node: NodeIndex,
+    ) {
+        for dir in &[Direction::Outgoing, Direction::Incoming] {
+            for edge in graph.edges_directed(node, *dir) {
+                self.remove(edge.source(), edge.target(), edge.id());
+            }
+        }
+    }
+}
@@ -0,0 +1,201 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+// A blocked Floyd-Warshall kernel on a dense row major distance matrix.
+//
+// The pivot nodes are processed in blocks of ``BLOCK_SIZE``. The rows of the
+// pivot block are first relaxed against each other, after which they are
+// final for that block and are copied into a small buffer that stays in
+// cache while every other row is relaxed against it, one tile of columns at
+// a time. The inner min-plus loop runs over contiguous slices so the
+// compiler can vectorize it.
+
+use std::ops::Add;
+
+use rayon::prelude::*;
+
+/// Number of pivot nodes in a block
+const BLOCK_SIZE: usize = 64;
+/// Number of columns relaxed against all the pivot rows of a block at once
+const COLUMN_TILE: usize = 512;
+
+/// An edge weight type the kernel can run on.
+pub trait Weight: Copy + PartialOrd + Add<Output = Self> + Send + Sync {
+    const INFINITY: Self;
+    const ZERO: Self;
+
+    fn from_f64(value: f64) -> Self;
+}
+
+impl Weight for f64 {
+    const INFINITY: Self = std::f64::INFINITY;
+    const ZERO: Self = 0.0;
+
+    fn from_f64(value: f64) -> Self {
+        value
+    }
+}
+
+impl Weight for f32 {
+    const INFINITY: Self = std::f32::INFINITY;
+    const ZERO: Self = 0.0;
+
+    fn from_f64(value: f64) -> Self {
+        value as f32
+    }
+}
+
+type Row<'a, T> = (&'a mut [T], Option<&'a mut [i64]>);
+
+#[inline]
+fn relax<T: Weight>(row: &mut [T], d_ik: T, row_k: &[T]) {
+    for (d_ij, d_kj) in row.iter_mut().zip(row_k) {
+        let d_ikj = d_ik + *d_kj;
+        *d_ij = if d_ikj < *d_ij { d_ikj } else { *d_ij };
+    }
+}
+
+#[inline]
+fn relax_with_pred<T: Weight>(
+    row: &mut [T],
+    pred_row: &mut [i64],
+    d_ik: T,
+    row_k: &[T],
+    pred_row_k: &[i64],
+) {
+    for ((d_ij, p_ij), (d_kj, p_kj)) in row
+        .iter_mut()
+        .zip(pred_row.iter_mut())
+        .zip(row_k.iter().zip(pred_row_k))
+    {
+        let d_ikj = d_ik + *d_kj;
+        if d_ikj < *d_ij {
+            *d_ij = d_ikj;
+            *p_ij = *p_kj;
+        }
+    }
+}
+
+/// Relax the columns ``lo..hi`` of a row against the rows of pivot nodes
+/// ``start..end``, which are stored from ``start`` in ``pivot``.
+#[inline]
+fn relax_columns<T: Weight>(
+    (row, pred_row): &mut Row<T>,
+    pivot: &[T],
+    pivot_pred: &[i64],
+    (start, end): (usize, usize),
+    (lo, hi): (usize, usize),
+) {
+    let n = row.len();
+    for k in start..end {
+        let d_ik = row[k];
+        if d_ik == T::INFINITY {
+            continue;
+        }
+        let offset = (k - start) * n;
+        match pred_row {
+            Some(pred_row) => relax_with_pred(
+                &mut row[lo..hi],
+                &mut pred_row[lo..hi],
+                d_ik,
+                &pivot[offset + lo..offset + hi],
+                &pivot_pred[offset + lo..offset + hi],
+            ),
+            None => {
+                relax(&mut row[lo..hi], d_ik, &pivot[offset + lo..offset + hi])
+            }
+        }
+    }
+}
+
+/// Run the Floyd-Warshall relaxation in place on the ``n`` by ``n`` row
+/// major matrix ``dist``.
+///
+/// ``dist`` must already hold the direct edge weights with ``0`` on the
+/// diagonal and ``inf`` for missing edges. If ``pred`` is set it must hold
+/// ``i`` at ``(i, j)`` for every edge ``i -> j`` and ``-1`` everywhere else,
+/// and it is updated so that ``(i, j)`` is the node before ``j`` on the
+/// shortest path from ``i`` to ``j``. Rows outside of the pivot block are
+/// relaxed in parallel if ``n`` is at least ``parallel_threshold``.
+pub fn floyd_warshall<T: Weight>(
+    dist: &mut [T],
+    pred: Option<&mut [i64]>,
+    n: usize,
+    parallel_threshold: usize,
+) {
+    if n == 0 {
+        return;
+    }
+    let mut rows: Vec<Row<T>> = match pred {
+        Some(pred) => dist
+            .chunks_mut(n)
+            .zip(pred.chunks_mut(n).map(Some))
+            .collect(),
+        None => dist.chunks_mut(n).map(|row| (row, None)).collect(),
+    };
+    let with_pred = rows[0].1.is_some();
+    let mut pivot: Vec<T> = Vec::with_capacity(BLOCK_SIZE * n);
+    let mut pivot_pred: Vec<i64> =
+        Vec::with_capacity(if with_pred { BLOCK_SIZE * n } else { 0 });
+    for start in (0..n).step_by(BLOCK_SIZE) {
+        let end = (start + BLOCK_SIZE).min(n);
+        // Relax the rows of the pivot block against each other, the pivot
+        // row is copied since it is also one of the rows being relaxed
+        for k in start..end {
+            pivot.clear();
+            pivot.extend_from_slice(rows[k].0);
+            pivot_pred.clear();
+            if let Some(pred_row) = &rows[k].1 {
+                pivot_pred.extend_from_slice(pred_row);
+            }
+            for row in rows[start..end].iter_mut() {
+                relax_columns(row, &pivot, &pivot_pred, (k, k + 1), (0, n));
+            }
+        }
+        pivot.clear();
+        pivot_pred.clear();
+        for (row, pred_row) in rows[start..end].iter() {
+            pivot.extend_from_slice(row);
+            if let Some(pred_row) = pred_row {
+                pivot_pred.extend_from_slice(pred_row);
+            }
+        }
+        // The columns of the pivot block go first so the entries used as
+        // d_ik are final before the remaining columns are relaxed
+        let tiles: Vec<(usize, usize)> = std::iter::once((start, end))
+            .chain(
+                (0..start)
+                    .step_by(COLUMN_TILE)
+                    .map(|lo| (lo, (lo + COLUMN_TILE).min(start))),
+            )
+            .chain(
+                (end..n)
+                    .step_by(COLUMN_TILE)
+                    .map(|lo| (lo, (lo + COLUMN_TILE).min(n))),
+            )
+            .collect();
+        let update = |row: &mut Row<T>| {
+            for tile in &tiles {
+                relax_columns(row, &pivot, &pivot_pred, (start, end), *tile);
+            }
+        };
+        let (head, rest) = rows.split_at_mut(start);
+        let tail = &mut rest[end - start..];
+        if n < parallel_threshold {
+            head.iter_mut().chain(tail.iter_mut()).for_each(update);
+        } else {
+            head.par_iter_mut()
+                .chain(tail.par_iter_mut())
+                .for_each(update);
+        }
+    }
+}
@@ -12,7 +12,7 @@
 
 use std::iter;
 
-use petgraph::algo;
+use super::topo_order::TopoOrder;
 use petgraph::graph::NodeIndex;
 use petgraph::stable_graph::{StableDiGraph, StableUnGraph};
 
@@ -22,6 +22,7 @@ use pyo3::wrap_pyfunction;
 use pyo3::Python;
 
 use super::digraph;
+use super::edge_map::edge_map_for;
 use super::graph;
 
 fn pairwise<I>(right: I) -> impl Iterator<Item = (Option<I::Item>, I::Item)>
@@ -32,6 +33,18 @@ where
     left.zip(right)
 }
 
+/// Get the number of nodes a generator creates from its ``num_nodes`` and
+/// ``weights`` arguments, one of which must be set.
+fn get_num_nodes(
+    num_nodes: &Option<usize>,
+    weights: &Option<Vec<PyObject>>,
+) -> usize {
+    match weights {
+        Some(weights) => weights.len(),
+        None => num_nodes.unwrap(),
+    }
+}
+
 /// Generate a cycle graph
 ///
 /// :param int num_node: The number of nodes to generate the graph with. Node
@@ -78,29 +91,31 @@ pub fn directed_cycle_graph(
     weights: Option<Vec<PyObject>>,
     bidirectional: bool,
 ) -> PyResult<digraph::PyDiGraph> {
-    let mut graph = StableDiGraph::<PyObject, PyObject>::default();
     if weights.is_none() && num_nodes.is_none() {
         return Err(PyIndexError::new_err(
             "num_nodes and weights list not specified",
         ));
     }
-    let node_len: usize;
+    let node_len = get_num_nodes(&num_nodes, &weights);
+    let edge_len = if bidirectional {
+        2 * node_len
+    } else {
+        node_len
+    };
+    let mut graph =
+        StableDiGraph::<PyObject, PyObject>::with_capacity(node_len, edge_len);
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
-            node_len = weights.len();
             for weight in weights {
                 let index = graph.add_node(weight);
                 node_list.push(index);
             }
             node_list
         }
-        None => {
-            node_len = num_nodes.unwrap();
-            (0..num_nodes.unwrap())
-                .map(|_| graph.add_node(py.None()))
-                .collect()
-        }
+        None => (0..num_nodes.unwrap())
+            .map(|_| graph.add_node(py.None()))
+            .collect(),
     };
     for (node_a, node_b) in pairwise(nodes) {
         match node_a {
@@ -122,9 +137,12 @@ pub fn directed_cycle_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        generation: 0,
         check_cycle: false,
-        cycle_state: algo::DfsSpace::default(),
+        topo_order: TopoOrder::default(),
         multigraph: true,
+        edge_map: None,
+        payload_index: None,
     })
 }
 
@@ -176,29 +194,26 @@ pub fn cycle_graph(
     weights: Option<Vec<PyObject>>,
     multigraph: bool,
 ) -> PyResult<graph::PyGraph> {
-    let mut graph = StableUnGraph::<PyObject, PyObject>::default();
     if weights.is_none() && num_nodes.is_none() {
         return Err(PyIndexError::new_err(
             "num_nodes and weights list not specified",
         ));
     }
-    let node_len: usize;
+    let node_len = get_num_nodes(&num_nodes, &weights);
+    let mut graph =
+        StableUnGraph::<PyObject, PyObject>::with_capacity(node_len, node_len);
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
-            node_len = weights.len();
             for weight in weights {
                 let index = graph.add_node(weight);
                 node_list.push(index);
             }
             node_list
         }
-        None => {
-            node_len = num_nodes.unwrap();
-            (0..num_nodes.unwrap())
-                .map(|_| graph.add_node(py.None()))
-                .collect()
-        }
+        None => (0..num_nodes.unwrap())
+            .map(|_| graph.add_node(py.None()))
+            .collect(),
     };
     for (node_a, node_b) in pairwise(nodes) {
         match node_a {
@@ -209,10 +224,13 @@ pub fn cycle_graph(
     let last_node_index = NodeIndex::new(node_len - 1);
     let first_node_index = NodeIndex::new(0);
     graph.add_edge(last_node_index, first_node_index, py.None());
+    let edge_map = edge_map_for(&graph, multigraph);
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        generation: 0,
         multigraph,
+        edge_map,
     })
 }
 
@@ -262,12 +280,19 @@ pub fn directed_path_graph(
     weights: Option<Vec<PyObject>>,
     bidirectional: bool,
 ) -> PyResult<digraph::PyDiGraph> {
-    let mut graph = StableDiGraph::<PyObject, PyObject>::default();
     if weights.is_none() && num_nodes.is_none() {
         return Err(PyIndexError::new_err(
             "num_nodes and weights list not specified",
         ));
     }
+    let node_len = get_num_nodes(&num_nodes, &weights);
+    let edge_len = if bidirectional {
+        2 * node_len.saturating_sub(1)
+    } else {
+        node_len.saturating_sub(1)
+    };
+    let mut graph =
+        StableDiGraph::<PyObject, PyObject>::with_capacity(node_len, edge_len);
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
@@ -295,9 +320,12 @@ pub fn directed_path_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        generation: 0,
         check_cycle: false,
-        cycle_state: algo::DfsSpace::default(),
+        topo_order: TopoOrder::default(),
         multigraph: true,
+        edge_map: None,
+        payload_index: None,
     })
 }
 
@@ -349,12 +377,16 @@ pub fn path_graph(
     weights: Option<Vec<PyObject>>,
     multigraph: bool,
 ) -> PyResult<graph::PyGraph> {
-    let mut graph = StableUnGraph::<PyObject, PyObject>::default();
     if weights.is_none() && num_nodes.is_none() {
         return Err(PyIndexError::new_err(
             "num_nodes and weights list not specified",
         ));
     }
+    let node_len = get_num_nodes(&num_nodes, &weights);
+    let mut graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+        node_len,
+        node_len.saturating_sub(1),
+    );
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
@@ -374,10 +406,13 @@ pub fn path_graph(
             None => continue,
         };
     }
+    let edge_map = edge_map_for(&graph, multigraph);
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        generation: 0,
         multigraph,
+        edge_map,
     })
 }
 
@@ -454,12 +489,19 @@ pub fn directed_star_graph(
     inward: bool,
     bidirectional: bool,
 ) -> PyResult<digraph::PyDiGraph> {
-    let mut graph = StableDiGraph::<PyObject, PyObject>::default();
     if weights.is_none() && num_nodes.is_none() {
         return Err(PyIndexError::new_err(
             "num_nodes and weights list not specified",
         ));
     }
+    let node_len = get_num_nodes(&num_nodes, &weights);
+    let edge_len = if bidirectional {
+        2 * node_len.saturating_sub(1)
+    } else {
+        node_len.saturating_sub(1)
+    };
+    let mut graph =
+        StableDiGraph::<PyObject, PyObject>::with_capacity(node_len, edge_len);
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
@@ -487,9 +529,12 @@ pub fn directed_star_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        generation: 0,
         check_cycle: false,
-        cycle_state: algo::DfsSpace::default(),
+        topo_order: TopoOrder::default(),
         multigraph: true,
+        edge_map: None,
+        payload_index: None,
     })
 }
 
@@ -541,12 +586,16 @@ pub fn star_graph(
     weights: Option<Vec<PyObject>>,
     multigraph: bool,
 ) -> PyResult<graph::PyGraph> {
-    let mut graph = StableUnGraph::<PyObject, PyObject>::default();
     if weights.is_none() && num_nodes.is_none() {
         return Err(PyIndexError::new_err(
             "num_nodes and weights list not specified",
         ));
     }
+    let node_len = get_num_nodes(&num_nodes, &weights);
+    let mut graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+        node_len,
+        node_len.saturating_sub(1),
+    );
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
@@ -563,10 +612,13 @@ pub fn star_graph(
     for node in nodes[1..].iter() {
         graph.add_edge(nodes[0], *node, py.None());
     }
+    let edge_map = edge_map_for(&graph, multigraph);
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        generation: 0,
         multigraph,
+        edge_map,
     })
 }
 
@@ -617,12 +669,16 @@ pub fn mesh_graph(
     weights: Option<Vec<PyObject>>,
     multigraph: bool,
 ) -> PyResult<graph::PyGraph> {
-    let mut graph = StableUnGraph::<PyObject, PyObject>::default();
     if weights.is_none() && num_nodes.is_none() {
         return Err(PyIndexError::new_err(
             "num_nodes and weights list not specified",
         ));
     }
+    let node_len = get_num_nodes(&num_nodes, &weights);
+    let mut graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+        node_len,
+        node_len * node_len.saturating_sub(1) / 2,
+    );
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
@@ -643,10 +699,13 @@ pub fn mesh_graph(
             graph.add_edge(nodes[i], nodes[j], py.None());
         }
     }
+    let edge_map = edge_map_for(&graph, multigraph);
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        generation: 0,
         multigraph,
+        edge_map,
     })
 }
 
@@ -692,12 +751,16 @@ pub fn directed_mesh_graph(
     num_nodes: Option<usize>,
     weights: Option<Vec<PyObject>>,
 ) -> PyResult<digraph::PyDiGraph> {
-    let mut graph = StableDiGraph::<PyObject, PyObject>::default();
     if weights.is_none() && num_nodes.is_none() {
         return Err(PyIndexError::new_err(
             "num_nodes and weights list not specified",
         ));
     }
+    let node_len = get_num_nodes(&num_nodes, &weights);
+    let mut graph = StableDiGraph::<PyObject, PyObject>::with_capacity(
+        node_len,
+        node_len * node_len.saturating_sub(1),
+    );
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
@@ -721,9 +784,12 @@ pub fn directed_mesh_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        generation: 0,
         check_cycle: false,
-        cycle_state: algo::DfsSpace::default(),
+        topo_order: TopoOrder::default(),
         multigraph: true,
+        edge_map: None,
+        payload_index: None,
     })
 }
 
@@ -783,7 +849,6 @@ pub fn grid_graph(
     weights: Option<Vec<PyObject>>,
     multigraph: bool,
 ) -> PyResult<graph::PyGraph> {
-    let mut graph = StableUnGraph::<PyObject, PyObject>::default();
     if weights.is_none() && (rows.is_none() || cols.is_none()) {
         return Err(PyIndexError::new_err(
             "dimensions and weights list not specified",
@@ -794,15 +859,21 @@ pub fn grid_graph(
     let mut collen = cols.unwrap_or(0);
     let mut num_nodes = rowlen * collen;
 
+    if let Some(weights) = &weights {
+        if num_nodes < weights.len() && rowlen == 0 {
+            collen = weights.len();
+            rowlen = 1;
+            num_nodes = collen;
+        }
+    }
+    let edge_len =
+        rowlen * collen.saturating_sub(1) + rowlen.saturating_sub(1) * collen;
+    let mut graph =
+        StableUnGraph::<PyObject, PyObject>::with_capacity(num_nodes, edge_len);
+
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
-            if num_nodes < weights.len() && rowlen == 0 {
-                collen = weights.len();
-                rowlen = 1;
-                num_nodes = collen;
-            }
-
             let mut node_cnt = num_nodes;
 
             for weight in weights {
@@ -840,10 +911,13 @@ pub fn grid_graph(
             }
         }
     }
+    let edge_map = edge_map_for(&graph, multigraph);
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        generation: 0,
         multigraph,
+        edge_map,
     })
 }
 
@@ -902,7 +976,6 @@ pub fn directed_grid_graph(
     weights: Option<Vec<PyObject>>,
     bidirectional: bool,
 ) -> PyResult<digraph::PyDiGraph> {
-    let mut graph = StableDiGraph::<PyObject, PyObject>::default();
     if weights.is_none() && (rows.is_none() || cols.is_none()) {
         return Err(PyIndexError::new_err(
             "dimensions and weights list not specified",
@@ -913,15 +986,22 @@ pub fn directed_grid_graph(
     let mut collen = cols.unwrap_or(0);
     let mut num_nodes = rowlen * collen;
 
+    if let Some(weights) = &weights {
+        if num_nodes < weights.len() && rowlen == 0 {
+            collen = weights.len();
+            rowlen = 1;
+            num_nodes = collen;
+        }
+    }
+    let edge_len = (rowlen * collen.saturating_sub(1)
+        + rowlen.saturating_sub(1) * collen)
+        * if bidirectional { 2 } else { 1 };
+    let mut graph =
+        StableDiGraph::<PyObject, PyObject>::with_capacity(num_nodes, edge_len);
+
     let nodes: Vec<NodeIndex> = match weights {
         Some(weights) => {
             let mut node_list: Vec<NodeIndex> = Vec::new();
-            if num_nodes < weights.len() && rowlen == 0 {
-                collen = weights.len();
-                rowlen = 1;
-                num_nodes = collen;
-            }
-
             let mut node_cnt = num_nodes;
 
             for weight in weights {
@@ -977,9 +1057,12 @@ pub fn directed_grid_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        generation: 0,
         check_cycle: false,
-        cycle_state: algo::DfsSpace::default(),
+        topo_order: TopoOrder::default(),
         multigraph: true,
+        edge_map: None,
+        payload_index: None,
     })
 }
 
@@ -15,13 +15,14 @@ use std::collections::BTreeMap;
 use std::fs::File;
 use std::io::prelude::*;
 use std::io::BufReader;
+use std::mem::size_of;
 use std::ops::{Index, IndexMut};
 use std::str;
 
 use hashbrown::{HashMap, HashSet};
 
 use pyo3::class::PyMappingProtocol;
-use pyo3::exceptions::PyIndexError;
+use pyo3::exceptions::{PyIndexError, PyValueError};
 use pyo3::gc::{PyGCProtocol, PyVisit};
 use pyo3::prelude::*;
 use pyo3::types::{PyBool, PyDict, PyList, PyLong, PyString, PyTuple};
@@ -29,10 +30,19 @@ use pyo3::PyTraverseError;
 use pyo3::Python;
 
 use ndarray::prelude::*;
-use numpy::PyReadonlyArray2;
+use numpy::{IntoPyArray, PyReadonlyArray1, PyReadonlyArray2};
 
+use super::array_utils::{indices_from_array, payloads_from_array};
+use super::contraction::{
+    boundary_edges, combine_parallel, contraction_members, quotient,
+};
+use super::csr::CSRGraph;
 use super::dot_utils::build_dot;
+use super::edge_map::{edge_map_for, EdgeMap};
 use super::iterators::{EdgeList, NodeIndices, WeightedEdgeList};
+use super::memory::{graph_slots, payload_bytes};
+use super::pickle_state::{pack_state, unpack_state};
+use super::views::{AdjView, EdgeView, NodeView, ViewGraph};
 use super::{NoEdgeBetweenNodes, NodesRemoved};
 
 use petgraph::graph::{EdgeIndex, NodeIndex};
@@ -82,15 +92,28 @@ use petgraph::visit::{
 /// :param bool multigraph: When this is set to ``False`` the created PyGraph
 ///     object will not be a multigraph (which is the default behavior). When
 ///     ``False`` if parallel edges are added the weight/weight from that
-///     method call will be used to update the existing edge in place.
+///     method call will be used to update the existing edge in place. A
+///     non-multigraph also keeps a hash index of its edges so that finding the
+///     edge between two nodes (for example in :meth:`has_edge`,
+///     :meth:`get_edge_data` or when adding an edge) takes constant time
+///     instead of scanning the neighbors of a node.
+/// :param int node_capacity: The number of nodes to allocate space for up
+///     front. If you know how many nodes will be added to the graph, setting
+///     this avoids reallocating and copying the node storage as it grows.
+/// :param int edge_capacity: The number of edges to allocate space for up
+///     front, see ``node_capacity``.
 ///
 #[pyclass(module = "retworkx", subclass, gc)]
-#[text_signature = "(/, multigraph=True)"]
+#[text_signature = "(/, multigraph=True, node_capacity=0, edge_capacity=0)"]
 #[derive(Clone)]
 pub struct PyGraph {
     pub graph: StableUnGraph<PyObject, PyObject>,
     pub node_removed: bool,
     pub multigraph: bool,
+    pub edge_map: Option<EdgeMap>,
+    /// Incremented by every change to the nodes or edges of the graph, so
+    /// live views can tell that their position in it is stale
+    pub generation: u64,
 }
 
 pub type Edges<'a, E> =
@@ -263,61 +286,88 @@ impl GetAdjacencyMatrix for PyGraph {
     }
 }
 
-#[pymethods]
+// Rust side only PyGraph methods
 impl PyGraph {
-    #[new]
-    #[args(multigraph = "true")]
-    fn new(multigraph: bool) -> Self {
-        PyGraph {
-            graph: StableUnGraph::<PyObject, PyObject>::default(),
-            node_removed: false,
-            multigraph,
+    /// The bytes allocated on the heap for the structure of the graph,
+    /// not including the payloads.
+    fn _heap_bytes(&self) -> usize {
+        graph_slots(&self.graph).total()
+            + self.edge_map.as_ref().map_or(0, |map| map.heap_bytes())
+    }
+
+    fn _add_node(&mut self, obj: PyObject) -> NodeIndex {
+        self.generation += 1;
+        self.graph.add_node(obj)
+    }
+
+    fn _add_edge(
+        &mut self,
+        u: NodeIndex,
+        v: NodeIndex,
+        edge: PyObject,
+    ) -> EdgeIndex {
+        if !self.multigraph {
+            let exists = self._find_edge(u, v);
+            if let Some(index) = exists {
+                let edge_weight = self.graph.edge_weight_mut(index).unwrap();
+                *edge_weight = edge;
+                return index;
+            }
+        }
+        let index = self.graph.add_edge(u, v, edge);
+        self.generation += 1;
+        if let Some(edge_map) = &mut self.edge_map {
+            edge_map.insert(u, v, index);
         }
+        index
     }
 
-    fn __getstate__(&self, py: Python) -> PyResult<PyObject> {
-        let out_dict = PyDict::new(py);
-        let node_dict = PyDict::new(py);
-        let mut out_list: Vec<PyObject> =
-            Vec::with_capacity(self.graph.edge_count());
-        out_dict.set_item("nodes", node_dict)?;
-        out_dict.set_item("nodes_removed", self.node_removed)?;
-        out_dict.set_item("multigraph", self.multigraph)?;
-        for node_index in self.graph.node_indices() {
-            let node_data = self.graph.node_weight(node_index).unwrap();
-            node_dict.set_item(node_index.index(), node_data)?;
+    /// Find an edge between two nodes, using the edge map if the graph
+    /// isn't a multigraph instead of scanning the adjacency list.
+    pub fn _find_edge(&self, a: NodeIndex, b: NodeIndex) -> Option<EdgeIndex> {
+        match &self.edge_map {
+            Some(edge_map) => edge_map.get(&self.graph, a, b),
+            None => self.graph.find_edge(a, b),
         }
-        for edge in self.graph.edge_indices() {
-            let edge_w = self.graph.edge_weight(edge);
-            let endpoints = self.graph.edge_endpoints(edge).unwrap();
+    }
 
-            let triplet = (endpoints.0.index(), endpoints.1.index(), edge_w)
-                .to_object(py);
-            out_list.push(triplet);
+    /// Remove every edge, keeping the nodes, and reset the state derived
+    /// from the edges.
+    pub fn clear_edges(&mut self) {
+        self.graph.clear_edges();
+        self.generation += 1;
+        self.edge_map = edge_map_for(&self.graph, self.multigraph);
+    }
+
+    fn _remove_edge(&mut self, edge: EdgeIndex) -> Option<PyObject> {
+        if let Some(edge_map) = &mut self.edge_map {
+            if let Some((source, target)) = self.graph.edge_endpoints(edge) {
+                edge_map.remove(source, target, edge);
+            }
         }
-        let py_out_list: PyObject = PyList::new(py, out_list).into();
-        out_dict.set_item("edges", py_out_list)?;
-        Ok(out_dict.into())
+        self.generation += 1;
+        self.graph.remove_edge(edge)
     }
 
-    fn __setstate__(&mut self, py: Python, state: PyObject) -> PyResult<()> {
-        self.graph = StableUnGraph::<PyObject, PyObject>::default();
-        let dict_state = state.cast_as::<PyDict>(py)?;
+    fn _remove_node(&mut self, node: NodeIndex) -> Option<PyObject> {
+        if let Some(edge_map) = &mut self.edge_map {
+            edge_map.remove_node(&self.graph, node);
+        }
+        self.generation += 1;
+        self.graph.remove_node(node)
+    }
+
+    /// Rebuild the graph from the dictionary pickle state used before the
+    /// structure was packed into a single array.
+    fn _setstate_legacy(
+        &mut self,
+        py: Python,
+        dict_state: &PyDict,
+    ) -> PyResult<()> {
         let nodes_dict =
             dict_state.get_item("nodes").unwrap().downcast::<PyDict>()?;
         let edges_list =
             dict_state.get_item("edges").unwrap().downcast::<PyList>()?;
-        let nodes_removed_raw = dict_state
-            .get_item("nodes_removed")
-            .unwrap()
-            .downcast::<PyBool>()?;
-        self.node_removed = nodes_removed_raw.extract()?;
-        let multigraph_raw = dict_state
-            .get_item("multigraph")
-            .unwrap()
-            .downcast::<PyBool>()?;
-        self.multigraph = multigraph_raw.extract()?;
-
         let mut node_indices: Vec<usize> = Vec::new();
         for raw_index in nodes_dict.keys() {
             let tmp_index = raw_index.downcast::<PyLong>()?;
@@ -358,6 +408,63 @@ impl PyGraph {
         }
         Ok(())
     }
+}
+
+#[pymethods]
+impl PyGraph {
+    #[new]
+    #[args(multigraph = "true", node_capacity = "0", edge_capacity = "0")]
+    fn new(
+        multigraph: bool,
+        node_capacity: usize,
+        edge_capacity: usize,
+    ) -> Self {
+        let graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+            node_capacity,
+            edge_capacity,
+        );
+        let mut edge_map = edge_map_for(&graph, multigraph);
+        if let Some(edge_map) = edge_map.as_mut() {
+            edge_map.reserve(edge_capacity);
+        }
+        PyGraph {
+            graph,
+            node_removed: false,
+            generation: 0,
+            multigraph,
+            edge_map,
+        }
+    }
+
+    fn __getstate__(&self, py: Python) -> PyResult<PyObject> {
+        let out_dict = PyDict::new(py);
+        out_dict.set_item("nodes_removed", self.node_removed)?;
+        out_dict.set_item("multigraph", self.multigraph)?;
+        pack_state(py, &self.graph, out_dict)?;
+        Ok(out_dict.into())
+    }
+
+    fn __setstate__(&mut self, py: Python, state: PyObject) -> PyResult<()> {
+        self.graph = StableUnGraph::<PyObject, PyObject>::default();
+        self.generation += 1;
+        let dict_state = state.cast_as::<PyDict>(py)?;
+        let nodes_removed_raw = dict_state
+            .get_item("nodes_removed")
+            .unwrap()
+            .downcast::<PyBool>()?;
+        self.node_removed = nodes_removed_raw.extract()?;
+        let multigraph_raw = dict_state
+            .get_item("multigraph")
+            .unwrap()
+            .downcast::<PyBool>()?;
+        self.multigraph = multigraph_raw.extract()?;
+        match unpack_state(py, dict_state)? {
+            Some(graph) => self.graph = graph,
+            None => self._setstate_legacy(py, dict_state)?,
+        }
+        self.edge_map = edge_map_for(&self.graph, self.multigraph);
+        Ok(())
+    }
 
     /// Whether the graph is a multigraph (allows multiple edges between
     /// nodes) or not
@@ -394,6 +501,36 @@ impl PyGraph {
             .collect()
     }
 
+    /// Get a live view of the nodes of the graph
+    ///
+    /// Unlike :meth:`nodes` and :meth:`node_indexes` this doesn't build a
+    /// list of every node, the returned view looks up nodes in the graph
+    /// every time it is used and reflects any later changes to the graph.
+    ///
+    /// :returns: A mapping of node indices to node data
+    /// :rtype: NodeView
+    #[text_signature = "(self)"]
+    pub fn node_view(slf: PyRef<Self>) -> NodeView {
+        NodeView {
+            graph: ViewGraph::Undirected(slf.into()),
+        }
+    }
+
+    /// Get a live view of the edges of the graph
+    ///
+    /// Unlike :meth:`edges` and :meth:`edge_list` this doesn't build a list
+    /// of every edge, the returned view looks up edges in the graph every
+    /// time it is used and reflects any later changes to the graph.
+    ///
+    /// :returns: A mapping of ``(source, target)`` tuples to edge data
+    /// :rtype: EdgeView
+    #[text_signature = "(self)"]
+    pub fn edge_view(slf: PyRef<Self>) -> EdgeView {
+        EdgeView {
+            graph: ViewGraph::Undirected(slf.into()),
+        }
+    }
+
     /// Return a list of all node indexes.
     ///
     /// :returns: A list of all the node indexes in the graph
@@ -416,7 +553,7 @@ impl PyGraph {
     pub fn has_edge(&self, node_a: usize, node_b: usize) -> bool {
         let index_a = NodeIndex::new(node_a);
         let index_b = NodeIndex::new(node_b);
-        self.graph.find_edge(index_a, index_b).is_some()
+        self._find_edge(index_a, index_b).is_some()
     }
 
     ///  Return the edge data for the edge between 2 nodes.
@@ -439,7 +576,7 @@ impl PyGraph {
     ) -> PyResult<&PyObject> {
         let index_a = NodeIndex::new(node_a);
         let index_b = NodeIndex::new(node_b);
-        let edge_index = match self.graph.find_edge(index_a, index_b) {
+        let edge_index = match self._find_edge(index_a, index_b) {
             Some(edge_index) => edge_index,
             None => {
                 return Err(NoEdgeBetweenNodes::new_err(
@@ -472,7 +609,7 @@ impl PyGraph {
     ) -> PyResult<()> {
         let index_a = NodeIndex::new(source);
         let index_b = NodeIndex::new(target);
-        let edge_index = match self.graph.find_edge(index_a, index_b) {
+        let edge_index = match self._find_edge(index_a, index_b) {
             Some(edge_index) => edge_index,
             None => {
                 return Err(NoEdgeBetweenNodes::new_err(
@@ -506,6 +643,47 @@ impl PyGraph {
         Ok(())
     }
 
+    /// Update the weights/payloads of many edges at once by edge index
+    ///
+    /// This is the array equivalent of calling
+    /// :meth:`~retworkx.PyGraph.update_edge_by_index` once per edge.
+    ///
+    /// :param numpy.ndarray edge_indices: A 1 dimensional ``np.int64`` array
+    ///     of the edge indices to update
+    /// :param weights: The new payloads for the edges. This can either be a
+    ///     1 dimensional ``np.float64`` array (each value will be used as a
+    ///     ``float`` payload) or any other sequence (including an object
+    ///     array) of the same length as ``edge_indices``.
+    ///
+    /// :raises IndexError: When an edge index is not present in the graph. No
+    ///     edges are updated in this case.
+    /// :raises ValueError: When ``weights`` is not the same length as
+    ///     ``edge_indices``
+    #[text_signature = "(self, edge_indices, weights, /)"]
+    pub fn update_edges_from_array<'p>(
+        &mut self,
+        py: Python<'p>,
+        edge_indices: PyReadonlyArray1<'p, i64>,
+        weights: &'p PyAny,
+    ) -> PyResult<()> {
+        let edges = indices_from_array(&edge_indices)?;
+        let payloads = payloads_from_array(py, Some(weights), edges.len())?;
+        for edge in &edges {
+            if self.graph.edge_weight(EdgeIndex::new(*edge)).is_none() {
+                return Err(PyIndexError::new_err(format!(
+                    "No edge found for index {}",
+                    edge
+                )));
+            }
+        }
+        for (edge, payload) in edges.into_iter().zip(payloads) {
+            let data =
+                self.graph.edge_weight_mut(EdgeIndex::new(edge)).unwrap();
+            *data = payload;
+        }
+        Ok(())
+    }
+
     /// Return the node data for a given node index
     ///
     /// :param int node: The index for the node
@@ -570,6 +748,63 @@ impl PyGraph {
         }
     }
 
+    /// Get the node indices of the graph as a numpy array
+    ///
+    /// This is equivalent to :meth:`~retworkx.PyGraph.node_indexes` but
+    /// returns a numpy array directly instead of a
+    /// :class:`~retworkx.NodeIndices` object.
+    ///
+    /// :returns: A 1 dimensional ``np.int64`` array of node indices
+    /// :rtype: numpy.ndarray
+    #[text_signature = "(self)"]
+    pub fn node_index_array(&self, py: Python) -> PyObject {
+        let out: Vec<i64> = self
+            .graph
+            .node_indices()
+            .map(|node| node.index() as i64)
+            .collect();
+        out.into_pyarray(py).into()
+    }
+
+    /// Get the edge list of the graph as a numpy array
+    ///
+    /// This is equivalent to :meth:`~retworkx.PyGraph.edge_list` but returns
+    /// a numpy array directly instead of an :class:`~retworkx.EdgeList`
+    /// object. The rows are in the same order as the indices returned by
+    /// :meth:`~retworkx.PyGraph.edge_ids_array`.
+    ///
+    /// :returns: A 2 dimensional ``np.int64`` array with shape ``(E, 2)``
+    ///     where each row is the ``(source, target)`` node indices of an edge
+    /// :rtype: numpy.ndarray
+    #[text_signature = "(self)"]
+    pub fn edge_index_array(&self, py: Python) -> PyObject {
+        let mut flat: Vec<i64> =
+            Vec::with_capacity(2 * self.graph.edge_count());
+        for edge in self.graph.edge_references() {
+            flat.push(edge.source().index() as i64);
+            flat.push(edge.target().index() as i64);
+        }
+        let out =
+            Array2::from_shape_vec((self.graph.edge_count(), 2), flat).unwrap();
+        out.into_pyarray(py).into()
+    }
+
+    /// Get the edge indices of the graph as a numpy array
+    ///
+    /// :returns: A 1 dimensional ``np.int64`` array of edge indices in the
+    ///     same order as the rows of
+    ///     :meth:`~retworkx.PyGraph.edge_index_array`
+    /// :rtype: numpy.ndarray
+    #[text_signature = "(self)"]
+    pub fn edge_ids_array(&self, py: Python) -> PyObject {
+        let out: Vec<i64> = self
+            .graph
+            .edge_references()
+            .map(|edge| edge.id().index() as i64)
+            .collect();
+        out.into_pyarray(py).into()
+    }
+
     /// Get edge list with weights
     ///
     /// Returns a list of tuples of the form ``(source, target, weight)`` where
@@ -602,7 +837,7 @@ impl PyGraph {
     #[text_signature = "(self, node, /)"]
     pub fn remove_node(&mut self, node: usize) -> PyResult<()> {
         let index = NodeIndex::new(node);
-        self.graph.remove_node(index);
+        self._remove_node(index);
         self.node_removed = true;
         Ok(())
     }
@@ -630,16 +865,7 @@ impl PyGraph {
     ) -> PyResult<usize> {
         let p_index = NodeIndex::new(node_a);
         let c_index = NodeIndex::new(node_b);
-        if !self.multigraph {
-            let exists = self.graph.find_edge(p_index, c_index);
-            if let Some(index) = exists {
-                let edge_weight = self.graph.edge_weight_mut(index).unwrap();
-                *edge_weight = edge;
-                return Ok(index.index());
-            }
-        }
-        let edge = self.graph.add_edge(p_index, c_index, edge);
-        Ok(edge.index())
+        Ok(self._add_edge(p_index, c_index, edge).index())
     }
 
     /// Add new edges to the graph.
@@ -666,17 +892,7 @@ impl PyGraph {
         for obj in obj_list {
             let p_index = NodeIndex::new(obj.0);
             let c_index = NodeIndex::new(obj.1);
-            if !self.multigraph {
-                let exists = self.graph.find_edge(p_index, c_index);
-                if let Some(index) = exists {
-                    let edge_weight =
-                        self.graph.edge_weight_mut(index).unwrap();
-                    *edge_weight = obj.2;
-                    out_list.push(index.index());
-                    continue;
-                }
-            }
-            let edge = self.graph.add_edge(p_index, c_index, obj.2);
+            let edge = self._add_edge(p_index, c_index, obj.2);
             out_list.push(edge.index());
         }
         Ok(out_list)
@@ -706,22 +922,78 @@ impl PyGraph {
         for obj in obj_list {
             let p_index = NodeIndex::new(obj.0);
             let c_index = NodeIndex::new(obj.1);
-            if !self.multigraph {
-                let exists = self.graph.find_edge(p_index, c_index);
-                if let Some(index) = exists {
-                    let edge_weight =
-                        self.graph.edge_weight_mut(index).unwrap();
-                    *edge_weight = py.None();
-                    out_list.push(index.index());
-                    continue;
-                }
-            }
-            let edge = self.graph.add_edge(p_index, c_index, py.None());
+            let edge = self._add_edge(p_index, c_index, py.None());
             out_list.push(edge.index());
         }
         Ok(out_list)
     }
 
+    /// Add new edges to the graph from arrays of node indices.
+    ///
+    /// This is equivalent to :meth:`add_edges_from` (or
+    /// :meth:`add_edges_from_no_data` if ``weights`` is not set) but instead
+    /// of a list of tuples it takes numpy arrays, which avoids converting every
+    /// edge from a Python object. It is the preferred method for adding a
+    /// large number of edges at once.
+    ///
+    /// If :attr:`~retworkx.PyGraph.multigraph` is ``False`` and an edge already
+    /// exists between ``node_a`` and ``node_b`` the weight/payload of that
+    /// existing edge will be updated. This will occur in array order so if
+    /// there are multiple parallel edges in the input the last entry will be
+    /// used.
+    ///
+    /// :param numpy.ndarray node_a: A 1 dimensional ``np.int64`` array of the
+    ///     first node index for each edge
+    /// :param numpy.ndarray node_b: A 1 dimensional ``np.int64`` array of the
+    ///     second node index for each edge. It must be the same length as
+    ///     ``node_a``.
+    /// :param weights: An optional payload for each edge. This can either be
+    ///     a 1 dimensional ``np.float64`` array (each value will be used as
+    ///     a ``float`` payload) or any other sequence (including an object
+    ///     array) of the same length as ``node_a``. If not specified ``None``
+    ///     will be used for every edge.
+    ///
+    /// :returns: A 1 dimensional ``np.int64`` array of the indices of the
+    ///     created (or updated) edges
+    /// :rtype: numpy.ndarray
+    ///
+    /// :raises IndexError: When a node index in ``node_a`` or ``node_b`` is
+    ///     not present in the graph. No edges are added in this case.
+    /// :raises ValueError: When the input arrays are not the same length
+    #[text_signature = "(self, node_a, node_b, /, weights=None)"]
+    pub fn add_edges_from_array<'p>(
+        &mut self,
+        py: Python<'p>,
+        node_a: PyReadonlyArray1<'p, i64>,
+        node_b: PyReadonlyArray1<'p, i64>,
+        weights: Option<&'p PyAny>,
+    ) -> PyResult<PyObject> {
+        let node_a = indices_from_array(&node_a)?;
+        let node_b = indices_from_array(&node_b)?;
+        if node_a.len() != node_b.len() {
+            return Err(PyValueError::new_err(
+                "node_a and node_b must be the same length",
+            ));
+        }
+        let payloads = payloads_from_array(py, weights, node_a.len())?;
+        for node in node_a.iter().chain(node_b.iter()) {
+            if self.graph.node_weight(NodeIndex::new(*node)).is_none() {
+                return Err(PyIndexError::new_err(format!(
+                    "No node found for index {}",
+                    node
+                )));
+            }
+        }
+        let mut out_list: Vec<i64> = Vec::with_capacity(node_a.len());
+        for ((a, b), payload) in node_a.into_iter().zip(node_b).zip(payloads) {
+            let p_index = NodeIndex::new(a);
+            let c_index = NodeIndex::new(b);
+            let edge = self._add_edge(p_index, c_index, payload);
+            out_list.push(edge.index() as i64);
+        }
+        Ok(out_list.into_pyarray(py).into())
+    }
+
     /// Extend graph from an edge list
     ///
     /// This method differs from :meth:`add_edges_from_no_data` in that it will
@@ -744,20 +1016,11 @@ impl PyGraph {
         for (source, target) in edge_list {
             let max_index = cmp::max(source, target);
             while max_index >= self.node_count() {
-                self.graph.add_node(py.None());
+                self._add_node(py.None());
             }
             let source_index = NodeIndex::new(source);
             let target_index = NodeIndex::new(target);
-            if !self.multigraph {
-                let exists = self.graph.find_edge(source_index, target_index);
-                if let Some(index) = exists {
-                    let edge_weight =
-                        self.graph.edge_weight_mut(index).unwrap();
-                    *edge_weight = py.None();
-                    continue;
-                }
-            }
-            self.graph.add_edge(source_index, target_index, py.None());
+            self._add_edge(source_index, target_index, py.None());
         }
     }
 
@@ -785,20 +1048,11 @@ impl PyGraph {
         for (source, target, weight) in edge_list {
             let max_index = cmp::max(source, target);
             while max_index >= self.node_count() {
-                self.graph.add_node(py.None());
+                self._add_node(py.None());
             }
             let source_index = NodeIndex::new(source);
             let target_index = NodeIndex::new(target);
-            if !self.multigraph {
-                let exists = self.graph.find_edge(source_index, target_index);
-                if let Some(index) = exists {
-                    let edge_weight =
-                        self.graph.edge_weight_mut(index).unwrap();
-                    *edge_weight = weight;
-                    continue;
-                }
-            }
-            self.graph.add_edge(source_index, target_index, weight);
+            self._add_edge(source_index, target_index, weight);
         }
     }
 
@@ -820,7 +1074,7 @@ impl PyGraph {
     ) -> PyResult<()> {
         let p_index = NodeIndex::new(node_a);
         let c_index = NodeIndex::new(node_b);
-        let edge_index = match self.graph.find_edge(p_index, c_index) {
+        let edge_index = match self._find_edge(p_index, c_index) {
             Some(edge_index) => edge_index,
             None => {
                 return Err(NoEdgeBetweenNodes::new_err(
@@ -828,7 +1082,7 @@ impl PyGraph {
                 ))
             }
         };
-        self.graph.remove_edge(edge_index);
+        self._remove_edge(edge_index);
         Ok(())
     }
 
@@ -838,7 +1092,7 @@ impl PyGraph {
     #[text_signature = "(self, edge, /)"]
     pub fn remove_edge_from_index(&mut self, edge: usize) -> PyResult<()> {
         let edge_index = EdgeIndex::new(edge);
-        self.graph.remove_edge(edge_index);
+        self._remove_edge(edge_index);
         Ok(())
     }
 
@@ -858,7 +1112,7 @@ impl PyGraph {
             .iter()
             .map(|(x, y)| (NodeIndex::new(*x), NodeIndex::new(*y)))
         {
-            let edge_index = match self.graph.find_edge(p_index, c_index) {
+            let edge_index = match self._find_edge(p_index, c_index) {
                 Some(edge_index) => edge_index,
                 None => {
                     return Err(NoEdgeBetweenNodes::new_err(
@@ -866,7 +1120,7 @@ impl PyGraph {
                     ))
                 }
             };
-            self.graph.remove_edge(edge_index);
+            self._remove_edge(edge_index);
         }
         Ok(())
     }
@@ -879,7 +1133,7 @@ impl PyGraph {
     /// :rtype: int
     #[text_signature = "(self, obj, /)"]
     pub fn add_node(&mut self, obj: PyObject) -> PyResult<usize> {
-        let index = self.graph.add_node(obj);
+        let index = self._add_node(obj);
         Ok(index.index())
     }
 
@@ -893,7 +1147,7 @@ impl PyGraph {
     pub fn add_nodes_from(&mut self, obj_list: Vec<PyObject>) -> NodeIndices {
         let out_list: Vec<usize> = obj_list
             .into_iter()
-            .map(|obj| self.graph.add_node(obj).index())
+            .map(|obj| self._add_node(obj).index())
             .collect();
         NodeIndices { nodes: out_list }
     }
@@ -911,11 +1165,117 @@ impl PyGraph {
         index_list: Vec<usize>,
     ) -> PyResult<()> {
         for node in index_list.iter().map(|x| NodeIndex::new(*x)) {
-            self.graph.remove_node(node);
+            self._remove_node(node);
         }
         Ok(())
     }
 
+    /// Contract a set of nodes into a single new node.
+    ///
+    /// The nodes in ``nodes`` are removed from the graph and replaced by a
+    /// new node with ``obj`` as its payload. Every edge between one of
+    /// ``nodes`` and a node outside of ``nodes`` is moved to the new node,
+    /// edges between two of ``nodes`` are dropped. This is done in a single
+    /// pass over the edges of ``nodes``.
+    ///
+    /// If the graph was created with ``multigraph=False`` the edges that
+    /// become parallel are combined into a single edge, either with
+    /// ``weight_combo_fn`` or by keeping the weight of the last one.
+    ///
+    /// :param list nodes: The indices of the nodes to contract. Any duplicate
+    ///     indices are ignored.
+    /// :param obj: The python object to attach to the new node
+    /// :param weight_combo_fn: An optional python callable that takes the
+    ///     weights of two parallel edges and returns the weight for the
+    ///     combined edge. Only used if the graph has ``multigraph=False``.
+    ///
+    /// :returns: The index of the new node
+    /// :rtype: int
+    ///
+    /// :raises IndexError: If one of the ``nodes`` is not in the graph
+    #[text_signature = "(self, nodes, obj, /, weight_combo_fn=None)"]
+    pub fn contract_nodes(
+        &mut self,
+        py: Python,
+        nodes: Vec<usize>,
+        obj: PyObject,
+        weight_combo_fn: Option<PyObject>,
+    ) -> PyResult<usize> {
+        let (members, member_set) = contraction_members(&self.graph, &nodes)?;
+        let mut edges = boundary_edges(py, &self.graph, &members, &member_set);
+        if !self.multigraph {
+            edges = combine_parallel(py, edges, &weight_combo_fn)?;
+        }
+        let new_node = self._add_node(obj);
+        for node in members {
+            self._remove_node(node);
+            self.node_removed = true;
+        }
+        for ((other, _), weight) in edges {
+            self._add_edge(new_node, other, weight);
+        }
+        Ok(new_node.index())
+    }
+
+    /// Return the quotient graph of this graph for a partition of its nodes.
+    ///
+    /// This contracts every block of ``partition`` into a single node, like
+    /// calling :meth:`~retworkx.PyGraph.contract_nodes` once for every
+    /// block, but builds the contracted graph in a single pass over the
+    /// graph. This graph is not modified.
+    ///
+    /// The node for each block has the list of the payloads of the nodes in
+    /// the block as its payload, or the return of ``node_fn`` called with
+    /// that list. The node for the ``i``-th block has index ``i`` in the
+    /// returned graph. The nodes that are not in any block are added after
+    /// them in node index order, with their payloads unchanged. Edges
+    /// between two nodes of the same block are dropped and, if the graph was
+    /// created with ``multigraph=False``, edges that become parallel are
+    /// combined into a single edge, either with ``weight_combo_fn`` or by
+    /// keeping the weight of the last one.
+    ///
+    /// :param list partition: A list of blocks, each a list of the node
+    ///     indices in that block. The blocks must not be empty and a node can
+    ///     be in at most one block.
+    /// :param node_fn: An optional python callable that takes the list of
+    ///     payloads of the nodes in a block and returns the payload for the
+    ///     node of the block.
+    /// :param weight_combo_fn: An optional python callable that takes the
+    ///     weights of two parallel edges and returns the weight for the
+    ///     combined edge. Only used if the graph has ``multigraph=False``.
+    ///
+    /// :returns: The quotient graph
+    /// :rtype: PyGraph
+    ///
+    /// :raises IndexError: If a node in ``partition`` is not in the graph
+    /// :raises ValueError: If a block is empty or a node appears more than
+    ///     once in ``partition``
+    #[text_signature = "(self, partition, /, node_fn=None, weight_combo_fn=None)"]
+    pub fn quotient_graph(
+        &self,
+        py: Python,
+        partition: Vec<Vec<usize>>,
+        node_fn: Option<PyObject>,
+        weight_combo_fn: Option<PyObject>,
+    ) -> PyResult<PyGraph> {
+        let graph = quotient(
+            py,
+            &self.graph,
+            partition,
+            &node_fn,
+            &weight_combo_fn,
+            self.multigraph,
+        )?;
+        let edge_map = edge_map_for(&graph, self.multigraph);
+        Ok(PyGraph {
+            graph,
+            node_removed: false,
+            generation: 0,
+            multigraph: self.multigraph,
+            edge_map,
+        })
+    }
+
     /// Get the index and data for the neighbors of a node.
     ///
     /// This will return a dictionary where the keys are the node indexes of
@@ -944,10 +1304,37 @@ impl PyGraph {
         Ok(out_map)
     }
 
+    /// Get a live view of the neighbors of a node
+    ///
+    /// Unlike :meth:`adj` this doesn't build a dictionary, the returned view
+    /// looks up the neighbors of the node in the graph every time it is used
+    /// and reflects any later changes to the graph.
+    ///
+    /// :param int node: The index of the node to get the neighbors of
+    ///
+    /// :returns: A mapping of the node indices of the neighbors to the edge
+    ///     data of the edge between that neighbor and ``node``
+    /// :rtype: AdjView
+    /// :raises IndexError: If ``node`` is not in the graph
+    #[text_signature = "(self, node, /)"]
+    pub fn adj_view(slf: PyRef<Self>, node: usize) -> PyResult<AdjView> {
+        if !slf.graph.contains_node(NodeIndex::new(node)) {
+            return Err(PyIndexError::new_err("No node found for index"));
+        }
+        Ok(AdjView {
+            graph: ViewGraph::Undirected(slf.into()),
+            node: NodeIndex::new(node),
+            direction: Some(petgraph::Direction::Outgoing),
+        })
+    }
+
     /// Get the neighbors of a node.
     ///
     /// This with return a list of neighbor node indices
     ///
+    /// This builds a new list on every call. To loop over the neighbors
+    /// of a node without copying them use :meth:`adj_view` instead.
+    ///
     /// :param int node: The index of the node to get the neibhors of
     ///
     /// :returns: A list of the neighbor node indicies
@@ -1164,7 +1551,9 @@ impl PyGraph {
         Ok(PyGraph {
             graph: out_graph,
             node_removed: false,
+            generation: 0,
             multigraph: true,
+            edge_map: None,
         })
     }
 
@@ -1189,7 +1578,13 @@ impl PyGraph {
     ) -> PyGraph {
         let array = matrix.as_array();
         let shape = array.shape();
-        let mut out_graph = StableUnGraph::<PyObject, PyObject>::default();
+        let edge_count = array
+            .indexed_iter()
+            .filter(|((row, col), weight)| col >= row && **weight > 0.0)
+            .count();
+        let mut out_graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+            shape[0], edge_count,
+        );
         let _node_indices: Vec<NodeIndex> = (0..shape[0])
             .map(|node| out_graph.add_node(node.to_object(py)))
             .collect();
@@ -1214,7 +1609,9 @@ impl PyGraph {
         PyGraph {
             graph: out_graph,
             node_removed: false,
+            generation: 0,
             multigraph: true,
+            edge_map: None,
         }
     }
 
@@ -1324,6 +1721,7 @@ impl PyGraph {
     ) -> PyResult<PyObject> {
         let mut new_node_map: HashMap<NodeIndex, NodeIndex> =
             HashMap::with_capacity(other.node_count());
+        self.generation += 1;
 
         // TODO: Reimplement this without looping over the graphs
         // Loop over other nodes add add to self graph
@@ -1342,16 +1740,22 @@ impl PyGraph {
             let new_c_index = new_node_map.get(&edge.target()).unwrap();
             let weight =
                 weight_transform_callable(py, &edge_map_func, edge.weight())?;
-            self.graph.add_edge(*new_p_index, *new_c_index, weight);
+            let edge = self.graph.add_edge(*new_p_index, *new_c_index, weight);
+            if let Some(edge_map) = &mut self.edge_map {
+                edge_map.insert(*new_p_index, *new_c_index, edge);
+            }
         }
         // Add edges from map
         for (this_index, (index, weight)) in node_map.iter() {
             let new_index = new_node_map.get(&NodeIndex::new(*index)).unwrap();
-            self.graph.add_edge(
+            let edge = self.graph.add_edge(
                 NodeIndex::new(*this_index),
                 *new_index,
                 weight.clone_ref(py),
             );
+            if let Some(edge_map) = &mut self.edge_map {
+                edge_map.insert(NodeIndex::new(*this_index), *new_index, edge);
+            }
         }
         let out_dict = PyDict::new(py);
         for (orig_node, new_node) in new_node_map.iter() {
@@ -1360,6 +1764,157 @@ impl PyGraph {
         Ok(out_dict.into())
     }
 
+    /// Return a read-only compressed sparse row snapshot of this graph
+    ///
+    /// The returned :class:`~retworkx.CSRGraph` stores the adjacency of the
+    /// graph in contiguous arrays which makes it much faster to traverse than
+    /// a :class:`~retworkx.PyGraph`. This is useful when the same graph is
+    /// analysed many times between mutations. Node and edge indices are
+    /// preserved and the node and edge weights/data payloads are passed by
+    /// reference to the new object. Later changes to this graph are not
+    /// reflected in the returned snapshot.
+    ///
+    /// :returns: A frozen copy of this graph
+    /// :rtype: CSRGraph
+    #[text_signature = "(self)"]
+    pub fn freeze(&self, py: Python) -> CSRGraph {
+        CSRGraph::from_graph(py, &self.graph)
+    }
+
+    fn __sizeof__(&self) -> usize {
+        size_of::<Self>() + self._heap_bytes()
+    }
+
+    /// Get an estimate of the memory used by the graph
+    ///
+    /// :param bool deep: If set to ``True`` the memory used by the node and
+    ///     edge weight/data payloads is included, as reported by
+    ///     :func:`sys.getsizeof` for each payload and, for builtin
+    ///     containers (``list``, ``tuple``, ``dict``, ``set`` and
+    ///     ``frozenset``), everything they contain. Objects referenced more
+    ///     than once are only counted once. By default only the memory used
+    ///     by the graph itself is counted.
+    ///
+    /// :returns: A dictionary of the number of bytes used by each part of
+    ///     the graph with the keys:
+    ///
+    ///     * ``"object"``: the graph object itself
+    ///     * ``"node_slots"``: the slots holding nodes
+    ///     * ``"edge_slots"``: the slots holding edges
+    ///     * ``"free_node_slots"``: the slots left vacant by removed nodes,
+    ///       which are reused by new nodes
+    ///     * ``"free_edge_slots"``: the slots left vacant by removed edges,
+    ///       which are reused by new edges
+    ///     * ``"edge_index"``: the index of edges by their endpoints kept
+    ///       when ``multigraph`` is ``False``
+    ///     * ``"payloads"``: the node and edge payloads, only present if
+    ///       ``deep`` is ``True``
+    ///     * ``"total"``: the sum of all of the above
+    /// :rtype: dict
+    #[text_signature = "(self, /, deep=False)"]
+    #[args(deep = "false")]
+    pub fn memory_usage(&self, py: Python, deep: bool) -> PyResult<PyObject> {
+        let out_dict = PyDict::new(py);
+        let slots = graph_slots(&self.graph);
+        out_dict.set_item("object", size_of::<Self>())?;
+        out_dict.set_item("node_slots", slots.node_slots)?;
+        out_dict.set_item("edge_slots", slots.edge_slots)?;
+        out_dict.set_item("free_node_slots", slots.free_node_slots)?;
+        out_dict.set_item("free_edge_slots", slots.free_edge_slots)?;
+        out_dict.set_item(
+            "edge_index",
+            self.edge_map.as_ref().map_or(0, |map| map.heap_bytes()),
+        )?;
+        let mut total = self.__sizeof__();
+        if deep {
+            let payloads = payload_bytes(
+                py,
+                self.graph
+                    .node_indices()
+                    .map(|node| &self.graph[node])
+                    .chain(
+                        self.graph.edge_indices().map(|edge| &self.graph[edge]),
+                    ),
+            )?;
+            out_dict.set_item("payloads", payloads)?;
+            total += payloads;
+        }
+        out_dict.set_item("total", total)?;
+        Ok(out_dict.into())
+    }
+
+    /// Return a shallow copy of the graph
+    ///
+    /// The new graph has the same nodes and edges with the same indices, and
+    /// the same settings as this graph. Unlike :func:`copy.deepcopy` the
+    /// structure of the graph is copied natively without going through
+    /// pickling, and the node and edge weight/data payloads are not copied.
+    /// They are passed by reference so if you update (not replace) an object
+    /// used as the weight in one graph it will also be updated in the other.
+    ///
+    /// :returns: A copy of this graph
+    /// :rtype: PyGraph
+    #[text_signature = "(self)"]
+    pub fn copy(&self) -> PyGraph {
+        self.clone()
+    }
+
+    fn __copy__(&self) -> PyGraph {
+        self.clone()
+    }
+
+    /// Remove the holes left in the node and edge indices by removals
+    ///
+    /// The graph is rebuilt so that the node indices and the edge indices
+    /// are contiguous from ``0``, keeping the relative order of the existing
+    /// indices. Node and edge weight/data payloads are not copied. A graph
+    /// without holes can use faster paths in methods and functions that
+    /// would otherwise need to remap the indices on every call.
+    ///
+    /// :returns: A tuple of two ``np.int64`` arrays ``(node_map, edge_map)``
+    ///     where ``node_map[old_index]`` is the new index of the node that
+    ///     had the index ``old_index`` (and similarly for ``edge_map`` and
+    ///     edges), or ``-1`` if there was no node (or edge) with that index.
+    ///     The arrays have one entry for every index up to the largest index
+    ///     in use before compacting.
+    /// :rtype: tuple
+    #[text_signature = "(self)"]
+    pub fn compact(&mut self, py: Python) -> (PyObject, PyObject) {
+        let node_bound = self.graph.node_bound();
+        let edge_bound = self
+            .graph
+            .edge_indices()
+            .last()
+            .map_or(0, |edge| edge.index() + 1);
+        let mut node_mapping: Vec<i64> = vec![-1; node_bound];
+        let mut edge_mapping: Vec<i64> = vec![-1; edge_bound];
+        let mut graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+            self.graph.node_count(),
+            self.graph.edge_count(),
+        );
+        for node in self.graph.node_indices() {
+            let new_node = graph.add_node(self.graph[node].clone_ref(py));
+            node_mapping[node.index()] = new_node.index() as i64;
+        }
+        for edge in self.graph.edge_indices() {
+            let (source, target) = self.graph.edge_endpoints(edge).unwrap();
+            let new_edge = graph.add_edge(
+                NodeIndex::new(node_mapping[source.index()] as usize),
+                NodeIndex::new(node_mapping[target.index()] as usize),
+                self.graph[edge].clone_ref(py),
+            );
+            edge_mapping[edge.index()] = new_edge.index() as i64;
+        }
+        self.graph = graph;
+        self.generation += 1;
+        self.node_removed = false;
+        self.edge_map = edge_map_for(&self.graph, self.multigraph);
+        (
+            node_mapping.into_pyarray(py).into(),
+            edge_mapping.into_pyarray(py).into(),
+        )
+    }
+
     /// Return a new PyGraph object for a subgraph of this graph
     ///
     /// :param list nodes: A list of node indices to generate the subgraph
@@ -1380,7 +1935,10 @@ impl PyGraph {
             HashMap::with_capacity(nodes.len());
         let node_filter =
             |node: NodeIndex| -> bool { node_set.contains(&node.index()) };
-        let mut out_graph = StableUnGraph::<PyObject, PyObject>::default();
+        let mut out_graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+            node_set.len(),
+            0,
+        );
         let filtered = NodeFiltered(self, node_filter);
         for node in filtered.node_references() {
             let new_node = out_graph.add_node(node.1.clone_ref(py));
@@ -1395,10 +1953,13 @@ impl PyGraph {
                 edge.weight().clone_ref(py),
             );
         }
+        let edge_map = edge_map_for(&out_graph, self.multigraph);
         PyGraph {
             graph: out_graph,
             node_removed: false,
+            generation: 0,
             multigraph: self.multigraph,
+            edge_map,
         }
     }
 }
@@ -1428,7 +1989,7 @@ impl PyMappingProtocol for PyGraph {
     }
 
     fn __delitem__(&'p mut self, idx: usize) -> PyResult<()> {
-        match self.graph.remove_node(NodeIndex::new(idx as usize)) {
+        match self._remove_node(NodeIndex::new(idx as usize)) {
             Some(_) => Ok(()),
             None => Err(PyIndexError::new_err("No node found for index")),
         }
@@ -1469,6 +2030,8 @@ impl PyGCProtocol for PyGraph {
     // [2] https://pyo3.rs/v0.12.4/class/protocols.html#garbage-collector-integration
     fn __clear__(&mut self) {
         self.graph = StableUnGraph::<PyObject, PyObject>::default();
+        self.generation += 1;
+        self.edge_map = edge_map_for(&self.graph, self.multigraph);
         self.node_removed = false;
     }
 }
@@ -12,20 +12,44 @@
 
 #![allow(clippy::float_cmp, clippy::upper_case_acronyms)]
 
+use std::cell::RefCell;
 use std::collections::hash_map::DefaultHasher;
 use std::convert::TryInto;
 use std::hash::Hasher;
+use std::mem::size_of;
 
 use hashbrown::HashMap;
 
 use pyo3::class::iter::{IterNextOutput, PyIterProtocol};
 use pyo3::class::{PyMappingProtocol, PyObjectProtocol, PySequenceProtocol};
-use pyo3::exceptions::{PyIndexError, PyKeyError, PyNotImplementedError};
+use pyo3::exceptions::{
+    PyIndexError, PyKeyError, PyNotImplementedError, PyValueError,
+};
 use pyo3::gc::{PyGCProtocol, PyVisit};
 use pyo3::prelude::*;
-use pyo3::types::PySequence;
+use pyo3::types::{PyDict, PySequence};
 use pyo3::PyTraverseError;
 
+use ndarray::Array2;
+use numpy::IntoPyArray;
+
+use super::memory::{hash_map_bytes, payload_bytes, vec_bytes};
+
+/// Cast an array built for ``__array__`` to the requested dtype if numpy
+/// passed one in.
+fn cast_array(
+    py: Python,
+    array: PyObject,
+    dtype: Option<&PyAny>,
+) -> PyResult<PyObject> {
+    match dtype {
+        Some(dtype) if !dtype.is_none() => {
+            Ok(array.call_method1(py, "astype", (dtype,))?)
+        }
+        _ => Ok(array),
+    }
+}
+
 /// A custom class for the return from :func:`retworkx.bfs_successors`
 ///
 /// This class is a container class for the results of the
@@ -227,6 +251,15 @@ impl NodeIndices {
     fn __setstate__(&mut self, state: Vec<usize>) {
         self.nodes = state;
     }
+
+    fn __array__(
+        &self,
+        py: Python,
+        dtype: Option<&PyAny>,
+    ) -> PyResult<PyObject> {
+        let out: Vec<i64> = self.nodes.iter().map(|n| *n as i64).collect();
+        cast_array(py, out.into_pyarray(py).into(), dtype)
+    }
 }
 
 #[pyproto]
@@ -341,6 +374,20 @@ impl EdgeList {
     fn __setstate__(&mut self, state: Vec<(usize, usize)>) {
         self.edges = state;
     }
+
+    fn __array__(
+        &self,
+        py: Python,
+        dtype: Option<&PyAny>,
+    ) -> PyResult<PyObject> {
+        let mut flat: Vec<i64> = Vec::with_capacity(2 * self.edges.len());
+        for (source, target) in &self.edges {
+            flat.push(*source as i64);
+            flat.push(*target as i64);
+        }
+        let out = Array2::from_shape_vec((self.edges.len(), 2), flat).unwrap();
+        cast_array(py, out.into_pyarray(py).into(), dtype)
+    }
 }
 
 #[pyproto]
@@ -459,6 +506,37 @@ impl WeightedEdgeList {
     fn __setstate__(&mut self, state: Vec<(usize, usize, PyObject)>) {
         self.edges = state;
     }
+
+    fn __sizeof__(&self) -> usize {
+        size_of::<Self>() + vec_bytes(&self.edges)
+    }
+
+    /// Get an estimate of the memory used by the edge list
+    ///
+    /// :param bool deep: If set to ``True`` the memory used by the edge
+    ///     weight/data payloads is included, as reported by
+    ///     :func:`sys.getsizeof` (recursing into builtin containers).
+    ///
+    /// :returns: A dictionary of the number of bytes used with the keys
+    ///     ``"object"``, ``"edges"``, ``"payloads"`` (only if ``deep`` is
+    ///     ``True``) and ``"total"``
+    /// :rtype: dict
+    #[text_signature = "(self, /, deep=False)"]
+    #[args(deep = "false")]
+    fn memory_usage(&self, py: Python, deep: bool) -> PyResult<PyObject> {
+        let out_dict = PyDict::new(py);
+        out_dict.set_item("object", size_of::<Self>())?;
+        out_dict.set_item("edges", vec_bytes(&self.edges))?;
+        let mut total = self.__sizeof__();
+        if deep {
+            let payloads =
+                payload_bytes(py, self.edges.iter().map(|edge| &edge.2))?;
+            out_dict.set_item("payloads", payloads)?;
+            total += payloads;
+        }
+        out_dict.set_item("total", total)?;
+        Ok(out_dict.into())
+    }
 }
 
 #[pyproto]
@@ -838,6 +916,31 @@ impl PathMapping {
         self.paths = state;
     }
 
+    fn __sizeof__(&self) -> usize {
+        size_of::<Self>()
+            + hash_map_bytes(&self.paths)
+            + self.paths.values().map(vec_bytes).sum::<usize>()
+    }
+
+    /// Get an estimate of the memory used by the mapping
+    ///
+    /// :returns: A dictionary of the number of bytes used with the keys
+    ///     ``"object"``, ``"mapping"`` (the hash table), ``"paths"`` (the
+    ///     node lists of the paths) and ``"total"``
+    /// :rtype: dict
+    #[text_signature = "(self)"]
+    fn memory_usage(&self, py: Python) -> PyResult<PyObject> {
+        let out_dict = PyDict::new(py);
+        out_dict.set_item("object", size_of::<Self>())?;
+        out_dict.set_item("mapping", hash_map_bytes(&self.paths))?;
+        out_dict.set_item(
+            "paths",
+            self.paths.values().map(vec_bytes).sum::<usize>(),
+        )?;
+        out_dict.set_item("total", self.__sizeof__())?;
+        Ok(out_dict.into())
+    }
+
     fn keys(&self) -> PathMappingKeys {
         PathMappingKeys {
             path_keys: self.paths.keys().copied().collect(),
@@ -1122,6 +1225,24 @@ impl PathLengthMapping {
         self.path_lengths = state;
     }
 
+    fn __sizeof__(&self) -> usize {
+        size_of::<Self>() + hash_map_bytes(&self.path_lengths)
+    }
+
+    /// Get an estimate of the memory used by the mapping
+    ///
+    /// :returns: A dictionary of the number of bytes used with the keys
+    ///     ``"object"``, ``"mapping"`` (the hash table) and ``"total"``
+    /// :rtype: dict
+    #[text_signature = "(self)"]
+    fn memory_usage(&self, py: Python) -> PyResult<PyObject> {
+        let out_dict = PyDict::new(py);
+        out_dict.set_item("object", size_of::<Self>())?;
+        out_dict.set_item("mapping", hash_map_bytes(&self.path_lengths))?;
+        out_dict.set_item("total", self.__sizeof__())?;
+        Ok(out_dict.into())
+    }
+
     fn keys(&self) -> PathLengthMappingKeys {
         PathLengthMappingKeys {
             path_length_keys: self.path_lengths.keys().copied().collect(),
@@ -1326,3 +1447,383 @@ impl PyIterProtocol for PathLengthMappingItems {
         }
     }
 }
+
+/// A custom class for the return from :func:`retworkx.floyd_warshall`
+///
+/// This class is a read-only mapping of source node indices to a dictionary
+/// of the target nodes reachable from that source and the length of the
+/// shortest path to them. It implements the Python mapping protocol, so you
+/// can treat the return as a read-only mapping/dict of dicts. The lengths
+/// are stored in a dense matrix and the dictionary for a source node is
+/// only built the first time it is accessed, so looking up a few sources of
+/// a large result doesn't convert all of it to Python objects. Later lookups
+/// of the same source return the same dictionary.
+///
+/// For example::
+///
+///     import retworkx
+///
+///     graph = retworkx.generators.directed_path_graph(5)
+///     lengths = retworkx.floyd_warshall(graph)
+///     # Source node access
+///     from_zero = lengths[0]
+///     print(from_zero[4])
+///     # Use as iterator
+///     for source, targets in lengths.items():
+///         print(source, targets)
+///
+#[pyclass(module = "retworkx", gc)]
+pub struct AllPairsPathLengthMapping {
+    pub nodes: Vec<usize>,
+    pub positions: HashMap<usize, usize>,
+    /// Path lengths between the positions of ``nodes``, ``inf`` if there
+    /// is no path
+    pub lengths: Array2<f32>,
+    /// The dictionaries built by ``row()``, by position
+    rows: RefCell<Vec<Option<PyObject>>>,
+}
+
+impl AllPairsPathLengthMapping {
+    pub fn from_lengths(
+        nodes: Vec<usize>,
+        lengths: Array2<f32>,
+    ) -> AllPairsPathLengthMapping {
+        let positions: HashMap<usize, usize> = nodes
+            .iter()
+            .enumerate()
+            .map(|(position, node)| (*node, position))
+            .collect();
+        let rows = RefCell::new((0..nodes.len()).map(|_| None).collect());
+        AllPairsPathLengthMapping {
+            nodes,
+            positions,
+            lengths,
+            rows,
+        }
+    }
+
+    /// Get the dictionary of path lengths from the node at ``position``,
+    /// building it from the matrix the first time.
+    fn row(&self, py: Python, position: usize) -> PyResult<PyObject> {
+        if let Some(row) = &self.rows.borrow()[position] {
+            return Ok(row.clone_ref(py));
+        }
+        let out_dict = PyDict::new(py);
+        for (target, length) in
+            self.nodes.iter().zip(self.lengths.row(position))
+        {
+            if length.is_finite() {
+                out_dict.set_item(*target, *length as usize)?;
+            }
+        }
+        let row: PyObject = out_dict.into();
+        self.rows.borrow_mut()[position] = Some(row.clone_ref(py));
+        Ok(row)
+    }
+}
+
+#[pymethods]
+impl AllPairsPathLengthMapping {
+    #[new]
+    fn new() -> AllPairsPathLengthMapping {
+        AllPairsPathLengthMapping::from_lengths(
+            Vec::new(),
+            Array2::from_elem((0, 0), 0.0),
+        )
+    }
+
+    fn __getstate__(&self) -> (Vec<usize>, Vec<f32>) {
+        (self.nodes.clone(), self.lengths.iter().copied().collect())
+    }
+
+    fn __setstate__(&mut self, state: (Vec<usize>, Vec<f32>)) -> PyResult<()> {
+        let (nodes, lengths) = state;
+        let n = nodes.len();
+        let lengths =
+            Array2::from_shape_vec((n, n), lengths).map_err(|_| {
+                PyValueError::new_err("Invalid AllPairsPathLengthMapping state")
+            })?;
+        *self = AllPairsPathLengthMapping::from_lengths(nodes, lengths);
+        Ok(())
+    }
+
+    fn __sizeof__(&self) -> usize {
+        size_of::<Self>()
+            + vec_bytes(&self.nodes)
+            + hash_map_bytes(&self.positions)
+            + self.lengths.len() * size_of::<f32>()
+    }
+
+    /// Get an estimate of the memory used by the mapping
+    ///
+    /// :returns: A dictionary of the number of bytes used with the keys
+    ///     ``"object"``, ``"mapping"`` (the node list and the hash table of
+    ///     node positions), ``"lengths"`` (the dense matrix of path lengths)
+    ///     and ``"total"``
+    /// :rtype: dict
+    #[text_signature = "(self)"]
+    fn memory_usage(&self, py: Python) -> PyResult<PyObject> {
+        let out_dict = PyDict::new(py);
+        out_dict.set_item("object", size_of::<Self>())?;
+        out_dict.set_item(
+            "mapping",
+            vec_bytes(&self.nodes) + hash_map_bytes(&self.positions),
+        )?;
+        out_dict.set_item("lengths", self.lengths.len() * size_of::<f32>())?;
+        out_dict.set_item("total", self.__sizeof__())?;
+        Ok(out_dict.into())
+    }
+
+    fn keys(&self) -> AllPairsPathLengthMappingKeys {
+        AllPairsPathLengthMappingKeys {
+            keys: self.nodes.clone(),
+            iter_pos: 0,
+        }
+    }
+
+    fn values(slf: PyRef<Self>) -> AllPairsPathLengthMappingValues {
+        AllPairsPathLengthMappingValues {
+            mapping: slf.into(),
+            iter_pos: 0,
+        }
+    }
+
+    fn items(slf: PyRef<Self>) -> AllPairsPathLengthMappingItems {
+        AllPairsPathLengthMappingItems {
+            mapping: slf.into(),
+            iter_pos: 0,
+        }
+    }
+}
+
+#[pyproto]
+impl<'p> PyObjectProtocol<'p> for AllPairsPathLengthMapping {
+    fn __richcmp__(
+        &self,
+        other: PyObject,
+        op: pyo3::basic::CompareOp,
+    ) -> PyResult<bool> {
+        let compare = |other: PyObject| -> PyResult<bool> {
+            let gil = Python::acquire_gil();
+            let py = gil.python();
+            let other_ref = other.as_ref(py);
+            if other_ref.len()? != self.nodes.len() {
+                return Ok(false);
+            }
+            for (position, key) in self.nodes.iter().enumerate() {
+                match other_ref.get_item(key) {
+                    Ok(other_value) => {
+                        if !self
+                            .row(py, position)?
+                            .as_ref(py)
+                            .rich_compare(
+                                other_value,
+                                pyo3::basic::CompareOp::Eq,
+                            )?
+                            .is_true()?
+                        {
+                            return Ok(false);
+                        }
+                    }
+                    Err(ref err) if err.is_instance::<PyKeyError>(py) => {
+                        return Ok(false);
+                    }
+                    Err(err) => return Err(err),
+                }
+            }
+            Ok(true)
+        };
+        match op {
+            pyo3::basic::CompareOp::Eq => compare(other),
+            pyo3::basic::CompareOp::Ne => match compare(other) {
+                Ok(res) => Ok(!res),
+                Err(err) => Err(err),
+            },
+            _ => Err(PyNotImplementedError::new_err(
+                "Comparison not implemented",
+            )),
+        }
+    }
+
+    fn __str__(&self) -> PyResult<String> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        let mut str_vec: Vec<String> = Vec::with_capacity(self.nodes.len());
+        for (position, node) in self.nodes.iter().enumerate() {
+            str_vec.push(format!(
+                "{}: {}",
+                node,
+                self.row(py, position)?.as_ref(py).str()?
+            ));
+        }
+        Ok(format!(
+            "AllPairsPathLengthMapping{{{}}}",
+            str_vec.join(", ")
+        ))
+    }
+
+    fn __hash__(&self) -> PyResult<u64> {
+        let mut hasher = DefaultHasher::new();
+        for node in &self.nodes {
+            hasher.write_usize(*node);
+        }
+        for length in self.lengths.iter() {
+            hasher.write(&length.to_be_bytes());
+        }
+        Ok(hasher.finish())
+    }
+}
+
+#[pyproto]
+impl PySequenceProtocol for AllPairsPathLengthMapping {
+    fn __len__(&self) -> PyResult<usize> {
+        Ok(self.nodes.len())
+    }
+
+    fn __contains__(&self, index: usize) -> PyResult<bool> {
+        Ok(self.positions.contains_key(&index))
+    }
+}
+
+#[pyproto]
+impl PyMappingProtocol for AllPairsPathLengthMapping {
+    /// Return the number of nodes in the graph
+    fn __len__(&self) -> PyResult<usize> {
+        Ok(self.nodes.len())
+    }
+    fn __getitem__(&'p self, idx: usize) -> PyResult<PyObject> {
+        match self.positions.get(&idx) {
+            Some(position) => {
+                let gil = Python::acquire_gil();
+                self.row(gil.python(), *position)
+            }
+            None => Err(PyIndexError::new_err("No node found for index")),
+        }
+    }
+}
+
+#[pyproto]
+impl PyIterProtocol for AllPairsPathLengthMapping {
+    fn __iter__(slf: PyRef<Self>) -> AllPairsPathLengthMappingKeys {
+        AllPairsPathLengthMappingKeys {
+            keys: slf.nodes.clone(),
+            iter_pos: 0,
+        }
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for AllPairsPathLengthMapping {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        if let Ok(rows) = self.rows.try_borrow() {
+            for row in rows.iter().flatten() {
+                visit.call(row)?;
+            }
+        }
+        Ok(())
+    }
+
+    fn __clear__(&mut self) {
+        for row in self.rows.get_mut().iter_mut() {
+            *row = None;
+        }
+    }
+}
+
+#[pyclass(module = "retworkx")]
+pub struct AllPairsPathLengthMappingKeys {
+    pub keys: Vec<usize>,
+    iter_pos: usize,
+}
+
+#[pyproto]
+impl PyIterProtocol for AllPairsPathLengthMappingKeys {
+    fn __iter__(slf: PyRef<Self>) -> Py<AllPairsPathLengthMappingKeys> {
+        slf.into()
+    }
+    fn __next__(
+        mut slf: PyRefMut<Self>,
+    ) -> IterNextOutput<usize, &'static str> {
+        if slf.iter_pos < slf.keys.len() {
+            let res = IterNextOutput::Yield(slf.keys[slf.iter_pos]);
+            slf.iter_pos += 1;
+            res
+        } else {
+            IterNextOutput::Return("Ended")
+        }
+    }
+}
+
+#[pyclass(module = "retworkx", gc)]
+pub struct AllPairsPathLengthMappingValues {
+    mapping: Py<AllPairsPathLengthMapping>,
+    iter_pos: usize,
+}
+
+#[pyproto]
+impl PyIterProtocol for AllPairsPathLengthMappingValues {
+    fn __iter__(slf: PyRef<Self>) -> Py<AllPairsPathLengthMappingValues> {
+        slf.into()
+    }
+    fn __next__(
+        mut slf: PyRefMut<Self>,
+    ) -> PyResult<IterNextOutput<PyObject, &'static str>> {
+        let py = slf.py();
+        let position = slf.iter_pos;
+        let mapping = slf.mapping.borrow(py);
+        if position < mapping.nodes.len() {
+            let row = mapping.row(py, position)?;
+            drop(mapping);
+            slf.iter_pos += 1;
+            Ok(IterNextOutput::Yield(row))
+        } else {
+            Ok(IterNextOutput::Return("Ended"))
+        }
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for AllPairsPathLengthMappingValues {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        visit.call(&self.mapping)
+    }
+
+    fn __clear__(&mut self) {}
+}
+
+#[pyclass(module = "retworkx", gc)]
+pub struct AllPairsPathLengthMappingItems {
+    mapping: Py<AllPairsPathLengthMapping>,
+    iter_pos: usize,
+}
+
+#[pyproto]
+impl PyIterProtocol for AllPairsPathLengthMappingItems {
+    fn __iter__(slf: PyRef<Self>) -> Py<AllPairsPathLengthMappingItems> {
+        slf.into()
+    }
+    fn __next__(
+        mut slf: PyRefMut<Self>,
+    ) -> PyResult<IterNextOutput<(usize, PyObject), &'static str>> {
+        let py = slf.py();
+        let position = slf.iter_pos;
+        let mapping = slf.mapping.borrow(py);
+        if position < mapping.nodes.len() {
+            let item = (mapping.nodes[position], mapping.row(py, position)?);
+            drop(mapping);
+            slf.iter_pos += 1;
+            Ok(IterNextOutput::Yield(item))
+        } else {
+            Ok(IterNextOutput::Return("Ended"))
+        }
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for AllPairsPathLengthMappingItems {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        visit.call(&self.mapping)
+    }
+
+    fn __clear__(&mut self) {}
+}
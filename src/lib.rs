@@ -11,26 +11,41 @@
 // under the License.
 
 #![allow(clippy::float_cmp)]
+#![allow(clippy::too_many_arguments)]
 
+mod array_utils;
 mod astar;
+mod batch;
+mod contraction;
+mod csr;
 mod digraph;
 mod dijkstra;
+mod distance_matrix;
 mod dot_utils;
+mod edge_map;
+mod floyd_warshall;
 mod generators;
 mod graph;
 mod isomorphism;
 mod iterators;
 mod k_shortest_path;
 mod max_weight_matching;
+mod memory;
+mod payload_index;
+mod pickle_state;
+mod shortest_path;
+mod topo_order;
 mod union;
+mod views;
 
+use std::borrow::Cow;
 use std::cmp::{Ordering, Reverse};
 use std::collections::{BTreeSet, BinaryHeap};
 
 use hashbrown::{HashMap, HashSet};
 
 use pyo3::create_exception;
-use pyo3::exceptions::{PyException, PyValueError};
+use pyo3::exceptions::{PyException, PyIndexError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use pyo3::wrap_pyfunction;
@@ -43,24 +58,28 @@ use petgraph::prelude::*;
 use petgraph::stable_graph::EdgeReference;
 use petgraph::unionfind::UnionFind;
 use petgraph::visit::{
-    Bfs, Data, GraphBase, GraphProp, IntoEdgeReferences, IntoNeighbors,
-    IntoNodeIdentifiers, NodeCount, NodeIndexable, Reversed, VisitMap,
-    Visitable,
+    Bfs, Data, GraphBase, GraphProp, IntoEdgeReferences, IntoEdges,
+    IntoNeighbors, IntoNodeIdentifiers, NodeCount, NodeIndexable, Reversed,
+    VisitMap, Visitable,
 };
 use petgraph::EdgeType;
 
 use ndarray::prelude::*;
-use numpy::IntoPyArray;
+use numpy::{IntoPyArray, PyArray2, PyReadonlyArray1};
 use rand::distributions::{Distribution, Uniform};
 use rand::prelude::*;
 use rand_pcg::Pcg64;
 use rayon::prelude::*;
 
+use crate::array_utils::{
+    csr_arrays, dtype_name, fill_rows, output_array, output_dtype_name,
+};
 use crate::generators::PyInit_generators;
 use crate::iterators::{
-    EdgeList, NodeIndices, PathLengthMapping, PathMapping, Pos2DMapping,
-    WeightedEdgeList,
+    AllPairsPathLengthMapping, EdgeList, NodeIndices, PathLengthMapping,
+    PathMapping, Pos2DMapping, WeightedEdgeList,
 };
+use crate::topo_order::TopoOrder;
 
 trait NodesRemoved {
     fn nodes_removed(&self) -> bool;
@@ -158,21 +177,40 @@ fn dag_longest_path_length(graph: &digraph::PyDiGraph) -> PyResult<usize> {
 
 /// Find the number of weakly connected components in a DAG.
 ///
-/// :param PyDiGraph graph: The graph to find the number of weakly connected
-///     components on
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The graph to find the number of weakly connected
+///     components on, a :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 ///
 /// :returns: The number of weakly connected components in the DAG
 /// :rtype: int
 #[pyfunction]
 #[text_signature = "(graph, /)"]
-fn number_weakly_connected_components(graph: &digraph::PyDiGraph) -> usize {
-    algo::connected_components(graph)
+fn number_weakly_connected_components(
+    py: Python,
+    graph: csr::AnyDiGraph,
+) -> usize {
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => {
+            let graph: &digraph::PyDiGraph = &graph;
+            py.allow_threads(|| algo::connected_components(graph))
+        }
+        csr::AnyDiGraph::Frozen(graph) => {
+            let graph: &csr::CSRDiGraph = &graph;
+            py.allow_threads(|| _csr_components(graph).len())
+        }
+    }
 }
 
 /// Find the weakly connected components in a directed graph
 ///
-/// :param PyDiGraph graph: The graph to find the weakly connected components
-///     in
+/// :param graph: The graph to find the weakly connected components in, a
+///     :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 ///
 /// :returns: A list of sets where each set it a weakly connected component of
 ///     the graph
@@ -180,6 +218,15 @@ fn number_weakly_connected_components(graph: &digraph::PyDiGraph) -> usize {
 #[pyfunction]
 #[text_signature = "(graph, /)"]
 pub fn weakly_connected_components(
+    graph: csr::AnyDiGraph,
+) -> Vec<BTreeSet<usize>> {
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => _weakly_connected_components(&graph),
+        csr::AnyDiGraph::Frozen(graph) => _csr_components(&*graph),
+    }
+}
+
+fn _weakly_connected_components(
     graph: &digraph::PyDiGraph,
 ) -> Vec<BTreeSet<usize>> {
     let mut seen: HashSet<NodeIndex> =
@@ -216,7 +263,9 @@ pub fn weakly_connected_components(
 
 /// Check if the graph is weakly connected
 ///
-/// :param PyDiGraph graph: The graph to check if it is weakly connected
+/// :param graph: The graph to check if it is weakly connected, a
+///     :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 ///
 /// :returns: Whether the graph is weakly connected or not
 /// :rtype: bool
@@ -224,26 +273,61 @@ pub fn weakly_connected_components(
 /// :raises NullGraph: If an empty graph is passed in
 #[pyfunction]
 #[text_signature = "(graph, /)"]
-pub fn is_weakly_connected(graph: &digraph::PyDiGraph) -> PyResult<bool> {
-    if graph.graph.node_count() == 0 {
-        return Err(NullGraph::new_err("Invalid operation on a NullGraph"));
-    }
-    Ok(weakly_connected_components(graph)[0].len() == graph.graph.node_count())
+pub fn is_weakly_connected(graph: csr::AnyDiGraph) -> PyResult<bool> {
+    let (first_len, node_count) = match graph {
+        csr::AnyDiGraph::Graph(graph) => {
+            if graph.graph.node_count() == 0 {
+                return Err(NullGraph::new_err(
+                    "Invalid operation on a NullGraph",
+                ));
+            }
+            (
+                _weakly_connected_components(&graph)[0].len(),
+                graph.graph.node_count(),
+            )
+        }
+        csr::AnyDiGraph::Frozen(graph) => {
+            if graph.node_count() == 0 {
+                return Err(NullGraph::new_err(
+                    "Invalid operation on a NullGraph",
+                ));
+            }
+            (_csr_components(&*graph)[0].len(), graph.node_count())
+        }
+    };
+    Ok(first_len == node_count)
 }
 
 /// Check that the PyDiGraph or PyDAG doesn't have a cycle
 ///
-/// :param PyDiGraph graph: The graph to check for cycles
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The graph to check for cycles, a
+///     :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 ///
 /// :returns: ``True`` if there are no cycles in the input graph, ``False``
 ///     if there are cycles
 /// :rtype: bool
 #[pyfunction]
 #[text_signature = "(graph, /)"]
-fn is_directed_acyclic_graph(graph: &digraph::PyDiGraph) -> bool {
-    match algo::toposort(graph, None) {
-        Ok(_nodes) => true,
-        Err(_err) => false,
+fn is_directed_acyclic_graph(py: Python, graph: csr::AnyDiGraph) -> bool {
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => {
+            // Cycle checking guarantees the graph is acyclic
+            if graph.check_cycle {
+                return true;
+            }
+            let graph: &digraph::PyDiGraph = &graph;
+            py.allow_threads(|| algo::toposort(graph, None).is_ok())
+        }
+        csr::AnyDiGraph::Frozen(graph) => {
+            let graph: &csr::CSRDiGraph = &graph;
+            py.allow_threads(|| algo::toposort(graph, None).is_ok())
+        }
     }
 }
 
@@ -256,7 +340,9 @@ fn is_directed_acyclic_graph(graph: &digraph::PyDiGraph) -> bool {
 ///  2. Merge nodes from ``second`` over ``first`` given that:
 ///
 ///     - The ``merge_nodes`` is ``True``. operates in O(n^2), with n being the
-///       number of nodes in ``second``.
+///       number of nodes in ``second``. If ``first`` has a payload index
+///       (see :meth:`~retworkx.PyDiGraph.build_payload_index`) this is
+///       expected O(n) instead.
 ///     - The respective node in ``second`` and ``first`` share the same
 ///       weight/data payload.
 ///
@@ -428,7 +514,18 @@ fn graph_is_isomorphic(
 
 /// Return the topological sort of node indexes from the provided graph
 ///
-/// :param PyDiGraph graph: The DAG to get the topological sort on
+/// If ``check_cycle`` is enabled on the graph the topological order is
+/// maintained incrementally as edges are added and this function returns it
+/// in linear time in the number of nodes without re-sorting the graph.
+///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The DAG to get the topological sort on, a
+///     :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 ///
 /// :returns: A list of node indices topologically sorted.
 /// :rtype: NodeIndices
@@ -436,8 +533,26 @@ fn graph_is_isomorphic(
 /// :raises DAGHasCycle: if a cycle is encountered while sorting the graph
 #[pyfunction]
 #[text_signature = "(graph, /)"]
-fn topological_sort(graph: &digraph::PyDiGraph) -> PyResult<NodeIndices> {
-    let nodes = match algo::toposort(graph, None) {
+fn topological_sort(
+    py: Python,
+    graph: csr::AnyDiGraph,
+) -> PyResult<NodeIndices> {
+    let res = match graph {
+        csr::AnyDiGraph::Graph(graph) => {
+            if graph.check_cycle {
+                return Ok(NodeIndices {
+                    nodes: graph.topo_order.nodes(&graph.graph),
+                });
+            }
+            let graph: &digraph::PyDiGraph = &graph;
+            py.allow_threads(|| algo::toposort(graph, None))
+        }
+        csr::AnyDiGraph::Frozen(graph) => {
+            let graph: &csr::CSRDiGraph = &graph;
+            py.allow_threads(|| algo::toposort(graph, None))
+        }
+    };
+    let nodes = match res {
         Ok(nodes) => nodes,
         Err(_err) => {
             return Err(DAGHasCycle::new_err("Sort encountered a cycle"))
@@ -517,7 +632,9 @@ where
 
 /// Get edge list in depth first order
 ///
-/// :param PyDiGraph graph: The graph to get the DFS edge list from
+/// :param graph: The graph to get the DFS edge list from, a
+///     :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 /// :param int source: An optional node index to use as the starting node
 ///     for the depth-first search. The edge list will only return edges in
 ///     the components reachable from this index. If this is not specified
@@ -530,17 +647,24 @@ where
 #[pyfunction]
 #[text_signature = "(graph, /, source=None)"]
 fn digraph_dfs_edges(
-    graph: &digraph::PyDiGraph,
+    graph: csr::AnyDiGraph,
     source: Option<usize>,
 ) -> EdgeList {
-    EdgeList {
-        edges: dfs_edges(graph, source, graph.graph.edge_count()),
-    }
+    let edges = match graph {
+        csr::AnyDiGraph::Graph(graph) => {
+            dfs_edges(&*graph, source, graph.graph.edge_count())
+        }
+        csr::AnyDiGraph::Frozen(graph) => {
+            dfs_edges(&*graph, source, graph.payloads.edge_count)
+        }
+    };
+    EdgeList { edges }
 }
 
 /// Get edge list in depth first order
 ///
-/// :param PyGraph graph: The graph to get the DFS edge list from
+/// :param graph: The graph to get the DFS edge list from, a
+///     :class:`~retworkx.PyGraph` or a frozen :class:`~retworkx.CSRGraph`
 /// :param int source: An optional node index to use as the starting node
 ///     for the depth-first search. The edge list will only return edges in
 ///     the components reachable from this index. If this is not specified
@@ -552,10 +676,16 @@ fn digraph_dfs_edges(
 /// :rtype: EdgeList
 #[pyfunction]
 #[text_signature = "(graph, /, source=None)"]
-fn graph_dfs_edges(graph: &graph::PyGraph, source: Option<usize>) -> EdgeList {
-    EdgeList {
-        edges: dfs_edges(graph, source, graph.graph.edge_count()),
-    }
+fn graph_dfs_edges(graph: csr::AnyGraph, source: Option<usize>) -> EdgeList {
+    let edges = match graph {
+        csr::AnyGraph::Graph(graph) => {
+            dfs_edges(&*graph, source, graph.graph.edge_count())
+        }
+        csr::AnyGraph::Frozen(graph) => {
+            dfs_edges(&*graph, source, graph.payloads.edge_count)
+        }
+    };
+    EdgeList { edges }
 }
 
 /// Return successors in a breadth-first-search from a source node.
@@ -918,7 +1048,11 @@ fn graph_k_shortest_path_lengths(
 ///    :math:`\rightarrow` target, update the source :math:`\rightarrow` target
 ///    distance (to pass through w).
 ///
-/// The return format is ``{Source Node: {Target Node: Distance}}``.
+/// The return is a read-only mapping of the form
+/// ``{Source Node: {Target Node: Distance}}``. The distances are computed
+/// over a dense matrix, in parallel if the number of nodes is at least
+/// ``parallel_threshold``, and the dictionary of a source node is only built
+/// when it is accessed.
 ///
 /// .. note::
 ///
@@ -929,74 +1063,56 @@ fn graph_k_shortest_path_lengths(
 ///
 ///     Edge weights are restricted to 1 in the current implementation.
 ///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
 /// :param PyDigraph graph: The DiGraph to get all shortest paths from
+/// :param int parallel_threshold: The number of nodes to execute
+///     the algorithm in parallel at. It defaults to 300, but this can
+///     be tuned
 ///
-/// :returns: A dictionary of shortest paths
-/// :rtype: dict
-#[pyfunction]
-#[text_signature = "(dag, /)"]
-fn floyd_warshall(py: Python, dag: &digraph::PyDiGraph) -> PyResult<PyObject> {
-    let mut dist: HashMap<(usize, usize), usize> =
-        HashMap::with_capacity(dag.node_count());
-    for node in dag.graph.node_indices() {
-        // Distance from a node to itself is zero
-        dist.insert((node.index(), node.index()), 0);
+/// :returns: A read-only mapping of source nodes to a dictionary of target
+///     nodes and the length of the shortest path to them
+/// :rtype: AllPairsPathLengthMapping
+#[pyfunction(parallel_threshold = "300")]
+#[text_signature = "(dag, /, parallel_threshold=300)"]
+fn floyd_warshall(
+    py: Python,
+    dag: &digraph::PyDiGraph,
+    parallel_threshold: usize,
+) -> PyResult<AllPairsPathLengthMapping> {
+    let nodes: Vec<usize> =
+        dag.graph.node_indices().map(|node| node.index()).collect();
+    let n = nodes.len();
+    let mut position: Vec<usize> = vec![0; dag.graph.node_bound()];
+    for (pos, node) in nodes.iter().enumerate() {
+        position[*node] = pos;
     }
-    for edge in dag.graph.edge_indices() {
+    // Path lengths are small integers, which float32 holds exactly for any
+    // graph small enough for a dense matrix to fit in memory
+    let mut lengths = Array2::<f32>::from_elem((n, n), std::f32::INFINITY);
+    for edge in dag.graph.edge_references() {
         // Distance between nodes that share an edge is 1
-        let source_target = dag.graph.edge_endpoints(edge).unwrap();
-        let u = source_target.0.index();
-        let v = source_target.1.index();
-        // Update dist only if the key hasn't been set to 0 already
-        // (i.e. in case edge is a self edge). Assumes edge weight = 1.
-        dist.entry((u, v)).or_insert(1);
-    }
-    // The shortest distance between any pair of nodes u, v is the min of the
-    // distance tracked so far from u->v and the distance from u to v thorough
-    // another node w, for any w.
-    for w in dag.graph.node_indices() {
-        for u in dag.graph.node_indices() {
-            for v in dag.graph.node_indices() {
-                let u_v_dist = match dist.get(&(u.index(), v.index())) {
-                    Some(u_v_dist) => *u_v_dist,
-                    None => std::usize::MAX,
-                };
-                let u_w_dist = match dist.get(&(u.index(), w.index())) {
-                    Some(u_w_dist) => *u_w_dist,
-                    None => std::usize::MAX,
-                };
-                let w_v_dist = match dist.get(&(w.index(), v.index())) {
-                    Some(w_v_dist) => *w_v_dist,
-                    None => std::usize::MAX,
-                };
-                if u_w_dist == std::usize::MAX || w_v_dist == std::usize::MAX {
-                    // Avoid overflow!
-                    continue;
-                }
-                if u_v_dist > u_w_dist + w_v_dist {
-                    dist.insert((u.index(), v.index()), u_w_dist + w_v_dist);
-                }
-            }
-        }
+        lengths[[
+            position[edge.source().index()],
+            position[edge.target().index()],
+        ]] = 1.0;
     }
-
-    // Some re-formatting for Python: Dict[int, Dict[int, int]]
-    let out_dict = PyDict::new(py);
-    for (nodes, distance) in dist {
-        let u_index = nodes.0;
-        let v_index = nodes.1;
-        if out_dict.contains(u_index)? {
-            let u_dict =
-                out_dict.get_item(u_index).unwrap().downcast::<PyDict>()?;
-            u_dict.set_item(v_index, distance)?;
-            out_dict.set_item(u_index, u_dict)?;
-        } else {
-            let u_dict = PyDict::new(py);
-            u_dict.set_item(v_index, distance)?;
-            out_dict.set_item(u_index, u_dict)?;
-        }
+    // Distance from a node to itself is zero
+    for x in lengths.diag_mut() {
+        *x = 0.0;
     }
-    Ok(out_dict.into())
+    py.allow_threads(|| {
+        floyd_warshall::floyd_warshall(
+            lengths.as_slice_mut().unwrap(),
+            None,
+            n,
+            parallel_threshold,
+        )
+    });
+    Ok(AllPairsPathLengthMapping::from_lengths(nodes, lengths))
 }
 
 fn get_edge_iter_with_weights<G>(
@@ -1045,6 +1161,144 @@ where
     })
 }
 
+/// Build the dense matrix of ``edges`` and run the Floyd-Warshall kernel on
+/// it with ``T`` as the element type, returning the distance matrix and, if
+/// ``return_predecessors`` is set, the predecessor matrix. ``edges`` use the
+/// compacted matrix positions from ``get_edge_iter_with_weights()``, so the
+/// predecessor entries are positions too.
+fn _floyd_warshall_matrix<T>(
+    py: Python,
+    n: usize,
+    edges: &[(usize, usize, f64)],
+    as_undirected: bool,
+    return_predecessors: bool,
+    parallel_threshold: usize,
+    dtype: &str,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject>
+where
+    T: floyd_warshall::Weight + numpy::Element,
+{
+    let dist_array: &PyArray2<T> =
+        output_array(py, out, (n, n), dtype)?.extract()?;
+    // output_array() checked that the array is writeable, C contiguous and
+    // in native byte order. It's the caller's job (see the docs of ``out``)
+    // not to touch it from another thread while the GIL is released below.
+    let mut dist = unsafe { dist_array.as_array_mut() };
+    dist.fill(T::INFINITY);
+    let mut pred: Option<Array2<i64>> = if return_predecessors {
+        Some(Array2::<i64>::from_elem((n, n), -1))
+    } else {
+        None
+    };
+    for (i, j, weight) in edges {
+        let weight = T::from_f64(*weight);
+        let reverse = if as_undirected { Some((*j, *i)) } else { None };
+        for (source, target) in std::iter::once((*i, *j)).chain(reverse) {
+            if weight < dist[[source, target]] {
+                dist[[source, target]] = weight;
+                if let Some(pred) = pred.as_mut() {
+                    pred[[source, target]] = source as i64;
+                }
+            }
+        }
+    }
+    // 0 out the diagonal
+    for x in dist.diag_mut() {
+        *x = T::ZERO;
+    }
+    if let Some(pred) = pred.as_mut() {
+        for x in pred.diag_mut() {
+            *x = -1;
+        }
+    }
+    // The relaxation only touches the matrices, so let other Python threads
+    // run while it executes. Every pivot block updates every row so an out
+    // array can't be filled in chunks, the relaxation runs in place on it
+    // and leaves paging the mapped file to the OS.
+    py.allow_threads(|| {
+        floyd_warshall::floyd_warshall(
+            dist.as_slice_mut().unwrap(),
+            pred.as_mut().map(|pred| pred.as_slice_mut().unwrap()),
+            n,
+            parallel_threshold,
+        )
+    });
+    if dist_array.hasattr("flush")? {
+        dist_array.call_method0("flush")?;
+    }
+    let dist: PyObject = dist_array.into();
+    Ok(match pred {
+        Some(pred) => {
+            let pred: PyObject = pred.into_pyarray(py).into();
+            (dist, pred).into_py(py)
+        }
+        None => dist,
+    })
+}
+
+fn _floyd_warshall_numpy<G>(
+    py: Python,
+    graph: G,
+    weight_fn: &Option<PyObject>,
+    as_undirected: bool,
+    default_weight: f64,
+    dtype: Option<&PyAny>,
+    return_predecessors: bool,
+    parallel_threshold: usize,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject>
+where
+    G: GraphBase
+        + IntoEdgeReferences
+        + IntoNodeIdentifiers
+        + NodeIndexable
+        + NodeCount
+        + GraphProp
+        + NodesRemoved,
+    G: Data<NodeWeight = PyObject, EdgeWeight = PyObject>,
+{
+    if return_predecessors && out.map_or(false, |out| !out.is_none()) {
+        return Err(PyValueError::new_err(
+            "out can't be used with return_predecessors",
+        ));
+    }
+    let n = graph.node_count();
+    let dtype = output_dtype_name(py, dtype, out, "float64")?;
+    let mut edges: Vec<(usize, usize, f64)> = Vec::new();
+    for (i, j, weight) in get_edge_iter_with_weights(graph) {
+        let edge_weight =
+            weight_callable(py, weight_fn, &weight, default_weight)?;
+        edges.push((i, j, edge_weight));
+    }
+    match dtype.as_str() {
+        "float64" => _floyd_warshall_matrix::<f64>(
+            py,
+            n,
+            &edges,
+            as_undirected,
+            return_predecessors,
+            parallel_threshold,
+            &dtype,
+            out,
+        ),
+        "float32" => _floyd_warshall_matrix::<f32>(
+            py,
+            n,
+            &edges,
+            as_undirected,
+            return_predecessors,
+            parallel_threshold,
+            &dtype,
+            out,
+        ),
+        _ => Err(PyValueError::new_err(format!(
+            "Unsupported dtype {}, only float64 and float32 are supported",
+            dtype
+        ))),
+    }
+}
+
 /// Find all-pairs shortest path lengths using Floyd's algorithm
 ///
 /// Floyd's algorithm is used for finding shortest paths in dense graphs
@@ -1057,7 +1311,13 @@ where
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads if parallelization was enabled.
 ///
-/// :param PyGraph graph: The graph to run Floyd's algorithm on
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The graph to run Floyd's algorithm on, a
+///     :class:`~retworkx.PyGraph` or a frozen :class:`~retworkx.CSRGraph`
 /// :param weight_fn: A callable object (function, lambda, etc) which
 ///     will be passed the edge object and expected to return a ``float``. This
 ///     tells retworkx/rust how to extract a numerical weight as a ``float``
@@ -1073,69 +1333,75 @@ where
 /// :param int parallel_threshold: The number of nodes to execute
 ///     the algorithm in parallel at. It defaults to 300, but this can
 ///     be tuned
+/// :param dtype: The dtype of the output distance matrix, either
+///     ``numpy.float64`` (the default) or ``numpy.float32``. ``float32``
+///     halves the memory used at the cost of precision.
+/// :param bool return_predecessors: If set to ``True`` a predecessor matrix
+///     is returned along with the distance matrix.
+/// :param out: Where to write the distance matrix to instead of a new array,
+///     for matrices that don't fit in memory. Either a ``numpy.memmap`` (or
+///     any other writeable C contiguous array) of the right shape and dtype,
+///     whose dtype is used if ``dtype`` isn't set, or a path to create a new
+///     ``.npy`` file at. Every step of the algorithm updates every row, so it
+///     runs in place on the mapped file and the OS pages it in and out as
+///     needed. It can't be used with ``return_predecessors``. ``out`` must not
+///     be read or written from another thread until the function returns.
 ///
 /// :returns: A matrix of shortest path distances between nodes. If there is no
 ///     path between two nodes then the corresponding matrix entry will be
-///     ``np.inf``.
+///     ``np.inf``. If ``return_predecessors`` is set a tuple
+///     ``(dist, pred)`` is returned instead, where ``pred`` is an int64
+///     matrix whose entry ``[i, j]`` is the row/column position of the
+///     node before ``j`` on the shortest path from ``i`` to ``j``, or
+///     ``-1`` if ``i == j`` or there is no path. The rows and columns of
+///     both matrices are in node index order, skipping the indices of
+///     removed nodes, so ``pred`` holds positions in the matrix and not
+///     node indices. ``graph.node_indexes()[pos]`` gives the node index
+///     of a position, the two are the same if no nodes were removed.
 /// :rtype: numpy.ndarray
-#[pyfunction(parallel_threshold = "300", default_weight = "1.0")]
-#[text_signature = "(graph, /, weight_fn=None, default_weight=1.0, parallel_threshold=300)"]
+/// :raises ValueError: If ``dtype`` is not ``float64`` or ``float32``, if
+///     ``out`` doesn't match the output or if both ``out`` and
+///     ``return_predecessors`` are set
+#[pyfunction(
+    parallel_threshold = "300",
+    default_weight = "1.0",
+    return_predecessors = "false"
+)]
+#[text_signature = "(graph, /, weight_fn=None, default_weight=1.0, parallel_threshold=300, dtype=None, return_predecessors=False, out=None)"]
 fn graph_floyd_warshall_numpy(
     py: Python,
-    graph: &graph::PyGraph,
+    graph: csr::AnyGraph,
     weight_fn: Option<PyObject>,
     default_weight: f64,
     parallel_threshold: usize,
+    dtype: Option<&PyAny>,
+    return_predecessors: bool,
+    out: Option<&PyAny>,
 ) -> PyResult<PyObject> {
-    let n = graph.node_count();
-    // Allocate empty matrix
-    let mut mat = Array2::<f64>::from_elem((n, n), std::f64::INFINITY);
-
-    // Build adjacency matrix
-    for (i, j, weight) in get_edge_iter_with_weights(graph) {
-        let edge_weight =
-            weight_callable(py, &weight_fn, &weight, default_weight)?;
-        mat[[i, j]] = mat[[i, j]].min(edge_weight);
-        mat[[j, i]] = mat[[j, i]].min(edge_weight);
+    match graph {
+        csr::AnyGraph::Graph(graph) => _floyd_warshall_numpy(
+            py,
+            &*graph,
+            &weight_fn,
+            true,
+            default_weight,
+            dtype,
+            return_predecessors,
+            parallel_threshold,
+            out,
+        ),
+        csr::AnyGraph::Frozen(graph) => _floyd_warshall_numpy(
+            py,
+            &*graph,
+            &weight_fn,
+            true,
+            default_weight,
+            dtype,
+            return_predecessors,
+            parallel_threshold,
+            out,
+        ),
     }
-
-    // 0 out the diagonal
-    for x in mat.diag_mut() {
-        *x = 0.0;
-    }
-    // Perform the Floyd-Warshall algorithm.
-    // In each loop, this finds the shortest path from point i
-    // to point j using intermediate nodes 0..k
-    if n < parallel_threshold {
-        for k in 0..n {
-            for i in 0..n {
-                for j in 0..n {
-                    let d_ijk = mat[[i, k]] + mat[[k, j]];
-                    if d_ijk < mat[[i, j]] {
-                        mat[[i, j]] = d_ijk;
-                    }
-                }
-            }
-        }
-    } else {
-        for k in 0..n {
-            let row_k = mat.slice(s![k, ..]).to_owned();
-            mat.axis_iter_mut(Axis(0))
-                .into_par_iter()
-                .for_each(|mut row_i| {
-                    let m_ik = row_i[k];
-                    row_i.iter_mut().zip(row_k.iter()).for_each(
-                        |(m_ij, m_kj)| {
-                            let d_ijk = m_ik + *m_kj;
-                            if d_ijk < *m_ij {
-                                *m_ij = d_ijk;
-                            }
-                        },
-                    )
-                })
-        }
-    }
-    Ok(mat.into_pyarray(py).into())
 }
 
 /// Find all-pairs shortest path lengths using Floyd's algorithm
@@ -1150,7 +1416,14 @@ fn graph_floyd_warshall_numpy(
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads if parallelization was enabled.
 ///
-/// :param PyDiGraph graph: The directed graph to run Floyd's algorithm on
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The directed graph to run Floyd's algorithm on, a
+///     :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 /// :param weight_fn: A callable object (function, lambda, etc) which
 ///     will be passed the edge object and expected to return a ``float``. This
 ///     tells retworkx/rust how to extract a numerical weight as a ``float``
@@ -1168,76 +1441,77 @@ fn graph_floyd_warshall_numpy(
 /// :param int parallel_threshold: The number of nodes to execute
 ///     the algorithm in parallel at. It defaults to 300, but this can
 ///     be tuned
+/// :param dtype: The dtype of the output distance matrix, either
+///     ``numpy.float64`` (the default) or ``numpy.float32``. ``float32``
+///     halves the memory used at the cost of precision.
+/// :param bool return_predecessors: If set to ``True`` a predecessor matrix
+///     is returned along with the distance matrix.
+/// :param out: Where to write the distance matrix to instead of a new array,
+///     for matrices that don't fit in memory. Either a ``numpy.memmap`` (or
+///     any other writeable C contiguous array) of the right shape and dtype,
+///     whose dtype is used if ``dtype`` isn't set, or a path to create a new
+///     ``.npy`` file at. Every step of the algorithm updates every row, so it
+///     runs in place on the mapped file and the OS pages it in and out as
+///     needed. It can't be used with ``return_predecessors``. ``out`` must not
+///     be read or written from another thread until the function returns.
 ///
 /// :returns: A matrix of shortest path distances between nodes. If there is no
 ///     path between two nodes then the corresponding matrix entry will be
-///     ``np.inf``.
+///     ``np.inf``. If ``return_predecessors`` is set a tuple
+///     ``(dist, pred)`` is returned instead, where ``pred`` is an int64
+///     matrix whose entry ``[i, j]`` is the row/column position of the
+///     node before ``j`` on the shortest path from ``i`` to ``j``, or
+///     ``-1`` if ``i == j`` or there is no path. The rows and columns of
+///     both matrices are in node index order, skipping the indices of
+///     removed nodes, so ``pred`` holds positions in the matrix and not
+///     node indices. ``graph.node_indexes()[pos]`` gives the node index
+///     of a position, the two are the same if no nodes were removed.
 /// :rtype: numpy.ndarray
+/// :raises ValueError: If ``dtype`` is not ``float64`` or ``float32``, if
+///     ``out`` doesn't match the output or if both ``out`` and
+///     ``return_predecessors`` are set
 #[pyfunction(
     parallel_threshold = "300",
     as_undirected = "false",
-    default_weight = "1.0"
+    default_weight = "1.0",
+    return_predecessors = "false"
 )]
-#[text_signature = "(graph, /, weight_fn=None, as_undirected=False, default_weight=1.0, parallel_threshold=300)"]
+#[text_signature = "(graph, /, weight_fn=None, as_undirected=False, default_weight=1.0, parallel_threshold=300, dtype=None, return_predecessors=False, out=None)"]
 fn digraph_floyd_warshall_numpy(
     py: Python,
-    graph: &digraph::PyDiGraph,
+    graph: csr::AnyDiGraph,
     weight_fn: Option<PyObject>,
     as_undirected: bool,
     default_weight: f64,
     parallel_threshold: usize,
+    dtype: Option<&PyAny>,
+    return_predecessors: bool,
+    out: Option<&PyAny>,
 ) -> PyResult<PyObject> {
-    let n = graph.node_count();
-
-    // Allocate empty matrix
-    let mut mat = Array2::<f64>::from_elem((n, n), std::f64::INFINITY);
-
-    // Build adjacency matrix
-    for (i, j, weight) in get_edge_iter_with_weights(graph) {
-        let edge_weight =
-            weight_callable(py, &weight_fn, &weight, default_weight)?;
-        mat[[i, j]] = mat[[i, j]].min(edge_weight);
-        if as_undirected {
-            mat[[j, i]] = mat[[j, i]].min(edge_weight);
-        }
-    }
-    // 0 out the diagonal
-    for x in mat.diag_mut() {
-        *x = 0.0;
-    }
-    // Perform the Floyd-Warshall algorithm.
-    // In each loop, this finds the shortest path from point i
-    // to point j using intermediate nodes 0..k
-    if n < parallel_threshold {
-        for k in 0..n {
-            for i in 0..n {
-                for j in 0..n {
-                    let d_ijk = mat[[i, k]] + mat[[k, j]];
-                    if d_ijk < mat[[i, j]] {
-                        mat[[i, j]] = d_ijk;
-                    }
-                }
-            }
-        }
-    } else {
-        for k in 0..n {
-            let row_k = mat.slice(s![k, ..]).to_owned();
-            mat.axis_iter_mut(Axis(0))
-                .into_par_iter()
-                .for_each(|mut row_i| {
-                    let m_ik = row_i[k];
-                    row_i.iter_mut().zip(row_k.iter()).for_each(
-                        |(m_ij, m_kj)| {
-                            let d_ijk = m_ik + *m_kj;
-                            if d_ijk < *m_ij {
-                                *m_ij = d_ijk;
-                            }
-                        },
-                    )
-                })
-        }
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => _floyd_warshall_numpy(
+            py,
+            &*graph,
+            &weight_fn,
+            as_undirected,
+            default_weight,
+            dtype,
+            return_predecessors,
+            parallel_threshold,
+            out,
+        ),
+        csr::AnyDiGraph::Frozen(graph) => _floyd_warshall_numpy(
+            py,
+            &*graph,
+            &weight_fn,
+            as_undirected,
+            default_weight,
+            dtype,
+            return_predecessors,
+            parallel_threshold,
+            out,
+        ),
     }
-    Ok(mat.into_pyarray(py).into())
 }
 
 /// Collect runs that match a filter function
@@ -1413,79 +1687,104 @@ fn layers(
 /// defaults to 300). If the function will be running in parallel the env var
 /// ``RAYON_NUM_THREADS`` can be used to adjust how many threads will be used.
 ///
-/// :param PyDiGraph graph: The graph to get the distance matrix for
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The graph to get the distance matrix for, a
+///     :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 /// :param int parallel_threshold: The number of nodes to calculate the
 ///     the distance matrix in parallel at. It defaults to 300, but this can
 ///     be tuned
 /// :param bool as_undirected: If set to ``True`` the input directed graph
 ///     will be treat as if each edge was bidirectional/undirected in the
 ///     output distance matrix.
-///
-/// :returns: The distance matrix
+/// :param dtype: The dtype of the output matrix, one of ``numpy.float64``
+///     (the default), ``numpy.int32``, ``numpy.uint16`` or ``numpy.uint8``.
+///     The smaller integer types use a fraction of the memory of the default
+///     but can only hold distances up to their maximum value.
+/// :param null_value: The value of the entries for pairs of nodes without a
+///     path between them. It defaults to ``0.0``, the same value as the
+///     diagonal, set it to for example ``numpy.inf`` (or ``-1`` for
+///     ``int32``) to tell the two apart. For an integer ``dtype`` the
+///     largest value of the type (such as ``255`` for ``uint8``) can be
+///     used, it is then reserved for ``null_value`` and a distance that
+///     large raises a ``ValueError``.
+/// :param int cutoff: If set only the distances up to ``cutoff`` are
+///     computed, the entries of pairs of nodes further apart than that are
+///     set to ``null_value``. Each search stops at that depth so this is
+///     much faster when only nearby pairs matter.
+/// :param bool sparse: If set to ``True`` return the matrix in compressed
+///     sparse row form instead, as a tuple of numpy arrays
+///     ``(indptr, indices, data)`` holding only the distances between
+///     distinct nodes that can reach each other (within ``cutoff``). The
+///     distances from row ``i`` are ``data[indptr[i]:indptr[i + 1]]`` and
+///     their columns are ``indices[indptr[i]:indptr[i + 1]]``, in increasing
+///     order. ``indptr`` and ``indices`` are ``int64`` and ``data`` has the
+///     type set by ``dtype``, ``null_value`` is ignored. This can be passed
+///     directly to ``scipy.sparse.csr_matrix((data, indices, indptr))``.
+/// :param out: Where to write the distance matrix to instead of a new array,
+///     for matrices that don't fit in memory. Either a ``numpy.memmap`` (or
+///     any other writeable C contiguous array) of the right shape and dtype,
+///     whose dtype is used if ``dtype`` isn't set, or a path to create a new
+///     ``.npy`` file at, which can be opened again with
+///     ``numpy.load(path, mmap_mode="r")``. The rows are computed in chunks
+///     that are flushed to the file one at a time so the memory used stays
+///     bounded by the size of a chunk. It can't be used with ``sparse``.
+///     ``out`` must not be read or written from another thread until the
+///     function returns.
+///
+/// :returns: The distance matrix (``out`` if it is set, or the memory mapped
+///     file it points to), or its ``(indptr, indices, data)`` arrays if
+///     ``sparse`` is set
 /// :rtype: numpy.ndarray
-#[pyfunction(parallel_threshold = "300", as_undirected = "false")]
-#[text_signature = "(graph, /, parallel_threshold=300, as_undirected=False)"]
+/// :raises ValueError: If ``dtype`` isn't supported, if ``null_value`` can't
+///     be represented in ``dtype``, if a distance within ``cutoff`` is too
+///     large for ``dtype`` or if ``out`` doesn't match the output
+#[pyfunction(
+    parallel_threshold = "300",
+    as_undirected = "false",
+    null_value = "0.0",
+    sparse = "false"
+)]
+#[text_signature = "(graph, /, parallel_threshold=300, as_undirected=False, dtype=None, null_value=0.0, cutoff=None, sparse=False, out=None)"]
 pub fn digraph_distance_matrix(
     py: Python,
-    graph: &digraph::PyDiGraph,
+    graph: csr::AnyDiGraph,
     parallel_threshold: usize,
     as_undirected: bool,
+    dtype: Option<&PyAny>,
+    null_value: f64,
+    cutoff: Option<usize>,
+    sparse: bool,
+    out: Option<&PyAny>,
 ) -> PyResult<PyObject> {
-    let n = graph.node_count();
-    let mut matrix = Array2::<f64>::zeros((n, n));
-    let bfs_traversal = |index: usize, mut row: ArrayViewMut1<f64>| {
-        let mut seen: HashMap<NodeIndex, usize> = HashMap::with_capacity(n);
-        let start_index = NodeIndex::new(index);
-        let mut level = 0;
-        let mut next_level: HashSet<NodeIndex> = HashSet::new();
-        next_level.insert(start_index);
-        while !next_level.is_empty() {
-            let this_level = next_level;
-            next_level = HashSet::new();
-            let mut found: Vec<NodeIndex> = Vec::new();
-            for v in this_level {
-                if !seen.contains_key(&v) {
-                    seen.insert(v, level);
-                    found.push(v);
-                    row[[v.index()]] = level as f64;
-                }
-            }
-            if seen.len() == n {
-                return;
-            }
-            for node in found {
-                for v in graph
-                    .graph
-                    .neighbors_directed(node, petgraph::Direction::Outgoing)
-                {
-                    next_level.insert(v);
-                }
-                if as_undirected {
-                    for v in graph
-                        .graph
-                        .neighbors_directed(node, petgraph::Direction::Incoming)
-                    {
-                        next_level.insert(v);
-                    }
-                }
-            }
-            level += 1
-        }
-    };
-    if n < parallel_threshold {
-        matrix
-            .axis_iter_mut(Axis(0))
-            .enumerate()
-            .for_each(|(index, row)| bfs_traversal(index, row));
-    } else {
-        // Parallelize by row and iterate from each row index in BFS order
-        matrix
-            .axis_iter_mut(Axis(0))
-            .into_par_iter()
-            .enumerate()
-            .for_each(|(index, row)| bfs_traversal(index, row));
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => _csr_distance_matrix(
+            py,
+            &graph.graph,
+            parallel_threshold,
+            as_undirected,
+            dtype,
+            null_value,
+            cutoff,
+            sparse,
+            out,
+        ),
+        csr::AnyDiGraph::Frozen(graph) => _csr_distance_matrix(
+            py,
+            &*graph,
+            parallel_threshold,
+            as_undirected,
+            dtype,
+            null_value,
+            cutoff,
+            sparse,
+            out,
+        ),
     }
-    Ok(matrix.into_pyarray(py).into())
 }
 
 /// Get the distance matrix for an undirected graph
@@ -1499,64 +1798,266 @@ pub fn digraph_distance_matrix(
 /// defaults to 300). If the function will be running in parallel the env var
 /// ``RAYON_NUM_THREADS`` can be used to adjust how many threads will be used.
 ///
-/// :param PyGraph graph: The graph to get the distance matrix for
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The graph to get the distance matrix for, a
+///     :class:`~retworkx.PyGraph` or a frozen :class:`~retworkx.CSRGraph`
 /// :param int parallel_threshold: The number of nodes to calculate the
 ///     the distance matrix in parallel at. It defaults to 300, but this can
 ///     be tuned
-///
-/// :returns: The distance matrix
+/// :param dtype: The dtype of the output matrix, one of ``numpy.float64``
+///     (the default), ``numpy.int32``, ``numpy.uint16`` or ``numpy.uint8``.
+///     The smaller integer types use a fraction of the memory of the default
+///     but can only hold distances up to their maximum value.
+/// :param null_value: The value of the entries for pairs of nodes without a
+///     path between them. It defaults to ``0.0``, the same value as the
+///     diagonal, set it to for example ``numpy.inf`` (or ``-1`` for
+///     ``int32``) to tell the two apart. For an integer ``dtype`` the
+///     largest value of the type (such as ``255`` for ``uint8``) can be
+///     used, it is then reserved for ``null_value`` and a distance that
+///     large raises a ``ValueError``.
+/// :param int cutoff: If set only the distances up to ``cutoff`` are
+///     computed, the entries of pairs of nodes further apart than that are
+///     set to ``null_value``. Each search stops at that depth so this is
+///     much faster when only nearby pairs matter.
+/// :param bool sparse: If set to ``True`` return the matrix in compressed
+///     sparse row form instead, as a tuple of numpy arrays
+///     ``(indptr, indices, data)`` holding only the distances between
+///     distinct nodes that can reach each other (within ``cutoff``). The
+///     distances from row ``i`` are ``data[indptr[i]:indptr[i + 1]]`` and
+///     their columns are ``indices[indptr[i]:indptr[i + 1]]``, in increasing
+///     order. ``indptr`` and ``indices`` are ``int64`` and ``data`` has the
+///     type set by ``dtype``, ``null_value`` is ignored. This can be passed
+///     directly to ``scipy.sparse.csr_matrix((data, indices, indptr))``.
+/// :param out: Where to write the distance matrix to instead of a new array,
+///     for matrices that don't fit in memory. Either a ``numpy.memmap`` (or
+///     any other writeable C contiguous array) of the right shape and dtype,
+///     whose dtype is used if ``dtype`` isn't set, or a path to create a new
+///     ``.npy`` file at, which can be opened again with
+///     ``numpy.load(path, mmap_mode="r")``. The rows are computed in chunks
+///     that are flushed to the file one at a time so the memory used stays
+///     bounded by the size of a chunk. It can't be used with ``sparse``.
+///     ``out`` must not be read or written from another thread until the
+///     function returns.
+///
+/// :returns: The distance matrix (``out`` if it is set, or the memory mapped
+///     file it points to), or its ``(indptr, indices, data)`` arrays if
+///     ``sparse`` is set
 /// :rtype: numpy.ndarray
-#[pyfunction(parallel_threshold = "300")]
-#[text_signature = "(graph, /, parallel_threshold=300)"]
+/// :raises ValueError: If ``dtype`` isn't supported, if ``null_value`` can't
+///     be represented in ``dtype``, if a distance within ``cutoff`` is too
+///     large for ``dtype`` or if ``out`` doesn't match the output
+#[pyfunction(parallel_threshold = "300", null_value = "0.0", sparse = "false")]
+#[text_signature = "(graph, /, parallel_threshold=300, dtype=None, null_value=0.0, cutoff=None, sparse=False, out=None)"]
 pub fn graph_distance_matrix(
     py: Python,
-    graph: &graph::PyGraph,
+    graph: csr::AnyGraph,
     parallel_threshold: usize,
+    dtype: Option<&PyAny>,
+    null_value: f64,
+    cutoff: Option<usize>,
+    sparse: bool,
+    out: Option<&PyAny>,
 ) -> PyResult<PyObject> {
-    let n = graph.node_count();
-    let mut matrix = Array2::<f64>::zeros((n, n));
-    let bfs_traversal = |index: usize, mut row: ArrayViewMut1<f64>| {
-        let mut seen: HashMap<NodeIndex, usize> = HashMap::with_capacity(n);
-        let start_index = NodeIndex::new(index);
-        let mut level = 0;
-        let mut next_level: HashSet<NodeIndex> = HashSet::new();
-        next_level.insert(start_index);
-        while !next_level.is_empty() {
-            let this_level = next_level;
-            next_level = HashSet::new();
-            let mut found: Vec<NodeIndex> = Vec::new();
-            for v in this_level {
-                if !seen.contains_key(&v) {
-                    seen.insert(v, level);
-                    found.push(v);
-                    row[[v.index()]] = level as f64;
-                }
-            }
-            if seen.len() == n {
-                return;
-            }
-            for node in found {
-                for v in graph.graph.neighbors(node) {
-                    next_level.insert(v);
-                }
-            }
-            level += 1
-        }
+    match graph {
+        csr::AnyGraph::Graph(graph) => _csr_distance_matrix(
+            py,
+            &graph.graph,
+            parallel_threshold,
+            false,
+            dtype,
+            null_value,
+            cutoff,
+            sparse,
+            out,
+        ),
+        csr::AnyGraph::Frozen(graph) => _csr_distance_matrix(
+            py,
+            &*graph,
+            parallel_threshold,
+            false,
+            dtype,
+            null_value,
+            cutoff,
+            sparse,
+            out,
+        ),
+    }
+}
+
+/// Compute the distance matrix of ``graph`` from its adjacency rows.
+fn _csr_distance_matrix<'a, G>(
+    py: Python,
+    graph: G,
+    parallel_threshold: usize,
+    as_undirected: bool,
+    dtype: Option<&PyAny>,
+    null_value: f64,
+    cutoff: Option<usize>,
+    sparse: bool,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject>
+where
+    G: csr::AsAdjacency<'a>
+        + IntoNodeIdentifiers
+        + GraphBase<NodeId = NodeIndex>
+        + NodeIndexable
+        + GraphProp,
+{
+    let out_adj = graph.adjacency(Direction::Outgoing);
+    let in_adj = if graph.is_directed() {
+        graph.adjacency(Direction::Incoming)
+    } else {
+        Cow::Owned(csr::Adjacency::default())
     };
-    if n < parallel_threshold {
-        matrix
-            .axis_iter_mut(Axis(0))
-            .enumerate()
-            .for_each(|(index, row)| bfs_traversal(index, row));
+    let (out_rows, in_rows) = if !graph.is_directed() {
+        (vec![&*out_adj], vec![&*out_adj])
+    } else if as_undirected {
+        (vec![&*out_adj, &*in_adj], vec![&*in_adj, &*out_adj])
     } else {
-        // Parallelize by row and iterate from each row index in BFS order
-        matrix
-            .axis_iter_mut(Axis(0))
-            .into_par_iter()
-            .enumerate()
-            .for_each(|(index, row)| bfs_traversal(index, row));
+        (vec![&*out_adj], vec![&*in_adj])
+    };
+    let bfs_graph = distance_matrix::BfsGraph::new(
+        &out_rows,
+        &in_rows,
+        graph.node_identifiers().map(|node| node.index()).collect(),
+        graph.node_bound(),
+    );
+    _distance_matrix(
+        py,
+        &bfs_graph,
+        parallel_threshold,
+        dtype,
+        null_value,
+        cutoff,
+        sparse,
+        out,
+    )
+}
+
+/// Compute the distance matrix of ``bfs_graph`` with the element type named
+/// by ``dtype`` (or the dtype of ``out``).
+fn _distance_matrix(
+    py: Python,
+    bfs_graph: &distance_matrix::BfsGraph,
+    parallel_threshold: usize,
+    dtype: Option<&PyAny>,
+    null_value: f64,
+    cutoff: Option<usize>,
+    sparse: bool,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject> {
+    if sparse && out.is_some() {
+        return Err(PyValueError::new_err("out can't be used with sparse"));
     }
-    Ok(matrix.into_pyarray(py).into())
+    match output_dtype_name(py, dtype, out, "float64")?.as_str() {
+        "float64" => _typed_distance_matrix::<f64>(
+            py,
+            bfs_graph,
+            parallel_threshold,
+            null_value,
+            cutoff,
+            sparse,
+            out,
+        ),
+        "int32" => _typed_distance_matrix::<i32>(
+            py,
+            bfs_graph,
+            parallel_threshold,
+            null_value,
+            cutoff,
+            sparse,
+            out,
+        ),
+        "uint16" => _typed_distance_matrix::<u16>(
+            py,
+            bfs_graph,
+            parallel_threshold,
+            null_value,
+            cutoff,
+            sparse,
+            out,
+        ),
+        "uint8" => _typed_distance_matrix::<u8>(
+            py,
+            bfs_graph,
+            parallel_threshold,
+            null_value,
+            cutoff,
+            sparse,
+            out,
+        ),
+        name => Err(PyValueError::new_err(format!(
+            "Unsupported dtype {}, only float64, int32, uint16 and uint8 are \
+             supported",
+            name
+        ))),
+    }
+}
+
+fn _typed_distance_matrix<T>(
+    py: Python,
+    bfs_graph: &distance_matrix::BfsGraph,
+    parallel_threshold: usize,
+    null_value: f64,
+    cutoff: Option<usize>,
+    sparse: bool,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject>
+where
+    T: distance_matrix::Distance + numpy::Element,
+{
+    let too_far = || {
+        PyValueError::new_err(format!(
+            "The graph has distances too large for {}",
+            T::NAME
+        ))
+    };
+    if sparse {
+        // The rows are only as long as the number of nodes each source
+        // reaches, they are concatenated straight into the output arrays
+        let rows = py
+            .allow_threads(|| {
+                bfs_graph.sparse_rows::<T>(cutoff, parallel_threshold)
+            })
+            .ok_or_else(too_far)?;
+        return Ok(csr_arrays(py, rows));
+    }
+    // A null value of T::MAX would be ambiguous with a distance of T::MAX,
+    // so that distance counts as too large instead
+    let max_distance = if null_value == T::MAX as f64 {
+        T::MAX - 1
+    } else {
+        T::MAX
+    };
+    let null_value = T::from_f64(null_value).ok_or_else(|| {
+        PyValueError::new_err(format!(
+            "null_value {} can not be represented as {}",
+            null_value,
+            T::NAME
+        ))
+    })?;
+    let n = bfs_graph.nodes.len();
+    let parallel = n >= parallel_threshold;
+    let matrix = output_array(py, out, (n, n), T::NAME)?;
+    // The BFS never touches a Python object so each chunk of rows is
+    // computed without the GIL
+    let fits = fill_rows(
+        py,
+        matrix,
+        out.is_some(),
+        |mut chunk: ArrayViewMut2<T>, first| {
+            chunk.fill(null_value);
+            bfs_graph.fill(chunk, first, cutoff, max_distance, parallel)
+        },
+    )?;
+    if !fits {
+        return Err(too_far());
+    }
+    Ok(matrix.into())
 }
 
 /// Return the adjacency matrix for a PyDiGraph object
@@ -1770,65 +2271,97 @@ fn weight_callable(
     }
 }
 
-/// Find the shortest path from a node
-///
-/// This function will generate the shortest path from a source node using
-/// Dijkstra's algorithm.
-///
-/// :param PyGraph graph:
-/// :param int source: The node index to find paths from
-/// :param int target: An optional target to find a path to
-/// :param weight_fn: An optional weight function for an edge. It will accept
-///     a single argument, the edge's weight object and will return a float which
-///     will be used to represent the weight/cost of the edge
-/// :param float default_weight: If ``weight_fn`` isn't specified this optional
-///     float value will be used for the weight/cost of each edge.
-/// :param bool as_undirected: If set to true the graph will be treated as
-///     undirected for finding the shortest path.
-///
-/// :return: Dictionary of paths. The keys are destination node indices and
-///     the dict values are lists of node indices making the path.
-/// :rtype: dict
-#[pyfunction(default_weight = "1.0", as_undirected = "false")]
-#[text_signature = "(graph, source, /, target=None weight_fn=None, default_weight=1.0)"]
-pub fn graph_dijkstra_shortest_paths(
+fn _dijkstra_arrays<Ty: EdgeType>(
     py: Python,
-    graph: &graph::PyGraph,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
     source: usize,
     target: Option<usize>,
-    weight_fn: Option<PyObject>,
+    weight_fn: &Option<PyObject>,
     default_weight: f64,
-) -> PyResult<PathMapping> {
-    let start = NodeIndex::new(source);
-    let goal_index: Option<NodeIndex> = target.map(NodeIndex::new);
-    let mut paths: HashMap<NodeIndex, Vec<NodeIndex>> =
-        HashMap::with_capacity(graph.node_count());
-    dijkstra::dijkstra(
-        graph,
-        start,
-        goal_index,
-        |e| weight_callable(py, &weight_fn, e.weight(), default_weight),
-        Some(&mut paths),
+    as_undirected: bool,
+) -> PyResult<PyObject> {
+    if !graph.contains_node(NodeIndex::new(source)) {
+        return Err(PyIndexError::new_err(format!(
+            "No node found for index {}",
+            source
+        )));
+    }
+    let (dist, pred) = shortest_path::dijkstra_arrays(
+        graph.node_bound(),
+        source,
+        target,
+        |node| {
+            let node = NodeIndex::new(node);
+            let reverse_edges = if as_undirected && Ty::is_directed() {
+                Some(graph.edges_directed(node, petgraph::Direction::Incoming))
+            } else {
+                None
+            };
+            graph
+                .edges_directed(node, petgraph::Direction::Outgoing)
+                .chain(reverse_edges.into_iter().flatten())
+                .map(move |edge| {
+                    let next = if edge.source() == node {
+                        edge.target()
+                    } else {
+                        edge.source()
+                    };
+                    (next.index(), edge.id().index())
+                })
+        },
+        |edge| {
+            weight_callable(
+                py,
+                weight_fn,
+                &graph[EdgeIndex::new(edge)],
+                default_weight,
+            )
+        },
     )?;
+    let dist: PyObject = dist.into_pyarray(py).into();
+    let pred: PyObject = pred.into_pyarray(py).into();
+    Ok((dist, pred).into_py(py))
+}
 
-    Ok(PathMapping {
-        paths: paths
-            .iter()
-            .filter_map(|(k, v)| {
-                let k_int = k.index();
-                if k_int == source
-                    || target.is_some() && target.unwrap() != k_int
-                {
-                    None
-                } else {
-                    Some((
-                        k.index(),
-                        v.iter().map(|x| x.index()).collect::<Vec<usize>>(),
-                    ))
-                }
+fn _frozen_dijkstra_arrays(
+    py: Python,
+    payloads: &csr::Payloads,
+    rows: &[&csr::Adjacency],
+    source: usize,
+    target: Option<usize>,
+    weight_fn: &Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<PyObject> {
+    if payloads
+        .nodes
+        .get(source)
+        .map_or(true, |node| node.is_none())
+    {
+        return Err(PyIndexError::new_err(format!(
+            "No node found for index {}",
+            source
+        )));
+    }
+    let (dist, pred) = shortest_path::dijkstra_arrays(
+        payloads.nodes.len(),
+        source,
+        target,
+        |node| {
+            rows.iter().flat_map(move |adj| {
+                adj.row(node)
+                    .iter()
+                    .cloned()
+                    .zip(adj.row_edges(node).iter().cloned())
             })
-            .collect(),
-    })
+        },
+        |edge| {
+            let weight = &payloads.edges[edge].as_ref().unwrap().2;
+            weight_callable(py, weight_fn, weight, default_weight)
+        },
+    )?;
+    let dist: PyObject = dist.into_pyarray(py).into();
+    let pred: PyObject = pred.into_pyarray(py).into();
+    Ok((dist, pred).into_py(py))
 }
 
 /// Find the shortest path from a node
@@ -1836,7 +2369,104 @@ pub fn graph_dijkstra_shortest_paths(
 /// This function will generate the shortest path from a source node using
 /// Dijkstra's algorithm.
 ///
-/// :param PyDiGraph graph:
+/// :param graph: A :class:`~retworkx.PyGraph` or a frozen
+///     :class:`~retworkx.CSRGraph`
+/// :param int source: The node index to find paths from
+/// :param int target: An optional target to find a path to
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float which
+///     will be used to represent the weight/cost of the edge
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param bool as_undirected: If set to true the graph will be treated as
+///     undirected for finding the shortest path.
+/// :param bool as_arrays: If set to true return the shortest paths as a pair
+///     of numpy arrays instead of a dictionary of paths, see below.
+///
+/// :return: Dictionary of paths. The keys are destination node indices and
+///     the dict values are lists of node indices making the path. If
+///     ``as_arrays`` is set a tuple ``(distances, predecessors)`` of a
+///     ``float64`` and an ``int64`` numpy array indexed by node index is
+///     returned instead, where ``distances`` is the length of the shortest
+///     path to each node (``np.inf`` if it isn't reached) and
+///     ``predecessors`` is the node before it on that path (``-1`` for
+///     ``source`` and nodes that aren't reached). If ``target`` is set only
+///     the nodes settled before ``target`` was reached are filled in. The
+///     path to a node can be rebuilt with
+///     :func:`~retworkx.path_from_predecessors`.
+/// :rtype: PathMapping or tuple
+#[pyfunction(
+    default_weight = "1.0",
+    as_undirected = "false",
+    as_arrays = "false"
+)]
+#[text_signature = "(graph, source, /, target=None, weight_fn=None, default_weight=1.0, as_arrays=False)"]
+pub fn graph_dijkstra_shortest_paths(
+    py: Python,
+    graph: csr::AnyGraph,
+    source: usize,
+    target: Option<usize>,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    as_arrays: bool,
+) -> PyResult<PyObject> {
+    match graph {
+        csr::AnyGraph::Graph(graph) => {
+            if as_arrays {
+                return _dijkstra_arrays(
+                    py,
+                    &graph.graph,
+                    source,
+                    target,
+                    &weight_fn,
+                    default_weight,
+                    false,
+                );
+            }
+            Ok(_dijkstra_shortest_paths(
+                py,
+                &*graph,
+                graph.node_count(),
+                source,
+                target,
+                weight_fn,
+                default_weight,
+            )?
+            .into_py(py))
+        }
+        csr::AnyGraph::Frozen(graph) => {
+            if as_arrays {
+                return _frozen_dijkstra_arrays(
+                    py,
+                    &graph.payloads,
+                    &[&graph.out_adj],
+                    source,
+                    target,
+                    &weight_fn,
+                    default_weight,
+                );
+            }
+            Ok(_dijkstra_shortest_paths(
+                py,
+                &*graph,
+                graph.payloads.node_count,
+                source,
+                target,
+                weight_fn,
+                default_weight,
+            )?
+            .into_py(py))
+        }
+    }
+}
+
+/// Find the shortest path from a node
+///
+/// This function will generate the shortest path from a source node using
+/// Dijkstra's algorithm.
+///
+/// :param graph: A :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 /// :param int source: The node index to find paths from
 /// :param int target: An optional target path to find the path
 /// :param weight_fn: An optional weight function for an edge. It will accept
@@ -1846,69 +2476,193 @@ pub fn graph_dijkstra_shortest_paths(
 ///     float value will be used for the weight/cost of each edge.
 /// :param bool as_undirected: If set to true the graph will be treated as
 ///     undirected for finding the shortest path.
+/// :param bool as_arrays: If set to true return the shortest paths as a pair
+///     of numpy arrays instead of a dictionary of paths, see below.
 ///
 /// :return: Dictionary of paths. The keys are destination node indices and
-///     the dict values are lists of node indices making the path.
-/// :rtype: dict
-#[pyfunction(default_weight = "1.0", as_undirected = "false")]
-#[text_signature = "(graph, source, /, target=None weight_fn=None, default_weight=1.0, as_undirected=False)"]
+///     the dict values are lists of node indices making the path. If
+///     ``as_arrays`` is set a tuple ``(distances, predecessors)`` of a
+///     ``float64`` and an ``int64`` numpy array indexed by node index is
+///     returned instead, where ``distances`` is the length of the shortest
+///     path to each node (``np.inf`` if it isn't reached) and
+///     ``predecessors`` is the node before it on that path (``-1`` for
+///     ``source`` and nodes that aren't reached). If ``target`` is set only
+///     the nodes settled before ``target`` was reached are filled in. The
+///     path to a node can be rebuilt with
+///     :func:`~retworkx.path_from_predecessors`.
+/// :rtype: PathMapping or tuple
+#[pyfunction(
+    default_weight = "1.0",
+    as_undirected = "false",
+    as_arrays = "false"
+)]
+#[text_signature = "(graph, source, /, target=None, weight_fn=None, default_weight=1.0, as_undirected=False, as_arrays=False)"]
 pub fn digraph_dijkstra_shortest_paths(
     py: Python,
-    graph: &digraph::PyDiGraph,
+    graph: csr::AnyDiGraph,
     source: usize,
     target: Option<usize>,
     weight_fn: Option<PyObject>,
     default_weight: f64,
     as_undirected: bool,
-) -> PyResult<PathMapping> {
-    let start = NodeIndex::new(source);
-    let goal_index: Option<NodeIndex> = target.map(NodeIndex::new);
-    let mut paths: HashMap<NodeIndex, Vec<NodeIndex>> =
-        HashMap::with_capacity(graph.node_count());
-    if as_undirected {
-        dijkstra::dijkstra(
-            // TODO: Use petgraph undirected adapter after
-            // https://github.com/petgraph/petgraph/pull/318 is available in
-            // a petgraph release.
-            &graph.to_undirected(py),
-            start,
-            goal_index,
-            |e| weight_callable(py, &weight_fn, e.weight(), default_weight),
-            Some(&mut paths),
-        )?;
-    } else {
-        dijkstra::dijkstra(
-            graph,
-            start,
-            goal_index,
-            |e| weight_callable(py, &weight_fn, e.weight(), default_weight),
-            Some(&mut paths),
-        )?;
-    }
-    Ok(PathMapping {
-        paths: paths
-            .iter()
-            .filter_map(|(k, v)| {
-                let k_int = k.index();
-                if k_int == source
-                    || target.is_some() && target.unwrap() != k_int
-                {
-                    None
+    as_arrays: bool,
+) -> PyResult<PyObject> {
+    let paths = match graph {
+        csr::AnyDiGraph::Graph(graph) => {
+            if as_arrays {
+                return _dijkstra_arrays(
+                    py,
+                    &graph.graph,
+                    source,
+                    target,
+                    &weight_fn,
+                    default_weight,
+                    as_undirected,
+                );
+            }
+            if as_undirected {
+                _dijkstra_shortest_paths(
+                    py,
+                    // TODO: Use petgraph undirected adapter after
+                    // https://github.com/petgraph/petgraph/pull/318 is
+                    // available in a petgraph release.
+                    &graph.to_undirected(py),
+                    graph.node_count(),
+                    source,
+                    target,
+                    weight_fn,
+                    default_weight,
+                )?
+            } else {
+                _dijkstra_shortest_paths(
+                    py,
+                    &*graph,
+                    graph.node_count(),
+                    source,
+                    target,
+                    weight_fn,
+                    default_weight,
+                )?
+            }
+        }
+        csr::AnyDiGraph::Frozen(graph) => {
+            if as_arrays {
+                let rows: Vec<&csr::Adjacency> = if as_undirected {
+                    vec![&graph.out_adj, &graph.in_adj]
                 } else {
-                    Some((
-                        k_int,
-                        v.iter().map(|x| x.index()).collect::<Vec<usize>>(),
-                    ))
-                }
-            })
-            .collect(),
-    })
+                    vec![&graph.out_adj]
+                };
+                return _frozen_dijkstra_arrays(
+                    py,
+                    &graph.payloads,
+                    &rows,
+                    source,
+                    target,
+                    &weight_fn,
+                    default_weight,
+                );
+            }
+            if as_undirected {
+                _dijkstra_shortest_paths(
+                    py,
+                    csr::Undirected::new(&graph),
+                    graph.payloads.node_count,
+                    source,
+                    target,
+                    weight_fn,
+                    default_weight,
+                )?
+            } else {
+                _dijkstra_shortest_paths(
+                    py,
+                    &*graph,
+                    graph.payloads.node_count,
+                    source,
+                    target,
+                    weight_fn,
+                    default_weight,
+                )?
+            }
+        }
+    };
+    Ok(paths.into_py(py))
+}
+
+/// Rebuild a shortest path from an array of predecessors
+///
+/// The ``predecessors`` array returned by
+/// :func:`~retworkx.dijkstra_shortest_paths` with ``as_arrays=True`` only
+/// stores the node before each node on its shortest path. This follows it
+/// back from ``target`` to ``source``. A row ``pred[source]`` of the
+/// predecessor matrix returned by :func:`~retworkx.floyd_warshall_numpy`
+/// can be used too, in which case ``source``, ``target`` and the returned
+/// path are matrix positions.
+///
+/// :param numpy.ndarray predecessors: An int64 array where entry ``i`` is
+///     the node before ``i`` on the shortest path from ``source`` to ``i``
+///     or ``-1`` if there is none
+/// :param int source: The node the shortest paths start at
+/// :param int target: The node to get the path to
+///
+/// :returns: The node indices on the path from ``source`` to ``target``,
+///     including both, or an empty list if ``target`` isn't reached
+/// :rtype: NodeIndices
+/// :raises IndexError: If ``source``, ``target`` or a predecessor is out of
+///     the bounds of ``predecessors``
+/// :raises ValueError: If following ``predecessors`` from ``target`` doesn't
+///     lead back to ``source``
+#[pyfunction]
+#[text_signature = "(predecessors, source, target, /)"]
+pub fn path_from_predecessors(
+    predecessors: PyReadonlyArray1<i64>,
+    source: usize,
+    target: usize,
+) -> PyResult<NodeIndices> {
+    let predecessors = predecessors.as_array();
+    let bound = predecessors.len();
+    if source >= bound || target >= bound {
+        return Err(PyIndexError::new_err(format!(
+            "No node found for index {}",
+            if source >= bound { source } else { target }
+        )));
+    }
+    let mut path: Vec<usize> = vec![target];
+    let mut node = target;
+    while node != source {
+        let pred = predecessors[node];
+        if pred == -1 {
+            if node == target {
+                return Ok(NodeIndices { nodes: Vec::new() });
+            }
+            return Err(PyValueError::new_err(format!(
+                "The predecessors of {} don't lead back to {}",
+                target, source
+            )));
+        }
+        if pred < 0 || pred as usize >= bound {
+            return Err(PyIndexError::new_err(format!(
+                "No node found for index {}",
+                pred
+            )));
+        }
+        if path.len() > bound {
+            return Err(PyValueError::new_err(format!(
+                "The predecessors of {} contain a cycle",
+                target
+            )));
+        }
+        node = pred as usize;
+        path.push(node);
+    }
+    path.reverse();
+    Ok(NodeIndices { nodes: path })
 }
 
 /// Compute the lengths of the shortest paths for a PyGraph object using
 /// Dijkstra's algorithm
 ///
-/// :param PyGraph graph: The input graph to use
+/// :param graph: The input graph to use, a :class:`~retworkx.PyGraph` or a
+///     frozen :class:`~retworkx.CSRGraph`
 /// :param int node: The node index to use as the source for finding the
 ///     shortest paths from
 /// :param edge_cost_fn: A python callable that will take in 1 parameter, an
@@ -1927,98 +2681,1065 @@ pub fn digraph_dijkstra_shortest_paths(
 #[text_signature = "(graph, node, edge_cost_fn, /, goal=None)"]
 fn graph_dijkstra_shortest_path_lengths(
     py: Python,
-    graph: &graph::PyGraph,
+    graph: csr::AnyGraph,
     node: usize,
     edge_cost_fn: PyObject,
     goal: Option<usize>,
 ) -> PyResult<PathLengthMapping> {
-    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
-        let res = edge_cost_fn.call1(py, (a,))?;
-        let raw = res.to_object(py);
-        raw.extract(py)
-    };
+    match graph {
+        csr::AnyGraph::Graph(graph) => _dijkstra_shortest_path_lengths(
+            py,
+            &*graph,
+            node,
+            edge_cost_fn,
+            goal,
+        ),
+        csr::AnyGraph::Frozen(graph) => _dijkstra_shortest_path_lengths(
+            py,
+            &*graph,
+            node,
+            edge_cost_fn,
+            goal,
+        ),
+    }
+}
 
-    let start = NodeIndex::new(node);
-    let goal_index: Option<NodeIndex> = goal.map(NodeIndex::new);
+/// Compute the lengths of the shortest paths for a PyDiGraph object using
+/// Dijkstra's algorithm
+///
+/// :param graph: The input graph to use, a :class:`~retworkx.PyDiGraph` or
+///     a frozen :class:`~retworkx.CSRDiGraph`
+/// :param int node: The node index to use as the source for finding the
+///     shortest paths from
+/// :param edge_cost_fn: A python callable that will take in 1 parameter, an
+///     edge's data object and will return a float that represents the
+///     cost/weight of that edge. It must be non-negative
+/// :param int goal: An optional node index to use as the end of the path.
+///     When specified the traversal will stop when the goal is reached and
+///     the output dictionary will only have a single entry with the length
+///     of the shortest path to the goal node.
+///
+/// :returns: A dictionary of the shortest paths from the provided node where
+///     the key is the node index of the end of the path and the value is the
+///     cost/sum of the weights of path
+/// :rtype: PathLengthMapping
+#[pyfunction]
+#[text_signature = "(graph, node, edge_cost_fn, /, goal=None)"]
+fn digraph_dijkstra_shortest_path_lengths(
+    py: Python,
+    graph: csr::AnyDiGraph,
+    node: usize,
+    edge_cost_fn: PyObject,
+    goal: Option<usize>,
+) -> PyResult<PathLengthMapping> {
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => _dijkstra_shortest_path_lengths(
+            py,
+            &*graph,
+            node,
+            edge_cost_fn,
+            goal,
+        ),
+        csr::AnyDiGraph::Frozen(graph) => _dijkstra_shortest_path_lengths(
+            py,
+            &*graph,
+            node,
+            edge_cost_fn,
+            goal,
+        ),
+    }
+}
 
-    let res = dijkstra::dijkstra(
-        graph,
-        start,
-        goal_index,
-        |e| edge_cost_callable(e.weight()),
-        None,
+/// Compute the lengths of the shortest paths between all pairs of nodes of a
+/// PyGraph object using Dijkstra's algorithm
+///
+/// The weight of every edge is computed once before the search is run from
+/// each source node. This function is multithreaded and will run the
+/// searches in parallel if the number of source nodes is above the value of
+/// ``parallel_threshold`` (it defaults to 300). If the function will be
+/// running in parallel the env var ``RAYON_NUM_THREADS`` can be used to
+/// adjust how many threads will be used.
+///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The input graph to use, a :class:`~retworkx.PyGraph` or a
+///     frozen :class:`~retworkx.CSRGraph`
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight/cost of the edge. It must
+///     be non-negative
+/// :param list sources: An optional list of node indices to find the paths
+///     from, in the order of the rows of the output. If not specified all
+///     the nodes of the graph (in index order) are used.
+/// :param list targets: An optional list of node indices to find the paths
+///     to, in the order of the columns of the output. If not specified all
+///     the nodes of the graph (in index order) are used.
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param int parallel_threshold: The number of source nodes to run the
+///     searches in parallel at. It defaults to 300, but this can be tuned
+/// :param float cutoff: If set only the paths with a length up to ``cutoff``
+///     are found, the entries of longer paths are set to ``np.inf``. Each
+///     search stops at that length so this is much faster when only nearby
+///     pairs matter.
+/// :param bool sparse: If set to ``True`` return the matrix in compressed
+///     sparse row form instead, as a tuple of numpy arrays
+///     ``(indptr, indices, data)`` holding only the finite entries for
+///     pairs of distinct nodes. The lengths from ``sources[i]`` are
+///     ``data[indptr[i]:indptr[i + 1]]`` and their columns (positions in
+///     ``targets``) are ``indices[indptr[i]:indptr[i + 1]]``, in increasing
+///     order. ``indptr`` and ``indices`` are ``int64`` and ``data`` is
+///     ``float64``.
+/// :param out: Where to write the matrix to instead of a new array, for
+///     matrices that don't fit in memory. Either a float64 ``numpy.memmap``
+///     (or any other writeable C contiguous array) of the right shape or a
+///     path to create a new ``.npy`` file at, which can be opened again with
+///     ``numpy.load(path, mmap_mode="r")``. The rows are computed in chunks
+///     that are flushed to the file one at a time so the memory used stays
+///     bounded by the size of a chunk. It can't be used with ``sparse``.
+///     ``out`` must not be read or written from another thread until the
+///     function returns.
+///
+/// :returns: A matrix of shape ``(len(sources), len(targets))`` where the
+///     entry ``[i, j]`` is the length of the shortest path from
+///     ``sources[i]`` to ``targets[j]``. If there is no path between two
+///     nodes the corresponding entry will be ``np.inf``. If ``out`` is set
+///     the matrix is written to it (or the memory mapped file it points to)
+///     and it is returned. If ``sparse`` is set the ``(indptr, indices,
+///     data)`` arrays of the matrix are returned instead.
+/// :rtype: numpy.ndarray
+/// :raises IndexError: If a node index in ``sources`` or ``targets`` is not
+///     in the graph
+/// :raises ValueError: If an edge weight is negative or NaN or if ``out``
+///     doesn't match the output
+#[pyfunction(
+    default_weight = "1.0",
+    parallel_threshold = "300",
+    sparse = "false"
+)]
+#[text_signature = "(graph, /, weight_fn=None, sources=None, targets=None, default_weight=1.0, parallel_threshold=300, cutoff=None, sparse=False, out=None)"]
+pub fn graph_all_pairs_dijkstra_path_lengths(
+    py: Python,
+    graph: csr::AnyGraph,
+    weight_fn: Option<PyObject>,
+    sources: Option<Vec<usize>>,
+    targets: Option<Vec<usize>>,
+    default_weight: f64,
+    parallel_threshold: usize,
+    cutoff: Option<f64>,
+    sparse: bool,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject> {
+    match graph {
+        csr::AnyGraph::Graph(graph) => _all_pairs_dijkstra_path_lengths(
+            py,
+            &graph.graph,
+            &weight_fn,
+            sources,
+            targets,
+            default_weight,
+            false,
+            parallel_threshold,
+            cutoff,
+            sparse,
+            out,
+        ),
+        csr::AnyGraph::Frozen(graph) => _all_pairs_dijkstra_path_lengths(
+            py,
+            &*graph,
+            &weight_fn,
+            sources,
+            targets,
+            default_weight,
+            false,
+            parallel_threshold,
+            cutoff,
+            sparse,
+            out,
+        ),
+    }
+}
+
+/// Compute the lengths of the shortest paths between all pairs of nodes of a
+/// PyDiGraph object using Dijkstra's algorithm
+///
+/// The weight of every edge is computed once before the search is run from
+/// each source node. This function is multithreaded and will run the
+/// searches in parallel if the number of source nodes is above the value of
+/// ``parallel_threshold`` (it defaults to 300). If the function will be
+/// running in parallel the env var ``RAYON_NUM_THREADS`` can be used to
+/// adjust how many threads will be used.
+///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The input graph to use, a :class:`~retworkx.PyDiGraph` or
+///     a frozen :class:`~retworkx.CSRDiGraph`
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight/cost of the edge. It must
+///     be non-negative
+/// :param list sources: An optional list of node indices to find the paths
+///     from, in the order of the rows of the output. If not specified all
+///     the nodes of the graph (in index order) are used.
+/// :param list targets: An optional list of node indices to find the paths
+///     to, in the order of the columns of the output. If not specified all
+///     the nodes of the graph (in index order) are used.
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param bool as_undirected: If set to true each directed edge will be
+///     treated as bidirectional/undirected.
+/// :param int parallel_threshold: The number of source nodes to run the
+///     searches in parallel at. It defaults to 300, but this can be tuned
+/// :param float cutoff: If set only the paths with a length up to ``cutoff``
+///     are found, the entries of longer paths are set to ``np.inf``. Each
+///     search stops at that length so this is much faster when only nearby
+///     pairs matter.
+/// :param bool sparse: If set to ``True`` return the matrix in compressed
+///     sparse row form instead, as a tuple of numpy arrays
+///     ``(indptr, indices, data)`` holding only the finite entries for
+///     pairs of distinct nodes. The lengths from ``sources[i]`` are
+///     ``data[indptr[i]:indptr[i + 1]]`` and their columns (positions in
+///     ``targets``) are ``indices[indptr[i]:indptr[i + 1]]``, in increasing
+///     order. ``indptr`` and ``indices`` are ``int64`` and ``data`` is
+///     ``float64``.
+/// :param out: Where to write the matrix to instead of a new array, for
+///     matrices that don't fit in memory. Either a float64 ``numpy.memmap``
+///     (or any other writeable C contiguous array) of the right shape or a
+///     path to create a new ``.npy`` file at, which can be opened again with
+///     ``numpy.load(path, mmap_mode="r")``. The rows are computed in chunks
+///     that are flushed to the file one at a time so the memory used stays
+///     bounded by the size of a chunk. It can't be used with ``sparse``.
+///     ``out`` must not be read or written from another thread until the
+///     function returns.
+///
+/// :returns: A matrix of shape ``(len(sources), len(targets))`` where the
+///     entry ``[i, j]`` is the length of the shortest path from
+///     ``sources[i]`` to ``targets[j]``. If there is no path between two
+///     nodes the corresponding entry will be ``np.inf``. If ``out`` is set
+///     the matrix is written to it (or the memory mapped file it points to)
+///     and it is returned. If ``sparse`` is set the ``(indptr, indices,
+///     data)`` arrays of the matrix are returned instead.
+/// :rtype: numpy.ndarray
+/// :raises IndexError: If a node index in ``sources`` or ``targets`` is not
+///     in the graph
+/// :raises ValueError: If an edge weight is negative or NaN or if ``out``
+///     doesn't match the output
+#[pyfunction(
+    default_weight = "1.0",
+    as_undirected = "false",
+    parallel_threshold = "300",
+    sparse = "false"
+)]
+#[text_signature = "(graph, /, weight_fn=None, sources=None, targets=None, default_weight=1.0, as_undirected=False, parallel_threshold=300, cutoff=None, sparse=False, out=None)"]
+pub fn digraph_all_pairs_dijkstra_path_lengths(
+    py: Python,
+    graph: csr::AnyDiGraph,
+    weight_fn: Option<PyObject>,
+    sources: Option<Vec<usize>>,
+    targets: Option<Vec<usize>>,
+    default_weight: f64,
+    as_undirected: bool,
+    parallel_threshold: usize,
+    cutoff: Option<f64>,
+    sparse: bool,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject> {
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => _all_pairs_dijkstra_path_lengths(
+            py,
+            &graph.graph,
+            &weight_fn,
+            sources,
+            targets,
+            default_weight,
+            as_undirected,
+            parallel_threshold,
+            cutoff,
+            sparse,
+            out,
+        ),
+        csr::AnyDiGraph::Frozen(graph) => _all_pairs_dijkstra_path_lengths(
+            py,
+            &*graph,
+            &weight_fn,
+            sources,
+            targets,
+            default_weight,
+            as_undirected,
+            parallel_threshold,
+            cutoff,
+            sparse,
+            out,
+        ),
+    }
+}
+
+fn _all_pairs_dijkstra_path_lengths<'a, G>(
+    py: Python,
+    graph: G,
+    weight_fn: &Option<PyObject>,
+    sources: Option<Vec<usize>>,
+    targets: Option<Vec<usize>>,
+    default_weight: f64,
+    as_undirected: bool,
+    parallel_threshold: usize,
+    cutoff: Option<f64>,
+    sparse: bool,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject>
+where
+    G: csr::AsAdjacency<'a>
+        + IntoEdgeReferences
+        + IntoNodeIdentifiers
+        + GraphBase<NodeId = NodeIndex, EdgeId = EdgeIndex>
+        + NodeIndexable
+        + GraphProp,
+    G: Data<EdgeWeight = PyObject>,
+{
+    if sparse && out.is_some() {
+        return Err(PyValueError::new_err("out can't be used with sparse"));
+    }
+    let sources = shortest_path::node_list(graph, sources)?;
+    let targets = shortest_path::node_list(graph, targets)?;
+    let weights =
+        shortest_path::edge_weights(py, graph, weight_fn, default_weight)?;
+    shortest_path::check_non_negative(&weights)?;
+    let out_adj = graph.adjacency(Direction::Outgoing);
+    let in_adj = if as_undirected && graph.is_directed() {
+        graph.adjacency(Direction::Incoming)
+    } else {
+        Cow::Owned(csr::Adjacency::default())
+    };
+    let rows: [&csr::Adjacency; 2] = [&*out_adj, &*in_adj];
+    let node_bound = graph.node_bound();
+    if sparse {
+        let rows = py.allow_threads(|| {
+            shortest_path::all_pairs_dijkstra_sparse(
+                &rows,
+                &weights,
+                node_bound,
+                &sources,
+                &targets,
+                cutoff,
+                parallel_threshold,
+            )
+        });
+        return Ok(csr_arrays(py, rows));
+    }
+    let parallel = sources.len() >= parallel_threshold;
+    let matrix =
+        output_array(py, out, (sources.len(), targets.len()), "float64")?;
+    fill_rows(
+        py,
+        matrix,
+        out.is_some(),
+        |chunk: ArrayViewMut2<f64>, first| {
+            shortest_path::all_pairs_dijkstra_fill(
+                &rows,
+                &weights,
+                node_bound,
+                &sources[first..first + chunk.nrows()],
+                &targets,
+                cutoff,
+                parallel,
+                chunk,
+            );
+            true
+        },
     )?;
-    Ok(PathLengthMapping {
-        path_lengths: res
-            .iter()
-            .filter_map(|(k, v)| {
-                let k_int = k.index();
-                if k_int == node || goal.is_some() && goal.unwrap() != k_int {
-                    None
-                } else {
-                    Some((k_int, *v))
-                }
+    Ok(matrix.into())
+}
+
+fn _bidirectional_dijkstra<E, I, F>(
+    source: usize,
+    target: usize,
+    has_node: impl Fn(usize) -> bool,
+    edges: E,
+    mut edge_cost: F,
+) -> PyResult<(f64, NodeIndices)>
+where
+    E: FnMut(NodeIndex, Direction) -> I,
+    I: Iterator<Item = (NodeIndex, usize)>,
+    F: FnMut(usize) -> PyResult<f64>,
+{
+    for node in &[source, target] {
+        if !has_node(*node) {
+            return Err(PyIndexError::new_err(format!(
+                "No node found for index {}",
+                node
+            )));
+        }
+    }
+    let res = dijkstra::bidirectional_dijkstra(
+        NodeIndex::new(source),
+        NodeIndex::new(target),
+        edges,
+        |edge| {
+            let cost = edge_cost(edge)?;
+            if cost.is_nan() || cost < 0.0 {
+                return Err(PyValueError::new_err(format!(
+                    "Invalid edge weight {}, edge weights must be non-negative",
+                    cost
+                )));
+            }
+            Ok(cost)
+        },
+    )?;
+    match res {
+        Some((length, path)) => Ok((
+            length,
+            NodeIndices {
+                nodes: path.into_iter().map(|x| x.index()).collect(),
+            },
+        )),
+        None => Err(NoPathFound::new_err(format!(
+            "No path found from {} to {}",
+            source, target
+        ))),
+    }
+}
+
+fn _stable_graph_bidirectional_dijkstra<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    source: usize,
+    target: usize,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    as_undirected: bool,
+) -> PyResult<(f64, NodeIndices)> {
+    _bidirectional_dijkstra(
+        source,
+        target,
+        |node| graph.contains_node(NodeIndex::new(node)),
+        |node, dir| {
+            let reverse_edges = if as_undirected && Ty::is_directed() {
+                Some(graph.edges_directed(node, dir.opposite()))
+            } else {
+                None
+            };
+            graph
+                .edges_directed(node, dir)
+                .chain(reverse_edges.into_iter().flatten())
+                .map(move |edge| {
+                    let next = if edge.source() == node {
+                        edge.target()
+                    } else {
+                        edge.source()
+                    };
+                    (next, edge.id().index())
+                })
+        },
+        |edge| {
+            weight_callable(
+                py,
+                &weight_fn,
+                &graph[EdgeIndex::new(edge)],
+                default_weight,
+            )
+        },
+    )
+}
+
+/// Run a bidirectional Dijkstra search on a frozen graph, following the
+/// edges in ``forward_rows`` from ``source`` and in ``backward_rows`` from
+/// ``target``.
+fn _frozen_bidirectional_dijkstra(
+    py: Python,
+    payloads: &csr::Payloads,
+    forward_rows: &[&csr::Adjacency],
+    backward_rows: &[&csr::Adjacency],
+    source: usize,
+    target: usize,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<(f64, NodeIndices)> {
+    _bidirectional_dijkstra(
+        source,
+        target,
+        |node| payloads.has_node(node),
+        |node, dir| {
+            let rows = match dir {
+                petgraph::Direction::Outgoing => forward_rows,
+                petgraph::Direction::Incoming => backward_rows,
+            };
+            let node = node.index();
+            rows.iter().flat_map(move |adj| {
+                adj.row(node)
+                    .iter()
+                    .map(|next| NodeIndex::new(*next))
+                    .zip(adj.row_edges(node).iter().cloned())
             })
-            .collect(),
-    })
+        },
+        |edge| {
+            let weight = &payloads.edges[edge].as_ref().unwrap().2;
+            weight_callable(py, &weight_fn, weight, default_weight)
+        },
+    )
+}
+
+/// Find the shortest path between two nodes of a PyGraph using a
+/// bidirectional Dijkstra search
+///
+/// A Dijkstra search is run from both ``source`` and ``target`` at the same
+/// time, stopping as soon as no shorter path can be found through the nodes
+/// where the two searches met. For a single pair of nodes this usually
+/// visits far fewer nodes than :func:`~retworkx.graph_dijkstra_shortest_paths`
+/// with a ``target``, and the edge weight is only computed for the edges it
+/// visits. If there are multiple shortest paths any one of them may be
+/// returned.
+///
+/// :param graph: The input graph to use, a :class:`~retworkx.PyGraph` or a
+///     frozen :class:`~retworkx.CSRGraph`
+/// :param int source: The node index to find the path from
+/// :param int target: The node index to find the path to
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight/cost of the edge. It must
+///     be non-negative
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+///
+/// :returns: A tuple of the length of the shortest path and the path as a
+///     list of node indices starting with ``source`` and ending with
+///     ``target``
+/// :rtype: tuple
+/// :raises IndexError: If ``source`` or ``target`` is not in the graph
+/// :raises NoPathFound: If there is no path from ``source`` to ``target``
+/// :raises ValueError: If an edge weight is negative or NaN
+#[pyfunction(default_weight = "1.0")]
+#[text_signature = "(graph, source, target, /, weight_fn=None, default_weight=1.0)"]
+pub fn graph_bidirectional_dijkstra(
+    py: Python,
+    graph: csr::AnyGraph,
+    source: usize,
+    target: usize,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<(f64, NodeIndices)> {
+    match graph {
+        csr::AnyGraph::Graph(graph) => _stable_graph_bidirectional_dijkstra(
+            py,
+            &graph.graph,
+            source,
+            target,
+            weight_fn,
+            default_weight,
+            false,
+        ),
+        csr::AnyGraph::Frozen(graph) => _frozen_bidirectional_dijkstra(
+            py,
+            &graph.payloads,
+            &[&graph.out_adj],
+            &[&graph.out_adj],
+            source,
+            target,
+            weight_fn,
+            default_weight,
+        ),
+    }
+}
+
+/// Find the shortest path between two nodes of a PyDiGraph using a
+/// bidirectional Dijkstra search
+///
+/// A Dijkstra search is run forward from ``source`` along the outgoing
+/// edges of each node and backward from ``target`` along the incoming edges
+/// at the same time, stopping as soon as no shorter path can be found
+/// through the nodes where the two searches met. For a single pair of nodes
+/// this usually visits far fewer nodes than
+/// :func:`~retworkx.digraph_dijkstra_shortest_paths` with a ``target``, and
+/// the edge weight is only computed for the edges it visits. If there are
+/// multiple shortest paths any one of them may be returned.
+///
+/// :param graph: The input graph to use, a :class:`~retworkx.PyDiGraph` or
+///     a frozen :class:`~retworkx.CSRDiGraph`
+/// :param int source: The node index to find the path from
+/// :param int target: The node index to find the path to
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight/cost of the edge. It must
+///     be non-negative
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param bool as_undirected: If set to true the graph will be treated as
+///     undirected for finding the shortest path.
+///
+/// :returns: A tuple of the length of the shortest path and the path as a
+///     list of node indices starting with ``source`` and ending with
+///     ``target``
+/// :rtype: tuple
+/// :raises IndexError: If ``source`` or ``target`` is not in the graph
+/// :raises NoPathFound: If there is no path from ``source`` to ``target``
+/// :raises ValueError: If an edge weight is negative or NaN
+#[pyfunction(default_weight = "1.0", as_undirected = "false")]
+#[text_signature = "(graph, source, target, /, weight_fn=None, default_weight=1.0, as_undirected=False)"]
+pub fn digraph_bidirectional_dijkstra(
+    py: Python,
+    graph: csr::AnyDiGraph,
+    source: usize,
+    target: usize,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    as_undirected: bool,
+) -> PyResult<(f64, NodeIndices)> {
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => _stable_graph_bidirectional_dijkstra(
+            py,
+            &graph.graph,
+            source,
+            target,
+            weight_fn,
+            default_weight,
+            as_undirected,
+        ),
+        csr::AnyDiGraph::Frozen(graph) => {
+            let (forward_rows, backward_rows) = if as_undirected {
+                (
+                    vec![&graph.out_adj, &graph.in_adj],
+                    vec![&graph.in_adj, &graph.out_adj],
+                )
+            } else {
+                (vec![&graph.out_adj], vec![&graph.in_adj])
+            };
+            _frozen_bidirectional_dijkstra(
+                py,
+                &graph.payloads,
+                &forward_rows,
+                &backward_rows,
+                source,
+                target,
+                weight_fn,
+                default_weight,
+            )
+        }
+    }
+}
+
+fn _bellman_ford_shortest_paths<'a, G>(
+    py: Python,
+    graph: G,
+    source: usize,
+    target: Option<usize>,
+    weight_fn: &Option<PyObject>,
+    default_weight: f64,
+    as_undirected: bool,
+    as_arrays: bool,
+) -> PyResult<PyObject>
+where
+    G: csr::AsAdjacency<'a>
+        + IntoEdgeReferences
+        + IntoNodeIdentifiers
+        + GraphBase<NodeId = NodeIndex, EdgeId = EdgeIndex>
+        + NodeIndexable
+        + GraphProp,
+    G: Data<EdgeWeight = PyObject>,
+{
+    if !graph.has_node(source) {
+        return Err(PyIndexError::new_err(format!(
+            "No node found for index {}",
+            source
+        )));
+    }
+    let weights =
+        shortest_path::edge_weights(py, graph, weight_fn, default_weight)?;
+    let out_adj = graph.adjacency(Direction::Outgoing);
+    let in_adj = if as_undirected && graph.is_directed() {
+        graph.adjacency(Direction::Incoming)
+    } else {
+        Cow::Owned(csr::Adjacency::default())
+    };
+    let node_bound = graph.node_bound();
+    let res = py.allow_threads(|| {
+        shortest_path::bellman_ford(
+            &[&*out_adj, &*in_adj],
+            &weights,
+            node_bound,
+            Some(source),
+        )
+    });
+    let (dist, pred) = match res {
+        Some(res) => res,
+        None => {
+            return Err(NegativeCycle::new_err(
+                "Negative cycle found reachable from the source node",
+            ))
+        }
+    };
+    if as_arrays {
+        let dist: PyObject = dist.into_pyarray(py).into();
+        let pred: PyObject = pred.into_pyarray(py).into();
+        return Ok((dist, pred).into_py(py));
+    }
+    let mut paths: HashMap<usize, Vec<usize>> = HashMap::new();
+    for node in graph.node_identifiers().map(|node| node.index()) {
+        if node == source
+            || dist[node] == std::f64::INFINITY
+            || target.is_some() && target.unwrap() != node
+        {
+            continue;
+        }
+        let mut path: Vec<usize> = vec![node];
+        while pred[*path.last().unwrap()] >= 0 {
+            path.push(pred[*path.last().unwrap()] as usize);
+        }
+        path.reverse();
+        paths.insert(node, path);
+    }
+    Ok(PathMapping { paths }.into_py(py))
+}
+
+/// Find the shortest paths from a node using the Bellman-Ford algorithm
+///
+/// Unlike :func:`~retworkx.graph_dijkstra_shortest_paths` the edge weights
+/// may be negative. In an undirected graph every edge can be traversed in
+/// both directions, so any edge with a negative weight that is reachable
+/// from ``source`` is a negative cycle.
+///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The input graph to use, a :class:`~retworkx.PyGraph` or a
+///     frozen :class:`~retworkx.CSRGraph`
+/// :param int source: The node index to find paths from
+/// :param int target: An optional target to find a path to
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight/cost of the edge
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param bool as_arrays: If set to true return the shortest paths as a pair
+///     of numpy arrays instead of a dictionary of paths, see below.
+///
+/// :return: Dictionary of paths. The keys are destination node indices and
+///     the dict values are lists of node indices making the path. If
+///     ``as_arrays`` is set a tuple ``(distances, predecessors)`` of a
+///     ``float64`` and an ``int64`` numpy array indexed by node index is
+///     returned instead, where ``distances`` is the length of the shortest
+///     path to each node (``np.inf`` if it isn't reached) and
+///     ``predecessors`` is the node before it on that path (``-1`` for
+///     ``source`` and nodes that aren't reached).
+/// :rtype: PathMapping
+/// :raises NegativeCycle: If there is a negative cycle reachable from
+///     ``source``
+#[pyfunction(default_weight = "1.0", as_arrays = "false")]
+#[text_signature = "(graph, source, /, target=None, weight_fn=None, default_weight=1.0, as_arrays=False)"]
+pub fn graph_bellman_ford_shortest_paths(
+    py: Python,
+    graph: csr::AnyGraph,
+    source: usize,
+    target: Option<usize>,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    as_arrays: bool,
+) -> PyResult<PyObject> {
+    match graph {
+        csr::AnyGraph::Graph(graph) => _bellman_ford_shortest_paths(
+            py,
+            &graph.graph,
+            source,
+            target,
+            &weight_fn,
+            default_weight,
+            false,
+            as_arrays,
+        ),
+        csr::AnyGraph::Frozen(graph) => _bellman_ford_shortest_paths(
+            py,
+            &*graph,
+            source,
+            target,
+            &weight_fn,
+            default_weight,
+            false,
+            as_arrays,
+        ),
+    }
 }
 
-/// Compute the lengths of the shortest paths for a PyDiGraph object using
-/// Dijkstra's algorithm
+/// Find the shortest paths from a node using the Bellman-Ford algorithm
 ///
-/// :param PyDiGraph graph: The input graph to use
-/// :param int node: The node index to use as the source for finding the
-///     shortest paths from
-/// :param edge_cost_fn: A python callable that will take in 1 parameter, an
-///     edge's data object and will return a float that represents the
-///     cost/weight of that edge. It must be non-negative
-/// :param int goal: An optional node index to use as the end of the path.
-///     When specified the traversal will stop when the goal is reached and
-///     the output dictionary will only have a single entry with the length
-///     of the shortest path to the goal node.
+/// Unlike :func:`~retworkx.digraph_dijkstra_shortest_paths` the edge
+/// weights may be negative.
 ///
-/// :returns: A dictionary of the shortest paths from the provided node where
-///     the key is the node index of the end of the path and the value is the
-///     cost/sum of the weights of path
-/// :rtype: PathLengthMapping
-#[pyfunction]
-#[text_signature = "(graph, node, edge_cost_fn, /, goal=None)"]
-fn digraph_dijkstra_shortest_path_lengths(
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The input graph to use, a :class:`~retworkx.PyDiGraph` or
+///     a frozen :class:`~retworkx.CSRDiGraph`
+/// :param int source: The node index to find paths from
+/// :param int target: An optional target to find a path to
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight/cost of the edge
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param bool as_undirected: If set to true the graph will be treated as
+///     undirected for finding the shortest path, in which case any edge
+///     with a negative weight that is reachable from ``source`` is a
+///     negative cycle.
+/// :param bool as_arrays: If set to true return the shortest paths as a pair
+///     of numpy arrays instead of a dictionary of paths, see below.
+///
+/// :return: Dictionary of paths. The keys are destination node indices and
+///     the dict values are lists of node indices making the path. If
+///     ``as_arrays`` is set a tuple ``(distances, predecessors)`` of a
+///     ``float64`` and an ``int64`` numpy array indexed by node index is
+///     returned instead, where ``distances`` is the length of the shortest
+///     path to each node (``np.inf`` if it isn't reached) and
+///     ``predecessors`` is the node before it on that path (``-1`` for
+///     ``source`` and nodes that aren't reached).
+/// :rtype: PathMapping
+/// :raises NegativeCycle: If there is a negative cycle reachable from
+///     ``source``
+#[pyfunction(
+    default_weight = "1.0",
+    as_undirected = "false",
+    as_arrays = "false"
+)]
+#[text_signature = "(graph, source, /, target=None, weight_fn=None, default_weight=1.0, as_undirected=False, as_arrays=False)"]
+pub fn digraph_bellman_ford_shortest_paths(
     py: Python,
-    graph: &digraph::PyDiGraph,
-    node: usize,
-    edge_cost_fn: PyObject,
-    goal: Option<usize>,
-) -> PyResult<PathLengthMapping> {
-    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
-        let res = edge_cost_fn.call1(py, (a,))?;
-        let raw = res.to_object(py);
-        raw.extract(py)
+    graph: csr::AnyDiGraph,
+    source: usize,
+    target: Option<usize>,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    as_undirected: bool,
+    as_arrays: bool,
+) -> PyResult<PyObject> {
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => _bellman_ford_shortest_paths(
+            py,
+            &graph.graph,
+            source,
+            target,
+            &weight_fn,
+            default_weight,
+            as_undirected,
+            as_arrays,
+        ),
+        csr::AnyDiGraph::Frozen(graph) => _bellman_ford_shortest_paths(
+            py,
+            &*graph,
+            source,
+            target,
+            &weight_fn,
+            default_weight,
+            as_undirected,
+            as_arrays,
+        ),
+    }
+}
+
+fn _johnson_all_pairs<'a, G>(
+    py: Python,
+    graph: G,
+    weight_fn: &Option<PyObject>,
+    default_weight: f64,
+    as_undirected: bool,
+    parallel_threshold: usize,
+) -> PyResult<PyObject>
+where
+    G: csr::AsAdjacency<'a>
+        + IntoEdgeReferences
+        + IntoNodeIdentifiers
+        + GraphBase<NodeId = NodeIndex, EdgeId = EdgeIndex>
+        + NodeIndexable
+        + GraphProp,
+    G: Data<EdgeWeight = PyObject>,
+{
+    let weights =
+        shortest_path::edge_weights(py, graph, weight_fn, default_weight)?;
+    let nodes: Vec<usize> =
+        graph.node_identifiers().map(|node| node.index()).collect();
+    let node_bound = graph.node_bound();
+    let out_adj = graph.adjacency(Direction::Outgoing);
+    let matrix = if graph.is_directed() && !as_undirected {
+        py.allow_threads(|| {
+            shortest_path::johnson_all_pairs_lengths(
+                &[&*out_adj],
+                weights,
+                node_bound,
+                &nodes,
+                parallel_threshold,
+            )
+        })
+    } else if weights.iter().any(|weight| *weight < 0.0) {
+        // A negative undirected edge can be traversed back and forth
+        None
+    } else {
+        let in_adj = if as_undirected {
+            graph.adjacency(Direction::Incoming)
+        } else {
+            Cow::Owned(csr::Adjacency::default())
+        };
+        Some(py.allow_threads(|| {
+            shortest_path::all_pairs_dijkstra_lengths(
+                &[&*out_adj, &*in_adj],
+                &weights,
+                node_bound,
+                &nodes,
+                &nodes,
+                None,
+                parallel_threshold,
+            )
+        }))
     };
+    match matrix {
+        Some(matrix) => Ok(matrix.into_pyarray(py).into()),
+        None => Err(NegativeCycle::new_err("Negative cycle found")),
+    }
+}
 
-    let start = NodeIndex::new(node);
-    let goal_index: Option<NodeIndex> = goal.map(NodeIndex::new);
+/// Find all-pairs shortest path lengths using Johnson's algorithm
+///
+/// Johnson's algorithm supports negative edge weights like
+/// :func:`~retworkx.graph_floyd_warshall_numpy` but runs a Dijkstra search
+/// from every node instead, which is much faster for sparse graphs. In an
+/// undirected graph every edge can be traversed in both directions, so any
+/// edge with a negative weight is a negative cycle and Johnson's algorithm
+/// reduces to running Dijkstra's algorithm from every node.
+///
+/// This function is multithreaded and will run the searches in parallel if
+/// the number of nodes in the graph is above the value of
+/// ``parallel_threshold`` (it defaults to 300). If the function will be
+/// running in parallel the env var ``RAYON_NUM_THREADS`` can be used to
+/// adjust how many threads will be used.
+///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The graph to run Johnson's algorithm on, a
+///     :class:`~retworkx.PyGraph` or a frozen :class:`~retworkx.CSRGraph`
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight/cost of the edge
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param int parallel_threshold: The number of nodes to execute
+///     the algorithm in parallel at. It defaults to 300, but this can
+///     be tuned
+///
+/// :returns: A matrix of shortest path distances between nodes in the same
+///     form as :func:`~retworkx.graph_floyd_warshall_numpy`. If there is no
+///     path between two nodes then the corresponding matrix entry will be
+///     ``np.inf``.
+/// :rtype: numpy.ndarray
+/// :raises NegativeCycle: If the graph has a negative cycle
+#[pyfunction(default_weight = "1.0", parallel_threshold = "300")]
+#[text_signature = "(graph, /, weight_fn=None, default_weight=1.0, parallel_threshold=300)"]
+pub fn graph_johnson_all_pairs(
+    py: Python,
+    graph: csr::AnyGraph,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    parallel_threshold: usize,
+) -> PyResult<PyObject> {
+    match graph {
+        csr::AnyGraph::Graph(graph) => _johnson_all_pairs(
+            py,
+            &graph.graph,
+            &weight_fn,
+            default_weight,
+            false,
+            parallel_threshold,
+        ),
+        csr::AnyGraph::Frozen(graph) => _johnson_all_pairs(
+            py,
+            &*graph,
+            &weight_fn,
+            default_weight,
+            false,
+            parallel_threshold,
+        ),
+    }
+}
 
-    let res = dijkstra::dijkstra(
-        graph,
-        start,
-        goal_index,
-        |e| edge_cost_callable(e.weight()),
-        None,
-    )?;
-    Ok(PathLengthMapping {
-        path_lengths: res
-            .iter()
-            .filter_map(|(k, v)| {
-                let k_int = k.index();
-                if k_int == node || goal.is_some() && goal.unwrap() != k_int {
-                    None
-                } else {
-                    Some((k_int, *v))
-                }
-            })
-            .collect(),
-    })
+/// Find all-pairs shortest path lengths using Johnson's algorithm
+///
+/// Johnson's algorithm supports negative edge weights like
+/// :func:`~retworkx.digraph_floyd_warshall_numpy` but is much faster for
+/// sparse graphs. The edges are reweighted to be non-negative once, using
+/// the potentials found by a single Bellman-Ford search, and then a
+/// Dijkstra search is run from every node.
+///
+/// This function is multithreaded and will run the searches in parallel if
+/// the number of nodes in the graph is above the value of
+/// ``parallel_threshold`` (it defaults to 300). If the function will be
+/// running in parallel the env var ``RAYON_NUM_THREADS`` can be used to
+/// adjust how many threads will be used.
+///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
+/// :param graph: The directed graph to run Johnson's algorithm on, a
+///     :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight/cost of the edge
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param bool as_undirected: If set to true each directed edge will be
+///     treated as bidirectional/undirected, in which case any edge with a
+///     negative weight is a negative cycle.
+/// :param int parallel_threshold: The number of nodes to execute
+///     the algorithm in parallel at. It defaults to 300, but this can
+///     be tuned
+///
+/// :returns: A matrix of shortest path distances between nodes in the same
+///     form as :func:`~retworkx.digraph_floyd_warshall_numpy`. If there is
+///     no path between two nodes then the corresponding matrix entry will be
+///     ``np.inf``.
+/// :rtype: numpy.ndarray
+/// :raises NegativeCycle: If the graph has a negative cycle
+#[pyfunction(
+    default_weight = "1.0",
+    as_undirected = "false",
+    parallel_threshold = "300"
+)]
+#[text_signature = "(graph, /, weight_fn=None, default_weight=1.0, as_undirected=False, parallel_threshold=300)"]
+pub fn digraph_johnson_all_pairs(
+    py: Python,
+    graph: csr::AnyDiGraph,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    as_undirected: bool,
+    parallel_threshold: usize,
+) -> PyResult<PyObject> {
+    match graph {
+        csr::AnyDiGraph::Graph(graph) => _johnson_all_pairs(
+            py,
+            &graph.graph,
+            &weight_fn,
+            default_weight,
+            as_undirected,
+            parallel_threshold,
+        ),
+        csr::AnyDiGraph::Frozen(graph) => _johnson_all_pairs(
+            py,
+            &*graph,
+            &weight_fn,
+            default_weight,
+            as_undirected,
+            parallel_threshold,
+        ),
+    }
 }
 
 /// Compute the A* shortest path for a PyGraph
@@ -2213,7 +3934,10 @@ pub fn directed_gnp_random_graph(
         Some(seed) => Pcg64::seed_from_u64(seed),
         None => Pcg64::from_entropy(),
     };
-    let mut inner_graph = StableDiGraph::<PyObject, PyObject>::new();
+    let mut inner_graph = StableDiGraph::<PyObject, PyObject>::with_capacity(
+        num_nodes as usize,
+        0,
+    );
     for x in 0..num_nodes {
         inner_graph.add_node(x.to_object(py));
     }
@@ -2269,10 +3993,13 @@ pub fn directed_gnp_random_graph(
 
     let graph = digraph::PyDiGraph {
         graph: inner_graph,
-        cycle_state: algo::DfsSpace::default(),
+        topo_order: TopoOrder::default(),
         check_cycle: false,
         node_removed: false,
+        generation: 0,
         multigraph: true,
+        edge_map: None,
+        payload_index: None,
     };
     Ok(graph)
 }
@@ -2321,7 +4048,10 @@ pub fn undirected_gnp_random_graph(
         Some(seed) => Pcg64::seed_from_u64(seed),
         None => Pcg64::from_entropy(),
     };
-    let mut inner_graph = StableUnGraph::<PyObject, PyObject>::default();
+    let mut inner_graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+        num_nodes as usize,
+        0,
+    );
     for x in 0..num_nodes {
         inner_graph.add_node(x.to_object(py));
     }
@@ -2366,7 +4096,9 @@ pub fn undirected_gnp_random_graph(
     let graph = graph::PyGraph {
         graph: inner_graph,
         node_removed: false,
+        generation: 0,
         multigraph: true,
+        edge_map: None,
     };
     Ok(graph)
 }
@@ -2409,13 +4141,17 @@ pub fn directed_gnm_random_graph(
         Some(seed) => Pcg64::seed_from_u64(seed),
         None => Pcg64::from_entropy(),
     };
-    let mut inner_graph = StableDiGraph::<PyObject, PyObject>::new();
+    let max_edges = num_nodes * (num_nodes - 1);
+    let mut inner_graph = StableDiGraph::<PyObject, PyObject>::with_capacity(
+        num_nodes as usize,
+        num_edges.min(max_edges) as usize,
+    );
     for x in 0..num_nodes {
         inner_graph.add_node(x.to_object(py));
     }
     // if number of edges to be created is >= max,
     // avoid randomly missed trials and directly add edges between every node
-    if num_edges >= num_nodes * (num_nodes - 1) {
+    if num_edges >= max_edges {
         for u in 0..num_nodes {
             for v in 0..num_nodes {
                 // avoid self-loops
@@ -2443,10 +4179,13 @@ pub fn directed_gnm_random_graph(
     }
     let graph = digraph::PyDiGraph {
         graph: inner_graph,
-        cycle_state: algo::DfsSpace::default(),
+        topo_order: TopoOrder::default(),
         check_cycle: false,
         node_removed: false,
+        generation: 0,
         multigraph: true,
+        edge_map: None,
+        payload_index: None,
     };
     Ok(graph)
 }
@@ -2489,13 +4228,17 @@ pub fn undirected_gnm_random_graph(
         Some(seed) => Pcg64::seed_from_u64(seed),
         None => Pcg64::from_entropy(),
     };
-    let mut inner_graph = StableUnGraph::<PyObject, PyObject>::default();
+    let max_edges = num_nodes * (num_nodes - 1) / 2;
+    let mut inner_graph = StableUnGraph::<PyObject, PyObject>::with_capacity(
+        num_nodes as usize,
+        num_edges.min(max_edges) as usize,
+    );
     for x in 0..num_nodes {
         inner_graph.add_node(x.to_object(py));
     }
     // if number of edges to be created is >= max,
     // avoid randomly missed trials and directly add edges between every node
-    if num_edges >= num_nodes * (num_nodes - 1) / 2 {
+    if num_edges >= max_edges {
         for u in 0..num_nodes {
             for v in u + 1..num_nodes {
                 let u_index = NodeIndex::new(u as usize);
@@ -2521,7 +4264,9 @@ pub fn undirected_gnm_random_graph(
     let graph = graph::PyGraph {
         graph: inner_graph,
         node_removed: false,
+        generation: 0,
         multigraph: true,
+        edge_map: None,
     };
     Ok(graph)
 }
@@ -2585,7 +4330,8 @@ pub fn random_geometric_graph(
         return Err(PyValueError::new_err("num_nodes must be > 0"));
     }
 
-    let mut inner_graph = StableUnGraph::<PyObject, PyObject>::default();
+    let mut inner_graph =
+        StableUnGraph::<PyObject, PyObject>::with_capacity(num_nodes, 0);
 
     let radius_p = pnorm(radius, p);
     let mut rng: Pcg64 = match seed {
@@ -2628,7 +4374,9 @@ pub fn random_geometric_graph(
     let graph = graph::PyGraph {
         graph: inner_graph,
         node_removed: false,
+        generation: 0,
         multigraph: true,
+        edge_map: None,
     };
     Ok(graph)
 }
@@ -2789,19 +4537,36 @@ pub fn max_weight_matching(
 
 /// Compute the strongly connected components for a directed graph
 ///
-/// This function is implemented using Kosaraju's algorithm
+/// This function is implemented using Kosaraju's algorithm.
+///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
 ///
-/// :param PyDiGraph graph: The input graph to find the strongly connected
-///     components for.
+/// :param graph: The input graph to find the strongly connected components
+///     for, a :class:`~retworkx.PyDiGraph` or a frozen
+///     :class:`~retworkx.CSRDiGraph`
 ///
 /// :return: A list of list of node ids for strongly connected components
 /// :rtype: list
 #[pyfunction]
 #[text_signature = "(graph, /)"]
 pub fn strongly_connected_components(
-    graph: &digraph::PyDiGraph,
+    py: Python,
+    graph: csr::AnyDiGraph,
 ) -> Vec<Vec<usize>> {
-    algo::kosaraju_scc(graph)
+    let components = match graph {
+        csr::AnyDiGraph::Graph(graph) => {
+            let graph: &digraph::PyDiGraph = &graph;
+            py.allow_threads(|| algo::kosaraju_scc(graph))
+        }
+        csr::AnyDiGraph::Frozen(graph) => {
+            let graph: &csr::CSRDiGraph = &graph;
+            py.allow_threads(|| algo::kosaraju_scc(graph))
+        }
+    };
+    components
         .iter()
         .map(|x| x.iter().map(|id| id.index()).collect())
         .collect()
@@ -3029,21 +4794,28 @@ fn _graph_triangles(graph: &graph::PyGraph, node: usize) -> (usize, usize) {
 ///     or self loops. It may produce incorrect/unexpected results if the
 ///     input graph has self loops or parallel edges.
 ///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
 /// :param PyGraph graph: Graph to be used.
 ///
 /// :returns: Transitivity.
 /// :rtype: float
 #[pyfunction]
 #[text_signature = "(graph, /)"]
-fn graph_transitivity(graph: &graph::PyGraph) -> f64 {
+fn graph_transitivity(py: Python, graph: &graph::PyGraph) -> f64 {
     let node_indices: Vec<NodeIndex> = graph.graph.node_indices().collect();
-    let (triangles, triples) = node_indices
-        .par_iter()
-        .map(|node| _graph_triangles(graph, node.index()))
-        .reduce(
-            || (0, 0),
-            |(sumx, sumy), (resx, resy)| (sumx + resx, sumy + resy),
-        );
+    let (triangles, triples) = py.allow_threads(|| {
+        node_indices
+            .par_iter()
+            .map(|node| _graph_triangles(graph, node.index()))
+            .reduce(
+                || (0, 0),
+                |(sumx, sumy), (resx, resy)| (sumx + resx, sumy + resy),
+            )
+    });
 
     match triangles {
         0 => 0.0,
@@ -3130,6 +4902,11 @@ fn _digraph_triangles(
 ///     or self loops. It may produce incorrect/unexpected results if the
 ///     input graph has self loops or parallel edges.
 ///
+/// The GIL is released while this runs, but ``graph`` stays borrowed until
+/// it returns. Modifying the graph from another Python thread in the
+/// meantime raises a ``RuntimeError`` (``Already borrowed``) instead of
+/// waiting for this call to finish.
+///
 /// :param PyDiGraph graph: Directed graph to be used.
 ///
 /// :returns: Transitivity.
@@ -3139,15 +4916,17 @@ fn _digraph_triangles(
 ///    Physical Review E, 76(2), 026107 (2007)
 #[pyfunction]
 #[text_signature = "(graph, /)"]
-fn digraph_transitivity(graph: &digraph::PyDiGraph) -> f64 {
+fn digraph_transitivity(py: Python, graph: &digraph::PyDiGraph) -> f64 {
     let node_indices: Vec<NodeIndex> = graph.graph.node_indices().collect();
-    let (triangles, triples) = node_indices
-        .par_iter()
-        .map(|node| _digraph_triangles(graph, node.index()))
-        .reduce(
-            || (0, 0),
-            |(sumx, sumy), (resx, resy)| (sumx + resx, sumy + resy),
-        );
+    let (triangles, triples) = py.allow_threads(|| {
+        node_indices
+            .par_iter()
+            .map(|node| _digraph_triangles(graph, node.index()))
+            .reduce(
+                || (0, 0),
+                |(sumx, sumy), (resx, resy)| (sumx + resx, sumy + resy),
+            )
+    });
 
     match triangles {
         0 => 0.0,
@@ -3371,7 +5150,7 @@ pub fn minimum_spanning_tree(
     default_weight: f64,
 ) -> PyResult<graph::PyGraph> {
     let mut spanning_tree = (*graph).clone();
-    spanning_tree.graph.clear_edges();
+    spanning_tree.clear_edges();
 
     for edge in minimum_spanning_edges(py, graph, weight_fn, default_weight)?
         .edges
@@ -3402,7 +5181,7 @@ fn graph_complement(
     graph: &graph::PyGraph,
 ) -> PyResult<graph::PyGraph> {
     let mut complement_graph = graph.clone(); // keep same node indexes
-    complement_graph.graph.clear_edges();
+    complement_graph.clear_edges();
 
     for node_a in graph.graph.node_indices() {
         let old_neighbors: HashSet<NodeIndex> =
@@ -3445,7 +5224,7 @@ fn digraph_complement(
     graph: &digraph::PyDiGraph,
 ) -> PyResult<digraph::PyDiGraph> {
     let mut complement_graph = graph.clone(); // keep same node indexes
-    complement_graph.graph.clear_edges();
+    complement_graph.clear_edges();
 
     for node_a in graph.graph.node_indices() {
         let old_neighbors: HashSet<NodeIndex> = graph
@@ -3533,6 +5312,148 @@ pub fn digraph_random_layout(
     _random_layout(&graph.graph, center, seed)
 }
 
+/// Find the connected components of ``graph`` following the edges in both
+/// directions.
+fn _csr_components<'a, G>(graph: G) -> Vec<BTreeSet<usize>>
+where
+    G: csr::AsAdjacency<'a>
+        + IntoNodeIdentifiers
+        + GraphBase<NodeId = NodeIndex>
+        + NodeIndexable
+        + GraphProp,
+{
+    let out_adj = graph.adjacency(Direction::Outgoing);
+    let in_adj = if graph.is_directed() {
+        graph.adjacency(Direction::Incoming)
+    } else {
+        Cow::Owned(csr::Adjacency::default())
+    };
+    let mut seen: Vec<bool> = vec![false; graph.node_bound()];
+    let mut out_vec: Vec<BTreeSet<usize>> = Vec::new();
+    let mut stack: Vec<usize> = Vec::new();
+    for start in graph.node_identifiers() {
+        let start = start.index();
+        if seen[start] {
+            continue;
+        }
+        let mut component_set: BTreeSet<usize> = BTreeSet::new();
+        seen[start] = true;
+        stack.push(start);
+        while let Some(node) = stack.pop() {
+            component_set.insert(node);
+            for adj in &[&*out_adj, &*in_adj] {
+                for neighbor in adj.row(node) {
+                    if !seen[*neighbor] {
+                        seen[*neighbor] = true;
+                        stack.push(*neighbor);
+                    }
+                }
+            }
+        }
+        out_vec.push(component_set);
+    }
+    out_vec
+}
+
+/// Find the connected components of an undirected graph
+///
+/// :param graph: The graph to find the connected components in, a
+///     :class:`~retworkx.PyGraph` or a frozen :class:`~retworkx.CSRGraph`
+///
+/// :returns: A list of sets where each set it a connected component of
+///     the graph
+/// :rtype: list
+#[pyfunction]
+#[text_signature = "(graph, /)"]
+pub fn connected_components(graph: csr::AnyGraph) -> Vec<BTreeSet<usize>> {
+    match graph {
+        csr::AnyGraph::Graph(graph) => _csr_components(&graph.graph),
+        csr::AnyGraph::Frozen(graph) => _csr_components(&*graph),
+    }
+}
+
+fn _dijkstra_shortest_paths<G>(
+    py: Python,
+    graph: G,
+    node_count: usize,
+    source: usize,
+    target: Option<usize>,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<PathMapping>
+where
+    G: IntoEdges<NodeId = NodeIndex, EdgeWeight = PyObject> + Visitable,
+{
+    let start = NodeIndex::new(source);
+    let goal_index: Option<NodeIndex> = target.map(NodeIndex::new);
+    let mut paths: HashMap<NodeIndex, Vec<NodeIndex>> =
+        HashMap::with_capacity(node_count);
+    dijkstra::dijkstra(
+        graph,
+        start,
+        goal_index,
+        |e| weight_callable(py, &weight_fn, e.weight(), default_weight),
+        Some(&mut paths),
+    )?;
+    Ok(PathMapping {
+        paths: paths
+            .iter()
+            .filter_map(|(k, v)| {
+                let k_int = k.index();
+                if k_int == source
+                    || target.is_some() && target.unwrap() != k_int
+                {
+                    None
+                } else {
+                    Some((
+                        k_int,
+                        v.iter().map(|x| x.index()).collect::<Vec<usize>>(),
+                    ))
+                }
+            })
+            .collect(),
+    })
+}
+
+fn _dijkstra_shortest_path_lengths<G>(
+    py: Python,
+    graph: G,
+    node: usize,
+    edge_cost_fn: PyObject,
+    goal: Option<usize>,
+) -> PyResult<PathLengthMapping>
+where
+    G: IntoEdges<NodeId = NodeIndex, EdgeWeight = PyObject> + Visitable,
+{
+    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
+        let res = edge_cost_fn.call1(py, (a,))?;
+        let raw = res.to_object(py);
+        raw.extract(py)
+    };
+    let start = NodeIndex::new(node);
+    let goal_index: Option<NodeIndex> = goal.map(NodeIndex::new);
+    let res = dijkstra::dijkstra(
+        graph,
+        start,
+        goal_index,
+        |e| edge_cost_callable(e.weight()),
+        None,
+    )?;
+    Ok(PathLengthMapping {
+        path_lengths: res
+            .iter()
+            .filter_map(|(k, v)| {
+                let k_int = k.index();
+                if k_int == node || goal.is_some() && goal.unwrap() != k_int {
+                    None
+                } else {
+                    Some((k_int, *v))
+                }
+            })
+            .collect(),
+    })
+}
+
 // The provided node is invalid.
 create_exception!(retworkx, InvalidNode, PyException);
 // Performing this operation would result in trying to add a cycle to a DAG.
@@ -3547,6 +5468,8 @@ create_exception!(retworkx, NoSuitableNeighbors, PyException);
 create_exception!(retworkx, NullGraph, PyException);
 // No path was found between the specified nodes.
 create_exception!(retworkx, NoPathFound, PyException);
+// The graph has a cycle with a negative total weight.
+create_exception!(retworkx, NegativeCycle, PyException);
 
 #[pymodule]
 fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
@@ -3557,12 +5480,14 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add("DAGHasCycle", py.get_type::<DAGHasCycle>())?;
     m.add("NoSuitableNeighbors", py.get_type::<NoSuitableNeighbors>())?;
     m.add("NoPathFound", py.get_type::<NoPathFound>())?;
+    m.add("NegativeCycle", py.get_type::<NegativeCycle>())?;
     m.add("NullGraph", py.get_type::<NullGraph>())?;
     m.add_wrapped(wrap_pyfunction!(bfs_successors))?;
     m.add_wrapped(wrap_pyfunction!(dag_longest_path))?;
     m.add_wrapped(wrap_pyfunction!(dag_longest_path_length))?;
     m.add_wrapped(wrap_pyfunction!(number_weakly_connected_components))?;
     m.add_wrapped(wrap_pyfunction!(weakly_connected_components))?;
+    m.add_wrapped(wrap_pyfunction!(connected_components))?;
     m.add_wrapped(wrap_pyfunction!(is_weakly_connected))?;
     m.add_wrapped(wrap_pyfunction!(is_directed_acyclic_graph))?;
     m.add_wrapped(wrap_pyfunction!(digraph_is_isomorphic))?;
@@ -3585,8 +5510,17 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(digraph_all_simple_paths))?;
     m.add_wrapped(wrap_pyfunction!(graph_dijkstra_shortest_paths))?;
     m.add_wrapped(wrap_pyfunction!(digraph_dijkstra_shortest_paths))?;
+    m.add_wrapped(wrap_pyfunction!(path_from_predecessors))?;
     m.add_wrapped(wrap_pyfunction!(graph_dijkstra_shortest_path_lengths))?;
     m.add_wrapped(wrap_pyfunction!(digraph_dijkstra_shortest_path_lengths))?;
+    m.add_wrapped(wrap_pyfunction!(graph_all_pairs_dijkstra_path_lengths))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_all_pairs_dijkstra_path_lengths))?;
+    m.add_wrapped(wrap_pyfunction!(graph_bidirectional_dijkstra))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_bidirectional_dijkstra))?;
+    m.add_wrapped(wrap_pyfunction!(graph_bellman_ford_shortest_paths))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_bellman_ford_shortest_paths))?;
+    m.add_wrapped(wrap_pyfunction!(graph_johnson_all_pairs))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_johnson_all_pairs))?;
     m.add_wrapped(wrap_pyfunction!(graph_astar_shortest_path))?;
     m.add_wrapped(wrap_pyfunction!(digraph_astar_shortest_path))?;
     m.add_wrapped(wrap_pyfunction!(graph_greedy_color))?;
@@ -3617,13 +5551,20 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(digraph_random_layout))?;
     m.add_class::<digraph::PyDiGraph>()?;
     m.add_class::<graph::PyGraph>()?;
+    m.add_class::<csr::CSRDiGraph>()?;
+    m.add_class::<csr::CSRGraph>()?;
     m.add_class::<iterators::BFSSuccessors>()?;
     m.add_class::<iterators::NodeIndices>()?;
     m.add_class::<iterators::EdgeList>()?;
     m.add_class::<iterators::WeightedEdgeList>()?;
     m.add_class::<iterators::PathMapping>()?;
     m.add_class::<iterators::PathLengthMapping>()?;
+    m.add_class::<iterators::AllPairsPathLengthMapping>()?;
     m.add_class::<iterators::Pos2DMapping>()?;
+    m.add_class::<views::NodeView>()?;
+    m.add_class::<views::EdgeView>()?;
+    m.add_class::<views::AdjView>()?;
+    m.add_class::<batch::DAGBatch>()?;
     m.add_wrapped(wrap_pymodule!(generators))?;
     Ok(())
 }
@@ -0,0 +1,141 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+// Estimates of the heap memory used by the Rust side of retworkx objects,
+// used for ``__sizeof__`` and the ``memory_usage()`` methods.
+
+use std::collections::VecDeque;
+use std::mem::size_of;
+
+use hashbrown::{HashMap, HashSet};
+
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyFrozenSet, PyList, PySet, PyTuple};
+use pyo3::Python;
+
+use petgraph::graph::{EdgeIndex, NodeIndex};
+use petgraph::stable_graph::StableGraph;
+use petgraph::visit::NodeIndexable;
+use petgraph::EdgeType;
+
+// The size of a node and an edge slot of a ``StableGraph``: the optional
+// payload plus the heads of the outgoing and incoming edge lists for a
+// node, and the optional payload, the next edges in the edge lists of both
+// endpoints and the endpoints for an edge.
+const NODE_SLOT: usize = size_of::<(Option<PyObject>, [EdgeIndex; 2])>();
+const EDGE_SLOT: usize =
+    size_of::<(Option<PyObject>, [EdgeIndex; 2], [NodeIndex; 2])>();
+
+/// The bytes allocated by a ``Vec``.
+#[allow(clippy::ptr_arg)]
+pub fn vec_bytes<T>(vec: &Vec<T>) -> usize {
+    vec.capacity() * size_of::<T>()
+}
+
+/// The bytes allocated by a ``VecDeque``.
+pub fn vec_deque_bytes<T>(deque: &VecDeque<T>) -> usize {
+    deque.capacity() * size_of::<T>()
+}
+
+fn buckets(capacity: usize) -> usize {
+    if capacity == 0 {
+        0
+    } else if capacity < 8 {
+        (capacity + 1).next_power_of_two()
+    } else {
+        (capacity * 8 / 7).next_power_of_two()
+    }
+}
+
+/// An estimate of the bytes allocated by a hashbrown ``HashMap``: a slot
+/// and a control byte per bucket.
+pub fn hash_map_bytes<K, V>(map: &HashMap<K, V>) -> usize {
+    let buckets = buckets(map.capacity());
+    if buckets == 0 {
+        return 0;
+    }
+    buckets * (size_of::<(K, V)>() + 1)
+}
+
+/// The bytes used by the node and edge slots of a graph
+pub struct GraphSlots {
+    pub node_slots: usize,
+    pub edge_slots: usize,
+    pub free_node_slots: usize,
+    pub free_edge_slots: usize,
+}
+
+/// Count the bytes of the slots of ``graph``, split into slots that hold a
+/// node or edge and slots left vacant by removals (which ``StableGraph``
+/// keeps on free lists for reuse). Only vacant slots below the highest index
+/// in use are counted.
+pub fn graph_slots<Ty: EdgeType>(
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+) -> GraphSlots {
+    let node_bound = graph.node_bound();
+    let edge_bound = graph
+        .edge_indices()
+        .last()
+        .map_or(0, |edge| edge.index() + 1);
+    GraphSlots {
+        node_slots: graph.node_count() * NODE_SLOT,
+        edge_slots: graph.edge_count() * EDGE_SLOT,
+        free_node_slots: (node_bound - graph.node_count()) * NODE_SLOT,
+        free_edge_slots: (edge_bound - graph.edge_count()) * EDGE_SLOT,
+    }
+}
+
+impl GraphSlots {
+    pub fn total(&self) -> usize {
+        self.node_slots
+            + self.edge_slots
+            + self.free_node_slots
+            + self.free_edge_slots
+    }
+}
+
+/// The total size reported by ``sys.getsizeof`` for ``objs`` and, for the
+/// builtin containers (``list``, ``tuple``, ``dict``, ``set`` and
+/// ``frozenset``), everything they contain. Every object is counted once
+/// even if it is referenced more than once.
+pub fn payload_bytes<'a>(
+    py: Python,
+    objs: impl Iterator<Item = &'a PyObject>,
+) -> PyResult<usize> {
+    let getsizeof = py.import("sys")?.getattr("getsizeof")?;
+    let mut seen: HashSet<usize> = HashSet::new();
+    let mut stack: Vec<&PyAny> = objs.map(|obj| obj.as_ref(py)).collect();
+    let mut total: usize = 0;
+    while let Some(obj) = stack.pop() {
+        if !seen.insert(obj.as_ptr() as usize) {
+            continue;
+        }
+        total += getsizeof.call1((obj,))?.extract::<usize>()?;
+        if let Ok(list) = obj.downcast::<PyList>() {
+            stack.extend(list.iter());
+        } else if let Ok(tuple) = obj.downcast::<PyTuple>() {
+            stack.extend(tuple.iter());
+        } else if let Ok(dict) = obj.downcast::<PyDict>() {
+            for (key, value) in dict.iter() {
+                stack.push(key);
+                stack.push(value);
+            }
+        } else if obj.downcast::<PySet>().is_ok()
+            || obj.downcast::<PyFrozenSet>().is_ok()
+        {
+            for item in obj.iter()? {
+                stack.push(item?);
+            }
+        }
+    }
+    Ok(total)
+}
@@ -0,0 +1,164 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use hashbrown::HashMap;
+
+use pyo3::basic::CompareOp;
+use pyo3::gc::{PyTraverseError, PyVisit};
+use pyo3::prelude::*;
+use pyo3::Python;
+
+use petgraph::graph::NodeIndex;
+use petgraph::stable_graph::StableGraph;
+use petgraph::EdgeType;
+
+use super::memory::{hash_map_bytes, vec_bytes};
+
+/// A hash index from node payloads to the nodes holding them.
+///
+/// Nodes are bucketed by the Python ``hash()`` of their payload, or of the
+/// result of calling ``key`` on the payload if a key function is set. Every
+/// candidate in a bucket is checked against the graph and compared for
+/// equality with the payload being looked up, so hash collisions and
+/// entries left behind by removed nodes never give a wrong match. A payload
+/// that is mutated in place in a way that changes its hash can't be found
+/// until it is set again with ``graph[index] = payload``.
+#[derive(Clone)]
+pub struct PayloadIndex {
+    map: HashMap<isize, Vec<NodeIndex>>,
+    key: Option<PyObject>,
+}
+
+impl PayloadIndex {
+    /// Build an index of all the nodes in ``graph``.
+    pub fn build<Ty: EdgeType>(
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+        key: Option<PyObject>,
+    ) -> PyResult<Self> {
+        let mut out = PayloadIndex {
+            map: HashMap::with_capacity(graph.node_count()),
+            key,
+        };
+        for node in graph.node_indices() {
+            let hash = out.hash(py, &graph[node])?;
+            out.insert(hash, node);
+        }
+        Ok(out)
+    }
+
+    /// Build a new index with the same key function for ``graph``.
+    pub fn rebuild<Ty: EdgeType>(
+        &self,
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+    ) -> PyResult<Self> {
+        PayloadIndex::build(py, graph, self.key.clone())
+    }
+
+    /// The hash ``payload`` is bucketed by.
+    pub fn hash(&self, py: Python, payload: &PyObject) -> PyResult<isize> {
+        match &self.key {
+            Some(key) => key.call1(py, (payload,))?.as_ref(py).hash(),
+            None => payload.as_ref(py).hash(),
+        }
+    }
+
+    pub fn insert(&mut self, hash: isize, node: NodeIndex) {
+        let bucket = self.map.entry(hash).or_insert_with(Vec::new);
+        if !bucket.contains(&node) {
+            bucket.push(node);
+        }
+    }
+
+    pub fn remove(&mut self, hash: isize, node: NodeIndex) {
+        if let Some(bucket) = self.map.get_mut(&hash) {
+            bucket.retain(|other| *other != node);
+            if bucket.is_empty() {
+                self.map.remove(&hash);
+            }
+        }
+    }
+
+    /// Remove ``node`` with ``payload`` from the index. An error computing
+    /// the hash is ignored, a stale entry is harmless since entries are
+    /// checked on lookup.
+    pub fn remove_payload(
+        &mut self,
+        py: Python,
+        node: NodeIndex,
+        payload: &PyObject,
+    ) {
+        if let Ok(hash) = self.hash(py, payload) {
+            self.remove(hash, node);
+        }
+    }
+
+    /// Find the lowest index node in ``graph`` with a payload equal to
+    /// ``obj``.
+    pub fn find<Ty: EdgeType>(
+        &self,
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+        obj: &PyObject,
+    ) -> PyResult<Option<NodeIndex>> {
+        let bucket = match self.map.get(&self.hash(py, obj)?) {
+            Some(bucket) => bucket,
+            None => return Ok(None),
+        };
+        let mut out: Option<NodeIndex> = None;
+        for node in bucket {
+            if out.map_or(false, |found| found < *node) {
+                continue;
+            }
+            if let Some(weight) = graph.node_weight(*node) {
+                if obj
+                    .as_ref(py)
+                    .rich_compare(weight, CompareOp::Eq)?
+                    .is_true()?
+                {
+                    out = Some(*node);
+                }
+            }
+        }
+        Ok(out)
+    }
+
+    /// Move every entry to the new node index given by ``node_mapping``,
+    /// where a negative entry marks a node that no longer exists.
+    pub fn remap(&mut self, node_mapping: &[i64]) {
+        for bucket in self.map.values_mut() {
+            *bucket = bucket
+                .iter()
+                .filter_map(|node| match node_mapping.get(node.index()) {
+                    Some(new) if *new >= 0 => {
+                        Some(NodeIndex::new(*new as usize))
+                    }
+                    _ => None,
+                })
+                .collect();
+        }
+        self.map.retain(|_, bucket| !bucket.is_empty());
+    }
+
+    pub fn heap_bytes(&self) -> usize {
+        hash_map_bytes(&self.map)
+            + self.map.values().map(vec_bytes).sum::<usize>()
+    }
+
+    pub fn traverse(&self, visit: &PyVisit) -> Result<(), PyTraverseError> {
+        if let Some(key) = &self.key {
+            visit.call(key)?;
+        }
+        Ok(())
+    }
+}
@@ -0,0 +1,232 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+// Packed pickle state for the graph classes.
+//
+// The structure of a graph is stored in a single ``np.uint8`` array so that
+// pickle protocol 5 can transfer it out-of-band (numpy arrays support
+// ``PickleBuffer``). The layout is, with all integers little endian:
+//
+//   * ``node_bound`` and ``edge_bound`` as u64
+//   * a bitmap with a bit set for every node slot holding a node
+//   * a bitmap with a bit set for every edge slot holding an edge
+//   * the source and target node of every edge in edge index order, as u32
+//     if ``node_bound`` fits in a u32 otherwise as u64
+//
+// The node and edge payloads are stored as two separate lists in node and
+// edge index order, so the node and edge indices of the graph are preserved
+// exactly when it is unpickled.
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
+use pyo3::Python;
+
+use numpy::{IntoPyArray, PyReadonlyArray1};
+
+use petgraph::graph::{EdgeIndex, NodeIndex};
+use petgraph::stable_graph::StableGraph;
+use petgraph::visit::NodeIndexable;
+use petgraph::EdgeType;
+
+const HEADER_LEN: usize = 16;
+
+fn index_width(node_bound: usize) -> usize {
+    if node_bound <= u32::MAX as usize {
+        4
+    } else {
+        8
+    }
+}
+
+fn bitmap_len(bound: usize) -> usize {
+    (bound + 7) / 8
+}
+
+fn invalid_state() -> PyErr {
+    PyValueError::new_err("Invalid packed graph state")
+}
+
+/// Add the packed ``structure`` array and the ``node_payloads`` and
+/// ``edge_payloads`` lists for ``graph`` to ``state``.
+pub fn pack_state<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    state: &PyDict,
+) -> PyResult<()> {
+    let node_bound = graph.node_bound();
+    let edge_bound = graph
+        .edge_indices()
+        .last()
+        .map_or(0, |edge| edge.index() + 1);
+    let width = index_width(node_bound);
+    let node_bitmap_start = HEADER_LEN;
+    let edge_bitmap_start = node_bitmap_start + bitmap_len(node_bound);
+    let endpoints_start = edge_bitmap_start + bitmap_len(edge_bound);
+    let mut structure: Vec<u8> =
+        vec![0; endpoints_start + 2 * width * graph.edge_count()];
+    structure[0..8].copy_from_slice(&(node_bound as u64).to_le_bytes());
+    structure[8..16].copy_from_slice(&(edge_bound as u64).to_le_bytes());
+
+    let mut node_payloads: Vec<&PyObject> =
+        Vec::with_capacity(graph.node_count());
+    for node in graph.node_indices() {
+        let index = node.index();
+        structure[node_bitmap_start + index / 8] |= 1 << (index % 8);
+        node_payloads.push(&graph[node]);
+    }
+    let mut edge_payloads: Vec<&PyObject> =
+        Vec::with_capacity(graph.edge_count());
+    let mut pos = endpoints_start;
+    for edge in graph.edge_indices() {
+        let index = edge.index();
+        structure[edge_bitmap_start + index / 8] |= 1 << (index % 8);
+        let (source, target) = graph.edge_endpoints(edge).unwrap();
+        for node in &[source, target] {
+            let bytes = (node.index() as u64).to_le_bytes();
+            structure[pos..pos + width].copy_from_slice(&bytes[..width]);
+            pos += width;
+        }
+        edge_payloads.push(&graph[edge]);
+    }
+    state.set_item("structure", structure.into_pyarray(py))?;
+    state.set_item("node_payloads", PyList::new(py, node_payloads))?;
+    state.set_item("edge_payloads", PyList::new(py, edge_payloads))?;
+    Ok(())
+}
+
+/// Rebuild a graph from a state dictionary created by ``pack_state``.
+///
+/// Returns ``None`` if ``state`` doesn't contain a packed structure (for
+/// example a pickle created by an older version of retworkx).
+pub fn unpack_state<Ty: EdgeType>(
+    py: Python,
+    state: &PyDict,
+) -> PyResult<Option<StableGraph<PyObject, PyObject, Ty>>> {
+    let structure = match state.get_item("structure") {
+        Some(structure) => structure.extract::<PyReadonlyArray1<u8>>()?,
+        None => return Ok(None),
+    };
+    let structure = structure.as_slice().map_err(|_| invalid_state())?;
+    let node_payloads: Vec<PyObject> = match state.get_item("node_payloads") {
+        Some(payloads) => payloads.extract()?,
+        None => return Err(invalid_state()),
+    };
+    let edge_payloads: Vec<PyObject> = match state.get_item("edge_payloads") {
+        Some(payloads) => payloads.extract()?,
+        None => return Err(invalid_state()),
+    };
+    if structure.len() < HEADER_LEN {
+        return Err(invalid_state());
+    }
+    let read_u64 = |pos: usize, width: usize| -> u64 {
+        let mut bytes = [0u8; 8];
+        bytes[..width].copy_from_slice(&structure[pos..pos + width]);
+        u64::from_le_bytes(bytes)
+    };
+    // Validate the bounds against the buffer before allocating anything
+    // sized by them, so a truncated or corrupted state raises instead of
+    // aborting on a capacity overflow. Indices are stored as u32 in the
+    // graph so neither bound can exceed that.
+    let node_bound = read_u64(0, 8);
+    let edge_bound = read_u64(8, 8);
+    if node_bound > u64::from(u32::MAX) || edge_bound > u64::from(u32::MAX) {
+        return Err(invalid_state());
+    }
+    let node_bound = node_bound as usize;
+    let edge_bound = edge_bound as usize;
+    let width = index_width(node_bound);
+    let node_bitmap_start = HEADER_LEN;
+    let edge_bitmap_start = node_bitmap_start
+        .checked_add(bitmap_len(node_bound))
+        .ok_or_else(invalid_state)?;
+    let endpoints_start = edge_bitmap_start
+        .checked_add(bitmap_len(edge_bound))
+        .ok_or_else(invalid_state)?;
+    let expected_len = edge_payloads
+        .len()
+        .checked_mul(2 * width)
+        .and_then(|len| len.checked_add(endpoints_start))
+        .ok_or_else(invalid_state)?;
+    if structure.len() != expected_len {
+        return Err(invalid_state());
+    }
+    let count_set = |start: usize, end: usize| -> usize {
+        structure[start..end]
+            .iter()
+            .map(|byte| byte.count_ones() as usize)
+            .sum()
+    };
+    if node_payloads.len() != count_set(node_bitmap_start, edge_bitmap_start)
+        || edge_payloads.len() != count_set(edge_bitmap_start, endpoints_start)
+    {
+        return Err(invalid_state());
+    }
+    let is_set = |start: usize, index: usize| -> bool {
+        structure[start + index / 8] & (1 << (index % 8)) != 0
+    };
+
+    let mut graph = StableGraph::<PyObject, PyObject, Ty>::with_capacity(
+        node_bound, edge_bound,
+    );
+    let mut node_payloads = node_payloads.into_iter();
+    let mut tmp_nodes: Vec<NodeIndex> = Vec::new();
+    let mut first_node: Option<NodeIndex> = None;
+    for index in 0..node_bound {
+        if is_set(node_bitmap_start, index) {
+            let payload = node_payloads.next().ok_or_else(invalid_state)?;
+            let node = graph.add_node(payload);
+            first_node.get_or_insert(node);
+        } else {
+            tmp_nodes.push(graph.add_node(py.None()));
+        }
+    }
+    if node_payloads.next().is_some() {
+        return Err(invalid_state());
+    }
+    let mut edge_payloads = edge_payloads.into_iter();
+    let mut tmp_edges: Vec<EdgeIndex> = Vec::new();
+    let mut pos = endpoints_start;
+    for index in 0..edge_bound {
+        if is_set(edge_bitmap_start, index) {
+            let source = read_u64(pos, width) as usize;
+            let target = read_u64(pos + width, width) as usize;
+            pos += 2 * width;
+            for node in &[source, target] {
+                if *node >= node_bound || !is_set(node_bitmap_start, *node) {
+                    return Err(invalid_state());
+                }
+            }
+            let payload = edge_payloads.next().ok_or_else(invalid_state)?;
+            graph.add_edge(
+                NodeIndex::new(source),
+                NodeIndex::new(target),
+                payload,
+            );
+        } else {
+            // Fill the hole with a temporary self loop so that every
+            // following edge keeps its index
+            let node = first_node.ok_or_else(invalid_state)?;
+            tmp_edges.push(graph.add_edge(node, node, py.None()));
+        }
+    }
+    if edge_payloads.next().is_some() {
+        return Err(invalid_state());
+    }
+    for edge in tmp_edges {
+        graph.remove_edge(edge);
+    }
+    for node in tmp_nodes {
+        graph.remove_node(node);
+    }
+    Ok(Some(graph))
+}
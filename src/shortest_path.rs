@@ -0,0 +1,515 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+// Weighted shortest path kernels that run on a compressed sparse row
+// adjacency and a flat array of edge weights. The weights are extracted from
+// the Python edge payloads once, with the GIL held, after which the searches
+// never touch a Python object and can run without the GIL and in parallel.
+
+use std::collections::BinaryHeap;
+
+use pyo3::exceptions::{PyIndexError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::Python;
+
+use petgraph::graph::{EdgeIndex, NodeIndex};
+use petgraph::visit::{
+    Data, EdgeRef, GraphBase, IntoEdgeReferences, IntoNodeIdentifiers,
+};
+
+use ndarray::prelude::*;
+use rayon::prelude::*;
+
+use super::astar::MinScored;
+use super::csr::{Adjacency, AsAdjacency};
+use super::weight_callable;
+
+/// Get the weight of every edge of ``graph`` from ``weight_fn`` (or
+/// ``default_weight`` if it isn't set), indexed by edge index. Removed edges
+/// have a weight of ``inf``. A NaN weight raises a ``ValueError``.
+pub fn edge_weights<G>(
+    py: Python,
+    graph: G,
+    weight_fn: &Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<Vec<f64>>
+where
+    G: IntoEdgeReferences + GraphBase<EdgeId = EdgeIndex>,
+    G: Data<EdgeWeight = PyObject>,
+{
+    let mut weights: Vec<f64> = Vec::new();
+    for edge in graph.edge_references() {
+        let weight =
+            weight_callable(py, weight_fn, edge.weight(), default_weight)?;
+        if weight.is_nan() {
+            return Err(PyValueError::new_err("NaN found as an edge weight"));
+        }
+        let index = edge.id().index();
+        if index >= weights.len() {
+            weights.resize(index + 1, std::f64::INFINITY);
+        }
+        weights[index] = weight;
+    }
+    Ok(weights)
+}
+
+/// Raise a ``ValueError`` if any of ``weights`` is negative.
+pub fn check_non_negative(weights: &[f64]) -> PyResult<()> {
+    match weights.iter().find(|weight| **weight < 0.0) {
+        Some(weight) => Err(PyValueError::new_err(format!(
+            "Negative edge weight {} found, edge weights must be non-negative",
+            weight
+        ))),
+        None => Ok(()),
+    }
+}
+
+/// Validate a list of node indices for ``graph``, defaulting to all the
+/// nodes of the graph in index order if ``nodes`` is ``None``.
+pub fn node_list<'a, G>(
+    graph: G,
+    nodes: Option<Vec<usize>>,
+) -> PyResult<Vec<usize>>
+where
+    G: AsAdjacency<'a> + IntoNodeIdentifiers + GraphBase<NodeId = NodeIndex>,
+{
+    match nodes {
+        Some(nodes) => {
+            for node in &nodes {
+                if !graph.has_node(*node) {
+                    return Err(PyIndexError::new_err(format!(
+                        "No node found for index {}",
+                        node
+                    )));
+                }
+            }
+            Ok(nodes)
+        }
+        None => Ok(graph.node_identifiers().map(|node| node.index()).collect()),
+    }
+}
+
+/// Run Dijkstra's algorithm from ``source`` following the edges in ``rows``.
+///
+/// ``dist`` is indexed by node index and is overwritten with the length of
+/// the shortest path to every node, ``inf`` for unreachable nodes. If
+/// ``targets`` is set to ``(is_target, count)`` the search stops as soon as
+/// the ``count`` nodes marked in ``is_target`` are settled, after which only
+/// the entries of ``dist`` for those nodes are final. If ``cutoff`` is set
+/// the search stops once every node within ``cutoff`` is settled, after
+/// which only the entries no larger than ``cutoff`` are final.
+pub fn dijkstra_lengths(
+    rows: &[&Adjacency],
+    weights: &[f64],
+    source: usize,
+    dist: &mut [f64],
+    targets: Option<(&[bool], usize)>,
+    cutoff: Option<f64>,
+) {
+    for x in dist.iter_mut() {
+        *x = std::f64::INFINITY;
+    }
+    let mut settled: Vec<bool> = vec![false; dist.len()];
+    let mut remaining = targets.map_or(0, |(_, count)| count);
+    let mut visit_next: BinaryHeap<MinScored<f64, usize>> = BinaryHeap::new();
+    dist[source] = 0.0;
+    visit_next.push(MinScored(0.0, source));
+    while let Some(MinScored(score, node)) = visit_next.pop() {
+        if settled[node] {
+            continue;
+        }
+        if cutoff.map_or(false, |cutoff| score > cutoff) {
+            return;
+        }
+        settled[node] = true;
+        if let Some((is_target, _)) = targets {
+            if is_target[node] {
+                remaining -= 1;
+                if remaining == 0 {
+                    return;
+                }
+            }
+        }
+        for adj in rows {
+            for (next, edge) in adj.row(node).iter().zip(adj.row_edges(node)) {
+                let next_score = score + weights[*edge];
+                if next_score < dist[*next] {
+                    dist[*next] = next_score;
+                    visit_next.push(MinScored(next_score, *next));
+                }
+            }
+        }
+    }
+}
+
+/// Fill ``matrix``, of shape ``(sources.len(), targets.len())``, with the
+/// lengths of the shortest paths from every source to every target, running
+/// one Dijkstra search per source. If ``cutoff`` is set the paths longer
+/// than it are left as ``inf``. The searches run in parallel if ``parallel``
+/// is set.
+pub fn all_pairs_dijkstra_fill(
+    rows: &[&Adjacency],
+    weights: &[f64],
+    node_bound: usize,
+    sources: &[usize],
+    targets: &[usize],
+    cutoff: Option<f64>,
+    parallel: bool,
+    mut matrix: ArrayViewMut2<f64>,
+) {
+    let mut is_target: Vec<bool> = vec![false; node_bound];
+    let mut target_count: usize = 0;
+    for target in targets {
+        if !is_target[*target] {
+            is_target[*target] = true;
+            target_count += 1;
+        }
+    }
+    let search = |index: usize, mut row: ArrayViewMut1<f64>| {
+        let mut dist: Vec<f64> = vec![0.0; node_bound];
+        dijkstra_lengths(
+            rows,
+            weights,
+            sources[index],
+            &mut dist,
+            Some((&is_target, target_count)),
+            cutoff,
+        );
+        for (out, target) in row.iter_mut().zip(targets) {
+            *out = match cutoff {
+                Some(cutoff) if dist[*target] > cutoff => std::f64::INFINITY,
+                _ => dist[*target],
+            };
+        }
+    };
+    if !parallel {
+        matrix
+            .axis_iter_mut(Axis(0))
+            .enumerate()
+            .for_each(|(index, row)| search(index, row));
+    } else {
+        matrix
+            .axis_iter_mut(Axis(0))
+            .into_par_iter()
+            .enumerate()
+            .for_each(|(index, row)| search(index, row));
+    }
+}
+
+/// Return a ``(sources.len(), targets.len())`` matrix with the lengths of
+/// the shortest paths from every source to every target, see
+/// ``all_pairs_dijkstra_fill()``. The searches run in parallel if there are
+/// at least ``parallel_threshold`` sources.
+pub fn all_pairs_dijkstra_lengths(
+    rows: &[&Adjacency],
+    weights: &[f64],
+    node_bound: usize,
+    sources: &[usize],
+    targets: &[usize],
+    cutoff: Option<f64>,
+    parallel_threshold: usize,
+) -> Array2<f64> {
+    let mut matrix =
+        Array2::<f64>::from_elem((sources.len(), targets.len()), 0.0);
+    all_pairs_dijkstra_fill(
+        rows,
+        weights,
+        node_bound,
+        sources,
+        targets,
+        cutoff,
+        sources.len() >= parallel_threshold,
+        matrix.view_mut(),
+    );
+    matrix
+}
+
+/// The buffers of a Dijkstra search reused between searches, only the
+/// entries of the nodes a search reaches are touched so a search costs time
+/// proportional to the part of the graph it explores.
+struct DijkstraState {
+    /// The tentative length of every node, ``inf`` between searches
+    dist: Vec<f64>,
+    /// The nodes with a finite entry in ``dist``
+    touched: Vec<usize>,
+    visit_next: BinaryHeap<MinScored<f64, usize>>,
+}
+
+impl DijkstraState {
+    fn new(node_bound: usize) -> Self {
+        DijkstraState {
+            dist: vec![std::f64::INFINITY; node_bound],
+            touched: Vec::new(),
+            visit_next: BinaryHeap::new(),
+        }
+    }
+
+    /// Run Dijkstra's algorithm from ``source`` following the edges in
+    /// ``rows`` and call ``visit`` with every node within ``cutoff`` of
+    /// ``source`` (all the reachable nodes if it is ``inf``) and the length of
+    /// the shortest path to it, in order of length.
+    fn run<F>(
+        &mut self,
+        rows: &[&Adjacency],
+        weights: &[f64],
+        source: usize,
+        cutoff: f64,
+        mut visit: F,
+    ) where
+        F: FnMut(usize, f64),
+    {
+        let dist = &mut self.dist;
+        let touched = &mut self.touched;
+        dist[source] = 0.0;
+        touched.push(source);
+        self.visit_next.push(MinScored(0.0, source));
+        while let Some(MinScored(score, node)) = self.visit_next.pop() {
+            // A node is only settled once, later entries for it are stale
+            if score > dist[node] {
+                continue;
+            }
+            if score > cutoff {
+                break;
+            }
+            visit(node, score);
+            for adj in rows {
+                for (next, edge) in
+                    adj.row(node).iter().zip(adj.row_edges(node))
+                {
+                    let next_score = score + weights[*edge];
+                    if next_score < dist[*next] {
+                        if dist[*next] == std::f64::INFINITY {
+                            touched.push(*next);
+                        }
+                        dist[*next] = next_score;
+                        self.visit_next.push(MinScored(next_score, *next));
+                    }
+                }
+            }
+        }
+        for node in touched.drain(..) {
+            dist[node] = std::f64::INFINITY;
+        }
+        self.visit_next.clear();
+    }
+}
+
+/// Find the lengths of the shortest paths from every source to the targets
+/// within ``cutoff`` of it (all the targets it can reach if ``cutoff`` isn't
+/// set), running one Dijkstra search per source. Every row is a list of
+/// ``(column, length)`` pairs sorted by column, where ``column`` is the
+/// position in ``targets``, and a source is left out of its own row. The
+/// searches run in parallel if there are at least ``parallel_threshold``
+/// sources.
+pub fn all_pairs_dijkstra_sparse(
+    rows: &[&Adjacency],
+    weights: &[f64],
+    node_bound: usize,
+    sources: &[usize],
+    targets: &[usize],
+    cutoff: Option<f64>,
+    parallel_threshold: usize,
+) -> Vec<Vec<(usize, f64)>> {
+    let cutoff = cutoff.unwrap_or(std::f64::INFINITY);
+    // The columns of every node, a node may be listed more than once in
+    // targets
+    let mut columns: Vec<Vec<usize>> = vec![Vec::new(); node_bound];
+    for (column, target) in targets.iter().enumerate() {
+        columns[*target].push(column);
+    }
+    let search = |state: &mut DijkstraState, source: &usize| {
+        let mut row: Vec<(usize, f64)> = Vec::new();
+        state.run(rows, weights, *source, cutoff, |node, length| {
+            if node != *source {
+                row.extend(
+                    columns[node].iter().map(|column| (*column, length)),
+                );
+            }
+        });
+        row.sort_unstable_by_key(|(column, _)| *column);
+        row
+    };
+    if sources.len() < parallel_threshold {
+        let mut state = DijkstraState::new(node_bound);
+        sources
+            .iter()
+            .map(|source| search(&mut state, source))
+            .collect()
+    } else {
+        sources
+            .par_iter()
+            .map_init(
+                || DijkstraState::new(node_bound),
+                |state, source| search(state, source),
+            )
+            .collect()
+    }
+}
+
+/// Run Dijkstra's algorithm from ``start`` returning the length of the
+/// shortest path to every node and the predecessor of every node on that
+/// path, both indexed by node index up to ``node_bound``. ``edges(node)``
+/// yields the ``(neighbor, edge index)`` pairs of the edges to follow from
+/// ``node``. Nodes that aren't reached have a length of ``inf`` and a
+/// predecessor of ``-1``, as does the predecessor of ``start``. If ``goal``
+/// is set the search stops as soon as it is reached and only the nodes
+/// settled up to that point are filled in. The edge cost is only computed
+/// for the edges that are relaxed.
+pub fn dijkstra_arrays<E, I, F>(
+    node_bound: usize,
+    start: usize,
+    goal: Option<usize>,
+    mut edges: E,
+    mut edge_cost: F,
+) -> PyResult<(Vec<f64>, Vec<i64>)>
+where
+    E: FnMut(usize) -> I,
+    I: Iterator<Item = (usize, usize)>,
+    F: FnMut(usize) -> PyResult<f64>,
+{
+    let mut dist: Vec<f64> = vec![std::f64::INFINITY; node_bound];
+    let mut pred: Vec<i64> = vec![-1; node_bound];
+    let mut settled: Vec<bool> = vec![false; node_bound];
+    let mut visit_next: BinaryHeap<MinScored<f64, usize>> = BinaryHeap::new();
+    dist[start] = 0.0;
+    visit_next.push(MinScored(0.0, start));
+    let mut stopped = false;
+    while let Some(MinScored(score, node)) = visit_next.pop() {
+        if settled[node] {
+            continue;
+        }
+        settled[node] = true;
+        if goal == Some(node) {
+            stopped = true;
+            break;
+        }
+        for (next, edge) in edges(node) {
+            if settled[next] {
+                continue;
+            }
+            let next_score = score + edge_cost(edge)?;
+            if next_score < dist[next] {
+                dist[next] = next_score;
+                pred[next] = node as i64;
+                visit_next.push(MinScored(next_score, next));
+            }
+        }
+    }
+    if stopped {
+        // Drop the tentative entries of the nodes that weren't settled
+        for (index, done) in settled.iter().enumerate() {
+            if !done {
+                dist[index] = std::f64::INFINITY;
+                pred[index] = -1;
+            }
+        }
+    }
+    Ok((dist, pred))
+}
+
+/// Run the Bellman-Ford algorithm following the edges in ``rows``.
+///
+/// If ``source`` is set the returned vectors are the length of the shortest
+/// path from ``source`` to every node (``inf`` for unreachable nodes) and
+/// the predecessor of every node on that path (``-1`` for ``source`` and
+/// unreachable nodes), indexed by node index. If ``source`` isn't set every
+/// node starts at ``0``, as if there was an extra node with an edge of
+/// weight ``0`` to every node, which gives the potentials used by Johnson's
+/// algorithm. Edge weights may be negative. Returns ``None`` if there is a
+/// negative cycle reachable from ``source`` (or anywhere in the graph if
+/// ``source`` isn't set).
+pub fn bellman_ford(
+    rows: &[&Adjacency],
+    weights: &[f64],
+    node_bound: usize,
+    source: Option<usize>,
+) -> Option<(Vec<f64>, Vec<i64>)> {
+    let mut dist: Vec<f64> = match source {
+        Some(source) => {
+            let mut dist = vec![std::f64::INFINITY; node_bound];
+            dist[source] = 0.0;
+            dist
+        }
+        None => vec![0.0; node_bound],
+    };
+    let mut pred: Vec<i64> = vec![-1; node_bound];
+    // Without a negative cycle every shortest path has fewer edges than
+    // there are nodes, so a round without any change is reached within
+    // node_bound + 1 rounds.
+    for _ in 0..=node_bound {
+        let mut changed = false;
+        for node in 0..node_bound {
+            let score = dist[node];
+            if score == std::f64::INFINITY {
+                continue;
+            }
+            for adj in rows {
+                for (next, edge) in
+                    adj.row(node).iter().zip(adj.row_edges(node))
+                {
+                    let next_score = score + weights[*edge];
+                    if next_score < dist[*next] {
+                        dist[*next] = next_score;
+                        pred[*next] = node as i64;
+                        changed = true;
+                    }
+                }
+            }
+        }
+        if !changed {
+            return Some((dist, pred));
+        }
+    }
+    None
+}
+
+/// Compute the lengths of the shortest paths between all pairs of
+/// ``nodes`` with Johnson's algorithm. The edge weights are reweighted once
+/// to be non-negative with the potentials from ``bellman_ford()`` and then
+/// ``all_pairs_dijkstra_lengths()`` is run on the new weights.
+///
+/// Every edge must appear in only one direction in ``rows`` (so this can't
+/// be used for an undirected graph, where any negative edge is a negative
+/// cycle). Returns ``None`` if there is a negative cycle.
+pub fn johnson_all_pairs_lengths(
+    rows: &[&Adjacency],
+    mut weights: Vec<f64>,
+    node_bound: usize,
+    nodes: &[usize],
+    parallel_threshold: usize,
+) -> Option<Array2<f64>> {
+    let (potential, _) = bellman_ford(rows, &weights, node_bound, None)?;
+    for node in 0..node_bound {
+        for adj in rows {
+            for (next, edge) in adj.row(node).iter().zip(adj.row_edges(node)) {
+                // Clamp the rounding error of the reweighting to keep
+                // Dijkstra's algorithm correct
+                weights[*edge] = (weights[*edge] + potential[node]
+                    - potential[*next])
+                    .max(0.0);
+            }
+        }
+    }
+    let mut matrix = all_pairs_dijkstra_lengths(
+        rows,
+        &weights,
+        node_bound,
+        nodes,
+        nodes,
+        None,
+        parallel_threshold,
+    );
+    for ((i, j), length) in matrix.indexed_iter_mut() {
+        *length += potential[nodes[j]] - potential[nodes[i]];
+    }
+    Some(matrix)
+}
@@ -0,0 +1,268 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use std::collections::VecDeque;
+
+use hashbrown::HashSet;
+
+use pyo3::prelude::*;
+
+use petgraph::algo;
+use petgraph::graph::NodeIndex;
+use petgraph::stable_graph::StableDiGraph;
+use petgraph::Direction::{Incoming, Outgoing};
+
+use super::memory::{vec_bytes, vec_deque_bytes};
+
+/// A dynamic topological order of a DAG maintained with the Pearce-Kelly
+/// algorithm.
+///
+/// Every node that has an edge is assigned a position key and the keys of
+/// the endpoints of every edge are kept increasing from source to target.
+/// Adding an edge that already agrees with the order is O(1); otherwise only
+/// the nodes whose keys lie between the two endpoints are visited and
+/// reordered. Nodes are stored in a deque so that a new parent node can be
+/// placed in front of every other node without disturbing them. Removed
+/// nodes leave a hole in the deque which is compacted away once holes make
+/// up half of it.
+#[derive(Clone, Default)]
+pub struct TopoOrder {
+    // The node at each position, offset by ``start``
+    order: VecDeque<Option<NodeIndex>>,
+    // The position key of each node, indexed by node index
+    position: Vec<Option<isize>>,
+    // The position key of the front of ``order``
+    start: isize,
+    holes: usize,
+}
+
+impl TopoOrder {
+    /// Build an order for every node of ``graph``, returning ``None`` if the
+    /// graph has a cycle.
+    pub fn from_graph(
+        graph: &StableDiGraph<PyObject, PyObject>,
+    ) -> Option<Self> {
+        let nodes = algo::toposort(graph, None).ok()?;
+        let mut out = TopoOrder {
+            order: VecDeque::with_capacity(nodes.len()),
+            position: vec![None; graph.node_bound()],
+            start: 0,
+            holes: 0,
+        };
+        for node in nodes {
+            out.push_back(node);
+        }
+        Some(out)
+    }
+
+    fn slot(&self, node: NodeIndex) -> Option<usize> {
+        let position = (*self.position.get(node.index())?)?;
+        if position < self.start {
+            return None;
+        }
+        let slot = (position - self.start) as usize;
+        match self.order.get(slot) {
+            Some(Some(slot_node)) if *slot_node == node => Some(slot),
+            _ => None,
+        }
+    }
+
+    fn set_position(&mut self, node: NodeIndex, position: isize) {
+        let index = node.index();
+        if index >= self.position.len() {
+            self.position.resize(index + 1, None);
+        }
+        self.position[index] = Some(position);
+    }
+
+    /// The position key of ``node``, or ``None`` if it isn't in the order.
+    fn key(&self, node: NodeIndex) -> Option<isize> {
+        self.position.get(node.index()).cloned().flatten()
+    }
+
+    /// Place ``node`` after every other node in the order.
+    pub fn push_back(&mut self, node: NodeIndex) {
+        self.remove(node);
+        let position = self.start + self.order.len() as isize;
+        self.order.push_back(Some(node));
+        self.set_position(node, position);
+    }
+
+    /// Place ``node`` before every other node in the order.
+    pub fn push_front(&mut self, node: NodeIndex) {
+        self.remove(node);
+        self.start -= 1;
+        self.order.push_front(Some(node));
+        self.set_position(node, self.start);
+    }
+
+    /// Add ``node`` to the end of the order if it isn't in it already,
+    /// returning its position key.
+    pub fn ensure(&mut self, node: NodeIndex) -> isize {
+        match self.slot(node) {
+            Some(slot) => self.start + slot as isize,
+            None => {
+                self.push_back(node);
+                self.start + self.order.len() as isize - 1
+            }
+        }
+    }
+
+    /// Remove ``node`` from the order.
+    pub fn remove(&mut self, node: NodeIndex) {
+        if let Some(slot) = self.slot(node) {
+            self.order[slot] = None;
+            self.position[node.index()] = None;
+            self.holes += 1;
+            if self.holes * 2 > self.order.len() {
+                self.compact();
+            }
+        }
+    }
+
+    fn compact(&mut self) {
+        let nodes: Vec<NodeIndex> = self.order.drain(..).flatten().collect();
+        self.start = 0;
+        self.holes = 0;
+        for (position, node) in nodes.iter().enumerate() {
+            self.position[node.index()] = Some(position as isize);
+        }
+        self.order.extend(nodes.into_iter().map(Some));
+    }
+
+    /// Give ``new`` the position of whichever of ``nodes`` is first in the
+    /// order, removing that node from the order. Used when ``nodes`` are
+    /// contracted into ``new`` so that only the edges that disagree with the
+    /// position need reordering. If none of ``nodes`` is in the order this
+    /// has no effect.
+    pub fn replace_first(&mut self, nodes: &[NodeIndex], new: NodeIndex) {
+        let first = nodes
+            .iter()
+            .filter_map(|node| self.slot(*node).map(|slot| (slot, *node)))
+            .min();
+        let old = match first {
+            Some((_, old)) if old != new => old,
+            _ => return,
+        };
+        // Removing ``new`` may compact the order and move every node, so
+        // the slot of ``old`` is only looked up after it
+        self.remove(new);
+        if let Some(slot) = self.slot(old) {
+            self.order[slot] = Some(new);
+            self.position[old.index()] = None;
+            self.set_position(new, self.start + slot as isize);
+        }
+    }
+
+    /// Update the order for a new edge ``source -> target`` that is about to
+    /// be added to ``graph``.
+    ///
+    /// Returns ``false`` and leaves the order unchanged if the edge would
+    /// introduce a cycle.
+    pub fn add_edge(
+        &mut self,
+        graph: &StableDiGraph<PyObject, PyObject>,
+        source: NodeIndex,
+        target: NodeIndex,
+    ) -> bool {
+        if source == target {
+            return false;
+        }
+        // Neither call moves the nodes already in the order
+        let upper = self.ensure(source);
+        let lower = self.ensure(target);
+        if upper < lower {
+            return true;
+        }
+        // Discover the nodes reachable from target that are currently
+        // ordered before source. Reaching source means there is a cycle.
+        let mut forward: Vec<NodeIndex> = Vec::new();
+        let mut seen: HashSet<NodeIndex> = HashSet::new();
+        let mut stack: Vec<NodeIndex> = vec![target];
+        seen.insert(target);
+        while let Some(node) = stack.pop() {
+            forward.push(node);
+            for child in graph.neighbors_directed(node, Outgoing) {
+                if child == source {
+                    return false;
+                }
+                if self.key(child).map_or(false, |key| key < upper)
+                    && seen.insert(child)
+                {
+                    stack.push(child);
+                }
+            }
+        }
+        // Discover the nodes that reach source and are currently ordered
+        // after target.
+        let mut backward: Vec<NodeIndex> = Vec::new();
+        stack.push(source);
+        seen.insert(source);
+        while let Some(node) = stack.pop() {
+            backward.push(node);
+            for parent in graph.neighbors_directed(node, Incoming) {
+                if self.key(parent).map_or(false, |key| key > lower)
+                    && seen.insert(parent)
+                {
+                    stack.push(parent);
+                }
+            }
+        }
+        // Reuse the position keys of the affected nodes, giving the
+        // ancestors of source the lowest ones.
+        forward.sort_unstable_by_key(|node| self.key(*node));
+        backward.sort_unstable_by_key(|node| self.key(*node));
+        let mut keys: Vec<isize> = backward
+            .iter()
+            .chain(forward.iter())
+            .filter_map(|node| self.key(*node))
+            .collect();
+        keys.sort_unstable();
+        for (node, key) in backward.into_iter().chain(forward).zip(keys) {
+            self.order[(key - self.start) as usize] = Some(node);
+            self.position[node.index()] = Some(key);
+        }
+        true
+    }
+
+    /// The bytes allocated for the order.
+    pub fn heap_bytes(&self) -> usize {
+        vec_deque_bytes(&self.order) + vec_bytes(&self.position)
+    }
+
+    /// Return every node of ``graph`` in topological order.
+    ///
+    /// Nodes that were never added to the order have no edges and are
+    /// returned at the end.
+    pub fn nodes(
+        &self,
+        graph: &StableDiGraph<PyObject, PyObject>,
+    ) -> Vec<usize> {
+        let mut out: Vec<usize> = Vec::with_capacity(graph.node_count());
+        out.extend(
+            self.order
+                .iter()
+                .flatten()
+                .filter(|node| graph.contains_node(**node))
+                .map(|node| node.index()),
+        );
+        if out.len() < graph.node_count() {
+            out.extend(
+                graph
+                    .node_indices()
+                    .filter(|node| self.slot(*node).is_none())
+                    .map(|node| node.index()),
+            );
+        }
+        out
+    }
+}
@@ -11,8 +11,8 @@
 // under the License.
 
 use crate::digraph::PyDiGraph;
+use crate::topo_order::TopoOrder;
 use hashbrown::{HashMap, HashSet};
-use petgraph::algo;
 use petgraph::graph::EdgeIndex;
 use pyo3::prelude::*;
 use pyo3::Python;
@@ -23,7 +23,8 @@ use std::cmp::Ordering;
 /// The algorithm has three phases:
 ///  - adds all nodes from `b` to `a`. operates in O(n), n being number of nodes in `b`.
 ///  - merges nodes from `b` over `a` given that:
-///     - `merge_nodes` is `true`. operates in O(n^2), n being number of nodes in `b`.
+///     - `merge_nodes` is `true`. operates in O(n^2), n being number of nodes in `b`,
+///       or in expected O(n) if `a` has a payload index.
 ///     - respective node in`b` and `a` share the same weight
 ///  - adds all edges from `b` to `a`.
 ///     - `merge_edges` is `true`
@@ -45,10 +46,13 @@ pub fn digraph_union(
     let second = &b.graph;
     let mut combined = PyDiGraph {
         graph: first.clone(),
-        cycle_state: algo::DfsSpace::default(),
+        topo_order: TopoOrder::default(),
         check_cycle: false,
         node_removed: false,
+        generation: 0,
         multigraph: true,
+        edge_map: None,
+        payload_index: None,
     };
     let mut node_map = HashMap::with_capacity(second.node_count());
     let mut edge_map = HashSet::with_capacity(second.edge_count());
@@ -59,7 +63,7 @@ pub fn digraph_union(
     };
 
     for node in second.node_indices() {
-        let node_index = combined.add_node(second[node].clone_ref(py))?;
+        let node_index = combined.add_node(py, second[node].clone_ref(py))?;
         node_map.insert(node.index(), node_index);
     }
 
@@ -90,7 +94,7 @@ pub fn digraph_union(
     if merge_nodes {
         for node in second.node_indices() {
             let weight = &second[node].clone_ref(py);
-            let index = a.find_node_by_weight(py, weight.clone_ref(py));
+            let index = a.find_node_by_weight(py, weight.clone_ref(py))?;
 
             if index.is_some() {
                 let other_node = node_map.get(&node.index());
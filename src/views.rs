@@ -0,0 +1,592 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+// Live views of the nodes, edges and neighbors of a graph. Unlike the
+// methods returning lists or dictionaries these don't copy anything when they
+// are created, every operation is answered from the graph when it is used.
+
+use pyo3::class::iter::{IterNextOutput, PyIterProtocol};
+use pyo3::class::{PyMappingProtocol, PySequenceProtocol};
+use pyo3::exceptions::{PyIndexError, PyKeyError, PyRuntimeError};
+use pyo3::gc::{PyGCProtocol, PyVisit};
+use pyo3::prelude::*;
+use pyo3::PyTraverseError;
+
+use fixedbitset::FixedBitSet;
+
+use petgraph::graph::{DefaultIx, EdgeIndex, NodeIndex};
+use petgraph::stable_graph::{StableGraph, WalkNeighbors};
+use petgraph::visit::NodeIndexable;
+use petgraph::{Direction, EdgeType};
+
+use super::digraph::PyDiGraph;
+use super::graph::PyGraph;
+
+/// The graph a view refers to.
+#[derive(Clone)]
+pub enum ViewGraph {
+    Directed(Py<PyDiGraph>),
+    Undirected(Py<PyGraph>),
+}
+
+// Borrow the graph of a view as ``$graph`` and evaluate ``$body`` with it.
+// Both graph classes have the same ``graph`` field and Rust side methods so
+// the body is the same code for either.
+macro_rules! with_graph {
+    ($py:expr, $source:expr, |$graph:ident| $body:expr) => {
+        match $source {
+            ViewGraph::Directed(graph) => {
+                let $graph = graph.borrow($py);
+                $body
+            }
+            ViewGraph::Undirected(graph) => {
+                let $graph = graph.borrow($py);
+                $body
+            }
+        }
+    };
+}
+
+impl ViewGraph {
+    fn traverse(&self, visit: &PyVisit) -> Result<(), PyTraverseError> {
+        match self {
+            ViewGraph::Directed(graph) => visit.call(graph),
+            ViewGraph::Undirected(graph) => visit.call(graph),
+        }
+    }
+}
+
+fn changed_size() -> PyErr {
+    PyRuntimeError::new_err("graph changed size during iteration")
+}
+
+/// A live view of the nodes of a graph
+///
+/// This class is returned by :meth:`retworkx.PyDiGraph.node_view` and
+/// :meth:`retworkx.PyGraph.node_view`. It is a read-only mapping from node
+/// index to node weight/data payload that reflects the current state of the
+/// graph. Creating the view, checking its length or whether it contains a
+/// node and looking up a payload don't copy the nodes of the graph, and
+/// iterating over it yields the node indices one at a time.
+///
+/// For example::
+///
+///     import retworkx
+///
+///     graph = retworkx.generators.directed_path_graph(5)
+///     nodes = graph.node_view()
+///     print(len(nodes))
+///     print(3 in nodes)
+///     for index in nodes:
+///         print(index, nodes[index])
+///
+#[pyclass(module = "retworkx", gc)]
+pub struct NodeView {
+    pub graph: ViewGraph,
+}
+
+#[pyproto]
+impl PyMappingProtocol for NodeView {
+    fn __len__(&self) -> PyResult<usize> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        Ok(with_graph!(py, &self.graph, |graph| graph
+            .graph
+            .node_count()))
+    }
+
+    fn __getitem__(&'p self, idx: usize) -> PyResult<PyObject> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        with_graph!(py, &self.graph, |graph| {
+            match graph.graph.node_weight(NodeIndex::new(idx)) {
+                Some(data) => Ok(data.clone_ref(py)),
+                None => Err(PyIndexError::new_err("No node found for index")),
+            }
+        })
+    }
+}
+
+#[pyproto]
+impl PySequenceProtocol for NodeView {
+    fn __contains__(&self, idx: usize) -> PyResult<bool> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        Ok(with_graph!(py, &self.graph, |graph| graph
+            .graph
+            .contains_node(NodeIndex::new(idx))))
+    }
+}
+
+#[pyproto]
+impl PyIterProtocol for NodeView {
+    fn __iter__(slf: PyRef<Self>) -> NodeViewIter {
+        let py = slf.py();
+        let (count, bound) = with_graph!(py, &slf.graph, |graph| (
+            graph.graph.node_count(),
+            graph.graph.node_bound()
+        ));
+        NodeViewIter {
+            graph: slf.graph.clone(),
+            iter_pos: 0,
+            count,
+            remaining: count,
+            bound,
+        }
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for NodeView {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        self.graph.traverse(&visit)
+    }
+
+    fn __clear__(&mut self) {}
+}
+
+#[pyclass(module = "retworkx", gc)]
+pub struct NodeViewIter {
+    graph: ViewGraph,
+    iter_pos: usize,
+    count: usize,
+    remaining: usize,
+    bound: usize,
+}
+
+#[pyproto]
+impl PyIterProtocol for NodeViewIter {
+    fn __iter__(slf: PyRef<Self>) -> Py<NodeViewIter> {
+        slf.into()
+    }
+
+    fn __next__(
+        mut slf: PyRefMut<Self>,
+    ) -> PyResult<IterNextOutput<usize, &'static str>> {
+        let py = slf.py();
+        let graph = slf.graph.clone();
+        with_graph!(py, &graph, |graph| {
+            if graph.graph.node_count() != slf.count {
+                return Err(changed_size());
+            }
+            if slf.remaining == 0 {
+                return Ok(IterNextOutput::Return("Ended"));
+            }
+            while slf.iter_pos < slf.bound {
+                let index = slf.iter_pos;
+                slf.iter_pos += 1;
+                if graph.graph.contains_node(NodeIndex::new(index)) {
+                    slf.remaining -= 1;
+                    return Ok(IterNextOutput::Yield(index));
+                }
+            }
+            Err(changed_size())
+        })
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for NodeViewIter {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        self.graph.traverse(&visit)
+    }
+
+    fn __clear__(&mut self) {}
+}
+
+/// A live view of the edges of a graph
+///
+/// This class is returned by :meth:`retworkx.PyDiGraph.edge_view` and
+/// :meth:`retworkx.PyGraph.edge_view`. It is a read-only mapping from
+/// ``(source, target)`` node index pairs to the edge weight/data payload of
+/// the edge between them that reflects the current state of the graph.
+/// Checking its length or whether it contains an edge and looking up a
+/// payload don't copy the edges of the graph, and iterating over it yields
+/// the ``(source, target)`` tuples of the edges one at a time. For an
+/// undirected graph an edge can be looked up with its endpoints in either
+/// order. In a multigraph looking up a pair of nodes with parallel edges
+/// returns the payload of one of them.
+///
+/// For example::
+///
+///     import retworkx
+///
+///     graph = retworkx.generators.directed_path_graph(5)
+///     edges = graph.edge_view()
+///     print(len(edges))
+///     print((0, 1) in edges)
+///     for source, target in edges:
+///         print(source, target, edges[source, target])
+///
+#[pyclass(module = "retworkx", gc)]
+pub struct EdgeView {
+    pub graph: ViewGraph,
+}
+
+#[pyproto]
+impl PyMappingProtocol for EdgeView {
+    fn __len__(&self) -> PyResult<usize> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        Ok(with_graph!(py, &self.graph, |graph| graph
+            .graph
+            .edge_count()))
+    }
+
+    fn __getitem__(&'p self, key: (usize, usize)) -> PyResult<PyObject> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        with_graph!(py, &self.graph, |graph| {
+            match graph._find_edge(NodeIndex::new(key.0), NodeIndex::new(key.1))
+            {
+                Some(edge) => Ok(graph.graph[edge].clone_ref(py)),
+                None => Err(PyKeyError::new_err(format!(
+                    "No edge between nodes {} and {}",
+                    key.0, key.1
+                ))),
+            }
+        })
+    }
+}
+
+#[pyproto]
+impl PySequenceProtocol for EdgeView {
+    fn __contains__(&self, key: (usize, usize)) -> PyResult<bool> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        Ok(with_graph!(py, &self.graph, |graph| graph
+            ._find_edge(NodeIndex::new(key.0), NodeIndex::new(key.1))
+            .is_some()))
+    }
+}
+
+#[pyproto]
+impl PyIterProtocol for EdgeView {
+    fn __iter__(slf: PyRef<Self>) -> EdgeViewIter {
+        let py = slf.py();
+        let (count, bound) = with_graph!(py, &slf.graph, |graph| (
+            graph.graph.edge_count(),
+            graph
+                .graph
+                .edge_indices()
+                .last()
+                .map_or(0, |edge| edge.index() + 1)
+        ));
+        EdgeViewIter {
+            graph: slf.graph.clone(),
+            iter_pos: 0,
+            count,
+            remaining: count,
+            bound,
+        }
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for EdgeView {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        self.graph.traverse(&visit)
+    }
+
+    fn __clear__(&mut self) {}
+}
+
+#[pyclass(module = "retworkx", gc)]
+pub struct EdgeViewIter {
+    graph: ViewGraph,
+    iter_pos: usize,
+    count: usize,
+    remaining: usize,
+    bound: usize,
+}
+
+#[pyproto]
+impl PyIterProtocol for EdgeViewIter {
+    fn __iter__(slf: PyRef<Self>) -> Py<EdgeViewIter> {
+        slf.into()
+    }
+
+    fn __next__(
+        mut slf: PyRefMut<Self>,
+    ) -> PyResult<IterNextOutput<(usize, usize), &'static str>> {
+        let py = slf.py();
+        let graph = slf.graph.clone();
+        with_graph!(py, &graph, |graph| {
+            if graph.graph.edge_count() != slf.count {
+                return Err(changed_size());
+            }
+            if slf.remaining == 0 {
+                return Ok(IterNextOutput::Return("Ended"));
+            }
+            while slf.iter_pos < slf.bound {
+                let index = slf.iter_pos;
+                slf.iter_pos += 1;
+                if let Some((source, target)) =
+                    graph.graph.edge_endpoints(EdgeIndex::new(index))
+                {
+                    slf.remaining -= 1;
+                    return Ok(IterNextOutput::Yield((
+                        source.index(),
+                        target.index(),
+                    )));
+                }
+            }
+            Err(changed_size())
+        })
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for EdgeViewIter {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        self.graph.traverse(&visit)
+    }
+
+    fn __clear__(&mut self) {}
+}
+
+/// A live view of the neighbors of a node
+///
+/// This class is returned by :meth:`retworkx.PyDiGraph.adj_view` and
+/// :meth:`retworkx.PyGraph.adj_view`. It is a read-only mapping from the
+/// node index of each neighbor of a node to the edge weight/data payload of
+/// the edge between them that reflects the current state of the graph. In
+/// the case of a multigraph only one edge will be used, not all of the
+/// edges between two nodes. Checking whether a node is a neighbor and
+/// looking up the payload of an edge don't copy the neighbors of the node,
+/// and for a graph that isn't a multigraph they don't scan them either.
+///
+/// For example::
+///
+///     import retworkx
+///
+///     graph = retworkx.generators.directed_path_graph(5)
+///     successors = graph.adj_view(2, False)
+///     print(3 in successors)
+///     for neighbor in successors:
+///         print(neighbor, successors[neighbor])
+///
+#[pyclass(module = "retworkx", gc)]
+pub struct AdjView {
+    pub graph: ViewGraph,
+    pub node: NodeIndex,
+    // ``None`` for both directions of a directed graph
+    pub direction: Option<Direction>,
+}
+
+impl AdjView {
+    fn find_edge(&self, py: Python, neighbor: usize) -> Option<EdgeIndex> {
+        let node = self.node;
+        let neighbor = NodeIndex::new(neighbor);
+        with_graph!(py, &self.graph, |graph| match self.direction {
+            Some(Direction::Outgoing) => graph._find_edge(node, neighbor),
+            Some(Direction::Incoming) => graph._find_edge(neighbor, node),
+            None => graph
+                ._find_edge(node, neighbor)
+                .or_else(|| graph._find_edge(neighbor, node)),
+        })
+    }
+}
+
+/// A position in the walk over the distinct neighbors of a node.
+///
+/// This follows the edge lists of the node in the graph with petgraph's
+/// detached ``WalkNeighbors`` cursors, so it doesn't copy them. When both
+/// directions of a directed graph are walked the outgoing edges come first.
+/// If a neighbor can be reached by more than one edge, which is the case in
+/// a multigraph or when walking both directions, the neighbors already
+/// found are marked in a bitset so each one is only yielded once.
+#[derive(Clone)]
+struct AdjWalk {
+    walk: WalkNeighbors<DefaultIx>,
+    /// The incoming edges to walk once the outgoing ones are done
+    incoming: Option<WalkNeighbors<DefaultIx>>,
+    seen: Option<FixedBitSet>,
+}
+
+impl AdjWalk {
+    fn new<Ty: EdgeType>(
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+        node: NodeIndex,
+        direction: Option<Direction>,
+        multigraph: bool,
+    ) -> Self {
+        let (walk, incoming) = match direction {
+            Some(dir) => (graph.neighbors_directed(node, dir).detach(), None),
+            None => (
+                graph.neighbors_directed(node, Direction::Outgoing).detach(),
+                Some(
+                    graph
+                        .neighbors_directed(node, Direction::Incoming)
+                        .detach(),
+                ),
+            ),
+        };
+        let seen = if multigraph || incoming.is_some() {
+            Some(FixedBitSet::with_capacity(graph.node_bound()))
+        } else {
+            None
+        };
+        AdjWalk {
+            walk,
+            incoming,
+            seen,
+        }
+    }
+
+    /// Advance to the next neighbor.
+    fn next<Ty: EdgeType>(
+        &mut self,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+    ) -> Option<NodeIndex> {
+        loop {
+            let neighbor = match self.walk.next(graph) {
+                Some((_, neighbor)) => neighbor,
+                None => {
+                    self.walk = self.incoming.take()?;
+                    continue;
+                }
+            };
+            if let Some(seen) = &mut self.seen {
+                if seen.put(neighbor.index()) {
+                    continue;
+                }
+            }
+            return Some(neighbor);
+        }
+    }
+}
+
+#[pyproto]
+impl PyMappingProtocol for AdjView {
+    fn __len__(&self) -> PyResult<usize> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        let node = self.node;
+        let direction = self.direction;
+        Ok(with_graph!(py, &self.graph, |graph| match direction {
+            // Without parallel edges every edge is to a different neighbor
+            Some(dir) if !graph.multigraph => {
+                graph.graph.edges_directed(node, dir).count()
+            }
+            _ => {
+                let mut walk = AdjWalk::new(
+                    &graph.graph,
+                    node,
+                    direction,
+                    graph.multigraph,
+                );
+                let mut count: usize = 0;
+                while walk.next(&graph.graph).is_some() {
+                    count += 1;
+                }
+                count
+            }
+        }))
+    }
+
+    fn __getitem__(&'p self, idx: usize) -> PyResult<PyObject> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        match self.find_edge(py, idx) {
+            Some(edge) => Ok(with_graph!(py, &self.graph, |graph| graph.graph
+                [edge]
+                .clone_ref(py))),
+            None => Err(PyKeyError::new_err(format!(
+                "Node {} is not a neighbor of node {}",
+                idx,
+                self.node.index()
+            ))),
+        }
+    }
+}
+
+#[pyproto]
+impl PySequenceProtocol for AdjView {
+    fn __contains__(&self, idx: usize) -> PyResult<bool> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        Ok(self.find_edge(py, idx).is_some())
+    }
+}
+
+#[pyproto]
+impl PyIterProtocol for AdjView {
+    fn __iter__(slf: PyRef<Self>) -> AdjViewIter {
+        let py = slf.py();
+        let (walk, generation) = with_graph!(py, &slf.graph, |graph| (
+            AdjWalk::new(
+                &graph.graph,
+                slf.node,
+                slf.direction,
+                graph.multigraph
+            ),
+            graph.generation
+        ));
+        AdjViewIter {
+            graph: slf.graph.clone(),
+            walk,
+            generation,
+        }
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for AdjView {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        self.graph.traverse(&visit)
+    }
+
+    fn __clear__(&mut self) {}
+}
+
+#[pyclass(module = "retworkx", gc)]
+pub struct AdjViewIter {
+    graph: ViewGraph,
+    walk: AdjWalk,
+    generation: u64,
+}
+
+#[pyproto]
+impl PyIterProtocol for AdjViewIter {
+    fn __iter__(slf: PyRef<Self>) -> Py<AdjViewIter> {
+        slf.into()
+    }
+
+    fn __next__(
+        mut slf: PyRefMut<Self>,
+    ) -> PyResult<IterNextOutput<usize, &'static str>> {
+        let py = slf.py();
+        let graph = slf.graph.clone();
+        with_graph!(py, &graph, |graph| {
+            // The cursor follows the edge lists of the graph, which are
+            // relinked when nodes or edges are added or removed, even if the
+            // number of them ends up the same
+            if graph.generation != slf.generation {
+                return Err(changed_size());
+            }
+            match slf.walk.next(&graph.graph) {
+                Some(neighbor) => Ok(IterNextOutput::Yield(neighbor.index())),
+                None => Ok(IterNextOutput::Return("Ended")),
+            }
+        })
+    }
+}
+
+#[pyproto]
+impl PyGCProtocol for AdjViewIter {
+    fn __traverse__(&self, visit: PyVisit) -> Result<(), PyTraverseError> {
+        self.graph.traverse(&visit)
+    }
+
+    fn __clear__(&mut self) {}
+}
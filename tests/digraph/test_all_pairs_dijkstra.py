@@ -0,0 +1,193 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestAllPairsDijkstraDiGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(list(range(6)))
+        self.graph.add_edges_from(
+            [
+                (0, 1, 7),
+                (2, 0, 9),
+                (0, 3, 14),
+                (1, 2, 10),
+                (3, 2, 2),
+                (3, 4, 9),
+                (1, 5, 15),
+                (2, 5, 11),
+                (4, 5, 6),
+            ]
+        )
+
+    def test_all_pairs(self):
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float
+        )
+        self.assertEqual(np.float64, res.dtype)
+        self.assertEqual((6, 6), res.shape)
+        expected = retworkx.digraph_floyd_warshall_numpy(
+            self.graph, weight_fn=float
+        )
+        np.testing.assert_array_equal(expected, res)
+
+    def test_matches_dijkstra_shortest_path_lengths(self):
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float
+        )
+        for source in self.graph.node_indexes():
+            lengths = retworkx.digraph_dijkstra_shortest_path_lengths(
+                self.graph, source, float
+            )
+            for target in self.graph.node_indexes():
+                if source == target:
+                    self.assertEqual(0.0, res[source, target])
+                elif target in lengths:
+                    self.assertEqual(lengths[target], res[source, target])
+                else:
+                    self.assertEqual(np.inf, res[source, target])
+
+    def test_sources_and_targets(self):
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float, sources=[0, 4], targets=[5, 2, 0]
+        )
+        expected = np.array([[22.0, 16.0, 0.0], [6.0, np.inf, np.inf]])
+        np.testing.assert_array_equal(expected, res)
+
+    def test_default_weight(self):
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, sources=[0], default_weight=2.0
+        )
+        expected = np.array([[0.0, 2.0, 4.0, 2.0, 4.0, 4.0]])
+        np.testing.assert_array_equal(expected, res)
+
+    def test_as_undirected(self):
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float, sources=[5], as_undirected=True
+        )
+        expected = np.array([[20.0, 15.0, 11.0, 13.0, 6.0, 0.0]])
+        np.testing.assert_array_equal(expected, res)
+
+    def test_removed_node(self):
+        self.graph.remove_node(3)
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float
+        )
+        self.assertEqual((5, 5), res.shape)
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float, sources=[0], targets=[4, 5]
+        )
+        np.testing.assert_array_equal(np.array([[np.inf, 22.0]]), res)
+
+    def test_parallel(self):
+        graph = retworkx.generators.directed_grid_graph(20, 20)
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            graph, parallel_threshold=1
+        )
+        expected = retworkx.digraph_floyd_warshall_numpy(graph)
+        np.testing.assert_array_equal(expected, res)
+
+    def test_invalid_node(self):
+        with self.assertRaises(IndexError):
+            retworkx.digraph_all_pairs_dijkstra_path_lengths(
+                self.graph, float, sources=[42]
+            )
+        with self.assertRaises(IndexError):
+            retworkx.digraph_all_pairs_dijkstra_path_lengths(
+                self.graph, float, targets=[42]
+            )
+
+    def test_negative_weight(self):
+        self.graph.add_edge(5, 0, -1)
+        with self.assertRaises(ValueError):
+            retworkx.digraph_all_pairs_dijkstra_path_lengths(self.graph, float)
+
+    def test_nan_weight(self):
+        with self.assertRaises(ValueError):
+            retworkx.digraph_all_pairs_dijkstra_path_lengths(
+                self.graph, lambda _: float("nan")
+            )
+
+    def test_weight_fn_error(self):
+        def weight_fn(_):
+            raise KeyError
+
+        with self.assertRaises(KeyError):
+            retworkx.digraph_all_pairs_dijkstra_path_lengths(
+                self.graph, weight_fn
+            )
+
+    def test_empty_graph(self):
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            retworkx.PyDiGraph()
+        )
+        self.assertEqual((0, 0), res.shape)
+
+    def test_cutoff(self):
+        res = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float, cutoff=16
+        )
+        expected = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float
+        )
+        expected[expected > 16] = np.inf
+        np.testing.assert_array_equal(expected, res)
+        np.testing.assert_array_equal(
+            [0.0, 7.0, 16.0, 14.0, np.inf, np.inf], res[0]
+        )
+
+    def test_sparse(self):
+        expected = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            self.graph, float, cutoff=20
+        )
+        for parallel_threshold in (300, 0):
+            indptr, indices, data = (
+                retworkx.digraph_all_pairs_dijkstra_path_lengths(
+                    self.graph,
+                    float,
+                    cutoff=20,
+                    sparse=True,
+                    parallel_threshold=parallel_threshold,
+                )
+            )
+            self.assertEqual(np.int64, indptr.dtype)
+            self.assertEqual(np.int64, indices.dtype)
+            self.assertEqual(np.float64, data.dtype)
+            self.assertEqual(7, len(indptr))
+            res = np.full((6, 6), np.inf)
+            np.fill_diagonal(res, 0.0)
+            for row in range(6):
+                columns = indices[indptr[row] : indptr[row + 1]]
+                self.assertEqual(sorted(columns), list(columns))
+                self.assertNotIn(row, columns)
+                res[row, columns] = data[indptr[row] : indptr[row + 1]]
+            np.testing.assert_array_equal(expected, res)
+
+    def test_sparse_sources_targets(self):
+        indptr, indices, data = (
+            retworkx.digraph_all_pairs_dijkstra_path_lengths(
+                self.graph,
+                float,
+                sources=[0, 4],
+                targets=[5, 0, 2, 5],
+                sparse=True,
+            )
+        )
+        np.testing.assert_array_equal([0, 3, 5], indptr)
+        np.testing.assert_array_equal([0, 2, 3, 0, 3], indices)
+        np.testing.assert_array_equal([22.0, 16.0, 22.0, 6.0, 6.0], data)
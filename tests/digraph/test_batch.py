@@ -0,0 +1,101 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestBatch(unittest.TestCase):
+    def test_batch(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        with dag.batch() as graph:
+            self.assertIs(dag, graph)
+            dag.add_nodes_from(range(100))
+            dag.add_edges_from_no_data([(i, i + 1) for i in range(99)])
+        self.assertTrue(dag.check_cycle)
+        self.assertEqual(99, len(dag.edge_list()))
+        self.assertEqual(list(range(100)), retworkx.topological_sort(dag))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(99, 0, None)
+
+    def test_check_cycle_suspended(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(3))
+        with dag.batch():
+            self.assertFalse(dag.check_cycle)
+            # A temporary cycle is fine as long as it is gone at the end
+            dag.add_edges_from_no_data([(0, 1), (1, 2), (2, 0)])
+            dag.remove_edge(2, 0)
+        self.assertTrue(dag.check_cycle)
+        self.assertEqual([(0, 1), (1, 2)], dag.edge_list())
+
+    def test_cycle_rolls_back(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(["a", "b"])
+        dag.add_edge(0, 1, None)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            with dag.batch():
+                dag.add_node("c")
+                dag.remove_node(0)
+                dag.extend_from_edge_list([(1, 2), (2, 1)])
+        self.assertTrue(dag.check_cycle)
+        self.assertEqual(["a", "b"], dag.nodes())
+        self.assertEqual([(0, 1)], dag.edge_list())
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(1, 0, None)
+
+    def test_exception_rolls_back(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_node("a")
+        with self.assertRaises(KeyError):
+            with graph.batch():
+                graph.add_node("b")
+                raise KeyError("b")
+        self.assertEqual(["a"], graph.nodes())
+
+    def test_without_check_cycle(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(2))
+        with graph.batch():
+            graph.add_edges_from_no_data([(0, 1), (1, 0)])
+        self.assertFalse(graph.check_cycle)
+        self.assertEqual(2, len(graph.edge_list()))
+
+    def test_insert_node_on_in_edges_multiple(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(3))
+        dag.add_edges_from_no_data([(0, 2), (1, 2)])
+        with dag.batch():
+            node = dag.add_node(3)
+            dag.insert_node_on_in_edges_multiple(node, [2])
+        self.assertEqual({(0, 3), (1, 3), (3, 2)}, set(dag.edge_list()))
+
+    def test_nested(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(3))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            with dag.batch():
+                dag.add_edge(0, 1, None)
+                with dag.batch():
+                    dag.add_edge(1, 0, None)
+        self.assertEqual([], dag.edge_list())
+
+    def test_reenter_active_batch(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        batch = dag.batch()
+        with batch:
+            with self.assertRaises(RuntimeError):
+                batch.__enter__()
+        with batch:
+            dag.add_node(None)
+        self.assertEqual(1, len(dag))
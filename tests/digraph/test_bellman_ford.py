@@ -0,0 +1,176 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestBellmanFordDiGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(["s", "t", "x", "y", "z"])
+        self.graph.add_edges_from(
+            [
+                (0, 1, 6),
+                (0, 3, 7),
+                (1, 2, 5),
+                (1, 3, 8),
+                (1, 4, -4),
+                (2, 1, -2),
+                (3, 2, -3),
+                (3, 4, 9),
+                (4, 0, 2),
+                (4, 2, 7),
+            ]
+        )
+
+    def test_bellman_ford(self):
+        paths = retworkx.digraph_bellman_ford_shortest_paths(
+            self.graph, 0, weight_fn=float
+        )
+        expected = {
+            1: [0, 3, 2, 1],
+            2: [0, 3, 2],
+            3: [0, 3],
+            4: [0, 3, 2, 1, 4],
+        }
+        self.assertEqual(expected, paths)
+
+    def test_bellman_ford_with_target(self):
+        paths = retworkx.digraph_bellman_ford_shortest_paths(
+            self.graph, 0, target=4, weight_fn=float
+        )
+        self.assertEqual({4: [0, 3, 2, 1, 4]}, paths)
+
+    def test_bellman_ford_as_arrays(self):
+        dist, pred = retworkx.digraph_bellman_ford_shortest_paths(
+            self.graph, 0, weight_fn=float, as_arrays=True
+        )
+        np.testing.assert_array_equal(
+            np.array([0.0, 2.0, 4.0, 7.0, -2.0]), dist
+        )
+        np.testing.assert_array_equal(np.array([-1, 2, 3, 0, 1]), pred)
+
+    def test_bellman_ford_matches_dijkstra(self):
+        paths = retworkx.digraph_bellman_ford_shortest_paths(
+            self.graph, 0, weight_fn=abs
+        )
+        expected = retworkx.digraph_dijkstra_shortest_paths(
+            self.graph, 0, weight_fn=abs
+        )
+        self.assertEqual({k: list(v) for k, v in expected.items()}, paths)
+
+    def test_negative_cycle(self):
+        self.graph.add_edge(2, 3, -10)
+        with self.assertRaises(retworkx.NegativeCycle):
+            retworkx.digraph_bellman_ford_shortest_paths(
+                self.graph, 0, weight_fn=float
+            )
+
+    def test_negative_cycle_not_reachable(self):
+        node = self.graph.add_node("a")
+        self.graph.add_edge(2, 3, -10)
+        paths = retworkx.digraph_bellman_ford_shortest_paths(
+            self.graph, node, weight_fn=float
+        )
+        self.assertEqual({}, paths)
+
+    def test_negative_self_loop(self):
+        self.graph.add_edge(4, 4, -1)
+        with self.assertRaises(retworkx.NegativeCycle):
+            retworkx.digraph_bellman_ford_shortest_paths(
+                self.graph, 0, weight_fn=float
+            )
+
+    def test_as_undirected(self):
+        with self.assertRaises(retworkx.NegativeCycle):
+            retworkx.digraph_bellman_ford_shortest_paths(
+                self.graph, 0, weight_fn=float, as_undirected=True
+            )
+        paths = retworkx.digraph_bellman_ford_shortest_paths(
+            self.graph, 4, as_undirected=True
+        )
+        self.assertEqual([4, 0], paths[0])
+
+    def test_invalid_source(self):
+        with self.assertRaises(IndexError):
+            retworkx.digraph_bellman_ford_shortest_paths(self.graph, 42)
+
+
+class TestJohnsonDiGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(["s", "t", "x", "y", "z"])
+        self.graph.add_edges_from(
+            [
+                (0, 1, 6),
+                (0, 3, 7),
+                (1, 2, 5),
+                (1, 3, 8),
+                (1, 4, -4),
+                (2, 1, -2),
+                (3, 2, -3),
+                (3, 4, 9),
+                (4, 0, 2),
+                (4, 2, 7),
+            ]
+        )
+
+    def test_johnson(self):
+        res = retworkx.digraph_johnson_all_pairs(self.graph, weight_fn=float)
+        expected = retworkx.digraph_floyd_warshall_numpy(
+            self.graph, weight_fn=float
+        )
+        np.testing.assert_array_equal(expected, res)
+        np.testing.assert_array_equal(
+            np.array([0.0, 2.0, 4.0, 7.0, -2.0]), res[0]
+        )
+
+    def test_johnson_removed_node(self):
+        self.graph.remove_node(1)
+        res = retworkx.digraph_johnson_all_pairs(self.graph, weight_fn=float)
+        self.assertEqual((4, 4), res.shape)
+        expected = retworkx.digraph_floyd_warshall_numpy(
+            self.graph, weight_fn=float
+        )
+        np.testing.assert_array_equal(expected, res)
+
+    def test_johnson_negative_cycle(self):
+        self.graph.add_edge(2, 3, -10)
+        with self.assertRaises(retworkx.NegativeCycle):
+            retworkx.digraph_johnson_all_pairs(self.graph, weight_fn=float)
+
+    def test_johnson_as_undirected(self):
+        with self.assertRaises(retworkx.NegativeCycle):
+            retworkx.digraph_johnson_all_pairs(
+                self.graph, weight_fn=float, as_undirected=True
+            )
+        res = retworkx.digraph_johnson_all_pairs(
+            self.graph, weight_fn=abs, as_undirected=True
+        )
+        expected = retworkx.digraph_floyd_warshall_numpy(
+            self.graph, weight_fn=abs, as_undirected=True
+        )
+        np.testing.assert_array_equal(expected, res)
+
+    def test_johnson_parallel(self):
+        graph = retworkx.generators.directed_grid_graph(20, 20)
+        res = retworkx.digraph_johnson_all_pairs(
+            graph, weight_fn=lambda _: -1.0, parallel_threshold=1
+        )
+        expected = retworkx.digraph_floyd_warshall_numpy(
+            graph, weight_fn=lambda _: -1.0
+        )
+        np.testing.assert_array_equal(expected, res)
@@ -0,0 +1,102 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import random
+import unittest
+
+import retworkx
+
+
+class TestBidirectionalDijkstraDiGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(list(range(6)))
+        self.graph.add_edges_from(
+            [
+                (0, 1, 7),
+                (2, 0, 9),
+                (0, 3, 14),
+                (1, 2, 10),
+                (3, 2, 2),
+                (3, 4, 9),
+                (1, 5, 15),
+                (2, 5, 11),
+                (4, 5, 6),
+            ]
+        )
+
+    def test_path(self):
+        length, path = retworkx.digraph_bidirectional_dijkstra(
+            self.graph, 0, 4, weight_fn=float
+        )
+        self.assertEqual(23.0, length)
+        self.assertEqual([0, 3, 4], path)
+
+    def test_follows_edge_direction(self):
+        length, path = retworkx.digraph_bidirectional_dijkstra(
+            self.graph, 2, 1, weight_fn=float
+        )
+        self.assertEqual(16.0, length)
+        self.assertEqual([2, 0, 1], path)
+
+    def test_as_undirected(self):
+        length, path = retworkx.digraph_bidirectional_dijkstra(
+            self.graph, 5, 0, weight_fn=float, as_undirected=True
+        )
+        self.assertEqual(20.0, length)
+        self.assertEqual([5, 2, 0], path)
+
+    def test_same_node(self):
+        length, path = retworkx.digraph_bidirectional_dijkstra(self.graph, 3, 3)
+        self.assertEqual(0.0, length)
+        self.assertEqual([3], path)
+
+    def test_no_path(self):
+        with self.assertRaises(retworkx.NoPathFound):
+            retworkx.digraph_bidirectional_dijkstra(self.graph, 5, 0)
+
+    def test_invalid_node(self):
+        with self.assertRaises(IndexError):
+            retworkx.digraph_bidirectional_dijkstra(self.graph, 0, 42)
+
+    def test_negative_weight(self):
+        with self.assertRaises(ValueError):
+            retworkx.digraph_bidirectional_dijkstra(
+                self.graph, 0, 5, weight_fn=lambda _: -1.0
+            )
+
+    def test_matches_dijkstra(self):
+        rng = random.Random(42)
+        graph = retworkx.directed_gnp_random_graph(50, 0.1, seed=42)
+        for edge in graph.edge_list():
+            graph.update_edge(edge[0], edge[1], rng.randint(1, 10))
+        lengths = retworkx.digraph_all_pairs_dijkstra_path_lengths(graph, float)
+        for source, target in [(0, 49), (3, 17), (25, 4), (40, 41)]:
+            if lengths[source, target] == float("inf"):
+                with self.assertRaises(retworkx.NoPathFound):
+                    retworkx.digraph_bidirectional_dijkstra(
+                        graph, source, target, weight_fn=float
+                    )
+                continue
+            length, path = retworkx.digraph_bidirectional_dijkstra(
+                graph, source, target, weight_fn=float
+            )
+            self.assertEqual(lengths[source, target], length)
+            self.assertEqual(source, path[0])
+            self.assertEqual(target, path[-1])
+            self.assertEqual(
+                length,
+                sum(
+                    graph.get_edge_data(path[i], path[i + 1])
+                    for i in range(len(path) - 1)
+                ),
+            )
@@ -0,0 +1,29 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestCapacity(unittest.TestCase):
+    def test_constructor_capacity(self):
+        graph = retworkx.PyDiGraph(node_capacity=10, edge_capacity=20)
+        self.assertEqual(0, len(graph))
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        self.assertEqual([(0, 1), (1, 2)], graph.edge_list())
+
+    def test_pydag_constructor_capacity(self):
+        dag = retworkx.PyDAG(True, False, 5, 5)
+        self.assertTrue(dag.check_cycle)
+        self.assertFalse(dag.multigraph)
@@ -0,0 +1,89 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestCompact(unittest.TestCase):
+    def test_compact(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(["a", "b", "c", "d"])
+        graph.add_edges_from(
+            [(0, 1, "a->b"), (1, 2, "b->c"), (2, 3, "c->d"), (0, 3, "a->d")]
+        )
+        graph.remove_node(1)
+        node_map, edge_map = graph.compact()
+        self.assertEqual([0, -1, 1, 2], node_map.tolist())
+        self.assertEqual([-1, -1, 0, 1], edge_map.tolist())
+        self.assertEqual([0, 1, 2], graph.node_indexes())
+        self.assertEqual(["a", "c", "d"], graph.nodes())
+        self.assertEqual(
+            [(1, 2, "c->d"), (0, 2, "a->d")], graph.weighted_edge_list()
+        )
+        self.assertEqual([0, 1], graph.edge_ids_array().tolist())
+
+    def test_compact_clears_nodes_removed(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        graph.remove_node(0)
+        graph.compact()
+        self.assertEqual([0, 1], graph.node_indexes())
+        self.assertEqual(2, graph.add_node(3))
+        res = retworkx.digraph_adjacency_matrix(graph, lambda _: 1)
+        self.assertEqual(
+            [[0, 1, 0], [0, 0, 0], [0, 0, 0]], res.astype(int).tolist()
+        )
+
+    def test_compact_keeps_payload_identity(self):
+        graph = retworkx.PyDiGraph()
+        payload = ["a"]
+        graph.add_node("removed")
+        graph.add_node(payload)
+        graph.remove_node(0)
+        graph.compact()
+        self.assertIs(payload, graph[0])
+
+    def test_compact_cycle_check(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(4))
+        dag.add_edges_from_no_data([(0, 1), (1, 2), (2, 3)])
+        dag.remove_node(0)
+        dag.compact()
+        self.assertEqual([0, 1, 2], retworkx.topological_sort(dag))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(2, 0, None)
+
+    def test_compact_multigraph_false(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from([(0, 1, "a"), (1, 2, "b")])
+        graph.remove_node(0)
+        graph.compact()
+        graph.add_edge(0, 1, "c")
+        self.assertEqual([(0, 1, "c")], graph.weighted_edge_list())
+
+    def test_compact_no_holes(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        node_map, edge_map = graph.compact()
+        self.assertEqual([0, 1, 2], node_map.tolist())
+        self.assertEqual([0, 1], edge_map.tolist())
+
+    def test_compact_empty(self):
+        graph = retworkx.PyDiGraph()
+        node_map, edge_map = graph.compact()
+        self.assertEqual([], node_map.tolist())
+        self.assertEqual([], edge_map.tolist())
@@ -80,3 +80,16 @@ class TestComplement(unittest.TestCase):
                 complement_graph,
             )
         )
+
+    def test_non_multigraph_updates_complement_edges(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.extend_from_edge_list([(0, 1), (1, 2), (2, 0)])
+
+        complement_graph = retworkx.complement(graph)
+        self.assertFalse(complement_graph.has_edge(0, 1))
+        self.assertTrue(complement_graph.has_edge(1, 0))
+        complement_graph.add_edge(1, 0, "a")
+        complement_graph.add_edge(0, 1, "b")
+        self.assertEqual(4, complement_graph.num_edges())
+        self.assertEqual("a", complement_graph.get_edge_data(1, 0))
+        self.assertEqual("b", complement_graph.get_edge_data(0, 1))
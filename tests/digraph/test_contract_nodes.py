@@ -0,0 +1,195 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestContractNodes(unittest.TestCase):
+    def setUp(self):
+        # a -> b -> c -> d, a -> c, e -> b
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "d", "e"])
+        self.graph.add_edges_from(
+            [
+                (0, 1, "ab"),
+                (1, 2, "bc"),
+                (2, 3, "cd"),
+                (0, 2, "ac"),
+                (4, 1, "eb"),
+            ]
+        )
+
+    def test_contract(self):
+        node = self.graph.contract_nodes([1, 2], "bc")
+        self.assertEqual("bc", self.graph[node])
+        self.assertEqual(4, len(self.graph))
+        self.assertNotIn(1, self.graph.node_indexes())
+        self.assertNotIn(2, self.graph.node_indexes())
+        self.assertEqual(
+            sorted(
+                [
+                    (0, node, "ab"),
+                    (node, 3, "cd"),
+                    (0, node, "ac"),
+                    (4, node, "eb"),
+                ]
+            ),
+            sorted(self.graph.weighted_edge_list()),
+        )
+
+    def test_contract_drops_internal_edges(self):
+        node = self.graph.contract_nodes([0, 1, 2], None)
+        self.assertEqual(
+            sorted([(node, 3, "cd"), (4, node, "eb")]),
+            sorted(self.graph.weighted_edge_list()),
+        )
+
+    def test_duplicate_nodes(self):
+        node = self.graph.contract_nodes([1, 2, 1], None)
+        self.assertEqual(4, len(self.graph))
+        self.assertEqual(4, len(self.graph.edge_list()))
+        self.assertIn(node, self.graph.node_indexes())
+
+    def test_invalid_node(self):
+        with self.assertRaises(IndexError):
+            self.graph.contract_nodes([1, 42], None)
+        self.assertEqual(5, len(self.graph))
+
+    def test_no_multigraph(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from([(0, 1, 1), (0, 2, 2), (1, 2, 3)])
+        node = graph.contract_nodes([1, 2], None)
+        self.assertEqual([(0, node, 2)], graph.weighted_edge_list())
+        self.assertTrue(graph.has_edge(0, node))
+
+    def test_no_multigraph_weight_combo(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(range(4))
+        graph.add_edges_from([(0, 1, 1), (0, 2, 2), (1, 3, 3), (2, 3, 4)])
+        node = graph.contract_nodes(
+            [1, 2], None, weight_combo_fn=lambda a, b: a + b
+        )
+        self.assertEqual(
+            sorted([(0, node, 3), (node, 3, 7)]),
+            sorted(graph.weighted_edge_list()),
+        )
+
+    def test_multigraph_keeps_parallel_edges(self):
+        node = self.graph.contract_nodes([1, 2], None)
+        self.assertEqual(2, len(self.graph.get_all_edge_data(0, node)))
+
+    def test_would_cycle(self):
+        # Contracting a and c would create a cycle through b
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            self.graph.contract_nodes([0, 2], None, check_cycle=True)
+        self.assertEqual(5, len(self.graph))
+        self.assertEqual(5, len(self.graph.edge_list()))
+
+    def test_would_cycle_not_checked(self):
+        node = self.graph.contract_nodes([0, 2], None)
+        self.assertTrue(self.graph.has_edge(node, 1))
+        self.assertTrue(self.graph.has_edge(1, node))
+
+    def test_dag_checks_cycle_by_default(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(3))
+        dag.add_edges_from_no_data([(0, 1), (1, 2)])
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.contract_nodes([0, 2], None)
+
+    def test_dag_topological_order(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(6))
+        dag.add_edges_from_no_data(
+            [(0, 1), (1, 2), (0, 3), (3, 4), (4, 5), (2, 5)]
+        )
+        node = dag.contract_nodes([2, 3], None)
+        order = retworkx.topological_sort(dag)
+        position = {node: pos for pos, node in enumerate(order)}
+        for source, target in dag.edge_list():
+            self.assertLess(position[source], position[target])
+        self.assertIn(node, position)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(5, 0, None)
+
+    def test_payload_index(self):
+        self.graph.build_payload_index()
+        node = self.graph.contract_nodes([1, 2], "bc")
+        self.assertEqual(node, self.graph.find_node_by_weight("bc"))
+        self.assertIsNone(self.graph.find_node_by_weight("b"))
+
+
+class TestQuotientGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "d", "e"])
+        self.graph.add_edges_from(
+            [
+                (0, 1, "ab"),
+                (1, 2, "bc"),
+                (2, 3, "cd"),
+                (3, 4, "de"),
+                (4, 0, "ea"),
+            ]
+        )
+
+    def test_quotient(self):
+        quotient = self.graph.quotient_graph([[0, 1], [2, 3]])
+        self.assertEqual([["a", "b"], ["c", "d"], "e"], quotient.nodes())
+        self.assertEqual(
+            [(0, 1, "bc"), (1, 2, "de"), (2, 0, "ea")],
+            quotient.weighted_edge_list(),
+        )
+        # The original graph is not modified
+        self.assertEqual(5, len(self.graph))
+
+    def test_node_fn(self):
+        quotient = self.graph.quotient_graph([[0, 1, 2, 3, 4]], node_fn="".join)
+        self.assertEqual(["abcde"], quotient.nodes())
+        self.assertEqual([], quotient.edge_list())
+
+    def test_matches_contract_nodes(self):
+        quotient = self.graph.quotient_graph([[1, 3], [0, 4]])
+        self.graph.contract_nodes([1, 3], None)
+        self.graph.contract_nodes([0, 4], None)
+        self.assertEqual(len(self.graph), len(quotient))
+        self.assertEqual(len(self.graph.edge_list()), len(quotient.edge_list()))
+
+    def test_no_multigraph(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(range(4))
+        graph.add_edges_from([(0, 2, 1), (0, 3, 2), (1, 2, 3), (1, 3, 4)])
+        quotient = graph.quotient_graph([[0, 1], [2, 3]], weight_combo_fn=max)
+        self.assertEqual([(0, 1, 4)], quotient.weighted_edge_list())
+        self.assertFalse(quotient.multigraph)
+
+    def test_invalid_partition(self):
+        with self.assertRaises(IndexError):
+            self.graph.quotient_graph([[0, 42]])
+        with self.assertRaises(ValueError):
+            self.graph.quotient_graph([[0, 1], [1, 2]])
+        with self.assertRaises(ValueError):
+            self.graph.quotient_graph([[0], []])
+
+    def test_dag_cycle(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(3))
+        dag.add_edges_from_no_data([(0, 1), (1, 2)])
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.quotient_graph([[0, 2]])
+        quotient = dag.quotient_graph([[0, 1]])
+        self.assertTrue(quotient.check_cycle)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            quotient.add_edge(1, 0, None)
@@ -0,0 +1,71 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import copy
+import unittest
+
+import retworkx
+
+
+class TestCopy(unittest.TestCase):
+    def test_copy(self):
+        dag = retworkx.PyDAG()
+        node_a = dag.add_node({"a": 1})
+        node_b = dag.add_child(node_a, "b", ["edge"])
+        node_c = dag.add_child(node_b, "c", "b->c")
+        dag.remove_node(node_b)
+        dag.add_edge(node_a, node_c, "a->c")
+        res = dag.copy()
+        self.assertIsInstance(res, retworkx.PyDAG)
+        self.assertEqual(dag.node_indexes(), res.node_indexes())
+        self.assertEqual(dag.weighted_edge_list(), res.weighted_edge_list())
+        self.assertEqual(
+            dag.edge_ids_array().tolist(), res.edge_ids_array().tolist()
+        )
+
+    def test_copy_shares_payloads(self):
+        graph = retworkx.PyDiGraph()
+        node_a = graph.add_node({"a": 1})
+        graph.add_child(node_a, "b", ["edge"])
+        res = graph.copy()
+        self.assertIs(graph[node_a], res[node_a])
+        self.assertIs(graph.get_edge_data(0, 1), res.get_edge_data(0, 1))
+
+    def test_copy_is_independent(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        res = graph.copy()
+        res.add_edge(2, 0, None)
+        res.remove_node(1)
+        self.assertEqual([(0, 1), (1, 2)], graph.edge_list())
+        self.assertEqual([0, 1, 2], graph.node_indexes())
+
+    def test_copy_keeps_settings(self):
+        dag = retworkx.PyDAG(check_cycle=True, multigraph=False)
+        dag.add_nodes_from(range(3))
+        dag.add_edges_from_no_data([(0, 1), (1, 2)])
+        res = dag.copy()
+        self.assertTrue(res.check_cycle)
+        self.assertFalse(res.multigraph)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            res.add_edge(2, 0, None)
+        res.add_edge(0, 1, "updated")
+        self.assertEqual(2, len(res.edge_list()))
+
+    def test_copy_module(self):
+        graph = retworkx.PyDiGraph()
+        payload = ["a"]
+        graph.add_node(payload)
+        res = copy.copy(graph)
+        self.assertIsInstance(res, retworkx.PyDiGraph)
+        self.assertIs(payload, res[0])
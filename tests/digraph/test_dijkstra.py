@@ -12,6 +12,8 @@
 
 import unittest
 
+import numpy as np
+
 import retworkx
 
 
@@ -139,6 +141,82 @@ class TestDijkstraDiGraph(unittest.TestCase):
         }
         self.assertEqual(expected, paths)
 
+    def test_dijkstra_path_as_arrays(self):
+        dist, pred = retworkx.digraph_dijkstra_shortest_paths(
+            self.graph, self.a, weight_fn=float, as_arrays=True
+        )
+        self.assertEqual(np.float64, dist.dtype)
+        self.assertEqual(np.int64, pred.dtype)
+        np.testing.assert_array_equal(
+            np.array([0.0, 7.0, 16.0, 14.0, 23.0, 22.0]), dist
+        )
+        np.testing.assert_array_equal(np.array([-1, 0, 3, 0, 3, 1]), pred)
+        paths = retworkx.digraph_dijkstra_shortest_paths(
+            self.graph, self.a, weight_fn=float
+        )
+        for node, path in paths.items():
+            self.assertEqual(
+                list(path), retworkx.path_from_predecessors(pred, self.a, node)
+            )
+
+    def test_path_from_predecessors(self):
+        _, pred = retworkx.digraph_dijkstra_shortest_paths(
+            self.graph, self.a, target=self.d, weight_fn=float, as_arrays=True
+        )
+        self.assertEqual(
+            [self.a, self.d],
+            retworkx.path_from_predecessors(pred, self.a, self.d),
+        )
+        self.assertEqual(
+            [self.a], retworkx.path_from_predecessors(pred, self.a, self.a)
+        )
+        self.assertEqual([], retworkx.path_from_predecessors(pred, self.a, 4))
+        with self.assertRaises(IndexError):
+            retworkx.path_from_predecessors(pred, self.a, 6)
+        with self.assertRaises(IndexError):
+            retworkx.path_from_predecessors(np.array([-1, 7]), 0, 1)
+        with self.assertRaises(ValueError):
+            retworkx.path_from_predecessors(np.array([-1, 2, 1]), 0, 1)
+        with self.assertRaises(ValueError):
+            retworkx.path_from_predecessors(np.array([-1, -1, 1]), 0, 2)
+
+    def test_dijkstra_path_as_arrays_with_target(self):
+        dist, pred = retworkx.digraph_dijkstra_shortest_paths(
+            self.graph, self.a, target=self.d, weight_fn=float, as_arrays=True
+        )
+        inf = np.inf
+        np.testing.assert_array_equal(
+            np.array([0.0, 7.0, inf, 14.0, inf, inf]), dist
+        )
+        np.testing.assert_array_equal(np.array([-1, 0, -1, 0, -1, -1]), pred)
+
+    def test_dijkstra_path_as_arrays_undirected(self):
+        dist, pred = retworkx.digraph_dijkstra_shortest_paths(
+            self.graph,
+            self.f,
+            weight_fn=float,
+            as_undirected=True,
+            as_arrays=True,
+        )
+        np.testing.assert_array_equal(
+            np.array([20.0, 15.0, 11.0, 13.0, 6.0, 0.0]), dist
+        )
+        np.testing.assert_array_equal(np.array([2, 5, 5, 2, 5, -1]), pred)
+
+    def test_dijkstra_path_as_arrays_removed_node(self):
+        self.graph.remove_node(self.b)
+        dist, pred = retworkx.digraph_dijkstra_shortest_paths(
+            self.graph, self.a, as_arrays=True
+        )
+        self.assertEqual(6, len(dist))
+        self.assertEqual(np.inf, dist[self.b])
+        self.assertEqual(-1, pred[self.b])
+        self.assertEqual(3.0, dist[self.f])
+        with self.assertRaises(IndexError):
+            retworkx.digraph_dijkstra_shortest_paths(
+                self.graph, self.b, as_arrays=True
+            )
+
     def test_dijkstra_with_no_goal_set(self):
         path = retworkx.digraph_dijkstra_shortest_path_lengths(
             self.graph, self.a, lambda x: 1
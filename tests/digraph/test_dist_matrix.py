@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
+import tempfile
 import unittest
 
 import numpy
@@ -99,3 +101,232 @@ class TestDistanceMatrix(unittest.TestCase):
             ]
         )
         self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_digraph_distance_matrix_integer_dtypes(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(7)))
+        graph.add_edges_from_no_data(
+            [(0, 1), (0, 6), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6)]
+        )
+        expected = retworkx.digraph_distance_matrix(graph)
+        for dtype in (numpy.int32, numpy.uint16, numpy.uint8):
+            dist = retworkx.digraph_distance_matrix(graph, dtype=dtype)
+            self.assertEqual(dtype, dist.dtype)
+            self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_digraph_distance_matrix_null_value(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        dist = retworkx.digraph_distance_matrix(graph, null_value=numpy.inf)
+        expected = numpy.array(
+            [
+                [0.0, 1.0, 2.0],
+                [numpy.inf, 0.0, 1.0],
+                [numpy.inf, numpy.inf, 0.0],
+            ]
+        )
+        self.assertTrue(numpy.array_equal(dist, expected))
+        dist = retworkx.digraph_distance_matrix(
+            graph, dtype=numpy.int32, null_value=-1
+        )
+        self.assertTrue(
+            numpy.array_equal(dist, [[0, 1, 2], [-1, 0, 1], [-1, -1, 0]])
+        )
+
+    def test_digraph_distance_matrix_invalid_null_value(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(3)))
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, dtype=numpy.uint8, null_value=-1
+            )
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, dtype=numpy.int32, null_value=numpy.inf
+            )
+
+    def test_digraph_distance_matrix_invalid_dtype(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(3)))
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(graph, dtype=numpy.int8)
+
+    def test_digraph_distance_matrix_too_large_for_dtype(self):
+        graph = retworkx.generators.directed_path_graph(300)
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(graph, dtype=numpy.uint8)
+        dist = retworkx.digraph_distance_matrix(graph, dtype=numpy.uint16)
+        self.assertEqual(299, dist[0, 299])
+
+    def test_digraph_distance_matrix_null_value_dtype_max(self):
+        graph = retworkx.generators.directed_path_graph(256)
+        dist = retworkx.digraph_distance_matrix(graph, dtype=numpy.uint8)
+        self.assertEqual(255, dist[0, 255])
+        # 255 can't be both the null value and a distance
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, dtype=numpy.uint8, null_value=255
+            )
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, dtype=numpy.uint8, null_value=255, cutoff=255
+            )
+        graph.remove_node(255)
+        dist = retworkx.digraph_distance_matrix(
+            graph, dtype=numpy.uint8, null_value=255
+        )
+        self.assertEqual(254, dist[0, 254])
+        self.assertEqual(255, dist[254, 0])
+
+    def test_digraph_distance_matrix_with_removals(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(4)))
+        graph.add_edges_from_no_data([(0, 1), (1, 2), (2, 3), (3, 0)])
+        graph.remove_node(1)
+        dist = retworkx.digraph_distance_matrix(graph, null_value=-1)
+        expected = numpy.array(
+            [[0.0, -1.0, -1.0], [2.0, 0.0, 1.0], [1.0, -1.0, 0.0]]
+        )
+        self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_digraph_distance_matrix_dense_graph(self):
+        graph = retworkx.directed_gnp_random_graph(200, 0.05, seed=42)
+        expected = retworkx.digraph_floyd_warshall_numpy(graph)
+        for parallel_threshold in (300, 0):
+            dist = retworkx.digraph_distance_matrix(
+                graph,
+                parallel_threshold=parallel_threshold,
+                null_value=numpy.inf,
+            )
+            self.assertTrue(numpy.array_equal(dist, expected))
+            dist = retworkx.digraph_distance_matrix(
+                graph,
+                parallel_threshold=parallel_threshold,
+                as_undirected=True,
+                dtype=numpy.uint8,
+            )
+            self.assertTrue(
+                numpy.array_equal(
+                    dist,
+                    retworkx.digraph_floyd_warshall_numpy(
+                        graph, as_undirected=True
+                    ),
+                )
+            )
+
+    def test_digraph_distance_matrix_cutoff(self):
+        graph = retworkx.generators.directed_path_graph(6)
+        dist = retworkx.digraph_distance_matrix(
+            graph, cutoff=2, null_value=numpy.inf
+        )
+        expected = retworkx.digraph_floyd_warshall_numpy(graph)
+        expected[expected > 2] = numpy.inf
+        self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_digraph_distance_matrix_cutoff_fits_dtype(self):
+        graph = retworkx.generators.directed_path_graph(300)
+        dist = retworkx.digraph_distance_matrix(
+            graph, dtype=numpy.uint8, cutoff=255
+        )
+        self.assertEqual(255, dist[0, 255])
+        self.assertEqual(0, dist[0, 256])
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, dtype=numpy.uint8, cutoff=256
+            )
+
+    def test_digraph_distance_matrix_sparse(self):
+        graph = retworkx.directed_gnp_random_graph(200, 0.02, seed=42)
+        graph.remove_node(7)
+        for cutoff in (None, 2):
+            expected = retworkx.digraph_distance_matrix(
+                graph, cutoff=cutoff, null_value=-1, dtype=numpy.int32
+            )
+            for parallel_threshold in (300, 0):
+                indptr, indices, data = retworkx.digraph_distance_matrix(
+                    graph,
+                    parallel_threshold=parallel_threshold,
+                    dtype=numpy.int32,
+                    cutoff=cutoff,
+                    sparse=True,
+                )
+                self.assertEqual(numpy.int64, indptr.dtype)
+                self.assertEqual(numpy.int64, indices.dtype)
+                self.assertEqual(numpy.int32, data.dtype)
+                self.assertEqual(200, len(indptr))
+                dist = numpy.full((199, 199), -1, dtype=numpy.int32)
+                numpy.fill_diagonal(dist, 0)
+                for row in range(199):
+                    columns = indices[indptr[row] : indptr[row + 1]]
+                    self.assertEqual(sorted(columns), list(columns))
+                    dist[row, columns] = data[indptr[row] : indptr[row + 1]]
+                self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_digraph_distance_matrix_sparse_empty(self):
+        indptr, indices, data = retworkx.digraph_distance_matrix(
+            retworkx.PyDiGraph(), sparse=True
+        )
+        self.assertEqual([0], list(indptr))
+        self.assertEqual(0, len(indices))
+        self.assertEqual(0, len(data))
+
+    def test_digraph_distance_matrix_out_memmap(self):
+        graph = retworkx.directed_gnp_random_graph(200, 0.05, seed=42)
+        expected = retworkx.digraph_distance_matrix(graph, dtype=numpy.uint8)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for parallel_threshold in (300, 0):
+                out = numpy.memmap(
+                    os.path.join(tmpdir, "dist.dat"),
+                    dtype=numpy.uint8,
+                    mode="w+",
+                    shape=(200, 200),
+                )
+                dist = retworkx.digraph_distance_matrix(
+                    graph, parallel_threshold=parallel_threshold, out=out
+                )
+                self.assertIs(out, dist)
+                self.assertTrue(numpy.array_equal(expected, out))
+                del dist, out
+
+    def test_digraph_distance_matrix_out_path(self):
+        graph = retworkx.generators.directed_path_graph(10)
+        expected = retworkx.digraph_distance_matrix(
+            graph, null_value=-1, dtype=numpy.int32
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "dist.npy")
+            dist = retworkx.digraph_distance_matrix(
+                graph, null_value=-1, dtype=numpy.int32, out=path
+            )
+            self.assertIsInstance(dist, numpy.memmap)
+            self.assertEqual(numpy.int32, dist.dtype)
+            del dist
+            self.assertTrue(
+                numpy.array_equal(expected, numpy.load(path, mmap_mode="r"))
+            )
+
+    def test_digraph_distance_matrix_out_invalid(self):
+        graph = retworkx.generators.directed_path_graph(10)
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(graph, out=numpy.zeros((10, 9)))
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, dtype=numpy.uint8, out=numpy.zeros((10, 10))
+            )
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, out=numpy.zeros((10, 10), dtype=numpy.float32)
+            )
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, sparse=True, out=numpy.zeros((10, 10))
+            )
+        out = numpy.zeros((10, 10))
+        out.flags.writeable = False
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(graph, out=out)
+        with self.assertRaises(ValueError):
+            retworkx.digraph_distance_matrix(
+                graph, out=numpy.zeros((10, 10), dtype=">f8")
+            )
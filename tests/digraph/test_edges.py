@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import pickle
 import unittest
 
 import retworkx
@@ -790,3 +791,66 @@ class TestEdgesMultigraphFalse(unittest.TestCase):
         graph.extend_from_weighted_edge_list(edge_list)
         self.assertEqual(len(graph), 4)
         self.assertEqual(["a", "b", "c", "d", "e"], graph.edges())
+
+    def test_edge_lookup_after_removal(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(list(range(4)))
+        graph.add_edges_from([(0, 1, "a"), (1, 2, "b"), (2, 3, "c")])
+        graph.remove_edge(1, 2)
+        self.assertFalse(graph.has_edge(1, 2))
+        with self.assertRaises(retworkx.NoEdgeBetweenNodes):
+            graph.get_edge_data(1, 2)
+        # The removed edge index is reused by the next edge
+        graph.add_edge(3, 0, "d")
+        self.assertTrue(graph.has_edge(3, 0))
+        self.assertFalse(graph.has_edge(1, 2))
+        self.assertFalse(graph.has_edge(0, 3))
+        self.assertEqual("d", graph.get_edge_data(3, 0))
+
+    def test_edge_lookup_after_node_removal(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from([(0, 1, "a"), (1, 2, "b")])
+        graph.remove_node(1)
+        new_node = graph.add_node("new")
+        self.assertEqual(1, new_node)
+        self.assertFalse(graph.has_edge(0, 1))
+        graph.add_edge(0, 1, "c")
+        self.assertEqual([(0, 1)], graph.edge_list())
+        self.assertEqual("c", graph.get_edge_data(0, 1))
+
+    def test_update_and_remove_edge(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(list(range(3)))
+        edge = graph.add_edge(0, 1, "a")
+        self.assertEqual(edge, graph.add_edge(0, 1, "b"))
+        graph.update_edge(0, 1, "c")
+        self.assertEqual(["c"], graph.edges())
+        graph.remove_edge_from_index(edge)
+        self.assertFalse(graph.has_edge(0, 1))
+        with self.assertRaises(retworkx.NoEdgeBetweenNodes):
+            graph.update_edge(0, 1, "d")
+        graph.add_edge(0, 1, "e")
+        self.assertEqual(["e"], graph.edges())
+
+    def test_add_child_and_parent(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        node = graph.add_node("a")
+        child = graph.add_child(node, "b", "edge_b")
+        parent = graph.add_parent(node, "c", "edge_c")
+        self.assertTrue(graph.has_edge(node, child))
+        self.assertTrue(graph.has_edge(parent, node))
+        self.assertEqual(0, graph.add_edge(node, child, "new"))
+        self.assertEqual(2, len(graph.edges()))
+
+    def test_pickle_and_subgraph(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.extend_from_edge_list([(0, 1), (1, 2), (2, 0)])
+        copy = pickle.loads(pickle.dumps(graph))
+        self.assertTrue(copy.has_edge(2, 0))
+        copy.add_edge(2, 0, "x")
+        self.assertEqual(3, len(copy.edges()))
+        subgraph = graph.subgraph([1, 2])
+        self.assertTrue(subgraph.has_edge(0, 1))
+        subgraph.add_edge(0, 1, "y")
+        self.assertEqual(["y"], subgraph.edges())
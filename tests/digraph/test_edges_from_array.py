@@ -0,0 +1,156 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestEdgesFromArray(unittest.TestCase):
+    def test_add_edges_from_array_no_weights(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(4)))
+        res = dag.add_edges_from_array(
+            np.array([0, 1, 2], dtype=np.int64),
+            np.array([1, 2, 3], dtype=np.int64),
+        )
+        np.testing.assert_array_equal(res, np.array([0, 1, 2]))
+        self.assertEqual(res.dtype, np.int64)
+        self.assertEqual(
+            [(0, 1, None), (1, 2, None), (2, 3, None)],
+            dag.weighted_edge_list(),
+        )
+
+    def test_add_edges_from_array_float_weights(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(3)))
+        dag.add_edges_from_array(
+            np.array([0, 1], dtype=np.int64),
+            np.array([1, 2], dtype=np.int64),
+            np.array([0.5, 1.5]),
+        )
+        self.assertEqual([(0, 1, 0.5), (1, 2, 1.5)], dag.weighted_edge_list())
+        for weight in dag.edges():
+            self.assertIsInstance(weight, float)
+
+    def test_add_edges_from_array_object_weights(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(3)))
+        weights = np.array(["a", {"b": 1}], dtype=object)
+        dag.add_edges_from_array(
+            np.array([0, 1], dtype=np.int64),
+            np.array([1, 2], dtype=np.int64),
+            weights,
+        )
+        self.assertEqual(["a", {"b": 1}], dag.edges())
+
+    def test_add_edges_from_array_list_weights(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(3)))
+        dag.add_edges_from_array(
+            np.array([0, 1], dtype=np.int64),
+            np.array([1, 2], dtype=np.int64),
+            ["a", "b"],
+        )
+        self.assertEqual(["a", "b"], dag.edges())
+
+    def test_add_edges_from_array_invalid_node(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(3)))
+        with self.assertRaises(IndexError):
+            dag.add_edges_from_array(
+                np.array([0, 1], dtype=np.int64),
+                np.array([1, 5], dtype=np.int64),
+            )
+        self.assertEqual([], dag.edges())
+
+    def test_add_edges_from_array_negative_node(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(3)))
+        with self.assertRaises(IndexError):
+            dag.add_edges_from_array(
+                np.array([-1], dtype=np.int64), np.array([1], dtype=np.int64)
+            )
+
+    def test_add_edges_from_array_length_mismatch(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(3)))
+        with self.assertRaises(ValueError):
+            dag.add_edges_from_array(
+                np.array([0, 1], dtype=np.int64),
+                np.array([1], dtype=np.int64),
+            )
+        with self.assertRaises(ValueError):
+            dag.add_edges_from_array(
+                np.array([0, 1], dtype=np.int64),
+                np.array([1, 2], dtype=np.int64),
+                np.array([1.0]),
+            )
+
+    def test_add_edges_from_array_cycle(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(3)))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edges_from_array(
+                np.array([0, 1, 2], dtype=np.int64),
+                np.array([1, 2, 0], dtype=np.int64),
+            )
+        self.assertEqual(0, dag.num_edges())
+
+    def test_add_edges_from_array_cycle_with_existing_edges(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(4)))
+        dag.add_edge(2, 3, None)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edges_from_array(
+                np.array([0, 1, 3], dtype=np.int64),
+                np.array([1, 2, 0], dtype=np.int64),
+            )
+        self.assertEqual([(2, 3)], dag.edge_list())
+        res = dag.add_edges_from_array(
+            np.array([0, 1], dtype=np.int64),
+            np.array([1, 2], dtype=np.int64),
+        )
+        self.assertEqual(2, len(res))
+        self.assertEqual([0, 1, 2, 3], retworkx.topological_sort(dag))
+
+    def test_add_edges_from_array_no_multigraph(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(list(range(3)))
+        res = graph.add_edges_from_array(
+            np.array([0, 0, 1], dtype=np.int64),
+            np.array([1, 1, 2], dtype=np.int64),
+            ["a", "b", "c"],
+        )
+        np.testing.assert_array_equal(res, np.array([0, 0, 1]))
+        self.assertEqual([(0, 1, "b"), (1, 2, "c")], graph.weighted_edge_list())
+
+    def test_update_edges_from_array(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(3)))
+        dag.add_edges_from_no_data([(0, 1), (1, 2)])
+        dag.update_edges_from_array(
+            np.array([1, 0], dtype=np.int64), np.array([2.0, 3.0])
+        )
+        self.assertEqual([(0, 1, 3.0), (1, 2, 2.0)], dag.weighted_edge_list())
+
+    def test_update_edges_from_array_invalid_index(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(3)))
+        dag.add_edges_from_no_data([(0, 1), (1, 2)])
+        with self.assertRaises(IndexError):
+            dag.update_edges_from_array(
+                np.array([0, 4], dtype=np.int64), ["a", "b"]
+            )
+        self.assertEqual([None, None], dag.edges())
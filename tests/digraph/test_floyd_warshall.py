@@ -55,7 +55,9 @@ class TestFloydWarshall(unittest.TestCase):
         cr_1_out = dag.add_node("cr[1]_out")
         dag.add_edge(cr_1, cr_1_out, "cr[1]")
 
-        result = retworkx.floyd_warshall(dag)
+        result = retworkx.floyd_warshall(
+            dag, parallel_threshold=self.parallel_threshold
+        )
         expected = {
             0: {0: 0, 5: 1, 6: 2, 7: 2, 8: 3, 9: 4, 10: 4, 11: 3, 12: 5},
             1: {1: 0, 5: 1, 6: 2, 7: 2, 8: 3, 9: 4, 10: 4, 11: 3, 12: 5},
@@ -73,7 +75,47 @@ class TestFloydWarshall(unittest.TestCase):
             13: {13: 0},
             14: {14: 0},
         }
-        self.assertDictEqual(result, expected)
+        self.assertEqual(result, expected)
+        self.assertEqual(expected, {k: v for k, v in result.items()})
+
+    def test_floyd_warshall_with_removals(self):
+        dag = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(5)))
+        dag.add_edges_from_no_data([(0, 1), (1, 3), (3, 4), (2, 4)])
+        dag.remove_node(1)
+        result = retworkx.floyd_warshall(
+            dag, parallel_threshold=self.parallel_threshold
+        )
+        self.assertIsInstance(result, retworkx.AllPairsPathLengthMapping)
+        self.assertEqual([0, 2, 3, 4], list(result))
+        self.assertNotIn(1, result)
+        self.assertEqual(
+            {0: {0: 0}, 2: {2: 0, 4: 1}, 3: {3: 0, 4: 1}, 4: {4: 0}}, result
+        )
+
+    def test_floyd_warshall_cycle_and_self_loop(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_no_data([(0, 1), (1, 2), (2, 0), (1, 1)])
+        result = retworkx.floyd_warshall(
+            graph, parallel_threshold=self.parallel_threshold
+        )
+        self.assertEqual({0: 0, 1: 1, 2: 2}, result[0])
+        self.assertEqual({0: 2, 1: 0, 2: 1}, result[1])
+        self.assertIsInstance(result[2][0], int)
+
+    def test_floyd_warshall_matches_numpy(self):
+        graph = retworkx.generators.directed_grid_graph(12, 12)
+        result = retworkx.floyd_warshall(
+            graph, parallel_threshold=self.parallel_threshold
+        )
+        dist = retworkx.digraph_floyd_warshall_numpy(graph)
+        for source, lengths in result.items():
+            for target in graph.node_indexes():
+                if dist[source, target] == numpy.inf:
+                    self.assertNotIn(target, lengths)
+                else:
+                    self.assertEqual(dist[source, target], lengths[target])
 
     def test_directed_floyd_warshall_numpy_cycle_as_undirected(self):
         graph = retworkx.PyDiGraph()
@@ -203,6 +245,123 @@ class TestFloydWarshall(unittest.TestCase):
         self.assertEqual(dist[0, 3], 6)
         self.assertEqual(dist[0, 4], 8)
 
+    def _path_from_predecessors(self, pred, source, target):
+        path = [target]
+        while path[-1] != source:
+            path.append(pred[source, path[-1]])
+        return path[::-1]
+
+    def test_floyd_warshall_numpy_float32(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(6)))
+        weights = [2, 12, 1, 5, 1]
+        graph.add_edges_from([(i, i + 1, weights[i]) for i in range(5)])
+        graph.add_edge(5, 0, 10)
+        dist = retworkx.digraph_floyd_warshall_numpy(
+            graph,
+            lambda x: x,
+            parallel_threshold=self.parallel_threshold,
+            dtype=numpy.float32,
+        )
+        self.assertEqual(numpy.float32, dist.dtype)
+        expected = retworkx.digraph_floyd_warshall_numpy(graph, lambda x: x)
+        self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_floyd_warshall_numpy_float64_dtype_name(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        dist = retworkx.digraph_floyd_warshall_numpy(graph, dtype="float64")
+        self.assertEqual(numpy.float64, dist.dtype)
+        self.assertEqual(2, dist[0, 2])
+
+    def test_floyd_warshall_numpy_invalid_dtype(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(3)))
+        with self.assertRaises(ValueError):
+            retworkx.digraph_floyd_warshall_numpy(graph, dtype=numpy.int32)
+
+    def test_floyd_warshall_numpy_predecessors(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(6)))
+        graph.add_edges_from(
+            [(0, 1, 1), (1, 2, 1), (0, 2, 5), (2, 3, 1), (3, 4, 1), (0, 4, 9)]
+        )
+        dist, pred = retworkx.digraph_floyd_warshall_numpy(
+            graph,
+            lambda x: x,
+            parallel_threshold=self.parallel_threshold,
+            return_predecessors=True,
+        )
+        self.assertEqual(numpy.int64, pred.dtype)
+        self.assertEqual((6, 6), pred.shape)
+        self.assertEqual(
+            [0, 1, 2, 3, 4], self._path_from_predecessors(pred, 0, 4)
+        )
+        self.assertEqual(4, dist[0, 4])
+        self.assertEqual(-1, pred[0, 0])
+        self.assertEqual(-1, pred[4, 0])
+        self.assertEqual(-1, pred[0, 5])
+
+    def test_floyd_warshall_numpy_as_undirected_predecessors(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(4)))
+        graph.add_edges_from_no_data([(0, 1), (2, 1), (3, 2)])
+        _, pred = retworkx.digraph_floyd_warshall_numpy(
+            graph,
+            as_undirected=True,
+            parallel_threshold=self.parallel_threshold,
+            return_predecessors=True,
+        )
+        self.assertEqual([3, 2, 1, 0], self._path_from_predecessors(pred, 3, 0))
+
+    def test_floyd_warshall_numpy_multiple_blocks(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(200)))
+        graph.add_edges_from(
+            [
+                (i, (i * j + 1) % 200, (i + j) % 5 + 1)
+                for i in range(200)
+                for j in (3, 7, 31)
+            ]
+        )
+        dist, pred = retworkx.digraph_floyd_warshall_numpy(
+            graph,
+            lambda x: x,
+            parallel_threshold=self.parallel_threshold,
+            return_predecessors=True,
+        )
+        expected = retworkx.digraph_all_pairs_dijkstra_path_lengths(
+            graph, lambda x: x
+        )
+        self.assertTrue(numpy.array_equal(dist, expected))
+        for source, target in [(0, 197), (150, 3), (64, 128)]:
+            path = self._path_from_predecessors(pred, source, target)
+            length = sum(
+                min(graph.get_all_edge_data(u, v))
+                for u, v in zip(path, path[1:])
+            )
+            self.assertEqual(dist[source, target], length)
+
+    def test_floyd_warshall_numpy_predecessors_are_positions(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(6)))
+        graph.remove_node(2)
+        graph.add_edges_from_no_data([(0, 1), (1, 3), (3, 4), (4, 5)])
+        dist, pred = retworkx.digraph_floyd_warshall_numpy(
+            graph,
+            parallel_threshold=self.parallel_threshold,
+            return_predecessors=True,
+        )
+        self.assertEqual((5, 5), pred.shape)
+        # Node 5 is at position 4 and is reached from node 4 at position 3
+        self.assertEqual(3, pred[0, 4])
+        self.assertEqual(4, dist[0, 4])
+        path = self._path_from_predecessors(pred, 0, 4)
+        self.assertEqual([0, 1, 2, 3, 4], path)
+        node_indexes = graph.node_indexes()
+        self.assertEqual([0, 1, 3, 4, 5], [node_indexes[x] for x in path])
+
 
 class TestParallelFloydWarshall(TestFloydWarshall):
     parallel_threshold = 0
@@ -0,0 +1,239 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestFreeze(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "d", "e"])
+        self.graph.add_edges_from(
+            [(0, 1, 1.0), (1, 2, 2.0), (0, 2, 5.0), (2, 3, 1.0), (3, 1, 1.0)]
+        )
+        self.graph.remove_node(4)
+        self.frozen = self.graph.freeze()
+
+    def test_freeze_contents(self):
+        self.assertIsInstance(self.frozen, retworkx.CSRDiGraph)
+        self.assertEqual(len(self.graph), len(self.frozen))
+        self.assertEqual(self.graph.nodes(), self.frozen.nodes())
+        self.assertEqual(self.graph.node_indexes(), self.frozen.node_indexes())
+        self.assertEqual(self.graph.edge_list(), self.frozen.edge_list())
+        self.assertEqual(
+            self.graph.weighted_edge_list(), self.frozen.weighted_edge_list()
+        )
+        self.assertEqual("c", self.frozen[2])
+        with self.assertRaises(IndexError):
+            self.frozen[4]
+
+    def test_freeze_shares_payloads(self):
+        graph = retworkx.PyDiGraph()
+        payload = {"a": 1}
+        graph.add_node(payload)
+        frozen = graph.freeze()
+        self.assertIs(payload, frozen[0])
+
+    def test_freeze_is_snapshot(self):
+        self.graph.add_edge(3, 0, 1.0)
+        self.assertFalse(self.frozen.has_edge(3, 0))
+        self.assertTrue(self.graph.has_edge(3, 0))
+
+    def test_adjacency(self):
+        for node in self.graph.node_indexes():
+            self.assertEqual(
+                sorted(self.graph.successor_indices(node)),
+                sorted(self.frozen.successor_indices(node)),
+            )
+            self.assertEqual(
+                sorted(self.graph.predecessor_indices(node)),
+                sorted(self.frozen.predecessor_indices(node)),
+            )
+            self.assertEqual(
+                self.graph.in_degree(node), self.frozen.in_degree(node)
+            )
+            self.assertEqual(
+                self.graph.out_degree(node), self.frozen.out_degree(node)
+            )
+
+    def test_csr_arrays(self):
+        indptr, indices, edge_ids = self.frozen.csr_arrays()
+        self.assertEqual(len(indptr), 6)
+        self.assertEqual(indptr[-1], 5)
+        self.assertEqual(len(indices), 5)
+        self.assertEqual(len(edge_ids), 5)
+        self.assertEqual(sorted(indices[indptr[0] : indptr[1]]), [1, 2])
+        self.assertEqual(indptr[4], indptr[5])
+
+    def test_dfs_edges(self):
+        self.assertEqual(
+            retworkx.dfs_edges(self.graph, 0),
+            retworkx.dfs_edges(self.frozen, 0),
+        )
+
+    def test_distance_matrix(self):
+        graph = retworkx.generators.directed_path_graph(5)
+        graph.add_edge(4, 0, None)
+        expected = retworkx.distance_matrix(graph)
+        res = retworkx.distance_matrix(graph.freeze())
+        np.testing.assert_array_equal(expected, res)
+        expected = retworkx.distance_matrix(graph, as_undirected=True)
+        res = retworkx.distance_matrix(graph.freeze(), as_undirected=True)
+        np.testing.assert_array_equal(expected, res)
+
+    def test_distance_matrix_parallel(self):
+        graph = retworkx.generators.directed_path_graph(10)
+        expected = retworkx.distance_matrix(graph)
+        res = retworkx.distance_matrix(graph.freeze(), parallel_threshold=2)
+        np.testing.assert_array_equal(expected, res)
+
+    def test_distance_matrix_dtype(self):
+        graph = retworkx.generators.directed_path_graph(10)
+        graph.remove_node(3)
+        expected = retworkx.distance_matrix(
+            graph, dtype=np.int32, null_value=-1
+        )
+        res = retworkx.distance_matrix(
+            graph.freeze(), dtype=np.int32, null_value=-1
+        )
+        self.assertEqual(np.int32, res.dtype)
+        np.testing.assert_array_equal(expected, res)
+
+    def test_dijkstra_shortest_paths(self):
+        expected = retworkx.dijkstra_shortest_paths(
+            self.graph, 0, weight_fn=float
+        )
+        res = retworkx.dijkstra_shortest_paths(self.frozen, 0, weight_fn=float)
+        self.assertEqual(expected, res)
+        self.assertEqual({1: [0, 1], 2: [0, 1, 2], 3: [0, 1, 2, 3]}, res)
+
+    def test_dijkstra_shortest_paths_as_undirected(self):
+        expected = retworkx.dijkstra_shortest_paths(
+            self.graph, 3, weight_fn=float, as_undirected=True
+        )
+        res = retworkx.dijkstra_shortest_paths(
+            self.frozen, 3, weight_fn=float, as_undirected=True
+        )
+        self.assertEqual(expected, res)
+        self.assertEqual({0: [3, 1, 0], 1: [3, 1], 2: [3, 2]}, res)
+
+    def test_dijkstra_shortest_paths_as_arrays(self):
+        for as_undirected in (False, True):
+            expected = retworkx.dijkstra_shortest_paths(
+                self.graph,
+                3,
+                weight_fn=float,
+                as_undirected=as_undirected,
+                as_arrays=True,
+            )
+            res = retworkx.dijkstra_shortest_paths(
+                self.frozen,
+                3,
+                weight_fn=float,
+                as_undirected=as_undirected,
+                as_arrays=True,
+            )
+            for expected_array, array in zip(expected, res):
+                np.testing.assert_array_equal(expected_array, array)
+
+    def test_dijkstra_shortest_path_lengths(self):
+        expected = retworkx.dijkstra_shortest_path_lengths(self.graph, 0, float)
+        res = retworkx.dijkstra_shortest_path_lengths(self.frozen, 0, float)
+        self.assertEqual(expected, res)
+        self.assertEqual({1: 1.0, 2: 3.0, 3: 4.0}, res)
+
+    def test_strongly_connected_components(self):
+        res = retworkx.strongly_connected_components(self.frozen)
+        self.assertEqual(
+            sorted(sorted(x) for x in res),
+            sorted(
+                sorted(x)
+                for x in retworkx.strongly_connected_components(self.graph)
+            ),
+        )
+
+    def test_weakly_connected_components(self):
+        self.graph.add_node("f")
+        frozen = self.graph.freeze()
+        self.assertEqual(
+            retworkx.weakly_connected_components(self.graph),
+            retworkx.weakly_connected_components(frozen),
+        )
+
+    def test_topological_sort(self):
+        dag = retworkx.generators.directed_path_graph(5)
+        self.assertEqual(
+            [0, 1, 2, 3, 4], retworkx.topological_sort(dag.freeze())
+        )
+
+    def test_topological_sort_cycle(self):
+        with self.assertRaises(retworkx.DAGHasCycle):
+            retworkx.topological_sort(self.frozen)
+
+    def test_number_weakly_connected_components(self):
+        self.graph.add_node("f")
+        frozen = self.graph.freeze()
+        self.assertEqual(2, retworkx.number_weakly_connected_components(frozen))
+        self.assertFalse(retworkx.is_weakly_connected(frozen))
+
+    def test_is_directed_acyclic_graph(self):
+        dag = retworkx.generators.directed_path_graph(5)
+        self.assertTrue(retworkx.is_directed_acyclic_graph(dag.freeze()))
+        self.assertFalse(retworkx.is_directed_acyclic_graph(self.frozen))
+
+    def test_floyd_warshall_numpy(self):
+        expected = retworkx.floyd_warshall_numpy(self.graph, weight_fn=float)
+        res = retworkx.floyd_warshall_numpy(self.frozen, weight_fn=float)
+        np.testing.assert_array_equal(expected, res)
+
+    def test_all_pairs_dijkstra_path_lengths(self):
+        expected = retworkx.all_pairs_dijkstra_path_lengths(self.graph, float)
+        res = retworkx.all_pairs_dijkstra_path_lengths(self.frozen, float)
+        self.assertEqual(
+            {k: dict(v) for k, v in expected.items()},
+            {k: dict(v) for k, v in res.items()},
+        )
+
+    def test_bidirectional_dijkstra(self):
+        expected = retworkx.bidirectional_dijkstra(self.graph, 0, 3, float)
+        res = retworkx.bidirectional_dijkstra(self.frozen, 0, 3, float)
+        self.assertEqual(expected, res)
+        self.assertEqual((4.0, [0, 1, 2, 3]), res)
+
+    def test_bellman_ford_shortest_paths(self):
+        expected = retworkx.bellman_ford_shortest_paths(
+            self.graph, 0, weight_fn=float
+        )
+        res = retworkx.bellman_ford_shortest_paths(
+            self.frozen, 0, weight_fn=float
+        )
+        self.assertEqual(expected, res)
+
+    def test_johnson_all_pairs(self):
+        expected = retworkx.johnson_all_pairs(self.graph, float)
+        res = retworkx.johnson_all_pairs(self.frozen, float)
+        self.assertEqual(
+            {k: dict(v) for k, v in expected.items()},
+            {k: dict(v) for k, v in res.items()},
+        )
+
+    def test_invalid_type(self):
+        with self.assertRaises(TypeError):
+            retworkx.digraph_dijkstra_shortest_paths(self.frozen.nodes(), 0)
+        with self.assertRaises(TypeError):
+            retworkx.digraph_dijkstra_shortest_paths(
+                retworkx.PyGraph().freeze(), 0
+            )
@@ -0,0 +1,81 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import sys
+import unittest
+
+import retworkx
+
+
+class TestMemoryUsage(unittest.TestCase):
+    def test_empty(self):
+        graph = retworkx.PyDiGraph()
+        usage = graph.memory_usage()
+        self.assertEqual(0, usage["node_slots"])
+        self.assertEqual(0, usage["edge_slots"])
+        self.assertEqual(usage["object"], usage["total"])
+        self.assertEqual(usage["total"], graph.__sizeof__())
+
+    def test_grows_with_graph(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(10))
+        small = graph.memory_usage()
+        graph.add_nodes_from(range(10))
+        graph.add_edges_from_no_data([(i, i + 1) for i in range(19)])
+        large = graph.memory_usage()
+        self.assertEqual(2 * small["node_slots"], large["node_slots"])
+        self.assertGreater(large["edge_slots"], 0)
+        self.assertGreater(large["total"], small["total"])
+        self.assertGreaterEqual(sys.getsizeof(graph), large["total"])
+
+    def test_free_slots(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2), (0, 2)])
+        before = graph.memory_usage()
+        graph.remove_node(1)
+        after = graph.memory_usage()
+        self.assertGreater(after["free_node_slots"], 0)
+        self.assertGreater(after["free_edge_slots"], 0)
+        self.assertEqual(
+            before["node_slots"],
+            after["node_slots"] + after["free_node_slots"],
+        )
+
+    def test_edge_index_and_topo_order(self):
+        graph = retworkx.PyDAG(check_cycle=True, multigraph=False)
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        usage = graph.memory_usage()
+        self.assertGreater(usage["edge_index"], 0)
+        self.assertGreater(usage["topo_order"], 0)
+        multigraph = retworkx.PyDAG()
+        self.assertEqual(0, multigraph.memory_usage()["edge_index"])
+
+    def test_deep(self):
+        graph = retworkx.PyDiGraph()
+        payload = ["a" * 100, {"b": 1}]
+        graph.add_node(payload)
+        graph.add_node(payload)
+        graph.add_edge(0, 1, None)
+        usage = graph.memory_usage(deep=True)
+        expected = (
+            sys.getsizeof(payload)
+            + sys.getsizeof(payload[0])
+            + sys.getsizeof(payload[1])
+            + sys.getsizeof("b")
+            + sys.getsizeof(1)
+            + sys.getsizeof(None)
+        )
+        self.assertEqual(expected, usage["payloads"])
+        self.assertEqual(graph.__sizeof__() + usage["payloads"], usage["total"])
+        self.assertNotIn("payloads", graph.memory_usage())
@@ -0,0 +1,132 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import pickle
+import unittest
+
+import retworkx
+
+
+class TestPayloadIndex(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "b"])
+        self.graph.build_payload_index()
+
+    def test_has_payload_index(self):
+        self.assertTrue(self.graph.has_payload_index)
+        self.assertFalse(retworkx.PyDiGraph().has_payload_index)
+
+    def test_find(self):
+        self.assertEqual(0, self.graph.find_node_by_weight("a"))
+        self.assertEqual(2, self.graph.find_node_by_weight("c"))
+        self.assertIsNone(self.graph.find_node_by_weight("z"))
+
+    def test_find_first_match(self):
+        self.assertEqual(1, self.graph.find_node_by_weight("b"))
+
+    def test_add_node(self):
+        index = self.graph.add_node("d")
+        self.assertEqual(index, self.graph.find_node_by_weight("d"))
+
+    def test_add_child_and_parent(self):
+        child = self.graph.add_child(0, "child", None)
+        parent = self.graph.add_parent(0, "parent", None)
+        self.assertEqual(child, self.graph.find_node_by_weight("child"))
+        self.assertEqual(parent, self.graph.find_node_by_weight("parent"))
+
+    def test_remove_node(self):
+        self.graph.remove_node(1)
+        self.assertEqual(3, self.graph.find_node_by_weight("b"))
+        del self.graph[3]
+        self.assertIsNone(self.graph.find_node_by_weight("b"))
+
+    def test_removed_slot_reused(self):
+        self.graph.remove_node(0)
+        index = self.graph.add_node("e")
+        self.assertEqual(0, index)
+        self.assertIsNone(self.graph.find_node_by_weight("a"))
+        self.assertEqual(0, self.graph.find_node_by_weight("e"))
+
+    def test_setitem(self):
+        self.graph[2] = "z"
+        self.assertIsNone(self.graph.find_node_by_weight("c"))
+        self.assertEqual(2, self.graph.find_node_by_weight("z"))
+
+    def test_setitem_unhashable(self):
+        with self.assertRaises(TypeError):
+            self.graph[2] = ["c"]
+        self.assertEqual("c", self.graph[2])
+
+    def test_add_unhashable(self):
+        with self.assertRaises(TypeError):
+            self.graph.add_node({})
+        self.assertEqual(4, len(self.graph))
+
+    def test_build_unhashable(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_node([1, 2])
+        with self.assertRaises(TypeError):
+            graph.build_payload_index()
+        self.assertFalse(graph.has_payload_index)
+
+    def test_key(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from([{"name": "a"}, {"name": "b"}])
+        graph.build_payload_index(key=lambda payload: payload["name"])
+        self.assertEqual(1, graph.find_node_by_weight({"name": "b"}))
+        self.assertIsNone(graph.find_node_by_weight({"name": "c"}))
+        index = graph.add_node({"name": "c"})
+        self.assertEqual(index, graph.find_node_by_weight({"name": "c"}))
+
+    def test_key_compares_payloads(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from([(1, "a"), (1, "b")])
+        graph.build_payload_index(key=lambda payload: payload[0])
+        self.assertEqual(1, graph.find_node_by_weight((1, "b")))
+        self.assertIsNone(graph.find_node_by_weight((1, "c")))
+
+    def test_clear(self):
+        self.graph.clear_payload_index()
+        self.assertFalse(self.graph.has_payload_index)
+        self.assertEqual(2, self.graph.find_node_by_weight("c"))
+        self.graph.add_node([])
+
+    def test_compact(self):
+        self.graph.remove_node(0)
+        self.graph.compact()
+        self.assertEqual(0, self.graph.find_node_by_weight("b"))
+        self.assertEqual(1, self.graph.find_node_by_weight("c"))
+
+    def test_copy(self):
+        copy = self.graph.copy()
+        self.assertTrue(copy.has_payload_index)
+        copy.add_node("d")
+        self.assertIsNone(self.graph.find_node_by_weight("d"))
+
+    def test_not_pickled(self):
+        graph = pickle.loads(pickle.dumps(self.graph))
+        self.assertFalse(graph.has_payload_index)
+        self.assertEqual(2, graph.find_node_by_weight("c"))
+
+    def test_memory_usage(self):
+        self.assertGreater(self.graph.memory_usage()["payload_index"], 0)
+        self.graph.clear_payload_index()
+        self.assertEqual(0, self.graph.memory_usage()["payload_index"])
+
+    def test_union_merge_nodes(self):
+        other = retworkx.PyDiGraph()
+        other.add_nodes_from(["c", "d"])
+        other.add_edge(0, 1, None)
+        union = retworkx.digraph_union(self.graph, other, True, False)
+        self.assertEqual(["a", "b", "c", "b", "d"], union.nodes())
+        self.assertEqual([(2, 5)], union.edge_list())
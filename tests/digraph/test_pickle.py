@@ -0,0 +1,140 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import pickle
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestPickle(unittest.TestCase):
+    def test_round_trip_with_holes(self):
+        dag = retworkx.PyDAG()
+        node_a = dag.add_node("a")
+        node_b = dag.add_child(node_a, "b", "a->b")
+        node_c = dag.add_child(node_b, "c", "b->c")
+        dag.add_edge(node_a, node_c, "a->c")
+        dag.remove_node(node_b)
+        res = pickle.loads(pickle.dumps(dag))
+        self.assertIsInstance(res, retworkx.PyDAG)
+        self.assertEqual([node_a, node_c], res.node_indexes())
+        self.assertEqual(["a", "c"], res.nodes())
+        self.assertEqual(
+            dag.edge_ids_array().tolist(), res.edge_ids_array().tolist()
+        )
+        self.assertEqual(dag.weighted_edge_list(), res.weighted_edge_list())
+
+    def test_edge_indices_preserved(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(4))
+        graph.add_edges_from([(0, 1, 0), (1, 2, 1), (2, 3, 2), (3, 0, 3)])
+        graph.remove_edge_from_index(1)
+        res = pickle.loads(pickle.dumps(graph))
+        self.assertEqual([0, 2, 3], res.edge_ids_array().tolist())
+        self.assertEqual(
+            [[0, 1], [2, 3], [3, 0]], res.edge_index_array().tolist()
+        )
+        self.assertEqual(3, res.get_edge_data(3, 0))
+
+    def test_state_is_packed(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(["a", "b"])
+        graph.add_edge(0, 1, "edge")
+        state = graph.__getstate__()
+        self.assertIsInstance(state["structure"], np.ndarray)
+        self.assertEqual(np.uint8, state["structure"].dtype)
+        self.assertEqual(["a", "b"], state["node_payloads"])
+        self.assertEqual(["edge"], state["edge_payloads"])
+
+    def test_protocol_5_out_of_band(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(100))
+        graph.add_edges_from_no_data([(i, i + 1) for i in range(99)])
+        buffers = []
+        data = pickle.dumps(graph, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(1, len(buffers))
+        res = pickle.loads(data, buffers=buffers)
+        self.assertEqual(graph.edge_list(), res.edge_list())
+        self.assertEqual(graph.nodes(), res.nodes())
+
+    def test_check_cycle_preserved(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(3))
+        dag.add_edges_from_no_data([(0, 1), (1, 2)])
+        res = pickle.loads(pickle.dumps(dag))
+        self.assertTrue(res.check_cycle)
+        self.assertEqual([0, 1, 2], retworkx.topological_sort(res))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            res.add_edge(2, 0, None)
+
+    def test_multigraph_false_preserved(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(range(2))
+        graph.add_edge(0, 1, "a")
+        res = pickle.loads(pickle.dumps(graph))
+        self.assertFalse(res.multigraph)
+        res.add_edge(0, 1, "b")
+        self.assertEqual(1, len(res.edge_list()))
+        self.assertEqual("b", res.get_edge_data(0, 1))
+
+    def test_legacy_state(self):
+        graph = retworkx.PyDiGraph()
+        graph.__setstate__(
+            {
+                "nodes": {0: "a", 2: "c"},
+                "edges": [(0, 2, "a->c")],
+                "nodes_removed": True,
+                "multigraph": True,
+            }
+        )
+        self.assertEqual([0, 2], graph.node_indexes())
+        self.assertEqual([(0, 2, "a->c")], graph.weighted_edge_list())
+
+    def test_invalid_packed_state(self):
+        graph = retworkx.PyDiGraph()
+        state = graph.__getstate__()
+        state["node_payloads"] = ["extra"]
+        with self.assertRaises(ValueError):
+            graph.__setstate__(state)
+
+    def test_truncated_packed_state(self):
+        graph = retworkx.PyDiGraph()
+        graph.extend_from_edge_list([(0, 1), (1, 2)])
+        state = graph.__getstate__()
+        state["structure"] = state["structure"][:-1]
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph().__setstate__(state)
+
+    def test_packed_state_bounds_too_large(self):
+        graph = retworkx.PyDiGraph()
+        graph.extend_from_edge_list([(0, 1)])
+        for offset in (0, 8):
+            state = graph.__getstate__()
+            structure = state["structure"].copy()
+            structure[offset : offset + 8] = 0xFF
+            state["structure"] = structure
+            with self.assertRaises(ValueError):
+                retworkx.PyDiGraph().__setstate__(state)
+
+    def test_packed_state_payload_count_mismatch(self):
+        graph = retworkx.PyDiGraph()
+        graph.extend_from_edge_list([(0, 1)])
+        state = graph.__getstate__()
+        state["edge_payloads"] = []
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph().__setstate__(state)
+
+    def test_empty(self):
+        res = pickle.loads(pickle.dumps(retworkx.PyDiGraph()))
+        self.assertEqual(0, len(res))
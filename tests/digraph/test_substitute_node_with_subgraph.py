@@ -0,0 +1,142 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestSubstitute(unittest.TestCase):
+    def setUp(self):
+        # 0 -> 1 -> 2, 3 -> 1 -> 4
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "d", "e"])
+        self.graph.add_edges_from(
+            [(0, 1, "ab"), (1, 2, "bc"), (3, 1, "db"), (1, 4, "be")]
+        )
+        # x -> y -> z
+        self.other = retworkx.PyDiGraph()
+        self.other.add_nodes_from(["x", "y", "z"])
+        self.other.add_edges_from([(0, 1, "xy"), (1, 2, "yz")])
+
+    @staticmethod
+    def in_to_x_out_from_z(source, target, weight):
+        return 0 if target == 1 else 2
+
+    def test_substitute(self):
+        res = self.graph.substitute_node_with_subgraph(
+            1, self.other, self.in_to_x_out_from_z
+        )
+        self.assertEqual({0, 1, 2}, set(res))
+        self.assertNotIn("b", self.graph.nodes())
+        self.assertEqual(7, len(self.graph))
+        for index, payload in enumerate(["x", "y", "z"]):
+            self.assertEqual(payload, self.graph[res[index]])
+        expected = {
+            (0, res[0], "ab"),
+            (3, res[0], "db"),
+            (res[2], 2, "bc"),
+            (res[2], 4, "be"),
+            (res[0], res[1], "xy"),
+            (res[1], res[2], "yz"),
+        }
+        self.assertEqual(expected, set(self.graph.weighted_edge_list()))
+
+    def test_edge_map_fn_args(self):
+        calls = []
+
+        def edge_map_fn(source, target, weight):
+            calls.append((source, target, weight))
+            return 1
+
+        self.graph.substitute_node_with_subgraph(1, self.other, edge_map_fn)
+        self.assertEqual(
+            sorted([(0, 1, "ab"), (3, 1, "db"), (1, 2, "bc"), (1, 4, "be")]),
+            sorted(calls),
+        )
+
+    def test_drop_edges(self):
+        res = self.graph.substitute_node_with_subgraph(
+            1, self.other, lambda s, t, w: None if w == "db" else 1
+        )
+        self.assertFalse(self.graph.has_edge(3, res[1]))
+        self.assertTrue(self.graph.has_edge(0, res[1]))
+        self.assertEqual(5, len(self.graph.edge_list()))
+
+    def test_empty_other(self):
+        res = self.graph.substitute_node_with_subgraph(
+            1, retworkx.PyDiGraph(), lambda s, t, w: None
+        )
+        self.assertEqual({}, res)
+        self.assertEqual(4, len(self.graph))
+        self.assertEqual([], self.graph.edge_list())
+
+    def test_self_loop(self):
+        self.graph.add_edge(1, 1, "loop")
+        res = self.graph.substitute_node_with_subgraph(
+            1, self.other, lambda s, t, w: 1
+        )
+        self.assertEqual("loop", self.graph.get_edge_data(res[1], res[1]))
+
+    def test_invalid_node(self):
+        with self.assertRaises(IndexError):
+            self.graph.substitute_node_with_subgraph(
+                42, self.other, lambda s, t, w: 0
+            )
+
+    def test_invalid_mapped_node_leaves_graph_unchanged(self):
+        with self.assertRaises(IndexError):
+            self.graph.substitute_node_with_subgraph(
+                1, self.other, lambda s, t, w: 42
+            )
+        self.assertEqual(5, len(self.graph))
+        self.assertEqual(4, len(self.graph.edge_list()))
+
+    def test_callback_error_leaves_graph_unchanged(self):
+        def edge_map_fn(source, target, weight):
+            raise KeyError(weight)
+
+        with self.assertRaises(KeyError):
+            self.graph.substitute_node_with_subgraph(1, self.other, edge_map_fn)
+        self.assertEqual(["a", "b", "c", "d", "e"], self.graph.nodes())
+
+    def test_dag(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(5))
+        dag.add_edges_from_no_data([(0, 1), (1, 2), (3, 1), (1, 4), (2, 4)])
+        res = dag.substitute_node_with_subgraph(
+            1, self.other, self.in_to_x_out_from_z
+        )
+        order = retworkx.topological_sort(dag)
+        position = {node: pos for pos, node in enumerate(order)}
+        self.assertEqual(len(dag), len(position))
+        for source, target in dag.edge_list():
+            self.assertLess(position[source], position[target])
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(4, res[0], None)
+
+    def test_dag_cyclic_other(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(range(3))
+        dag.add_edges_from_no_data([(0, 1), (1, 2)])
+        self.other.add_edge(2, 0, None)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.substitute_node_with_subgraph(1, self.other, lambda s, t, w: 0)
+        self.assertEqual([0, 1, 2], dag.node_indexes())
+
+    def test_payload_index(self):
+        self.graph.build_payload_index()
+        res = self.graph.substitute_node_with_subgraph(
+            1, self.other, self.in_to_x_out_from_z
+        )
+        self.assertIsNone(self.graph.find_node_by_weight("b"))
+        self.assertEqual(res[1], self.graph.find_node_by_weight("y"))
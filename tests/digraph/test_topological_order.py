@@ -0,0 +1,120 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import random
+import unittest
+
+import retworkx
+
+
+class TestMaintainedTopologicalOrder(unittest.TestCase):
+    def assertTopologicalOrder(self, dag):
+        order = retworkx.topological_sort(dag)
+        self.assertEqual(sorted(order), sorted(dag.node_indexes()))
+        position = {node: index for index, node in enumerate(order)}
+        for source, target in dag.edge_list():
+            self.assertLess(position[source], position[target])
+
+    def test_reversed_insertion(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(6)))
+        for node in range(5, 0, -1):
+            dag.add_edge(node - 1, node, None)
+        self.assertEqual([0, 1, 2, 3, 4, 5], retworkx.topological_sort(dag))
+
+    def test_edge_against_order(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(4)))
+        dag.add_edge(0, 1, None)
+        dag.add_edge(2, 3, None)
+        dag.add_edge(3, 0, None)
+        self.assertEqual([2, 3, 0, 1], retworkx.topological_sort(dag))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(1, 2, None)
+        self.assertTopologicalOrder(dag)
+
+    def test_self_loop(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        node = dag.add_node(None)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(node, node, None)
+        self.assertEqual([], dag.edge_list())
+
+    def test_add_parent_and_child(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        node = dag.add_node("a")
+        child = dag.add_child(node, "b", None)
+        parent = dag.add_parent(node, "c", None)
+        self.assertEqual([parent, node, child], retworkx.topological_sort(dag))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(child, parent, None)
+
+    def test_isolated_nodes(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(3)))
+        dag.add_edge(2, 1, None)
+        self.assertTopologicalOrder(dag)
+
+    def test_remove_nodes(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        nodes = dag.add_nodes_from(list(range(10)))
+        for node in nodes[1:]:
+            dag.add_edge(node, node - 1, None)
+        dag.remove_nodes_from([2, 4, 6, 8])
+        del dag[5]
+        self.assertEqual([9, 7, 3, 1, 0], retworkx.topological_sort(dag))
+        # Reuse the removed indices
+        dag.add_nodes_from(list(range(4)))
+        dag.add_edge(0, 8, None)
+        dag.add_edge(1, 6, None)
+        self.assertTopologicalOrder(dag)
+
+    def test_enable_check_cycle(self):
+        dag = retworkx.PyDAG()
+        dag.extend_from_edge_list([(3, 2), (2, 1), (1, 0)])
+        dag.check_cycle = True
+        self.assertEqual([3, 2, 1, 0], retworkx.topological_sort(dag))
+        dag.add_edge(0, dag.add_node(None), None)
+        self.assertTopologicalOrder(dag)
+        dag.check_cycle = False
+        dag.add_edge(0, 3, None)
+        with self.assertRaises(retworkx.DAGHasCycle):
+            retworkx.topological_sort(dag)
+
+    def test_subgraph_keeps_order(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.extend_from_edge_list([(3, 2), (2, 1), (1, 0)])
+        subgraph = dag.subgraph([1, 2, 3])
+        self.assertTrue(subgraph.check_cycle)
+        self.assertEqual([2, 1, 0], retworkx.topological_sort(subgraph))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            subgraph.add_edge(0, 2, None)
+
+    def test_random_insertions(self):
+        rng = random.Random(42)
+        dag = retworkx.PyDAG(check_cycle=True)
+        reference = retworkx.PyDAG()
+        dag.add_nodes_from(list(range(50)))
+        reference.add_nodes_from(list(range(50)))
+        for _ in range(400):
+            source = rng.randrange(50)
+            target = rng.randrange(50)
+            reference.add_edge(source, target, None)
+            would_cycle = not retworkx.is_directed_acyclic_graph(reference)
+            if would_cycle:
+                reference.remove_edge(source, target)
+                with self.assertRaises(retworkx.DAGWouldCycle):
+                    dag.add_edge(source, target, None)
+            else:
+                dag.add_edge(source, target, None)
+        self.assertEqual(sorted(reference.edge_list()), sorted(dag.edge_list()))
+        self.assertTopologicalOrder(dag)
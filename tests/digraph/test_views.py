@@ -0,0 +1,201 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestNodeView(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "d"])
+        self.graph.remove_node(1)
+
+    def test_len(self):
+        self.assertEqual(3, len(self.graph.node_view()))
+
+    def test_contains(self):
+        view = self.graph.node_view()
+        self.assertIn(0, view)
+        self.assertNotIn(1, view)
+        self.assertNotIn(10, view)
+
+    def test_getitem(self):
+        view = self.graph.node_view()
+        self.assertEqual("c", view[2])
+        with self.assertRaises(IndexError):
+            view[1]
+
+    def test_iter(self):
+        view = self.graph.node_view()
+        self.assertEqual([0, 2, 3], list(view))
+
+    def test_live(self):
+        view = self.graph.node_view()
+        self.graph.add_node("e")
+        self.assertEqual(4, len(view))
+        self.assertEqual([0, 1, 2, 3], list(view))
+        self.assertEqual("e", view[1])
+
+    def test_changed_during_iteration(self):
+        view = self.graph.node_view()
+        with self.assertRaises(RuntimeError):
+            for node in view:
+                self.graph.remove_node(node)
+
+    def test_empty(self):
+        view = retworkx.PyDiGraph().node_view()
+        self.assertEqual(0, len(view))
+        self.assertEqual([], list(view))
+
+
+class TestEdgeView(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(range(4))
+        self.graph.add_edges_from(
+            [(0, 1, "a"), (1, 2, "b"), (2, 3, "c"), (3, 0, "d")]
+        )
+        self.graph.remove_edge_from_index(1)
+
+    def test_len(self):
+        self.assertEqual(3, len(self.graph.edge_view()))
+
+    def test_contains(self):
+        view = self.graph.edge_view()
+        self.assertIn((0, 1), view)
+        self.assertNotIn((1, 0), view)
+        self.assertNotIn((1, 2), view)
+
+    def test_getitem(self):
+        view = self.graph.edge_view()
+        self.assertEqual("c", view[2, 3])
+        with self.assertRaises(KeyError):
+            view[1, 2]
+
+    def test_iter(self):
+        view = self.graph.edge_view()
+        self.assertEqual(self.graph.edge_list(), list(view))
+
+    def test_iter_after_many_removals(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(10))
+        graph.add_edges_from_no_data([(i, i + 1) for i in range(9)])
+        for edge in range(7):
+            graph.remove_edge_from_index(edge)
+        self.assertEqual([(7, 8), (8, 9)], list(graph.edge_view()))
+
+    def test_live(self):
+        view = self.graph.edge_view()
+        self.graph.add_edge(1, 2, "e")
+        self.assertIn((1, 2), view)
+        self.assertEqual("e", view[1, 2])
+        self.assertEqual(4, len(view))
+
+    def test_multigraph_false(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(range(2))
+        graph.add_edge(0, 1, "a")
+        self.assertEqual("a", graph.edge_view()[0, 1])
+
+
+class TestAdjView(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(range(4))
+        self.graph.add_edges_from(
+            [(0, 1, "0->1"), (1, 2, "1->2"), (3, 1, "3->1"), (1, 3, "1->3")]
+        )
+
+    def test_successors(self):
+        view = self.graph.adj_view(1, False)
+        self.assertEqual(2, len(view))
+        self.assertEqual({2, 3}, set(view))
+        self.assertEqual("1->3", view[3])
+        self.assertIn(2, view)
+        self.assertNotIn(0, view)
+        with self.assertRaises(KeyError):
+            view[0]
+
+    def test_predecessors(self):
+        view = self.graph.adj_view(1, True)
+        self.assertEqual(2, len(view))
+        self.assertEqual({0, 3}, set(view))
+        self.assertEqual("0->1", view[0])
+        self.assertEqual("3->1", view[3])
+        self.assertNotIn(2, view)
+
+    def test_both_directions(self):
+        view = self.graph.adj_view(1)
+        self.assertEqual(3, len(view))
+        self.assertEqual({0, 2, 3}, set(view))
+        self.assertEqual("0->1", view[0])
+        self.assertEqual("1->2", view[2])
+
+    def test_multigraph(self):
+        self.graph.add_edge(1, 2, "1->2 again")
+        view = self.graph.adj_view(1, False)
+        self.assertEqual(2, len(view))
+        self.assertEqual([2, 3], sorted(view))
+
+    def test_live(self):
+        view = self.graph.adj_view(0, False)
+        self.assertEqual([1], list(view))
+        self.graph.add_edge(0, 2, "0->2")
+        self.assertIn(2, view)
+        self.assertEqual(2, len(view))
+        self.graph.remove_edge(0, 1)
+        self.assertEqual([2], list(view))
+
+    def test_matches_adj(self):
+        view = self.graph.adj_view(1, False)
+        self.assertEqual(
+            self.graph.adj_direction(1, False), {n: view[n] for n in view}
+        )
+
+    def test_multigraph_both_directions(self):
+        self.graph.add_edge(1, 2, "1->2 again")
+        self.graph.add_edge(0, 1, "0->1 again")
+        self.graph.add_edge(3, 1, "3->1 again")
+        view = self.graph.adj_view(1)
+        self.assertEqual(3, len(view))
+        self.assertEqual([0, 2, 3], sorted(view))
+
+    def test_missing_node(self):
+        with self.assertRaises(IndexError):
+            self.graph.adj_view(42)
+
+    def test_changed_during_iteration(self):
+        view = self.graph.adj_view(1)
+        with self.assertRaises(RuntimeError):
+            for node in view:
+                self.graph.add_edge(1, 0, None)
+
+    def test_edge_replaced_during_iteration(self):
+        view = self.graph.adj_view(1, False)
+        with self.assertRaises(RuntimeError):
+            for node in view:
+                self.graph.remove_edge(1, node)
+                self.graph.add_edge(0, 2, None)
+
+    def test_hub_multigraph(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(range(100))
+        for _ in range(3):
+            graph.add_edges_from_no_data([(0, i) for i in range(1, 100)])
+            graph.add_edges_from_no_data([(i, 0) for i in range(50, 100)])
+        self.assertEqual(99, len(graph.adj_view(0, False)))
+        self.assertEqual(50, len(graph.adj_view(0, True)))
+        view = graph.adj_view(0)
+        self.assertEqual(99, len(view))
+        self.assertEqual(list(range(1, 100)), sorted(view))
@@ -0,0 +1,144 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestAllPairsDijkstraGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(list(range(6)))
+        self.graph.add_edges_from(
+            [
+                (0, 1, 7),
+                (0, 2, 9),
+                (0, 5, 14),
+                (1, 2, 10),
+                (1, 3, 15),
+                (2, 3, 11),
+                (2, 5, 2),
+                (3, 4, 6),
+                (4, 5, 9),
+            ]
+        )
+
+    def test_all_pairs(self):
+        res = retworkx.graph_all_pairs_dijkstra_path_lengths(self.graph, float)
+        self.assertEqual(np.float64, res.dtype)
+        expected = retworkx.graph_floyd_warshall_numpy(
+            self.graph, weight_fn=float
+        )
+        np.testing.assert_array_equal(expected, res)
+        np.testing.assert_array_equal(res, res.T)
+
+    def test_sources_and_targets(self):
+        res = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            self.graph, float, sources=[0, 3], targets=[4, 4, 0]
+        )
+        expected = np.array([[20.0, 20.0, 0.0], [6.0, 6.0, 20.0]])
+        np.testing.assert_array_equal(expected, res)
+
+    def test_disconnected(self):
+        self.graph.add_node(6)
+        res = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            self.graph, float, sources=[6]
+        )
+        expected = np.array([[np.inf] * 6 + [0.0]])
+        np.testing.assert_array_equal(expected, res)
+
+    def test_parallel(self):
+        graph = retworkx.generators.grid_graph(20, 20)
+        res = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            graph, parallel_threshold=1
+        )
+        expected = retworkx.graph_distance_matrix(graph)
+        np.testing.assert_array_equal(expected, res)
+
+    def test_negative_weight(self):
+        with self.assertRaises(ValueError):
+            retworkx.graph_all_pairs_dijkstra_path_lengths(
+                self.graph, lambda _: -1.0
+            )
+
+    def test_invalid_node(self):
+        with self.assertRaises(IndexError):
+            retworkx.graph_all_pairs_dijkstra_path_lengths(
+                self.graph, float, sources=[42]
+            )
+
+    def test_sparse_cutoff(self):
+        graph = retworkx.generators.grid_graph(20, 20)
+        expected = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            graph, cutoff=5
+        )
+        self.assertEqual(np.inf, expected[0, 399])
+        self.assertEqual(5.0, expected[0, 5])
+        for parallel_threshold in (300, 1):
+            indptr, indices, data = (
+                retworkx.graph_all_pairs_dijkstra_path_lengths(
+                    graph,
+                    cutoff=5,
+                    sparse=True,
+                    parallel_threshold=parallel_threshold,
+                )
+            )
+            res = np.full((400, 400), np.inf)
+            np.fill_diagonal(res, 0.0)
+            for row in range(400):
+                columns = indices[indptr[row] : indptr[row + 1]]
+                res[row, columns] = data[indptr[row] : indptr[row + 1]]
+            np.testing.assert_array_equal(expected, res)
+
+    def test_out_path(self):
+        graph = retworkx.generators.grid_graph(20, 20)
+        expected = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            graph, sources=[0, 1, 2], cutoff=10
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "lengths.npy")
+            for parallel_threshold in (300, 1):
+                res = retworkx.graph_all_pairs_dijkstra_path_lengths(
+                    graph,
+                    sources=[0, 1, 2],
+                    cutoff=10,
+                    parallel_threshold=parallel_threshold,
+                    out=path,
+                )
+                self.assertIsInstance(res, np.memmap)
+                del res
+                np.testing.assert_array_equal(
+                    expected, np.load(path, mmap_mode="r")
+                )
+
+    def test_out_array(self):
+        out = np.zeros((6, 6))
+        res = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            self.graph, float, out=out
+        )
+        self.assertIs(out, res)
+        np.testing.assert_array_equal(
+            retworkx.graph_floyd_warshall_numpy(self.graph, float), out
+        )
+        with self.assertRaises(ValueError):
+            retworkx.graph_all_pairs_dijkstra_path_lengths(
+                self.graph, float, out=np.zeros((6, 6), dtype=np.float32)
+            )
+        with self.assertRaises(ValueError):
+            retworkx.graph_all_pairs_dijkstra_path_lengths(
+                self.graph, float, sparse=True, out=out
+            )
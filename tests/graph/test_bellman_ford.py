@@ -0,0 +1,73 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestBellmanFordGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(list(range(6)))
+        self.graph.add_edges_from(
+            [
+                (0, 1, 7),
+                (0, 2, 9),
+                (0, 5, 14),
+                (1, 2, 10),
+                (1, 3, 15),
+                (2, 3, 11),
+                (2, 5, 2),
+                (3, 4, 6),
+                (4, 5, 9),
+            ]
+        )
+
+    def test_bellman_ford(self):
+        paths = retworkx.graph_bellman_ford_shortest_paths(
+            self.graph, 0, weight_fn=float
+        )
+        expected = retworkx.graph_dijkstra_shortest_paths(
+            self.graph, 0, weight_fn=float
+        )
+        self.assertEqual({k: list(v) for k, v in expected.items()}, paths)
+
+    def test_bellman_ford_as_arrays(self):
+        dist, pred = retworkx.graph_bellman_ford_shortest_paths(
+            self.graph, 0, weight_fn=float, as_arrays=True
+        )
+        np.testing.assert_array_equal(
+            np.array([0.0, 7.0, 9.0, 20.0, 20.0, 11.0]), dist
+        )
+        np.testing.assert_array_equal(np.array([-1, 0, 0, 2, 5, 2]), pred)
+
+    def test_negative_edge_is_negative_cycle(self):
+        self.graph.add_edge(4, 5, -1)
+        with self.assertRaises(retworkx.NegativeCycle):
+            retworkx.graph_bellman_ford_shortest_paths(
+                self.graph, 0, weight_fn=float
+            )
+
+    def test_johnson(self):
+        res = retworkx.graph_johnson_all_pairs(self.graph, weight_fn=float)
+        expected = retworkx.graph_floyd_warshall_numpy(
+            self.graph, weight_fn=float
+        )
+        np.testing.assert_array_equal(expected, res)
+
+    def test_johnson_negative_edge(self):
+        self.graph.add_edge(4, 5, -1)
+        with self.assertRaises(retworkx.NegativeCycle):
+            retworkx.graph_johnson_all_pairs(self.graph, weight_fn=float)
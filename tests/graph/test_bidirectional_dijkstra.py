@@ -0,0 +1,64 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestBidirectionalDijkstraGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(list(range(6)))
+        self.graph.add_edges_from(
+            [
+                (0, 1, 7),
+                (0, 2, 9),
+                (0, 5, 14),
+                (1, 2, 10),
+                (1, 3, 15),
+                (2, 3, 11),
+                (2, 5, 2),
+                (3, 4, 6),
+                (4, 5, 9),
+            ]
+        )
+
+    def test_path(self):
+        length, path = retworkx.graph_bidirectional_dijkstra(
+            self.graph, 0, 4, weight_fn=float
+        )
+        self.assertEqual(20.0, length)
+        self.assertEqual([0, 2, 5, 4], path)
+        length, path = retworkx.graph_bidirectional_dijkstra(
+            self.graph, 4, 0, weight_fn=float
+        )
+        self.assertEqual(20.0, length)
+        self.assertEqual([4, 5, 2, 0], path)
+
+    def test_default_weight(self):
+        length, path = retworkx.graph_bidirectional_dijkstra(
+            self.graph, 1, 5, default_weight=2.0
+        )
+        self.assertEqual(4.0, length)
+        self.assertEqual(3, len(path))
+
+    def test_grid(self):
+        graph = retworkx.generators.grid_graph(30, 30)
+        length, path = retworkx.graph_bidirectional_dijkstra(graph, 0, 899)
+        self.assertEqual(58.0, length)
+        self.assertEqual(59, len(path))
+
+    def test_no_path(self):
+        self.graph.add_node(6)
+        with self.assertRaises(retworkx.NoPathFound):
+            retworkx.graph_bidirectional_dijkstra(self.graph, 0, 6)
@@ -0,0 +1,34 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestCapacity(unittest.TestCase):
+    def test_constructor_capacity(self):
+        graph = retworkx.PyGraph(node_capacity=10, edge_capacity=20)
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        self.assertEqual([(0, 1), (1, 2)], graph.edge_list())
+
+    def test_constructor_capacity_multigraph_false(self):
+        graph = retworkx.PyGraph(
+            multigraph=False, node_capacity=3, edge_capacity=3
+        )
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.add_edges_from([(0, 1, "a-b"), (1, 2, "b-c")])
+        graph.add_edge(1, 0, "updated")
+        self.assertEqual(
+            [(0, 1, "updated"), (1, 2, "b-c")], graph.weighted_edge_list()
+        )
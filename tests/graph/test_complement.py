@@ -95,3 +95,16 @@ class TestComplement(unittest.TestCase):
                 complement_graph,
             )
         )
+
+    def test_non_multigraph_updates_complement_edges(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.extend_from_edge_list([(0, 1), (1, 2)])
+
+        complement_graph = retworkx.complement(graph)
+        self.assertFalse(complement_graph.has_edge(0, 1))
+        self.assertTrue(complement_graph.has_edge(2, 0))
+        complement_graph.add_edge(2, 0, "a")
+        complement_graph.add_edge(1, 0, "b")
+        self.assertEqual(2, complement_graph.num_edges())
+        self.assertEqual("a", complement_graph.get_edge_data(0, 2))
+        self.assertEqual("b", complement_graph.get_edge_data(0, 1))
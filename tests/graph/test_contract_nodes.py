@@ -0,0 +1,65 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestContractNodes(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "d"])
+        self.graph.add_edges_from(
+            [(0, 1, "ab"), (1, 2, "bc"), (2, 3, "cd"), (3, 0, "da")]
+        )
+
+    def test_contract(self):
+        node = self.graph.contract_nodes([1, 2], "bc")
+        self.assertEqual("bc", self.graph[node])
+        self.assertEqual(3, len(self.graph))
+        self.assertEqual(3, len(self.graph.edge_list()))
+        self.assertEqual("ab", self.graph.get_edge_data(0, node))
+        self.assertEqual("cd", self.graph.get_edge_data(node, 3))
+
+    def test_invalid_node(self):
+        with self.assertRaises(IndexError):
+            self.graph.contract_nodes([0, 42], None)
+        self.assertEqual(4, len(self.graph))
+
+    def test_no_multigraph(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from([(0, 1, 1), (2, 0, 2)])
+        node = graph.contract_nodes(
+            [1, 2], None, weight_combo_fn=lambda a, b: a + b
+        )
+        self.assertEqual([(node, 0, 3)], graph.weighted_edge_list())
+
+    def test_quotient(self):
+        quotient = self.graph.quotient_graph([[0, 1], [2, 3]])
+        self.assertEqual([["a", "b"], ["c", "d"]], quotient.nodes())
+        self.assertEqual(
+            [(0, 1, "bc"), (1, 0, "da")], quotient.weighted_edge_list()
+        )
+
+    def test_quotient_no_multigraph(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(range(4))
+        graph.add_edges_from([(0, 1, 1), (1, 2, 2), (2, 3, 3), (3, 0, 4)])
+        quotient = graph.quotient_graph([[0, 1], [2, 3]], weight_combo_fn=min)
+        self.assertEqual([(0, 1, 2)], quotient.weighted_edge_list())
+
+    def test_quotient_keeps_unlisted_nodes(self):
+        quotient = self.graph.quotient_graph([[1, 2]], node_fn=len)
+        self.assertEqual([2, "a", "d"], quotient.nodes())
+        self.assertEqual(3, len(quotient.edge_list()))
@@ -0,0 +1,58 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import copy
+import unittest
+
+import retworkx
+
+
+class TestCopy(unittest.TestCase):
+    def test_copy(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.add_edges_from([(0, 1, "a-b"), (1, 2, "b-c"), (2, 0, "c-a")])
+        graph.remove_node(1)
+        res = graph.copy()
+        self.assertIsInstance(res, retworkx.PyGraph)
+        self.assertEqual(graph.node_indexes(), res.node_indexes())
+        self.assertEqual(graph.weighted_edge_list(), res.weighted_edge_list())
+        self.assertEqual(
+            graph.edge_ids_array().tolist(), res.edge_ids_array().tolist()
+        )
+
+    def test_copy_shares_payloads(self):
+        graph = retworkx.PyGraph()
+        payload = {"a": 1}
+        graph.add_node(payload)
+        graph.add_node("b")
+        edge_payload = ["edge"]
+        graph.add_edge(0, 1, edge_payload)
+        res = graph.copy()
+        self.assertIs(payload, res[0])
+        self.assertIs(edge_payload, res.get_edge_data(0, 1))
+
+    def test_copy_is_independent(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        res = graph.copy()
+        self.assertFalse(res.multigraph)
+        res.remove_node(1)
+        self.assertEqual([(0, 1), (1, 2)], graph.edge_list())
+
+    def test_copy_module(self):
+        graph = retworkx.PyGraph()
+        graph.add_node("a")
+        res = copy.copy(graph)
+        self.assertIsInstance(res, retworkx.PyGraph)
+        self.assertEqual(["a"], res.nodes())
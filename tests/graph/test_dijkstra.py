@@ -12,6 +12,8 @@
 
 import unittest
 
+import numpy as np
+
 import retworkx
 
 
@@ -48,6 +50,23 @@ class TestDijkstraGraph(unittest.TestCase):
         expected = {4: [0, 3, 4]}
         self.assertEqual(expected, path)
 
+    def test_dijkstra_path_as_arrays(self):
+        dist, pred = retworkx.graph_dijkstra_shortest_paths(
+            self.graph, self.a, weight_fn=float, as_arrays=True
+        )
+        np.testing.assert_array_equal(
+            np.array([0.0, 7.0, 9.0, 11.0, 20.0, 20.0]), dist
+        )
+        np.testing.assert_array_equal(np.array([-1, 0, 0, 2, 3, 2]), pred)
+
+    def test_dijkstra_path_as_arrays_unreachable(self):
+        node = self.graph.add_node("G")
+        dist, pred = retworkx.graph_dijkstra_shortest_paths(
+            self.graph, node, as_arrays=True
+        )
+        np.testing.assert_array_equal(np.array([np.inf] * 6 + [0.0]), dist)
+        np.testing.assert_array_equal(np.array([-1] * 7), pred)
+
     def test_dijkstra_with_no_goal_set(self):
         path = retworkx.graph_dijkstra_shortest_path_lengths(
             self.graph, self.a, lambda x: 1
@@ -57,3 +57,74 @@ class TestDistanceMatrix(unittest.TestCase):
             ]
         )
         self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_graph_distance_matrix_integer_dtypes(self):
+        graph = retworkx.generators.cycle_graph(7)
+        expected = retworkx.graph_distance_matrix(graph)
+        for dtype in ("int32", "uint16", "uint8"):
+            dist = retworkx.graph_distance_matrix(graph, dtype=dtype)
+            self.assertEqual(numpy.dtype(dtype), dist.dtype)
+            self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_graph_distance_matrix_null_value(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edge(0, 1, None)
+        dist = retworkx.graph_distance_matrix(
+            graph, dtype=numpy.uint8, null_value=255
+        )
+        expected = numpy.array([[0, 1, 255], [1, 0, 255], [255, 255, 0]])
+        self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_graph_distance_matrix_invalid_null_value(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        with self.assertRaises(ValueError):
+            retworkx.graph_distance_matrix(
+                graph, dtype=numpy.uint16, null_value=0.5
+            )
+
+    def test_graph_distance_matrix_too_large_for_dtype(self):
+        graph = retworkx.generators.path_graph(600)
+        with self.assertRaises(ValueError):
+            retworkx.graph_distance_matrix(
+                graph, dtype=numpy.uint8, parallel_threshold=0
+            )
+
+    def test_graph_distance_matrix_with_removals(self):
+        graph = retworkx.generators.path_graph(5)
+        graph.remove_node(0)
+        dist = retworkx.graph_distance_matrix(graph)
+        expected = retworkx.graph_floyd_warshall_numpy(graph)
+        self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_graph_distance_matrix_dense_graph(self):
+        graph = retworkx.undirected_gnp_random_graph(200, 0.05, seed=42)
+        expected = retworkx.graph_floyd_warshall_numpy(graph)
+        for parallel_threshold in (300, 0):
+            dist = retworkx.graph_distance_matrix(
+                graph,
+                parallel_threshold=parallel_threshold,
+                null_value=numpy.inf,
+            )
+            self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_graph_distance_matrix_sparse_cutoff(self):
+        graph = retworkx.generators.grid_graph(10, 10)
+        expected = retworkx.graph_distance_matrix(graph, cutoff=3)
+        self.assertEqual(3.0, expected[0, 3])
+        self.assertEqual(0.0, expected[0, 4])
+        for parallel_threshold in (300, 0):
+            indptr, indices, data = retworkx.graph_distance_matrix(
+                graph,
+                parallel_threshold=parallel_threshold,
+                cutoff=3,
+                sparse=True,
+            )
+            self.assertEqual(numpy.float64, data.dtype)
+            dist = numpy.zeros((100, 100))
+            for row in range(100):
+                columns = indices[indptr[row] : indptr[row + 1]]
+                self.assertNotIn(row, columns)
+                dist[row, columns] = data[indptr[row] : indptr[row + 1]]
+            self.assertTrue(numpy.array_equal(dist, expected))
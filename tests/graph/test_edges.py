@@ -630,3 +630,33 @@ class TestEdgesMultigraphFalse(unittest.TestCase):
         graph.extend_from_weighted_edge_list(edge_list)
         self.assertEqual(len(graph), 4)
         self.assertEqual(["a", "b", "c", "d", "e"], graph.edges())
+
+    def test_edge_lookup_either_direction(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(list(range(3)))
+        edge = graph.add_edge(2, 0, "a")
+        self.assertTrue(graph.has_edge(0, 2))
+        self.assertTrue(graph.has_edge(2, 0))
+        self.assertEqual(edge, graph.add_edge(0, 2, "b"))
+        self.assertEqual("b", graph.get_edge_data(2, 0))
+        graph.update_edge(0, 2, "c")
+        self.assertEqual(["c"], graph.edges())
+        graph.remove_edge(0, 2)
+        self.assertFalse(graph.has_edge(2, 0))
+
+    def test_edge_lookup_after_node_removal(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from([(0, 1, "a"), (1, 2, "b")])
+        graph.remove_node(1)
+        self.assertEqual(1, graph.add_node("new"))
+        self.assertFalse(graph.has_edge(1, 0))
+        graph.add_edge(1, 0, "c")
+        graph.add_edge(0, 1, "d")
+        self.assertEqual(["d"], graph.edges())
+
+    def test_edge_lookup_generator(self):
+        graph = retworkx.generators.cycle_graph(4, multigraph=False)
+        self.assertTrue(graph.has_edge(0, 3))
+        graph.add_edge(0, 3, "a")
+        self.assertEqual(4, len(graph.edges()))
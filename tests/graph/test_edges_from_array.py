@@ -0,0 +1,129 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestEdgesFromArray(unittest.TestCase):
+    def test_add_edges_from_array_no_weights(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(4)))
+        res = graph.add_edges_from_array(
+            np.array([0, 1, 2], dtype=np.int64),
+            np.array([1, 2, 3], dtype=np.int64),
+        )
+        np.testing.assert_array_equal(res, np.array([0, 1, 2]))
+        self.assertEqual(res.dtype, np.int64)
+        self.assertEqual(
+            [(0, 1, None), (1, 2, None), (2, 3, None)],
+            graph.weighted_edge_list(),
+        )
+
+    def test_add_edges_from_array_float_weights(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_array(
+            np.array([0, 1], dtype=np.int64),
+            np.array([1, 2], dtype=np.int64),
+            np.array([0.5, 1.5]),
+        )
+        self.assertEqual([(0, 1, 0.5), (1, 2, 1.5)], graph.weighted_edge_list())
+        for weight in graph.edges():
+            self.assertIsInstance(weight, float)
+
+    def test_add_edges_from_array_object_weights(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        weights = np.array(["a", {"b": 1}], dtype=object)
+        graph.add_edges_from_array(
+            np.array([0, 1], dtype=np.int64),
+            np.array([1, 2], dtype=np.int64),
+            weights,
+        )
+        self.assertEqual(["a", {"b": 1}], graph.edges())
+
+    def test_add_edges_from_array_list_weights(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_array(
+            np.array([0, 1], dtype=np.int64),
+            np.array([1, 2], dtype=np.int64),
+            ["a", "b"],
+        )
+        self.assertEqual(["a", "b"], graph.edges())
+
+    def test_add_edges_from_array_invalid_node(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        with self.assertRaises(IndexError):
+            graph.add_edges_from_array(
+                np.array([0, 1], dtype=np.int64),
+                np.array([1, 5], dtype=np.int64),
+            )
+        self.assertEqual([], graph.edges())
+
+    def test_add_edges_from_array_negative_node(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        with self.assertRaises(IndexError):
+            graph.add_edges_from_array(
+                np.array([-1], dtype=np.int64), np.array([1], dtype=np.int64)
+            )
+
+    def test_add_edges_from_array_length_mismatch(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        with self.assertRaises(ValueError):
+            graph.add_edges_from_array(
+                np.array([0, 1], dtype=np.int64),
+                np.array([1], dtype=np.int64),
+            )
+        with self.assertRaises(ValueError):
+            graph.add_edges_from_array(
+                np.array([0, 1], dtype=np.int64),
+                np.array([1, 2], dtype=np.int64),
+                np.array([1.0]),
+            )
+
+    def test_add_edges_from_array_no_multigraph(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(list(range(3)))
+        res = graph.add_edges_from_array(
+            np.array([0, 1, 1], dtype=np.int64),
+            np.array([1, 0, 2], dtype=np.int64),
+            ["a", "b", "c"],
+        )
+        np.testing.assert_array_equal(res, np.array([0, 0, 1]))
+        self.assertEqual([(0, 1, "b"), (1, 2, "c")], graph.weighted_edge_list())
+
+    def test_update_edges_from_array(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        graph.update_edges_from_array(
+            np.array([1, 0], dtype=np.int64), np.array([2.0, 3.0])
+        )
+        self.assertEqual([(0, 1, 3.0), (1, 2, 2.0)], graph.weighted_edge_list())
+
+    def test_update_edges_from_array_invalid_index(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        with self.assertRaises(IndexError):
+            graph.update_edges_from_array(
+                np.array([0, 4], dtype=np.int64), ["a", "b"]
+            )
+        self.assertEqual([None, None], graph.edges())
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
+import tempfile
 import unittest
 
 import numpy
@@ -128,6 +130,172 @@ class TestFloydWarshall(unittest.TestCase):
         self.assertEqual(dist[0, 3], 6)
         self.assertEqual(dist[0, 4], 6)
 
+    def _path_from_predecessors(self, pred, source, target):
+        path = [target]
+        while path[-1] != source:
+            path.append(pred[source, path[-1]])
+        return path[::-1]
+
+    def test_floyd_warshall_numpy_float32(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(6)))
+        weights = [2, 12, 1, 5, 1]
+        graph.add_edges_from([(i, i + 1, weights[i]) for i in range(5)])
+        graph.add_edge(5, 0, 10)
+        dist = retworkx.graph_floyd_warshall_numpy(
+            graph,
+            lambda x: x,
+            parallel_threshold=self.parallel_threshold,
+            dtype=numpy.float32,
+        )
+        self.assertEqual(numpy.float32, dist.dtype)
+        expected = retworkx.graph_floyd_warshall_numpy(graph, lambda x: x)
+        self.assertTrue(numpy.array_equal(dist, expected))
+
+    def test_floyd_warshall_numpy_invalid_dtype(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        with self.assertRaises(ValueError):
+            retworkx.graph_floyd_warshall_numpy(graph, dtype="int64")
+
+    def test_floyd_warshall_numpy_predecessors(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(6)))
+        graph.add_edges_from(
+            [(0, 1, 1), (1, 2, 1), (0, 2, 5), (2, 3, 1), (3, 4, 1), (0, 4, 9)]
+        )
+        dist, pred = retworkx.graph_floyd_warshall_numpy(
+            graph,
+            lambda x: x,
+            parallel_threshold=self.parallel_threshold,
+            return_predecessors=True,
+        )
+        self.assertEqual(numpy.int64, pred.dtype)
+        self.assertEqual(
+            [0, 1, 2, 3, 4], self._path_from_predecessors(pred, 0, 4)
+        )
+        self.assertEqual(
+            [4, 3, 2, 1, 0], self._path_from_predecessors(pred, 4, 0)
+        )
+        self.assertEqual(4, dist[4, 0])
+        self.assertEqual(-1, pred[2, 2])
+        self.assertEqual(-1, pred[0, 5])
+
+    def test_floyd_warshall_numpy_predecessors_with_removals(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(5)))
+        graph.remove_node(0)
+        graph.add_edges_from_no_data([(1, 2), (2, 3), (3, 4)])
+        _, pred = retworkx.graph_floyd_warshall_numpy(
+            graph,
+            parallel_threshold=self.parallel_threshold,
+            return_predecessors=True,
+        )
+        self.assertEqual([0, 1, 2, 3], self._path_from_predecessors(pred, 0, 3))
+
+    def test_floyd_warshall_numpy_multiple_blocks(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(200)))
+        graph.add_edges_from(
+            [
+                (i, (i * j + 1) % 200, (i + j) % 5 + 1)
+                for i in range(200)
+                for j in (3, 7, 31)
+            ]
+        )
+        dist, pred = retworkx.graph_floyd_warshall_numpy(
+            graph,
+            lambda x: x,
+            parallel_threshold=self.parallel_threshold,
+            return_predecessors=True,
+        )
+        expected = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            graph, lambda x: x
+        )
+        self.assertTrue(numpy.array_equal(dist, expected))
+        for source, target in [(0, 197), (150, 11), (64, 128)]:
+            path = self._path_from_predecessors(pred, source, target)
+            length = sum(
+                min(graph.get_all_edge_data(u, v))
+                for u, v in zip(path, path[1:])
+            )
+            self.assertEqual(dist[source, target], length)
+
+    def test_floyd_warshall_numpy_out_memmap(self):
+        graph = retworkx.generators.grid_graph(10, 10)
+        expected = retworkx.graph_floyd_warshall_numpy(graph)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = numpy.memmap(
+                os.path.join(tmpdir, "dist.dat"),
+                dtype=numpy.float32,
+                mode="w+",
+                shape=(100, 100),
+            )
+            dist = retworkx.graph_floyd_warshall_numpy(
+                graph, parallel_threshold=self.parallel_threshold, out=out
+            )
+            self.assertIs(out, dist)
+            self.assertTrue(numpy.array_equal(expected, out))
+            del dist, out
+
+    def test_floyd_warshall_numpy_out_path(self):
+        graph = retworkx.generators.grid_graph(10, 10)
+        expected = retworkx.graph_floyd_warshall_numpy(graph)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "dist.npy")
+            dist = retworkx.graph_floyd_warshall_numpy(
+                graph,
+                parallel_threshold=self.parallel_threshold,
+                out=path,
+            )
+            self.assertIsInstance(dist, numpy.memmap)
+            del dist
+            self.assertTrue(
+                numpy.array_equal(expected, numpy.load(path, mmap_mode="r"))
+            )
+
+    def test_floyd_warshall_numpy_out_mismatch(self):
+        graph = retworkx.generators.grid_graph(10, 10)
+        with self.assertRaises(ValueError):
+            retworkx.graph_floyd_warshall_numpy(
+                graph, out=numpy.zeros((99, 100))
+            )
+        with self.assertRaises(ValueError):
+            retworkx.graph_floyd_warshall_numpy(
+                graph, dtype=numpy.float32, out=numpy.zeros((100, 100))
+            )
+        with self.assertRaises(ValueError):
+            retworkx.graph_floyd_warshall_numpy(
+                graph, out=numpy.zeros((100, 100)).T
+            )
+        with self.assertRaises(ValueError):
+            retworkx.graph_floyd_warshall_numpy(
+                graph, out=numpy.zeros((100, 100), dtype=">f8")
+            )
+        with self.assertRaises(ValueError):
+            retworkx.graph_floyd_warshall_numpy(
+                graph, out=numpy.zeros((100, 100)), return_predecessors=True
+            )
+
+    def test_floyd_warshall_numpy_predecessors_are_positions(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(6)))
+        graph.remove_node(2)
+        graph.add_edges_from_no_data([(0, 1), (1, 3), (3, 4), (4, 5)])
+        dist, pred = retworkx.graph_floyd_warshall_numpy(
+            graph,
+            parallel_threshold=self.parallel_threshold,
+            return_predecessors=True,
+        )
+        self.assertEqual((5, 5), pred.shape)
+        # Node 5 is at position 4 and is reached from node 4 at position 3
+        self.assertEqual(3, pred[0, 4])
+        self.assertEqual(4, dist[0, 4])
+        path = self._path_from_predecessors(pred, 0, 4)
+        self.assertEqual([0, 1, 2, 3, 4], path)
+        node_indexes = graph.node_indexes()
+        self.assertEqual([0, 1, 3, 4, 5], [node_indexes[x] for x in path])
+
 
 class TestParallelFloydWarshall(TestFloydWarshall):
     parallel_threshold = 0
@@ -0,0 +1,155 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestFreeze(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "d", "e"])
+        self.graph.add_edges_from(
+            [(0, 1, 1.0), (1, 2, 2.0), (0, 2, 5.0), (2, 3, 1.0)]
+        )
+        self.graph.remove_node(4)
+        self.frozen = self.graph.freeze()
+
+    def test_freeze_contents(self):
+        self.assertIsInstance(self.frozen, retworkx.CSRGraph)
+        self.assertEqual(len(self.graph), len(self.frozen))
+        self.assertEqual(self.graph.nodes(), self.frozen.nodes())
+        self.assertEqual(self.graph.node_indexes(), self.frozen.node_indexes())
+        self.assertEqual(
+            self.graph.weighted_edge_list(), self.frozen.weighted_edge_list()
+        )
+        with self.assertRaises(IndexError):
+            self.frozen[4]
+
+    def test_neighbors(self):
+        for node in self.graph.node_indexes():
+            self.assertEqual(
+                sorted(self.graph.neighbors(node)),
+                sorted(self.frozen.neighbors(node)),
+            )
+            self.assertEqual(self.graph.degree(node), self.frozen.degree(node))
+        self.assertTrue(self.frozen.has_edge(1, 0))
+        self.assertTrue(self.frozen.has_edge(0, 1))
+        self.assertFalse(self.frozen.has_edge(0, 3))
+
+    def test_csr_arrays(self):
+        indptr, indices, edge_ids = self.frozen.csr_arrays()
+        self.assertEqual(len(indptr), 6)
+        # Every edge is stored in the row of both endpoints
+        self.assertEqual(indptr[-1], 8)
+        self.assertEqual(len(indices), 8)
+        self.assertEqual(len(edge_ids), 8)
+
+    def test_dfs_edges(self):
+        self.assertEqual(
+            retworkx.dfs_edges(self.graph, 0),
+            retworkx.dfs_edges(self.frozen, 0),
+        )
+
+    def test_distance_matrix(self):
+        graph = retworkx.generators.cycle_graph(7)
+        expected = retworkx.distance_matrix(graph)
+        res = retworkx.distance_matrix(graph.freeze())
+        np.testing.assert_array_equal(expected, res)
+        res = retworkx.distance_matrix(graph.freeze(), parallel_threshold=2)
+        np.testing.assert_array_equal(expected, res)
+
+    def test_dijkstra_shortest_paths(self):
+        expected = retworkx.dijkstra_shortest_paths(
+            self.graph, 3, weight_fn=float
+        )
+        res = retworkx.dijkstra_shortest_paths(self.frozen, 3, weight_fn=float)
+        self.assertEqual(expected, res)
+
+    def test_dijkstra_shortest_paths_as_arrays(self):
+        expected = retworkx.dijkstra_shortest_paths(
+            self.graph, 3, weight_fn=float, as_arrays=True
+        )
+        res = retworkx.dijkstra_shortest_paths(
+            self.frozen, 3, weight_fn=float, as_arrays=True
+        )
+        for expected_array, array in zip(expected, res):
+            np.testing.assert_array_equal(expected_array, array)
+        self.assertEqual(
+            [3, 2, 1, 0], retworkx.path_from_predecessors(res[1], 3, 0)
+        )
+        with self.assertRaises(IndexError):
+            retworkx.dijkstra_shortest_paths(self.frozen, 4, as_arrays=True)
+
+    def test_dijkstra_shortest_path_lengths(self):
+        expected = retworkx.dijkstra_shortest_path_lengths(self.graph, 3, float)
+        res = retworkx.dijkstra_shortest_path_lengths(self.frozen, 3, float)
+        self.assertEqual(expected, res)
+        self.assertEqual({0: 4.0, 1: 3.0, 2: 1.0}, res)
+
+    def test_connected_components(self):
+        self.graph.add_node("f")
+        frozen = self.graph.freeze()
+        self.assertEqual(
+            [{0, 1, 2, 3}, {5}],
+            retworkx.connected_components(frozen),
+        )
+
+    def test_connected_components_graph(self):
+        self.graph.add_node("f")
+        self.assertEqual(
+            [{0, 1, 2, 3}, {5}],
+            retworkx.connected_components(self.graph),
+        )
+
+    def test_floyd_warshall_numpy(self):
+        expected = retworkx.floyd_warshall_numpy(self.graph, weight_fn=float)
+        res = retworkx.floyd_warshall_numpy(self.frozen, weight_fn=float)
+        np.testing.assert_array_equal(expected, res)
+
+    def test_all_pairs_dijkstra_path_lengths(self):
+        expected = retworkx.all_pairs_dijkstra_path_lengths(self.graph, float)
+        res = retworkx.all_pairs_dijkstra_path_lengths(self.frozen, float)
+        self.assertEqual(
+            {k: dict(v) for k, v in expected.items()},
+            {k: dict(v) for k, v in res.items()},
+        )
+
+    def test_bidirectional_dijkstra(self):
+        expected = retworkx.bidirectional_dijkstra(self.graph, 3, 0, float)
+        res = retworkx.bidirectional_dijkstra(self.frozen, 3, 0, float)
+        self.assertEqual(expected, res)
+        self.assertEqual((4.0, [3, 2, 1, 0]), res)
+
+    def test_bellman_ford_shortest_paths(self):
+        expected = retworkx.bellman_ford_shortest_paths(
+            self.graph, 3, weight_fn=float
+        )
+        res = retworkx.bellman_ford_shortest_paths(
+            self.frozen, 3, weight_fn=float
+        )
+        self.assertEqual(expected, res)
+
+    def test_johnson_all_pairs(self):
+        expected = retworkx.johnson_all_pairs(self.graph, float)
+        res = retworkx.johnson_all_pairs(self.frozen, float)
+        self.assertEqual(
+            {k: dict(v) for k, v in expected.items()},
+            {k: dict(v) for k, v in res.items()},
+        )
+
+    def test_invalid_type(self):
+        with self.assertRaises(TypeError):
+            retworkx.connected_components(retworkx.PyDiGraph().freeze())
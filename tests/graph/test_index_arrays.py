@@ -0,0 +1,54 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestIndexArrays(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(list(range(4)))
+        self.graph.add_edges_from_no_data([(0, 1), (1, 2), (2, 3), (3, 0)])
+
+    def test_node_index_array(self):
+        res = self.graph.node_index_array()
+        self.assertEqual(res.dtype, np.int64)
+        np.testing.assert_array_equal(res, np.array([0, 1, 2, 3]))
+
+    def test_node_index_array_with_removal(self):
+        self.graph.remove_node(1)
+        res = self.graph.node_index_array()
+        np.testing.assert_array_equal(res, np.array([0, 2, 3]))
+
+    def test_edge_index_array(self):
+        res = self.graph.edge_index_array()
+        self.assertEqual(res.dtype, np.int64)
+        self.assertEqual(res.shape, (4, 2))
+        np.testing.assert_array_equal(
+            res, np.array(list(self.graph.edge_list()))
+        )
+
+    def test_edge_index_array_empty(self):
+        res = retworkx.PyGraph().edge_index_array()
+        self.assertEqual(res.shape, (0, 2))
+
+    def test_edge_ids_array(self):
+        self.graph.remove_edge_from_index(1)
+        res = self.graph.edge_ids_array()
+        self.assertEqual(res.dtype, np.int64)
+        np.testing.assert_array_equal(res, np.array([0, 2, 3]))
+        edges = self.graph.edge_index_array()
+        np.testing.assert_array_equal(edges, np.array([[0, 1], [2, 3], [3, 0]]))
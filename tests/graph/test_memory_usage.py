@@ -0,0 +1,43 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import sys
+import unittest
+
+import retworkx
+
+
+class TestMemoryUsage(unittest.TestCase):
+    def test_memory_usage(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from_no_data([(0, 1), (1, 2)])
+        usage = graph.memory_usage()
+        self.assertGreater(usage["node_slots"], 0)
+        self.assertGreater(usage["edge_slots"], 0)
+        self.assertGreater(usage["edge_index"], 0)
+        self.assertNotIn("topo_order", usage)
+        self.assertEqual(usage["total"], graph.__sizeof__())
+        self.assertGreaterEqual(sys.getsizeof(graph), usage["total"])
+
+    def test_free_slots(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(range(3))
+        graph.remove_node(1)
+        usage = graph.memory_usage()
+        self.assertEqual(usage["node_slots"] / 2, usage["free_node_slots"])
+
+    def test_deep(self):
+        graph = retworkx.PyGraph()
+        graph.add_node("a" * 100)
+        usage = graph.memory_usage(deep=True)
+        self.assertEqual(sys.getsizeof("a" * 100), usage["payloads"])
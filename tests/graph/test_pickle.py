@@ -0,0 +1,88 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import pickle
+import unittest
+
+import retworkx
+
+
+class TestPickle(unittest.TestCase):
+    def test_round_trip_with_holes(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.add_edges_from([(0, 1, "a-b"), (1, 2, "b-c"), (2, 0, "c-a")])
+        graph.remove_node(1)
+        res = pickle.loads(pickle.dumps(graph))
+        self.assertEqual([0, 2], res.node_indexes())
+        self.assertEqual(["a", "c"], res.nodes())
+        self.assertEqual([2], res.edge_ids_array().tolist())
+        self.assertEqual(graph.weighted_edge_list(), res.weighted_edge_list())
+
+    def test_protocol_5_out_of_band(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(range(10))
+        graph.add_edges_from_no_data([(i, (i + 1) % 10) for i in range(10)])
+        buffers = []
+        data = pickle.dumps(graph, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(1, len(buffers))
+        res = pickle.loads(data, buffers=buffers)
+        self.assertEqual(graph.edge_list(), res.edge_list())
+
+    def test_multigraph_false_preserved(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(range(2))
+        graph.add_edge(0, 1, "a")
+        res = pickle.loads(pickle.dumps(graph))
+        self.assertFalse(res.multigraph)
+        res.add_edge(1, 0, "b")
+        self.assertEqual(1, len(res.edge_list()))
+
+    def test_legacy_state(self):
+        graph = retworkx.PyGraph()
+        graph.__setstate__(
+            {
+                "nodes": {0: "a", 2: "c"},
+                "edges": [(0, 2, "a-c")],
+                "nodes_removed": True,
+                "multigraph": True,
+            }
+        )
+        self.assertEqual([0, 2], graph.node_indexes())
+        self.assertEqual([(0, 2, "a-c")], graph.weighted_edge_list())
+
+    def test_truncated_packed_state(self):
+        graph = retworkx.PyGraph()
+        graph.extend_from_edge_list([(0, 1), (1, 2)])
+        state = graph.__getstate__()
+        state["structure"] = state["structure"][:-1]
+        with self.assertRaises(ValueError):
+            retworkx.PyGraph().__setstate__(state)
+
+    def test_packed_state_bounds_too_large(self):
+        graph = retworkx.PyGraph()
+        graph.extend_from_edge_list([(0, 1)])
+        for offset in (0, 8):
+            state = graph.__getstate__()
+            structure = state["structure"].copy()
+            structure[offset : offset + 8] = 0xFF
+            state["structure"] = structure
+            with self.assertRaises(ValueError):
+                retworkx.PyGraph().__setstate__(state)
+
+    def test_packed_state_payload_count_mismatch(self):
+        graph = retworkx.PyGraph()
+        graph.extend_from_edge_list([(0, 1)])
+        state = graph.__getstate__()
+        state["edge_payloads"] = []
+        with self.assertRaises(ValueError):
+            retworkx.PyGraph().__setstate__(state)
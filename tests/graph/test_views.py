@@ -0,0 +1,83 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestViews(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(["a", "b", "c", "d"])
+        self.graph.add_edges_from([(0, 1, "a-b"), (1, 2, "b-c"), (2, 3, "c-d")])
+
+    def test_node_view(self):
+        self.graph.remove_node(3)
+        view = self.graph.node_view()
+        self.assertEqual(3, len(view))
+        self.assertEqual([0, 1, 2], list(view))
+        self.assertIn(2, view)
+        self.assertNotIn(3, view)
+        self.assertEqual("b", view[1])
+
+    def test_edge_view(self):
+        view = self.graph.edge_view()
+        self.assertEqual(3, len(view))
+        self.assertEqual([(0, 1), (1, 2), (2, 3)], list(view))
+        self.assertIn((1, 0), view)
+        self.assertIn((0, 1), view)
+        self.assertNotIn((0, 2), view)
+        self.assertEqual("b-c", view[2, 1])
+
+    def test_adj_view(self):
+        view = self.graph.adj_view(1)
+        self.assertEqual(2, len(view))
+        self.assertEqual({0, 2}, set(view))
+        self.assertEqual("a-b", view[0])
+        self.assertIn(2, view)
+        self.assertNotIn(3, view)
+        self.graph.add_edge(1, 3, "b-d")
+        self.assertEqual("b-d", view[3])
+        self.assertEqual(3, len(view))
+
+    def test_adj_view_multigraph_false(self):
+        graph = retworkx.PyGraph(multigraph=False)
+        graph.add_nodes_from(range(3))
+        graph.add_edges_from([(0, 1, "a"), (2, 0, "b")])
+        view = graph.adj_view(0)
+        self.assertEqual(2, len(view))
+        self.assertEqual("b", view[2])
+
+    def test_adj_view_multigraph(self):
+        self.graph.add_edge(2, 1, "c-b")
+        self.graph.add_edge(1, 1, "b-b")
+        view = self.graph.adj_view(1)
+        self.assertEqual(3, len(view))
+        self.assertEqual([0, 1, 2], sorted(view))
+
+    def test_adj_view_missing_node(self):
+        with self.assertRaises(IndexError):
+            self.graph.adj_view(42)
+
+    def test_adj_view_changed_during_iteration(self):
+        view = self.graph.adj_view(1)
+        with self.assertRaises(RuntimeError):
+            for node in view:
+                self.graph.add_edge(1, 3, None)
+
+    def test_adj_view_edge_replaced_during_iteration(self):
+        view = self.graph.adj_view(1)
+        with self.assertRaises(RuntimeError):
+            for node in view:
+                self.graph.remove_edge(1, node)
+                self.graph.add_edge(0, 2, None)
@@ -12,8 +12,11 @@
 
 import copy
 import pickle
+import sys
 import unittest
 
+import numpy as np
+
 import retworkx
 
 
@@ -150,6 +153,16 @@ class TestNodeIndicesComparisons(unittest.TestCase):
         # Assert hash is stable
         self.assertEqual(hash_res, hash(res))
 
+    def test_numpy_array(self):
+        res = np.asarray(self.dag.node_indexes())
+        self.assertEqual(res.dtype, np.int64)
+        np.testing.assert_array_equal(res, np.array([0, 1]))
+
+    def test_numpy_array_dtype(self):
+        res = np.asarray(self.dag.node_indexes(), dtype=np.uint32)
+        self.assertEqual(res.dtype, np.uint32)
+        np.testing.assert_array_equal(res, np.array([0, 1]))
+
 
 class TestEdgeListComparisons(unittest.TestCase):
     def setUp(self):
@@ -207,6 +220,15 @@ class TestEdgeListComparisons(unittest.TestCase):
         # Assert hash is stable
         self.assertEqual(hash_res, hash(res))
 
+    def test_numpy_array(self):
+        res = np.asarray(self.dag.edge_list())
+        self.assertEqual(res.dtype, np.int64)
+        np.testing.assert_array_equal(res, np.array([[0, 1]]))
+
+    def test_numpy_array_empty(self):
+        res = np.asarray(retworkx.PyDAG().edge_list())
+        self.assertEqual(res.shape, (0, 2))
+
 
 class TestWeightedEdgeListComparisons(unittest.TestCase):
     def setUp(self):
@@ -273,6 +295,20 @@ class TestWeightedEdgeListComparisons(unittest.TestCase):
         with self.assertRaises(TypeError):
             hash(res)
 
+    def test_sizeof(self):
+        res = self.dag.weighted_edge_list()
+        self.assertGreater(sys.getsizeof(res), 0)
+        usage = res.memory_usage()
+        self.assertGreater(usage["edges"], 0)
+        self.assertNotIn("payloads", usage)
+        self.assertEqual(usage["total"], res.__sizeof__())
+
+    def test_memory_usage_deep(self):
+        res = self.dag.weighted_edge_list()
+        usage = res.memory_usage(deep=True)
+        self.assertEqual(sys.getsizeof("Edgy"), usage["payloads"])
+        self.assertEqual(usage["total"], res.__sizeof__() + usage["payloads"])
+
 
 class TestPathMapping(unittest.TestCase):
     def setUp(self):
@@ -399,6 +435,14 @@ class TestPathMapping(unittest.TestCase):
         res = retworkx.dijkstra_shortest_paths(self.dag, 0)
         self.assertNotIn(0, res)
 
+    def test_sizeof(self):
+        paths = retworkx.dijkstra_shortest_paths(self.dag, 0)
+        usage = paths.memory_usage()
+        self.assertGreater(usage["mapping"], 0)
+        self.assertGreater(usage["paths"], 0)
+        self.assertEqual(usage["total"], paths.__sizeof__())
+        self.assertGreater(sys.getsizeof(paths), usage["total"] - 1)
+
 
 class TestPathLengthMapping(unittest.TestCase):
     def setUp(self):
@@ -547,6 +591,135 @@ class TestPathLengthMapping(unittest.TestCase):
         res = retworkx.dijkstra_shortest_path_lengths(self.dag, 0, self.fn)
         self.assertNotIn(0, res)
 
+    def test_sizeof(self):
+        res = retworkx.dijkstra_shortest_path_lengths(self.dag, 0, self.fn)
+        usage = res.memory_usage()
+        self.assertGreater(usage["mapping"], 0)
+        self.assertEqual(usage["total"], res.__sizeof__())
+
+
+class TestAllPairsPathLengthMapping(unittest.TestCase):
+    def setUp(self):
+        self.dag = retworkx.PyDAG()
+        node_a = self.dag.add_node("a")
+        self.dag.add_child(node_a, "b", "Edgy")
+
+    def test__eq__match(self):
+        self.assertTrue(
+            retworkx.floyd_warshall(self.dag) == {0: {0: 0, 1: 1}, 1: {1: 0}}
+        )
+
+    def test__eq__not_match_keys(self):
+        self.assertFalse(
+            retworkx.floyd_warshall(self.dag) == {0: {0: 0, 1: 1}, 2: {1: 0}}
+        )
+
+    def test__eq__not_match_values(self):
+        self.assertFalse(
+            retworkx.floyd_warshall(self.dag) == {0: {0: 0, 1: 2}, 1: {1: 0}}
+        )
+
+    def test__eq__different_length(self):
+        self.assertFalse(retworkx.floyd_warshall(self.dag) == {1: {1: 0}})
+
+    def test_eq__same_type(self):
+        self.assertEqual(
+            retworkx.floyd_warshall(self.dag),
+            retworkx.floyd_warshall(self.dag),
+        )
+
+    def test__eq__invalid_type(self):
+        self.assertFalse(retworkx.floyd_warshall(self.dag) == ["a", None])
+
+    def test__eq__invalid_inner_type(self):
+        self.assertFalse(
+            retworkx.floyd_warshall(self.dag) == {0: "a", 1: {1: 0}}
+        )
+
+    def test__ne__match(self):
+        self.assertFalse(
+            retworkx.floyd_warshall(self.dag) != {0: {0: 0, 1: 1}, 1: {1: 0}}
+        )
+
+    def test__ne__not_match(self):
+        self.assertTrue(
+            retworkx.floyd_warshall(self.dag) != {0: {0: 0}, 1: {1: 0}}
+        )
+
+    def test__ne__invalid_type(self):
+        self.assertTrue(retworkx.floyd_warshall(self.dag) != ["a", None])
+
+    def test__gt__not_implemented(self):
+        with self.assertRaises(NotImplementedError):
+            retworkx.floyd_warshall(self.dag) > {1: {1: 0}}
+
+    def test_deepcopy(self):
+        lengths = retworkx.floyd_warshall(self.dag)
+        lengths_copy = copy.deepcopy(lengths)
+        self.assertEqual(lengths, lengths_copy)
+
+    def test_pickle(self):
+        lengths = retworkx.floyd_warshall(self.dag)
+        lengths_pickle = pickle.dumps(lengths)
+        lengths_copy = pickle.loads(lengths_pickle)
+        self.assertEqual(lengths, lengths_copy)
+
+    def test_str(self):
+        res = retworkx.floyd_warshall(self.dag)
+        self.assertEqual(
+            "AllPairsPathLengthMapping{0: {0: 0, 1: 1}, 1: {1: 0}}", str(res)
+        )
+
+    def test_hash(self):
+        res = retworkx.floyd_warshall(self.dag)
+        hash_res = hash(res)
+        self.assertIsInstance(hash_res, int)
+        # Assert hash is stable
+        self.assertEqual(hash_res, hash(res))
+
+    def test_index_error(self):
+        res = retworkx.floyd_warshall(self.dag)
+        with self.assertRaises(IndexError):
+            res[42]
+
+    def test_rows_cached(self):
+        res = retworkx.floyd_warshall(self.dag)
+        row = res[0]
+        self.assertIs(row, res[0])
+        self.assertIs(row, next(iter(res.values())))
+        self.assertEqual({0: 0, 1: 1}, row)
+
+    def test_keys(self):
+        keys = retworkx.floyd_warshall(self.dag).keys()
+        self.assertEqual([0, 1], list(keys))
+
+    def test_values(self):
+        values = retworkx.floyd_warshall(self.dag).values()
+        self.assertEqual([{0: 0, 1: 1}, {1: 0}], list(values))
+
+    def test_items(self):
+        items = retworkx.floyd_warshall(self.dag).items()
+        self.assertEqual([(0, {0: 0, 1: 1}), (1, {1: 0})], list(items))
+
+    def test_iter(self):
+        mapping_iter = iter(retworkx.floyd_warshall(self.dag))
+        output = list(mapping_iter)
+        self.assertEqual(output, [0, 1])
+
+    def test_contains(self):
+        res = retworkx.floyd_warshall(self.dag)
+        self.assertIn(1, res)
+
+    def test_not_contains(self):
+        res = retworkx.floyd_warshall(self.dag)
+        self.assertNotIn(2, res)
+
+    def test_sizeof(self):
+        res = retworkx.floyd_warshall(self.dag)
+        usage = res.memory_usage()
+        self.assertGreater(usage["lengths"], 0)
+        self.assertEqual(usage["total"], res.__sizeof__())
+
 
 class TestPos2DMapping(unittest.TestCase):
     def setUp(self):
@@ -39,6 +39,31 @@ class TestDispatchPyGraph(unittest.TestCase):
             res = retworkx.distance_matrix(self.graph, as_undirected=True)
             self.assertIsInstance(res, numpy.ndarray)
 
+    def test_distance_matrix_dtype(self):
+        res = retworkx.distance_matrix(
+            self.graph, dtype=numpy.uint8, null_value=255
+        )
+        self.assertIsInstance(res, numpy.ndarray)
+        self.assertEqual(numpy.uint8, res.dtype)
+
+    def test_distance_matrix_sparse(self):
+        indptr, indices, data = retworkx.distance_matrix(
+            self.graph, cutoff=1, sparse=True
+        )
+        self.assertEqual(len(self.graph) + 1, len(indptr))
+        self.assertIsInstance(indices, numpy.ndarray)
+        self.assertIsInstance(data, numpy.ndarray)
+
+    def test_distance_matrix_out(self):
+        out = numpy.zeros((10, 10), dtype=numpy.uint16)
+        res = retworkx.distance_matrix(self.graph, out=out)
+        self.assertIs(out, res)
+
+    def test_floyd_warshall_numpy_out(self):
+        out = numpy.zeros((10, 10), dtype=numpy.float32)
+        res = retworkx.floyd_warshall_numpy(self.graph, out=out)
+        self.assertIs(out, res)
+
     def test_adjacency_matrix(self):
         res = retworkx.adjacency_matrix(self.graph)
         self.assertIsInstance(res, numpy.ndarray)
@@ -74,6 +99,37 @@ class TestDispatchPyGraph(unittest.TestCase):
         )
         self.assertIsInstance(res, retworkx.PathLengthMapping)
 
+    def test_all_pairs_dijkstra_path_lengths(self):
+        res = retworkx.all_pairs_dijkstra_path_lengths(self.graph)
+        self.assertIsInstance(res, numpy.ndarray)
+        self.assertEqual((10, 10), res.shape)
+
+    def test_all_pairs_dijkstra_path_lengths_sparse(self):
+        indptr, _, _ = retworkx.all_pairs_dijkstra_path_lengths(
+            self.graph, cutoff=1.0, sparse=True
+        )
+        self.assertEqual(11, len(indptr))
+
+    def test_all_pairs_dijkstra_path_lengths_out(self):
+        out = numpy.zeros((10, 10))
+        res = retworkx.all_pairs_dijkstra_path_lengths(self.graph, out=out)
+        self.assertIs(out, res)
+
+    def test_bidirectional_dijkstra(self):
+        res = retworkx.bidirectional_dijkstra(self.graph, 0, 0)
+        self.assertEqual((0.0, [0]), (res[0], list(res[1])))
+
+    def test_bellman_ford_shortest_paths(self):
+        res = retworkx.bellman_ford_shortest_paths(self.graph, 0)
+        self.assertIsInstance(res, retworkx.PathMapping)
+
+    def test_johnson_all_pairs(self):
+        res = retworkx.johnson_all_pairs(self.graph)
+        self.assertIsInstance(res, numpy.ndarray)
+        numpy.testing.assert_array_equal(
+            retworkx.floyd_warshall_numpy(self.graph), res
+        )
+
     def test_k_shortest_path_lengths(self):
         res = retworkx.k_shortest_path_lengths(self.graph, 0, 2, lambda _: 1)
         self.assertIsInstance(res, retworkx.PathLengthMapping)
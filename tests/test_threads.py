@@ -0,0 +1,99 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import concurrent.futures
+import threading
+import unittest
+
+import numpy as np
+
+import retworkx
+
+
+class TestThreadedCalls(unittest.TestCase):
+    def setUp(self):
+        self.dag = retworkx.generators.directed_grid_graph(10, 10)
+        self.graph = retworkx.generators.grid_graph(10, 10)
+
+    def _run_threaded(self, func, *args):
+        expected = func(*args)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(func, *args) for _ in range(8)]
+            results = [future.result() for future in futures]
+        return expected, results
+
+    def test_distance_matrix(self):
+        for graph in (self.dag, self.graph):
+            expected, results = self._run_threaded(
+                retworkx.distance_matrix, graph
+            )
+            for res in results:
+                np.testing.assert_array_equal(expected, res)
+
+    def test_floyd_warshall_numpy(self):
+        for graph in (self.dag, self.graph):
+            expected, results = self._run_threaded(
+                retworkx.floyd_warshall_numpy, graph
+            )
+            for res in results:
+                np.testing.assert_array_equal(expected, res)
+
+    def test_topological_sort(self):
+        expected, results = self._run_threaded(
+            retworkx.topological_sort, self.dag
+        )
+        for res in results:
+            self.assertEqual(list(expected), list(res))
+
+    def test_structural_functions(self):
+        funcs = [
+            (retworkx.strongly_connected_components, self.dag),
+            (retworkx.is_directed_acyclic_graph, self.dag),
+            (retworkx.number_weakly_connected_components, self.dag),
+            (retworkx.graph_transitivity, self.graph),
+            (retworkx.floyd_warshall, self.dag),
+        ]
+        for func, graph in funcs:
+            expected, results = self._run_threaded(func, graph)
+            for res in results:
+                self.assertEqual(expected, res)
+
+    def test_mutation_during_call_raises(self):
+        def weight_fn(_):
+            self.dag.add_node(None)
+            return 1.0
+
+        with self.assertRaisesRegex(RuntimeError, "Already borrowed"):
+            retworkx.digraph_floyd_warshall_numpy(self.dag, weight_fn)
+
+    def test_graph_borrowed_while_gil_released(self):
+        graph = retworkx.generators.directed_grid_graph(30, 30)
+        started = threading.Event()
+
+        def run():
+            started.set()
+            retworkx.floyd_warshall_numpy(graph)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        started.wait()
+        errors = 0
+        # Only possible if this thread runs while the call is in progress.
+        # Removing a node that doesn't exist doesn't change the graph if the
+        # borrow succeeds.
+        while thread.is_alive():
+            try:
+                graph.remove_node(10**6)
+            except RuntimeError:
+                errors += 1
+        thread.join()
+        self.assertGreater(errors, 0)